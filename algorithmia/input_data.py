@@ -1,6972 +1,79 @@
-# QUEST 1
+"""Lazy store of puzzle inputs.
 
-q1_input1 = "CCCAABCCCAABCBCCCBBABCABBCBBBCCABCBCAAABBCCABACBACCBABBCCCCCCBAACCBBBABBACCCCACCCBABAAABCACABCCACCAAABCBABCBBCBACCCBACBCBCCBCAACBCACBABBBCAAACACBBABAACCAACABBCCBBAACBCCCBACCBBBBABBABCCCAABBACBABCCCBBBAACBABAACCBCACCCACCAAAAABABBACBBCABAABACBCBBCCAACBCCACBCAABACBACCAACBBBCCCCACACACCABBACAAAACCCCCCACAAACBABBAABCACACCBABBCBBCACABCCCACBABCACAAABACCAABBACBABAACAACBBCCCCBCABCBCBCBCCBCACBBBBBBABCCCACACACABBBBBBBBACABABCCBCCBAACBBBABACCCCAAAAAACCBBBBABCBCABBBAACCCAACBACAACCBBABCBCCABBBAAACCAACABAACCABBCABBBCBAACACCACCBBBABABAAAAAAACBBCBCCBAACCCCCCCBCCABBAAAABCBBACBBAABBCAAACBABCBBABCAACAABCCCCAABACCCACBAABCBACCCABCCCBAACBCBCBAACABBCBBCBCCBBBCACCACCBACAABCAACCCAABBBCABABABBAACCCBBBABBCCABCACBCCACCCCAACCBBAABCCBBBACABACBBBAABBBCBCACABABCAAAAACBCCAAAAABCCACBBCACCBBBABCCACCCCBABBBABBACBBBBBACBABCBABACAAABACABCAAACCCBBCACBBBCACACCCABCBBBCCCBAACBAACBABACBAACBBACCACCCCAAABACCACCCBBCBBACBBABABBABCBCABACACBABBCCACBCCBBCCACBCBCBAACBAABBCCBCCBBCCCCBBBBBCBBABBCAAACCABCBAABBAAAABCACACCABBCBCAABBCAABCCCBCCB"
-q1_input2 = "xDDDDxABAABDDDAABCAAABCBDDABDCCxBBBCBDCCxCCAxCBABAADCDDBDCADBxADxDBCDBADxDxxABDDDCABCADxxADxDBABDBBxxBBADBADDCAADCDDCxBACCxDxCxBCBBAxxDAxCAACDCxxxCDBxCCDDAAABACABACDDDCDAAACxDCAxCBDBBABCxCAADADDCBDDCDDxBCDBAxCxCBAAAxAxBDxBxCDAABDDAAxBBBCAxBCACxBDABBABADACDBCCCABAADBxBDABBBCCCBBABBCBDDxxxCxDxxBAABBxBAACCACBCDCAAAACDxDCCACDAxDBADBCBDBADDAADBABxACDAABxAADCBCACDAAxCBBADDBDDDCCCBCABCCCBABxCAAAACABBACxABACAAADBxABDADABxCDxxBDxADADABCACxDxCCBDCCBDDDDBxAxCDBAxDCABAAxAxDBCDBDAABxxCBCAACDDDBDCxCACDCAxBxCDDDxDABDBACxAxDDAxADxACDDDBxCBxAAADACxCBACCAABDBCBxDCBxxBCABCxxBBBABBBBBCBBABCCACDDxAAxxAACCxxDDAxDBADDDBCCADBADDCCBDDCBABCBABDADADAABCCCAADCxAABBDCBBxDDBDxBBCADCABDDDxCxBxCCACCBBABDBBxCxDBDAAABDCCCDBBxBDDACCBABACDxAAAAxCABBDACACDBAAxAxCAABBCAADCBBCBCADADBxDDCxDDAxDBxDDBBDxCDBABABADAACxCBCDBAxCAABDACBDAxxBBCDDCDDxCAADCCCDBBxCCAAAADABBBDDDCCBACxDAxBDCDABxAxCCCDADBCxxBDxDDxABACBDxxxBDDBABADDCxAADBDAxADAAxABDxABCCBCBCABxAxCABDBCBCxDDACAAxCAAAxBxADABxAADCCCCxADBCACDBBBDCBBxBBCCCDCBADDBCBAADADDDCCACBBxADCBDACDCCCACDCCDCACABBBCCBDDDDAACCAxACBCBBxACDBBAAAABxCCDBBBBBDADxABBABDCCAACBCxAAACCCxBxDCCAACBDxDxCDCCBxBBAxCADxAxDxAxCxBDADCDAABCDAxAxCCBCCDBCDACBDBDBxxBBCBBxDCCCBxAABxCBCDBCABBxBCCBBDBCxDDAAAABBCCACDCCCBCDBDDBDDCABCAxADBCADDCDAACDxCABCADDBAABDBCCDCCABDDxDAABBCABCBBBBAAxxACABABDxAACAAAABCACCCAAADDBAAxCACCDxCAADAABABBACBxCBABBACBCBBCACCCCAxBBCCBACADBDCCCBBABDBBBxCCCBAABxBDAxDABADADCxDCxBDAxBACCDDBCDCACADCDDCBDxDDAACDDABDBBxCDACAABBDAxxDDBDCxDBCABADDDADxBACxAADxCBABAABxCxADBDCCxBAAAxACxABDBCADxxDAAxABxDABAADDCDDBCBDACACCADDCxBCCCDCxCDDDBCCxDACCCCBCDDxCxDCBDDBACADAABABCDBxAABBCABDCCDCAABDCBCCDBDBAAAADDDBxAACADDDxBAxxCBCCDACCDCBAAxAxABAABBAAxAxDCAxCACCABADAxBCAxCCCDxxCCCCBADCADBAABABADBBBACCACBBCCBxDCAAACCADAADCDABAACBxBCBxCADDBCBABCBxDACCABACxBACAACBCBBxDDDAxxBDCADBBxxAxDBDBDBBAxBCxACCDBxAACDCDDCAABCABBADCABBBCDABACCxAxAAACDBBCAADADDxCDACAxDCBABxDBAAAxCADABDAADAxxDxBCCADBCDABxAxADCCCDxDADDBAAADxxACBBABCADDCAACDABABBDCxAAADBBAxxDACADABxCDBDCCxABACxDDDCAAACDDBxxBCABABDxxAAACDBCDCxAABCD"
-q1_input3 = "AxDxBDxDBCCDDCBDDxDDDBCxBDBADADAxBBBBxxxBBCBDCDACDxDAAADxxxBDCAABxAxBCCCAxABxDCDCBDCxBAAxABDxCDDDBCxCxCDCCxBDDBADxAxCBCBCxxCDABDDxCCBCBACxCCBDCCABDABBCACAxBABADxxCCCADBAAACCBADADBBDxxxDBDBDBCBDCCCDxBCCADBxCBxBBBxABBxxAxDCACCAxDBDDxDAAxBCDDBCCBCBAxBAxBDxxBABCBBDCACBCBADBACDCCAABBxxxBDDCAAABCBABBBCACxxDBDDADxxCDBACxCBBDBDCACCABBABDDDADDBABCDABCDxBDBACAxBCxBCDxAxBBBDACBxxACDAxDxCADxCDDCAACBCxDACADBBxADAxDxAxCCAxDxCAxCxxxDAAxBACxCBCACDBDCAAABDCAADBCADCDBDBBBBDBDBBxxACCxBCAxDDDxCBDBBxDACAACxCDCBBDBAxBxDBxDDDDCxADAxDxAAxxDBABDBBAxBxCDCBDBBBCCDxABDDxBCCCDBxCBADABxxDDADBADDDCBDxDCBABxDCBxDBCDCxAxxxxDxCCDxACADADCCBBxAABBxBCDDxBCADDADCBCBBAAxCACCDxxBADBxxCACBDxxDxADBCCDABADxBCDCABxxABCCxxAxCACDDxADCAxBABxxBDxCDBBDBACAAAxCACDxCAAADBxCAADBADCDDACADxCABABDDxxBCCCBCBxABCAxBxBDABCACxACxABBAAxDCCBAABCADxDCCDABDCxACCDDBBDxCxDxCBCBAAxBBCAAxCDDACxxxCxAABACDBBBBxBBxCDCCxCxDCCACACBDADABDDxCCCDDxxDDCAxDADAxCxAxBDBBBDBxBxBBDABBADABBDCABxxADBCDBBDDBACCAxxBAxxDBCBBDABDDADCAxxACxAABxABBCBDBBBCCCCDBDADADBxxxACDCxABAxxCBxxCxxxACBDAACCCACAxABBACBADDBxAxDxxxBBBCDDDCDBCxAxADAxDABBDAxBCBBDBAAxDDCCDAxABxCADAxCBABxxCDCBDCxBAAABxBBCCAxDADDDCxADBDABxAAADACBDDDDCDCDCBBDBBBBAxABBDCCCCxAxCBDDxxDCBCDBxDDCCDDxBxDBxACAxxBADBBDBDCBCCxxAxCxAxAxCxCDBACBDAACAAAxADDCxCCCxDCBDxCDDBDxxABxDCDBBDAAxAxABCxCCCBCDADDACAxDCDCBCxDxxxCAABxDDCDCDADCDDBDBDCxxxBACBAACBxBBCBBDACADxCBDDAxCxxBDxxBDxDxCBAAAxCxCBBBAxDACDBDDDCBCBAxDBxDABCCABDCDCABBDADCDACxBDxxBDCBACADDCABCxBDBCCCxADCAACBxxxxAxDCCBxCAxBDBDDCADCxBDDADADBABBAADCDCAACxxxBBAxAAABDAAAACDCCxBCCCDDCADBxABxCBACCCBAxCCxCCxCCBxCDAxCBxBCBBADADxBADBBCDCDBxxBDxxABxABCAxBDxxDAADBBBCCDAxxxxxDAxACACDAACCxBxBDABDDCDxxxxDBADBxAxDDBDADCCBCBxCDDCACADACBDBBBAxxCDAADxCDBBCABBDCDACDBDCDCxDADBCAxCxABADDAAAAxABDDDxBBDCxADBxBAxDCCACDABCBAAAxxBBCxxCxDCxAxABAABBBAAACBxCxxBBCBxAAxABABDCxDDDBADDDxxxCxBCBCDDBCxDxxCxAAxCCxDDACADDDAxDDCAxDCBxCDCxDCxABADAAAxDBCDBCDBBDDCDCCCDDxDCADCDCAADBDDCBCCxxCCxCDAxxxDCBxxDDBBDBxBDxAxBDBxBDBDCBDAAxAAADABACDDACDADCBDxxDAxACxBCABCxACxADCDxDACCACBAxADxBDCADxxBAAABBDxAxBBxACxBxBDAAAAxBxACCABxADCAxBCABCACBxCDBACCBBDDDCCACCBCxxDDBBABAxCCBDCDxAxBACAxBDDCAxxCBxDBDAADDDABxBBCAAxCCBACxBACBDBCBCADACBCCACBAxBBABDBBxxABAxxCBxCxADCDCAAxCxCxCDAxCCCBDxDDxxxxCxACxDACDCDBDxxxBDABDCxCCBxxxDCCxBCxCBBDBBBAxDBACCBCxBAAxCBBCBAxCCDxADCxxxBBDDBADAADCDBCDDAAAAxxBDDxCBBBxDBBCAAABDDCADDxxCxxxxDBCCACCBAxAACxAAADxCBBBxCAxCDxxxADDBCCBDCDBDBCDDxDDBBBDxCxxDADADBDABCxACCCDDCBCBCxBADCxACCCCxBDCxDCACDABxCBCCxAADDAxBBCCxCDADDBDBBCxDACDADxCCCxDDADxACADAACDBBCBBxxxDBBDBxxDCAxxDDxBCxCACACCBBCDBBBxCCBDxBBxxxAxxDACACABxABBDCCCBBBBCCCCCxxBxBABACCxxCxxBxxBCDDACDADCxDxCCxCACDDxABAAxBADxDBxCDCBxBDACAAAADCDACCBDBBABxxBDDDBDxACxBxxDxBDBBABxBBCCCBBBxCDxDADCCAxDCxDCxxABxCDxBxxCBDABCDDBxCDCAxxxDDxDxxBDxxBABBCBCxBCCBACBAxxBBCxCDxAxAxBxCBDDACBBBxDBCBAABCCDxxxAADDxxAxDxACCCBAxxxDCBDDACDAxBxDxDACBxDxAxxACBACBADCxxxxABBxCBDABxxCDCDxAxxxCDBDxBCADACACDxBBCxxxxBCCxBCCBxCBCCBDAxBBBBDADCCBxDxxDBCxADDBDDBBBxxxBxxCBCxDADxDDDACxxBADxABxDCBBxDxxCADBACACBBCCCDDxCxDCAAABCBDACBCCBBAxBxADBCDCBAABxCDABAABCAADxxBCCBxBDCAAxDBAxDAxCDBDBADCCxxAxDBCABAABCxBBDDBCDDxCBBCBACxDDADADCDBDxBBDxCBDBBDBDCBCCCDCxxBxCDACBCxxAAAxBCBxAxADAxxxDBCCCCxABDxBCAADADBxxCDADCDBDBxDBxCCxBDDCAxDxBCCDCCBxBxDBxDDADBBBxBBADxCCDCACBDxxBDBDDADxDABDADCABDxBBxDAxBBDDDxCxDCDDCAxDAAAxBCBCADAxBBBABACBDACADCAxBCxCADCCxDDCDBAxBBDBDBBAxBAAxAxBBxDCCxBDDxDDCCCxBBBDBxCxCBDADBAxxBxBCAxACAxCxCAxxCCDDDxDxABCBDDBBDDBCCADxBDAxCBBCxBCBACCDAABDDxACDAxxBDxxxACBAAAxACxxCCCDABBDADCxCBBACDCDAADCxxCDxxxBxACDDxCBBDDBBBDADxACDxxDBBBDBDAxBDxxBCDxxBAxAADCxBCxADxxBCDDABABxDBDBDBBDCDxBCBABCDCCBBDDAxxxBBCBBACDCAADCBDCCxAADABCDxCxBxAxBCDDCDAxCxCxBAABCCDDxxCBDxAAACxDCDxADACACxxAADBCxBDDCBDxxxCBACCACABAADxAxCAxCCCDAxxxBABCAxDCBxCBCBDxACABABxCxDxxxCDCDxDBBDABxDDBBxxBACACxxDxxDxDBBBADBxxBADxxDADxDBxBxCxBDCABBxAAACCCDACCDBCCADxxCBCDCAACCxDABBAxDDxxDDDBDxxxCxCCCDACBCDBADxAAxDBxABACBDxABxDBDxABCACDBxABxCDCAxACBADBxDxDxxDDDBDDxxCCxBxBDDxCCDACBDBDABCAACxxCCDCxDCDBBABCDxDCBDBDCBAxCCBxACBxACCxCBBDxABBDxxBCxBDxCACBDCCDDBxCDBCBxBBDADDCxACDCCCBCBAAxACACxxBxABxCADCBBBxACAABBBxxDCxCAAACCDBBAxDACDCAADDDCDxxxABCDDDxAxABCACCBxCxADxADDDBCCBCCBBABAxCBBAACCBCDxCAxBDDBxAxCACAxBCAAxACDxBCCAxBxxDCBDDAxBCCxCDxBABCCAAxACCDDxBxACACAxAxCAxxAACDCxBDADDCDDxDCDCCACBACDxBAADxCABACCDAxCxCBADBBCxABDABABBxACBDDxCABBBBxBAxCAAxDxCBxBBCDDDCCCBACxAxCBxCDxxCDxDDBDCADADCCBxCAxxBDxBBDDDAxCDCABDBBCDDCABxBxBDBxxCxCBDBADCCDxCAxxxADADACADDxCCxBDxCBACBDABCCxABBCDCBDAAAxBxxBxxxCBDxDCADBDCBCADDAAADxBACADxDACACBDDDACxCABDACCBDDBDABDACxxxDCCDCCBDBCABACAxABDCxxADCDxxABAxxDDBBxCCxCAAxBBCxxAACBADBBBADACxxxCACBBDCAACCDDBCCACxDACDDABCDDCDDxAAxBACDDAxADBBBDDxADCBCADCDCAAAxCCBxBDCDDAAxDADBDDxBADCCBAxCxBDBCADCDDABCAAACACDxADxDACACBxAxAxAxCBCBADBDxDDCCABBAADACACDxDBBCDCxADBDDBDBDDABACCCDCDCDACCCDCADBxCAAxBCBAAxBAACCDxDACCADCBxBCAxxxABADDDBxDxxABxxCCABxDCxCBxxADDDBDBABxxBBAxCAxxBDAAADCDDBxDCBDCADCxCBDACxDCCBADCDDCxBBDAABDDDxxCDBAABxDBDDADABAxDxDAACCBAADCxDDxBxCADxCCDCBCCxCCxDACxABxBxDBxxDDBCABCxBCCCDAxDACDBACBxDAxADDCDACADAACBADxDDAAxCDCxBxxCABBDDBBxDBABABxBxBDBDCDABABAADCADxCCCDxBDAxCBCxACBDAxxBCBACADCxCDxDDADxCCAxBBBACCDBDDDBDBxxBADAACxxxCDAxDABCDDCxCABxADCCxDDBCABAxDAADxACACBDABBDAAxDBCxxBACxCDxDBCDCCxDBBADBDBAxDxBDxBDxCDCxAAABCBAACxBABxABBCCBxDxBAADBCAACACCBDBDBBBABDCxCxBxAABCAxDBADxxACCAxDCBADAxBBCBxxCDADBDxxADBDCxCxxBCADBADAxDxDCDCAxDCDCBBCCxBBCBBBDBBCAAADCDxDBAxBCABBABCBBCDxCADDBCxBxBxDDBxAxDCCBCDDAAABBxDBDCCDAxCCAAAAACBxADBDCCxxBCBDxBBCDACxBDBBCBBxCxACBxCDBxDDDxDAAACCBDDCxCDBADxCxCAxCCACxBBADxABCADABxxAADDCDCAAxDCAxxCDDBxDBDDCBxDCCBBCDDBDBCCDCDxDxBADxDxxxCBxDCDBABBDCCxCADBBACCxxBAAAABDBxBDxxDCAACADBAACDCAxBDxDBCACDBxDCBxADCxAxBCxBDBBADBDxDDDBCABCADCCBCAACDxxDDxAxDCBAADACABAAAABCxBACxCDBBDBAAxACCDCxBBAxAACAADACDACDDxDxDCCBBDxBDCxxACBxxxBABBxADBCBCDDxBADDxBADCBxDBDCCxxDxDDBAAxAAACDBADxDxxCBDDADDDBDACCCCxACBDxBCCAABDxCCCCDBADCAAAxCABBBDxCCxxCxCBDDBBACxCBxACxCBCCAAABDCBBCAAADABABABCCCDBDBxCBBxABDBCDxAACADAADBCxxBABCxACDCCCDCABCCBBBCDAABBCxDBABxDDDAxDDACxDxCCBxCxxCAxAxCBBxDDxAACxBBBDxACDBAACAxxADAABxDxAxACDACDDCDACDDxDBBDADDCAAxxDxDACBxCDxDBDBCBBDAxCxACxxABBDAxxBDCBDxxBBCxACxDxDACDBBBDABAxBBACBxxBDxxCCDBxCxxDDCCxxAAxBxCCCBAxxCBxDDDAACCBAxABCBADxCDCxBADAxxxxCxACBCDBCCCAxDBxBBCCBDAxBCACxBABDBDDABDACDADBDDACxBxBCDxAACCCDxBCDAxxxBACDxBCxCCxBADBABCxBBxBxAxBABAxBACBxBDCADDCCDxBADBADACxAxBDxDCBACDxDDxACCAABBxBxDxDBDADBAAADxxAABBADCCBCxABAADCAxCCDADCAACCxAxAADBADDxxAAAxxBABADBABAABBACxxBxDBxAxAxxBxBABBxxBxACAxABBDDDCxCDxxCCDCCDxBABADAxBDBxACxABxxDDxxDxBxBxxCDAACDCBxACxAAAAAAxDACxDBAxBAxABBDBDBBCDBCxDDDBCCCABDCDCBxCBBDDCxDxCxBxBDBDBCADDDCCDACxBCCxxABABCCBxDBBDxDCxADDCDAxxxDCBDBDDDxABxDDxDBDADAxDxBBxBADxABCBxAxDCAxDBCxxxDxBDxxAABCDxDDBBxDDCDAAxAADDCxBDDBDBxACxBCDCABAAADxACDxDDDBxCBDABxBxDDABADxDBCCAADDCBCCCxCAAxDBABCxCCBDCBABxBDBAAxxDDAxDBACDDACCDADBBCDBCCCxCABCCCBxxCxCBDDDxxBxxBDDAABCDABBCDAAADCCACDDBxBACxDACACAADCBBDABAAACAxxBCxxxDxCxCCADBBDBxDxCxDCDxAxxxBxDBBBCBCBDADACDAACADxBAxDCDAACBBAAxCDxCDDxADxDxAABDCBDxBCDxAxADBBxAxBACDBBBACAABxxADCAxBBBAADDxCDBBCACBxCADDCDxDDCCCBABAACxDCABBxxxAxxDAADxxxBBCAABAAAABxDAxACCxBBxABDDxABDCCCACDDxADCAADxxBBABBDDDBBxxCBxDxDCCDCBCDBAAADDDDxAxCCDAADACDxABACAxBBDBADDCDxDDBxBAAAxCBCDDDAxDABDAxBDAxCDABADCAxCCBxCxDxxBAACxxADDxACDDACxxxACACxCBADDBCABDCDxADxADxBCBxBAxxBBxABCBDDDxACDxxCAxxDCxCBCxCDDBDCxxACDABxDADBCDAABDBBABxDxBBAAxxCDCxCxBAAACACDDADACCxDBDBAxDDxCDDBDABCDCxDABCCDDAxCADAxDCABADACDxxABxDxxAAACCCDBCxBCDDDDDDACCxBCCxxBDDDBAAAABCBADAxADDAxCxBCBDCCxxxxDDCBDxAABAxABCxAAxBxBAADCABDAxAABABDBAAxBCBDDCxCAxABDCADDCCCxDxCBDDxxDDCCxCCABBxDxACDxADxBABxDABBDCABxBACBCCABACCxxACBCCxBAxxBBxxADxAAAxxCDxBADCABAABACxxBAxCDCCxCxAxAxCBDBDCCCDBBDACDDDCBACBBBDBBCDBxCxBBAxCxxCBCACDADACDAAAACADDCBBxDBCxBACAxCABABBBxxBBCBBBCxBxDxCxBCDABDCBDCDDDBCAxABACBDCAxAxAAADDxxAxCABxDCDxAAxBCABxxAxCDxDCCADDCABABxxCDDABxBCxxxxABCCxxBDAxxxADBCDCBDCDABCBAADACAABBBBxDxACBDCACDBBDDBAxBDBADDDDCBxBCxDDADDCCCCAADBBAADCCBDBxACxDCxDxDCDDBCDDBDADACCxBAACCCBAxCCxAxxBCABCDBxDBxBAxBCBDBBBCBABADAxxDBCBAxBDxAxAABxADDxABDBCBxDDAxAADDxDDxABCDDAxCCCDCDBDCCADDCBDBCCAxDDDADBxxACAxBDDDDBCxCBADBABxDDxDxCxDADCABDxDDADDACDAACCCxxxDxxCDBABDBDxBCxCDxACCCBABxCAxBCCBxxBCBCBxDDCAxACxDBxAAxAAABxAxDBBABDDADDBxCCAAxAABBBBxBxDCDxDCAxxDABBxDBACBxCDBxxCBCDxDxCxCBCDAxDABCCAxDDDDBCCBCCCBxxBCACDAxDCDAACABCACxDBCABCDCDBDABxCBAxCAxCAxCxxDAxBBBDxBCBDCBCBAxBCxBxxBBxDxBxBBDCCCxDACBAxBBDACDBDAxBDxDBDxDBCAAAAxDBABDDCDxBBxxxADDDACDDBAABxACCxBDDBDBBBxDDBABCBCBxCAAABCCDCxABDDBADDDCDBxxCBBCADDCBxADCxACxDDCDDDxDBCCDAxABCxAxDCBDABABACBDBDDCDBCDCBCBACCBBACxxBBBACBxDBCACACDBDAAADDAABDBCDCDBDBCBxBCxDxxBxDxCAxCAxDDDCxBAxBBCxDADCBCADCxDBBDBAACxxAxBAxBBxBCBDDCxBCDAABAxCxAxACDADAxxxABBDBxxCBBACDDDAxxxBACADCxACCAADABxCBCAxxBCBAACxBCABBCDAxABCxCxBDBDCAxCAAADCxDCDAADDCBCBxxADABDDAxABCDBxBAxxBCxBxxxABDBCDCxBxCCADBCADAxDBxCDDCDDDxAxABxCBxABBCDxADDCCDxxxBCDBBxxBDBBCBBDCABBDBCBDBCADCBADBABADAxCCDBABABDABADBADxABACDCDCAAxDADAxCCBDCBDDxDDxxBDxBADDBCDAxDCBBACCDABCxxCDBDxxAxxCxCABCBDxCDxBxCADBxDxACBDAAABxxBCACCCBxBABAxABAxxBACxCxCDBxADDCADBDCDACAABDBDAACCBBAxDCDxBDDAxxDAxAABBxDxDDBBBCBxDCBAxAxAAxCABBBBCBxCDxABAxBxxxAxDDDCCDBxACxABACAAADDBCDDCABBxxBxxxxABDBxADABADxBCCBBACAxBAxCxCxxBCDxDDCCxC"
+Each input lives in its own text file under inputs/, named after the variable
+the quests import (e.g. inputs/q13_input3.txt). Nothing is read when this
+module is imported: `from input_data import q13_input3` goes through the
+module-level __getattr__() below, which reads (and caches) only that one file,
+so a single-quest run never pays for the other quests' inputs.
+"""
 
+from functools import cache
+from pathlib import Path
 
-# QUEST 2
+INPUT_DIR = Path(__file__).resolve().parent / "inputs"
 
-q2_words1 = "LOR,LL,SI,OR,UI,ET,A.".split(",")
-q2_helmet1 = "LOREM IPSUM DOLOR SIT AMET, CONSECTETUR ADIPISCING ELIT, SED DO EIUSMOD TEMPOR INCIDIDUNT UT LABORE ET DOLORE MAGNA ALIQUA. UT ENIM AD MINIM VENIAM, QUIS NOSTRUD EXERCITATION ULLAMCO LABORIS NISI UT ALIQUIP EX EA COMMODO CONSEQUAT. DUIS AUTE IRURE DOLOR IN REPREHENDERIT IN VOLUPTATE VELIT ESSE CILLUM DOLORE EU FUGIAT NULLA PARIATUR. EXCEPTEUR SINT OCCAECAT CUPIDATAT NON PROIDENT, SUNT IN CULPA QUI OFFICIA DESERUNT MOLLIT ANIM ID EST LABORUM."
 
-q2_words2 = "SMTX,OO,LW,PDL,UQTFWTVAVA,PD,PLKYCWNRWB,ID,A,UBX,KZOCJMROWS,F,RVQ,AYYE,VOHZ,AT,FWWK,WOW,UMASPLANLT,QXP,OW,BKVP,MVNT,L,WESLHXJOUO,BIFA,BVZ,PSUWEOSMSX,URSVFYFVRR,GN,HGOS,I,AOP,B,IZKW,GH,LT,XB,AZI,JT,TYR,NIJ,XN,OQN,DRKVNTWQDY,UDOCYDFYSJ,UECHHJRYVX,MPDW".split(
-    ","
-)
+def _ints(text: str) -> list[int]:
+    return [int(i) for i in text.split("\n")]
 
-q2_shield2 = """AEGTOTLPDFCHJZPARVQF
-TCCNEZMEMXLDEGXGXEHDRCVYLDOWLQTVEOXLQLWC
-CCFFKZPNEYUSUAFXSPUD
-SFZFWKAUSZJIBPKOGOMNOMOASRRZCR
-KIRZBBTONSNJKHPMRBBSCCINKTGEFSDYZEBQMNCQZKSXRREKYUPRMVKROSOZ
-BPIDBUNJSEQKCAASWKNXHRUMRCALVZ
-UTNKFUFHTGSWYBVLTQUGPLISMOFJMOXUFAIUGFWYALQCGFGZZM
-QMYVRZUQMGURMCUVMZJV
-SINWWRHAQTACELIQGVZRWUDFJMQQKVLBDIPQMRAJRLGGOEOBER
-MCZKHJTSSEEGPFQMKDKPUXLJMYQBLI
-CGNRRXOBZYWVOYROOGQALWAEQEUUVOHXNIKDLBOTJLWGGSMBCGYNKTCPAXKR
-ICKOYQPNWZFTVAUPGTMQLMOAPPDXDBTOQEIWFXHC
-QERASDFASDVOOOASDCYWECVY
-NDKMWRZSHMPHZPPWMJKJKCYLLNCFQELOZQAXNHSSEAQAXDAEQBFFRGWGWLSK
-RZBRBNGFIXWFPBXNJPWKTERTUTNIPHVJUQKZYAXTDLRITBMFNQFFSMNQEFHF
-OYFLXYMXAFKNCPNOQOZOHJYOEBECLTRHKPZIHMFWESIAXIVFLOVLMYTXPNLC
-LLSSJZDFMTBWAYAYQVXORUINZFAXLTIKHOOHOOOKJLONZDEAZO
-VFKECAZCJOKTOPPAODBLBUEPSJXUVKDWWTIQSNRU
-AMKUKHUSGVHAFCSDBFWFMZXLKDPZUYDMFZFHBTYS
-UPZJVWKZOYPLNKQBWTUVNNLMPNBTESXULOSHPBHP
-JJHNONTRDBBGTYHFMAWI
-PGDZTQKWWH
-XWZOQSUIOOWBMQVVXYOPIRUWFHIJCSVDVNWXDLXJ
-WSAMVIYWXJYHKWQMXQHZOKANNNKVDH
-HNAZARDKPIYJJHPQABUOEVOCOVWUSOGOUYEKBMSM
-LVADDWOHWNJZDCCXJQZQNGBMHODFHPUCTJEOJTTAJJPLFWBFGW
-XATDCZSVYOKIFMFQBNZPTVETZJVJFV
-CVHMTHQJKXYSTIHPLJAQ
-QQWHEASHSBMDNSBHLFBSPLTSLTUEEZTTXTYCPICDFPTMQTYRJDMWTTGVIIVC
-XERMRFBPHXHWRUVSKBTTZADBNMNZVJMMHJFAOBALEWAERRSUZIGSTHYVHLFF
-ODZPBQOIPCTRFTKHACSHZLJMLNVMEPOYBZBRALHLYMCDXMMRIB
-DBKINYAQOIFUAMYYWSMVDVTRAOWVJIQUICYBLUHVVDCKHEODYUBGWEDHMKHY
-WQZINTXRPLOIZTRZQMESJYJGEYGIBMJWXURUPIZU
-WLZURULQELJUUDIRGQER
-RYGCXHMICKFSHGDYLKYHLKDGNYBMYK
-RBLRXNDYTFRVKOIRJUHXITDPLAGSMNVKNHXBLQQY
-YCBMEHLCGDSMLZVYZWODEOIHHJNHIURKPJSRYIIA
-HKYVICXPNI
-SFQOUSDSFACYWZUDLMTJ
-VKXBXOJHQP
-WERTYOOOOOCBZXCJHDKGVCYUIQWTC
-IRXJLVEIMCVWYVTWLOHXMHNQKJYMSSWWREOYNGGO
-IJIUWYKENCFOTGCCFSPI
-QAFQMLHSSE
-RFOSKVWAAOFHTDBOLDQXEREBCSJRVT
-QIEYMHAWWYLLSADDJDQSQNFJFNNBYZHFNIOIKXQGNGYUCTMTSJLWJGQAOPAJ
-HPXRYYPZZDRZVFTGYNUKKMYUDLMSZG
-CXFRLUDJQLIGBETUFOOEIQVKAGPNOJ
-KKIGLDZBSZINAZJAFOQAIUAOFCQHFKJVNIULUMMKNPJPPLAIITTDCJLKSSRV
-GGXWMHUZHUWHQHWWIQFTYFVKRUPQOQ
-OHTVZDHZIG
-YCYWVIGIRZSECLTYMFAZSRXMKFKDXAMWFEODDKTMBMVLPJKJLRZBQPYYUTAE
-QBTZOCWYGW
-DVAJXJVSRDQLXFSATGCC
-BMXNOSRMGEAPCLQAJZRUDVSJYAVMKELOFTUXPDDACSLSNKBLWB
-XVPWMGFYLDWQMMFTLVVIYNMNPLJWKL
-CMDFIMJDUDBGAKPVCFYOCIULDINQWPVAHGZJMSFKCFVBYMSRBEBJEQBSVXON
-KLAZCCLJWW
-YUDNUXYHXJPQDSNCYALZYNXWFHCODLYRUBGOBIJASMOPQSOHLCVRBYXYGZZZ
-LGXUZTTMUJ
-OOYCTZNQDJXPYSPCLTHAWMHTBADRGX
-HWGZYBNLALDSRDDMULBPAGAIAREKWQDNSSEFMSVQ
-KMZCNGYFXDHSCFCMXEUGZICKAUXLLRSXISUOEOYLRRITODSUXVBZCNDPOHVK
-DVEGFXPQPZDONPEPJINH
-KRSTSFLQNPXUNYCDCEWTFQPBCJNROIZAPACSNAMQ
-PCDCHTFKCJ
-ZVEUTJGULRKTVVAPSGKBSHLAODOMEUSGEVCVBGFIBRRDSWBNJW
-DNFLCSNNRCJGOTKFZJYYONATUDQSZCYQTZZWFELWGADUJPZBZG
-AWXKXMVOHKYOOGRUTJANDYSBSMYGFD
-YPNDNOEVPJJXUDLJOEXNAATYRYVGEO
-AGBQMIBULECGDOVYVBMGRVXUIBDKALCKPCPNAZZDQGKMBBCKAEQUGFDLMFSY
-MAPDOLBFZB
-WKACKVSIEFONNJCWTCNMPYXNGXWEMBIYBIUKSQVT
-OBFEUGPZPQGNPDMDXQRYYLBRORKSPBYAZMTSDHLL
-QBOGOTIKUFLPQJZADIMFQOCRCMDBSIPRNOJZBRBVRYZBFCENAX
-ZADMLUFXEY
-JCRSQAKMAPUGUUOCPHZODFPARPINZL
-JUSTOFXSIINLSXVXEOWT
-WOKVANMZXFYMAIOOAFWHNFIKSDKHHGSCDCUTEBEW
-LCYKAAMCZRFOIWTPQKUKPNCEMDEMWDRGEOCPFIYP
-MWSIJAZVZHPRZZQDQEZFITTTXZJJCC
-NQIIQPVSQH
-HNCFVUAYVYOBNBNGCZBCIJKGZJBQHW
-HPITTFHBTRDRXWSFCWFQYRMMXBSBYZVDUYKCJQJG
-SLISAYOSRUPUGNGDVZGE
-KNWHYHGCMMWDBHYSSPLG
-WVKYYLVBNGUNOMCCFOMFFOFARFIYLDTFCTDAPNGXVWLWOXYKWT
-NAGGQYPOOOJAQOBLIOMCDDVWZDCINMGVCWLUUQDXTFBBGPVZTQ
-EJKOARYDAKBBJPVQRIPP
-XBERRIMFAYKJVUTZFDXAMBULOYRFLRSLHMORTRKSGDHJIVCITIZRTYRNLGJT
-QGNYIWJQGPOUAFIULRBRNROAIBHLJEDHFXZTRQFZ
-DLLUURRXDQATPASFAMPJOPNUBHVVUEYKCXQIPAIU
-CVKKJUWKDG
-HZVVBUQHURVDMCENBFQYHGZPCJYNBRGALOFHIFZDOUUJDVAHLI
-RYJLCQOJDEEHAMYSTVPRLBZEMTLOUMYXKNUJOFBWANPOALTNUZFVHTNWREZX
-ZYVTCJDFJNNCEKADFFUG
-CCIVGXHDJL
-WKREJEBPLF
-TQCTUTQDHKOEHAADLJKTASZMSCDOTQ
-JKUYDLSMSSDSACPZKPABCURWUGDPNCSJUOSASUBJ
-JHSTSPIGKL
-MZQKTVKMEH
-KOVJKOGRXDOLQBREFWDNIOVVFOGHEZ
-THUSNFLUQIFBKFJCXKQYEKCFWIKJWVXSVIUUKMHD
-EHLQPXOKIEHGQYBSFFNEXOOQAKYWCGDDUJEXWOCHUQZWWRWRPRALFFYEZWAK
-ZPJYAEASEJPCBXFLHJZSGWFDRKGVOEQPNTNREVMVCKGEAXJZME
-KNMBIIVLAPWIFMQBDWWJOIFHHHVYOP
-PQAFFFNAGKORNZRRZBZY
-VQPXAXWEAL
-DAYMZNQELFKWIECYYGRYCKRURLMJNLOOVQIAEPIA
-DVYBSJYFNUQZHIBIZXKMISISSWJGDWDNOQVZOLJSFAKPFPXPRXMXGJIGJINW
-WWXPALRYRTUBHYDICEDIFWONBXSHBMMQWWBJUWNO
-ZCSCGMYPWTGSDQAPAXZHLFDSJZXIVAWWGJXYUYML
-WODHUICXSODWYURTMRFY
-SODPYBWAOFICGFCSPXYGNCQBJINDMF
-SWVEYINVMCGXINKMYCNTKRZYLBJVQKOXYBVNMNSRQBYBHAUOUJ
-ROPUURSVKJNFLLVJGTYM
-YVCMKCADVTVRSXRFFVVRFDDMIGAXMGNPBXGEWANGRHHILCMLWFRZJOAWXQOK
-BAAWYPTVYXRUZQDHGHNHYOXKCJOMIBGRGIPTDSFN
-HXYAJKXPCLCCGVWVAKQIQQHTOGEPAQ
-NTALMDDFUK
-DWSTEQERHKJMGZLGGJCHTIHXHVADPO
-VCXQNTSWQLNKNXMZZHGWFTYTYKGYWLVNTSLMMQSLIQREQBSKVQ
-SOSNQTGMMDDTHOMCZVXW
-WOYOQYWDLI
-MATVUWANET
-FZOMSQBFWPMHCPCLCMQHGTCBVTHAVRHUAPGUXVSB
-FNVOIVCNPDXRJAANVSFOTGBAGHCDJEMLWIYGOJPRGTBWTYTHOAEJGQSVBKKC
-JQYHQOZTIMQBXFANAGVTRCOUNWUKMVVXVUBMWNXLCUPHCVRZNMJNOXLRBHML
-AQIXPDBDPCRYILUBYDOS
-URVJADOTQTNGAKDDRPBHMEKDJARXSM
-SZOTPCWZRHHMDEZINRSKYCKRSUXKAIZDUBNQYWTB
-SCZOPMMMHAEJMRRPKBEL
-WVCDYRSDHUMYHCSPXRVJIDSXSMQCEXHWZSIEDFVFVKTYZDVOFUFEPRTPCNVC
-WEOIZBHVCVERMIMQBYZAXOMTEOLWXKWBWQGXERSAEATWXYRYFVXYDVZHYGBY
-AJIVWFUHXYHCYSZXGRIPEHCIUZBXSMAMLPDMHZFAHWJDRXDAIQKOMUUDFGPD
-SLATWBPCAMKNKUNZEXIOKDHXHRFVLYDGOCZIOTHHNRTTJLOAOKLRSMMWAJZN
-CRMHCXVUPVMTEQPTCJCVHQMUIEPOSJNRNYFQXHFLTDYBRIKCHW
-DDSERPKIDX
-EUFXEEXDNSEAULSUBUEZZNCMORPBLTDFIAPBSPCNNCFUJDYKCS
-SQLIFUHARHRDOLSPTDSCRGKJGTHBYW
-AZXVPYJNJKQZLNGMNVJLAGZWDVGJOK
-FSUMDZOXQJVGNWWMFEGE
-MCERQZUSZIKQKCAOXSFL
-OOJIERHOUIDDSALOEAKXTUAUMJFWDNQDFCWZUAECYIXKVBNXTL
-OPNVVPPPOZ
-AGBMILVWYWFISQLIRGZZPYBISOWLICVCYVPXKBEX
-MRQDHBGRNGMNCVLMWRFIJMLWAZCKAXCJYJKTOSOEIDQPFKVIWV
-DCZTXDNEDHUYNGMTYUEJUTOQNSSGKGZGZWYCPYMOMMIBDXZMJEUFGVZAWITU
-WFINLETRSJZNBVCWKJZRWFRDQLAJPW
-JAACKPIPSJ
-JYMJFXACAWVFMFPBUTJPOQKJICRVRVVMYFGTEZMJTJUYKBMUINJVSHGAYECV
-HERWFNISQIQQJJTLWHWUURMODVJZJWIDIZBOWOQYCQBYHNWULL
-DEKCKMCYUZHUSEKNDWADGXPSBQYCPZVKVWDFTHQBWMLWFUOITE
-RIQEGPFZHYHJBPGNJARDFWFRYWSOWQCXITKPLHQPNYUYZFAZRJLUOHAWEIBW
-TIDCVEZTXFPFUGNPMVVZJPXMNQFHPTGQFQNTUHZZMIZCQTJWWLRAUZVKFUTL
-TKJVVLMTQMTMQOJASDVN
-MHVQJQTPTSSYJVEOIERZGUVJRFNKLHINWHHJAFNH
-FKBUJEWNGDWYVCWGTLWQRJITNOVFFZBHQZLRYJKKJMBJGRYWDWFNNIVQWAGJ
-KIHRDQRJCE
-EDBBFFARBGSSYRCARVHCLZFGWWKGDYTGFHJTIHLL
-XGBHFAUJYBWDNRGMLKWN
-ZUIAKLHLWQAHDCRJQVHTXPMJPTTDQMKIOPNFZNEXDHGOSNCBPCFYMNJUTEYX
-LZIQKMXTOM
-PSNHLQPNNCHJZAVONWJJLLPABZMTUTCTXGURCOMB
-COSCIHPSTXWZOJQXIDZSRMCKCBWSZCPFXALCVDTA
-ZPWSFCIJIF
-IJNBZDNGOFXQXGIBEDKRSWSHXJRGGU
-VXQHVSLYVROFHCRRRQOMRTFYHQPIVEZUWTAJNVFV
-OKNSCJHTEE
-BUZDXMLMKMMVPFDFFWQQPHFULIMZGIYYLBVOAQBOZCPYFBASAG
-VQKSYWXJURTSHAOBHMFGXYHDVXSWMHXPTJXZBAWKVWMLNFWCJP
-IUBDXFRNDDCELATZBWOI
-DBLIHHIFMDFKVNORIMRLVERAHRTONPCRKYZHRYXFSCSKRYTARJWYDSUDQKLU
-STCJRRCSGY
-BAXLIOXGVRQIMYDHABWHMXQDHHBGVJ
-OIDAZHJMDCKTVOUZBBZDROURNNAGSWTTRIMGWTMMZDHQVOAUBFUQQFHPVCAR
-ISRBFKCHCB
-EYVBWWPLYICCWASZSNYOFTIWYWALMF
-SDPLBANVOULYNJGLEQDUEJUDRYFPJWNIWEEDQDIIJTENMYRLHS
-JDMOTLGROGIMJCRPTGVBESZGHIXVJHUGNXYLBQIPEAFURFMKGYEBBPDDVFQT
-MGZWJMSUIVRGREUJLVLEIQHQYPAQFPVMWALVUQHLLSKLXMVCEIYSLAIMWALX
-AREQWZQWTG
-JPZCZGHSJWVCXDFOVGXD
-CNBXLHFNBOJUQXINMOJYWKUKZQLMIURSSFMAQNZAMRXQRINNLQ
-XJIZSLQZMDHVMPWUAJCK
-TJWZHPNEAFILDNZORMRZ
-DVAXUTGVTKISXGOFIFECEROLJIBDDAANWXMFCXUDOKKBGBYKBQZTGWKQDKPR
-SFJCJXSNBPNTTNXGKMZJXIIMWGSTOFSVGTIKQIQR
-BUEFDCJTMBBZRYCKVBJVXJNIRIPNGL
-MJUVRVLHNRFNPEFLPMQXOWRRLSRRUCHKLQVZNBPP
-UHFEZSATLJVYITYZQRBY
-YUBFLSAUMATLJRMMVWZLGXGOBMNPSRNGBAIILJLJHQBHUQPNDHQMWNLPSKUS
-GTFAJUNKDKGNXSABBBXR
-QSEEVARJTVCWITSREHVXKPHCRLBUJUHRIHVRBGGQRJQNKXRZAT
-YUEDZVVJUY
-RRYDVCQIOD
-WJMHQPABCUKPSMESAVGW
-LNKFAYHHMCDXIBOTPXDDHOPSALQCTOAUTQOMUNQL
-EGLKPACDIONYEHMJNACFPCXBOSXCGDVVPZUNLOSNDIRMSULXBA
-XNFGACERLBVDQFNQRGSS
-IYTSOHTZUBVKYGBMCQFRTAJVNZVSECEXZIPUWJUM
-LLDCGUSOIXFXJBKZSVDKHXBUKZRGVN
-OPFPIIDWYKENVSLKNHBPOGAEVEACFBFDFUJLMDYYETUKYNNWWL
-TSENWBUGNJSHNUVCYTYS
-AJTIDTXYTRUKWMNWVXZYYLMJSPKFSQNZLXKZDZVJXOAXSLVRCWVYXVKOORON
-EDMVGVFDYDIQCDWJRYMWJEZSKEKPZN
-WULZNCSHMTJFUCHJOLMG
-ZOTDKJLDEXKRFJNKOLAAWZIHRLHXNL
-MKETLHIWGSHHTYGTYFVXHPYDUWFRSK
-OQBUVVJNLVKMNUKYRQZWNRECMAKNQE
-SXAUJKTQRXLHEXULWOGO
-GRCWXIPGVZFRWEXBNYVSWUGJKHCDGVVWMLPSBEZH
-AEFERZJWSLNYWAYJRASIKYZMOACIFIKCBQBRHLBWFBTIKDEZMIWIGOVUTTVB
-HUPJKNIHMWQYCRNNNDGAVLVAPLFAFQMETWYGKEGISSRBITCGDD
-RTGTGQXQJLAADJUQHBMELRHPIVPJXIKKBGHUZDPQNMNAWRNXQNSNLKMACMVA
-IKFCOILVUYFNXEBYNGFGGWBDLXGJVTFFANXQQIVGLHXRYTDLPX
-YADCQWXVFFZVRASJUCUOASJTWFSIRKDBVELDTUOC
-LEYXBMVJUQHMAUTBXSMDMTKYYVRCJRFSNWLEFIPZBNZUPCWLAQ
-SWZOKWHUQNBTEBXRYCPCKOZULRFPRQEQTKEGZKABNEIUWUZNLTMHIANTVGSX
-VROPIQHZOJZEXJUBFWUMPUKFVVOHFM
-TUOUJAYLAPUJQGBOSNIKILGPOVUDFV
-SKOTRYLIWF
-TLLQZYPUAZNVVAIBXJQLSGVFDRNOVCFUVXIXRDDHDYPTBPIUPU
-VFYIXVPZGXLIIYPSFAHWDMUOYNBONXQERWZNUKKYJTSBLJBKJNVDNUNHZDJA
-TRSOQXSTXBTHBHVFVGYDZPMJLHMEWRTPEFBQVSYIMHFUEOGVWX
-HMKEQRTYKCEQXNLFMYGWLTPANUUEWGGBZBTMHHESBVCVDLRXJS
-FVHXAYYFUROTECCZKPSQ
-MGLPGURYED
-TZVJKKCZLRZJRAXDDHRVASMHGRDRQQPJQZDBCVPQ
-YBFUGGQEQCPXJGEMZMAZ
-RSMUGDYJKFZRWHHMXDIEQLQYLZULSNYYJORZPVHV
-HICGIAXMAQ
-FPPHDBYRWK
-AMUAFAPOKA
-LWKMXHTABD
-CLZPYMOOKURSBIHVYYHNTKZAWAQOIRCTBMJSDSRTCNBGLLFRDP
-AXDAGUDERHMEOPDCDJQTFLHYGEPHMGLQGDYEQAFIUNIAYONDHT
-QOAOPTHGEMQKVQUVDGZGUQNHTCKHHX
-GILOJLPLQH
-XYFNARSQOKJLXEWFMAYHCFCQHNIGYD
-CVKABVRXIG
-TWPYTBUKRKVPXWHWVTJC
-TMRCNYKOLHPGGCWQILFCUNERGMNXJMVOLNWNQEJRBJSEBZZBFH
-YSKOGZAOUJAYHZSLXMVODVSXPIXAOLZJGHEHJXFQ
-WGUHYLQEDDONDPKJPDXP
-MDSRHAWQHXMKLHOCSAKJEXVDMTJRXEOFCOLMEIMGIRJBXQMPDF
-MLOVCCTGCXMIIXWVBUVY
-KWPDRIUIXQUMSWLWOYCRJTFZCNAQWCAKPMADHUQSMANZAJTPPJCLHDMGRGUK
-BOXNSITXDUYFMJEKOTERRENLYHTMEV
-JVBVCWJAKPDRDQGUUTVXTJDFSSYGJEYGXKKAJAESQNROQKHIGBFUJRRVKMQR
-ENXCLBDINUMQUZZXNOZXCSRJQJPUCCBYFXDAFRDUJLEKIYRPYUUAKLMSRMJA
-LHAKKTTCTH
-PSMJWASBTYJSLWONENMZ
-YFZYWRXCCPBOZNYJWNMMUNSOLNKGACCHXFPXTXFNKXVKPVBUHZ
-TCPNYEPZTL
-HNCZLSMOHYMBSGQBOTXM
-FOVVECIXQP
-WBNJIYYXSNVKGQLMVCDDVEZJHDYNQMZJEYRTOLHMXLJJZCMKMJ
-MPGAGWJZOSRMBHIGIZHCOGGIYURDZQJYGZUVAIGGJWMZZJFACJ
-EIGQMNHILKIWFVPJBEQCMQPYHDDGXLVQDUBIWSWE
-DQPQXHOJGAYRAPSYPZSJJBARRREPQABMRFTQATPOMZKDPSSUBK
-QZBHQRLFGOSKINMBOFRPQFPUNWXUDDPDRETDNKIHKGSHINOQYL
-JVPOVGKIXRYGVYQZLHIKKUSYLNNKPG
-JPEBWSBGRDTNUADEAEOK
-XDQVJCIHJJAPFVYTPDEVFJWUFWQCUK
-AZHFBPPUVIXVTQGUFMQY
-QRDURVPNEL
-ESCAWHXAOC
-LBFMSXBMUVFIXLCNJOVAKMXAEPNPGJ
-UHBQWUIIOKJXYCEAMMGAXHSENKKUCJPLRVJCGNRGWSLBFESQFC
-SIUCOZNVXPJWERXCGQBC
-SKGBRYAUPJ
-RYUAMXZDSKKJICCTZYOYSIKGDUQHLVPRNEXDINQCEHHILUCJUZVQDMAOKPWU
-TTROKZPPQTSUTOKNWFTEDVCSPYSPVV
-RBQYCRCNSU
-TNYQFKXZIT
-POBXMSBEIBRLJJJIJCTMYSCIRAFZVWJIFDLAFOPE
-GYYTIBZTHNUVWLHKUBIJ
-RPAKJMUPGHMTAEFBIRYVKWUAFQQFMSBCVILENMIAWKAARZMZPZADGVICIGOG
-BFKZEDGJBQNGQOAMJAFHBWLACDIYCUGEYRNWTJGVNWQCWRWJLR
-VXKFMDPZDY
-SHKJDLRGLRHHQZVEEWJVBRKZGTREKE
-MUYCKSWFOWMJCJWHPSUVXVMLFGGNSX
-THTHBGHVGAWWWCUXNWOTLYGFWXAVTTOIHMNSWBJVLIEZVKYRLW
-OXZSZGZCYFDHMJUAHAOCUIXYLCGQYMHUXCRYATPJ
-HTZDUSVSAW
-FZCHUDCOOBTNSIPYVHVZWYEZZEOFXEYTZQVXMBGC
-QZXUXRIFKZ
-WOEIIETSPZSSJEDHBWVQCNFWPHOLGWEXURDUBMREOJKBFFEPTMBJGZBYONPU
-RVJXPAUDNDGDSRPZQQOO
-FISJZWGHZK
-YAPAICRDHVFZPBAQQYYEXZQEUPIWAMWOLQKRSKZTQSYKOVOLUJDTULHAJHGG
-ZYCDWXEWOBLNUACOBFLTIZHSCPNEHTPXAPNMXQID
-AHBJVADCGNTVPHKISUOKDUABEPWYGB
-NXWKDDLGPB
-KCBRJCPBNXNXDKDPLTUIEHIUYOSDEVJPGFDLXEZU
-DQZAJWCGDFIXTSTFIMYJDDGNDRLZQFMSMLFXVRPSOSQPIGRFNP
-XWSTXNNAKSWDNYGQTJRVJAPYMQFWBN
-IRTOWCJEKWJGUOKCMXWYRWBNTFCJACBIYWHFHUPTQYQZXBVGDR
-DVFONINXLLSHEVKGZCMHWJXZBSDKIJALNBJGYJXV
-JILBCIXCTYXOXPXLXCEEDTLTFITHAZCPITGTKMKWFOADIEACCGFQDKXGAOOI
-TMVOTCFEPR
-GLZKMHRGORURIURPOBZBTSWOHSLEGPUHNTPLPHCHPGQPBCLNPSBJYJKAQMMI
-UNSWITRILGJLFCJTGIKL
-NOTDGFLBWBYNPKOUEHBRLCFZQRHUHN
-NMHYKLSJLHDKUODSZXVZQNEMBKELSUBTWITZELDU
-UCNNGKDWTEHSJVRGILJALLAAWBWCKSVDYHREKPJE
-FLBQERMCZNMDRDVVDJZEZEJAILMDLCMXFHRXTOVWPDMKFBMDTPPRSOWIMFVP
-KSGROEBYBOETMEIQRUCM
-RRJIPPLBHTLUCCXBTJJJLGSTGPBASIEOJVPVAHYBURZSKKCRCUXCPQZNECZC
-IDSDOTRTAFBNLRGXBFBQBNBKWPSOYJQFBKSTSXVARZJKBRHZWPHYAEEQXGJK
-PUENSWAGGIPGFVMQQLTYOUJMTNIAXZPBVWTCOHJSRQICCVQDYK
-CNHKLTPRUZAHZQXZWPLM
-ITGRODUAZDVVJZAFUXFE
-VTYZUAYCPGTWZUQEJFUECWEFENUKWV
-TJRJTWNQKLUAZIHBDNMGSOFMKCEHZE
-FVTXPDHPVCJTXOONZNXPMZVBMKXURNFBTIFNIKATGFUMBLGNSNTYXEWRKEEF
-QKNNSZJENCYMTXUPOTNIYJAMESXVXETGODWNSCPGMCHDFLPZZV
-AYQDEKYNMKNNCXQTAQXJ
-SOYCALIEZWOEOQNRDIKVNKTICZTLEPJAGRHJRXZNOEJBAAIZQPITKSNSOVKU
-JKDGBYPXOGNGWEJDPPKGNBRFJCKJYN
-IHXYWRMYMSXGWCZWCEXORRKDZGBERGMWWSDSQMAK
-BSYNWYBRFWSZXZFLIKXM
-UEJNUBANGHMDKGXEDMPKSGOFXDOITM
-HHSTMKBBCWYXHXJSTTKAKQOWUQYXYNNYFTRCCWFWGKWAJXJQRITMDNOPRWHM
-FKGBZCYWWJ
-FFYVZSVFKM
-GJCSXMKVLMRVPIMKZBIMLQDUYONLENBVRLFMZPBIUUWZOCPQAIDLTNHLSQPM
-ORDSMPBQILQLUPBTCCGHDSFWBKNASRKTUGXZNTDYLRWXCTAACCLEGDBJXOEJ
-SJFTNPFLBZAVNWCTDNEX
-IGNMYOHRIRDRTEVXNXHYECFYTLVGPS
-CLCMNOHRZW
-JSIBVAPNFLANTTMZSCOEHPQAMCGNGO
-FRKYKLCDHM
-KIBQBEPZEOWDBRUAGVVVPYJHJYJFPHQIGKRZDGBDCNWQYUMLVP
-YYLKGNFQBYSYEKRCIURACKKQSLGRCSKKRJPEYZYBMAKQGVRGDU
-OYWWZLLEBBLUYILLUNHDTMGQJPKCCN
-AFNUHEWQPWXJEKFVFBPXIMYIRYGTYSEFKBYIAGUS
-FBSSADINVCYOJBFHKXHNQZMQPGFTHNGKSGLANSNEOKSMOFXBJQKESVQEOEEJ
-LVYAMUKNFOGYZAQCKOXK
-OBUMTBEUMI
-LOVCWVMMXLCWWCXCMKGP
-OAIYBBFKHZQGTDJSDFPFVOUAHLRYNR
-HIONMYVVSMUVYXWVYXYWOMYORWDNIT
-DGBHWQTUWJSGOXPAVVQTGDVSFPUCPWNZGILUKXHIJAMHMCRJAQ
-CIIBMWLWYHUQOZQKMJYEINPAUWPQHRRXQYEIIMSWJIPMUONDOU
-FYOEDOQKKQDERENOYPQITTTHDIAPHNSNWLMEOSHB
-BWHTUCJAWAIBLDJQKHUAUYKPXUICPQIIFEIIIZPBIFGDHDNVDPMHFGFLAMBR
-AFRTKJHQKDTJGGPCNJPH
-NESYJXEGPMMBZCIHLTUNOZLKIBFWDTUSSKPVHUOW
-XTJBDKEESIEXLKBJMMUUANMHAULGFNWENLOYQHKCOYEASDYTUJWVVRVVOJZU
-VENXDMPUICKWQGFPWNGG
-TXMZZZLBHAYHTYNIGCZYWNSGATXFHEWZOQEABOAOUOUWAWCWWPAQJLRZPSIJ
-CBFSIZBETWBRZJXDJTHQOOAKIFKEBINHAJSRTIUBBNKLYZTWRTKTZGDANPUF
-XLNRQHAIPLUORRIWCRLUHMAAWGHXNS
-QKOSITRAZGFNZRKSCUPFAOCXDGRJOWNXPCAKNDSEOFWHRSZTCZ
-BBDREAVNXMKVDSDBJWPQGCZGOZOBWFNUBELXCKDNDKWFGRPRUT
-CDUQNUPTFXVVKZYPSSAAMZNZVMUAQE
-NSILZRDVERPHMEKZKCTFCLJCAHPBJONSOJAHIIDDBPOLHUKUGXUECSKZEWOJ
-ZAEQXPBVOW
-VIALQODMLVELNPWPVSKHFMEKXEOHIGFCWGPRKXFEWRSITJMBEZ
-UKOUDZXAHVJONIWIXPAHECVDGJNEWS
-NVLUGOHGBIFBHRXCZMHWQUQBXPMXTPFOJCLWMSGL
-QXDNQCFJQYUUCRVMOREEVWZUMQGUELLYCMQVRERDVFKCJDVXBDWKXCYDKRVN
-YBMDGQENKMMQUPVNTLAFUUJGKCPYYM
-QLAALCQCCSJWQQYVXJYY
-MKCZZPEMOXVFJVOZPTBFHJGLSWTJBVCHTPSSQCRN
-KSPUREAJOGTAGWEUZIKZDVGNPQJGJR
-FDBSFCOEPE
-BYWYNCTPAPYZPICLYZHDKWNVEJCPII
-SZCLVCGSBL
-DIZDJMRXYZ
-LMNBBRUKFQAHYJUYENMCHPQCNJAOJXCDWNAKQAYW
-RWWZGTSTSUQPEWKGTRCJUHEWYOVUKKEPUNNWHJXOWTNMIUTVSHPOMGMRAYNN
-PRCCCKIROYXEWJCUWGSICOYYOCKSHEMLWBDEXHKV
-ZBGCNRBCJWBSQGULVLVNWKPDJNWARIDQEZCGVGBRKEKVXRVEGSYZVXIQCDQM
-AXJXDJHEQKRCUBMPOKUS
-DRHHTYWQBLUCLFPOFHATAYNRNXKLUE
-HHTBOCBOZFMCRDEXUVFCRXUYKADEGV
-FWTDANSEYM
-ZHONSIQDFYRXPQICHNNTCOQZFUFOIFSZLQJPYAGQ
-MLPFGPAPGOFGTJQCFQQZCFABYOCZZX
-EDTSAPAVYICCBMUPNORG
-TQJSCPXLQHEQJDHUEQPZWZTVHBRHLOMHEFFVSYJNCZEUDLRNJTJKLPHFFRZS
-YKGTWKWWSHPLJCDPQOSBOVBZGCFGXZTSLEHFETSBIWUKHTMXJA
-YWUWTMXAMMESOQAAOTAAJXUKKXLZCIILWLPABWAVUFIFNYUMWZWEPRKWLETP
-YEFXNYNXIWEJMBBXTBKDSLAEYSSUQLQYLTZQAKQN
-EVESYEBVOVPCFJXHBXTLWCZKVBAOCPLDEKTIIAJJ
-XBDFOJFJNIQHDBTEAYGJNBZPLHIZGVPLPBBEZQUFERNOKKGWOJ
-HSULORHMSLPXWPOFBJESPWMDHEXGJY
-URALHGGPXJFDVEQRMNBYRNQZZRZYLN
-EKUZRAUWLFWKCHZRTRGM
-EVPDDGEJQYJWQHYZDNDDAFTVUJUZWC
-PAZKGRGXDSSNUMIQUWFODGVBDAUAQFAIVYICVEVTSALWSULVGU
-QHXJKPIETXZKHDJGNWHFYEFVEWRXFIUKGDEABZMTFDXOAJVYDD
-VIGNDMXZFB
-UOPFQHRMQTUFZIDUBOFZ
-CVFYSTPNWQYHDJEZGBFMMRXLCHKJWKRWVYNRUQNS
-CPLRSBBARO
-FLMKUEIBNSGALGPXMMTZ
-VROSAMGRAN
-SPGDSABYXMTMJKVZPZFIWNVVXZUKKTGLLYJNLWSTXMQPUKRPNN
-UPEMDHNYIM
-RXNMUWUVFM
-KWEHMDKGUM
-SUAXHWDNUUIWKMYAJMWD
-BJJSISXYUYCXDFKNDWOV
-NDNIOMPMXOHVTRMIGKIZRYAMMRJSOJ
-FZFBWOFXJVRTEPJYNEKP
-TRBHFLPFQC
-EEWKUOZEND
-ACIHIWYDKA
-WOWWOWWOWWOWWOWWOWWOWWOWWOWWOWO
-JRKWXKOULF
-ZCXGYWDYLOPFVPLICCAUDICOGSYRUWUNEIMUXSLRTUVAKMLACQPEKPJCFJTB
-YHFMDMTPMJIUOANVBXNLGNGAOEHUEOFWXTOYHWTO
-UBHJGKHQXQ
-SPRVLQKBISBDJYHDAKHJSZWONGBWFRTNZSHDTCJY
-XUWEXGJFINBBGHJXNLGJLNRIQMKUWRNSQCGLWZFK
-LPBUQNYIQITJSYUWBHCKKWIJJTGRNIOLUPMHYHZBQUEKKOEUIJNTVIKKCAQK
-IQSWLDRBWLPGOVRXBICPPTPTFHOWGAHUDEUSCVPU
-DHRXDVNSQRHJQBXQRWCWTLDFTAUAJKZRMLXFSVHWBPAIBNOHUA
-QCSTBXEVMTOFXEEBNSUJ
-TFCRRDPAIVPLIEQJLAQXQBGPIKGXNDWZJRFZKDOQKXJGOQVCYHURINMUHMGE
-FJPZDALOGO
-QGRQHNZGAXBCQQFVSJZQ
-DTIZMCLPTHAQOHULPPAGCEUOUHAZHDWITRHDXQZUXKJPAHCNAISAPWZPGTUN
-PYZPCVSWMJHIZOCEWCSU
-XPKTANUTUVKRVDEXTGVDNUZCYBBVIKTKUBUSFDCC
-LUKVAZEQHTARMUTXGHECSVNKZDWRSODQPTCBSFLVJQCFUWPNYI
-PDFJOGHFUDNZOBNAYFCGFTCDGXHKPM
-XMKXTCOXDLOAPOMZXADNJXVMJHZQWNBURHKERUEC
-UVJLMSGUYSOKOFQFXRTUGQMAKVGWQVXKHGIEEFPDCYQRBRJUGP
-CUHWMEBYDE
-ARQRXAOCYGUHUWNWWFVKQFSPZSLUFLFXIDGWAMCJ
-LTJHSYJLVMHNNRPNSARPIIARXNDFYI
-QCPREDWGMZUBHCWVGEZDZYUHYKZZYYYXBGXTOUVIWENJSKECEH
-JJQXCCIWAFBDGKRXMITJTFWEWRSQZEGWFIKHKUGQ
-DFNLMFCNOXYVKLVQLTCO
-JHIYKQSUMUAQMAUCLSSJ
-ZIIYLEELUZLZWNVFDJWLPVQHZCHMCM
-OAGVRMSXHLJQFEGMOFIU
-TDZKQPLQNZTSPJOWKRCJXMBKLLCYFDNNFEENUBZC
-ZDXJDPSFSOGKXEFPLRXIDTWABEBVDHRAPQOXOHQCNNWSTRJIIKTAYSMWDHYR
-TVQYOVXNVCUUUYJLVWIPSHCXBYERIR
-PHIZSIMNUXOGVFBQBQOFVATOSDBDPYOOCZEHJMCJEUHGBLCSDEBKCOARYZOU
-ADQJMIDFSLQDZGDBXCPB
-ZWVTPPLZCYNXLAMRBRGN
-BBPMOVOXZUMIYVVRDHVLEOIEUBETWRTIRIEUOPZVVPGRSQGGGOCUGMTMESUA
-NHLPERNMVBZEJFRAZOPHPFGHHSGBFUOIASUFQVIAMPHUUOKEPEQWUCAHXIWN
-STQNTWADIU
-DUMUYMMJRTYLJLKIXOAG
-NKGVARMXMI
-RKZLEEKFUYFKWPOSPNPZCACRSAYAQZWISWNIQXPG
-CLZMHQSVZD
-XBIWOPUTDXZIFLSDYZGMDBFJHCVXEODVSRBGYDCQ
-UWCRDJKADXPIVDALFMICNOADRWSUFJJGMGMMMCRABWYIXWEXYT
-QXJRBDJGOVVBBVFLGIPWIEBNCAIRVDSWZVBHJXJLGPFNWVQCIR
-NQVLELQMSZRCRREBWQAFONNTUDWONEGVZNUPWLAB
-DHFKPWRNJSNAGUXWYERZ
-XNTJNVFKND
-RKVXKPNXORPIQHOHRVTKKKLTAPDOCZYGHTZJYKFE
-ELYQQPKDRC
-ZJDWWIAOJW
-HEJQFKUDMKLUGFQTALLBLQDBXEQMPG
-NFLLCIPIADGHDODFZHKJVCZMHKHAHERICSXTORBFUAIYSDYEAW
-IRBJAVACGWGQECPNLSAABAWVUURZNNFVQLWWXRMO
-EMUDKLYZZCDMULFFJAFFXEIRXLBXKLUPILEEQLWAGCPTZIRMWBUHXBKXOHLQ
-EEPANHIHVUCZFGHVFKNT
-IFOWWPEFVGDNFSJJGCTXOQKLEORFMF
-MKQAQTUMZLCNKIQRJWBBBLRXFBLTRYNWNZZLGAZVLXREPRVJGH
-ZKSVRJLZXOEFBHFVHOXNYEABSJYHQLEDBNNXBCJZDXHAQZFFNZSAMWUNGEBX
-ECABJQOKABLHFPYIEXNR
-YUGRFDHCXPLCXIYLANNFFAXHAHSRJCBGQCAVMWPC
-AVFQTLGBFBLHOIDBIOGODADKNFKISA
-SDUZMAKLJPKYFKQTWDHAAWZGRBDNPKAZIFFUDPZJYHIMIPQZMGGEOGYSFGCO
-MAHKTJBRCI
-PIUYOUAIKSOZFIMLZTCFFCYSFQOOUZHQZMQZSYTIGUSIFSGWKJ
-QMGDTRYUSSYNREUICXAP
-NAVTRCGXNQNUMPFXJZQGBOGGJUEJEMHONAWIXRPX
-CPBLUIHQVSJKSFAIKGSIBTRYWJROMYJLDXHRGSRL
-DTUMUYKKHXZHCVNOMWUHMOPPKOYMDZWJAFFFFOAVWQNWYFNQUI
-HTKFYBDKJIQMMLMVEXPJLEAVUBBIJJQHYALSBDAQXUHNUBZQKIVMIAZCUJPQ
-VVXZUYDEZIQXYFOEVDHWFHAETFFYQIXAISKSUFQVNTRSZXPYKB
-KFLKUCPKGDGKGIQIQBTFNTVXCQQLRQVFLJNTCRLPOEATEEQOWW
-DIGXYTWILEYHXBUEKZOX
-NQZSPQJILXGCLVYXSOBY
-SKVNFHWXHXIEBZEBUUGMJXPTNBSZUK
-CGOVNROUAMLZDQFLCKAUNFAIXJBEOWXQJLQRGFRL
-JXCJCNBTBQXSZLOMKQNJ
-GWOISYDDGW
-ASUBSPYEDB
-EMGGSHTANLTHAAOOWEAQ
-JEEPIKTDBQVHDBIRRASG
-VWMWZNJVPG
-ODEZBSFVUWLPNTDLBKON
-TFFXIBLVOTCUCKVJEZFPMICJIWQGJBAJFBBZUKMH
-HDNTVBRQWS
-IPMLFJIDPKDDQFKSARNDNICGWAIZBD
-UGCLJNYPKBPQBRFMLUAYYKESKYDODIUATRTXHPXRLJPBKTINSN
-RORAGLFDNNSKZQHQUDTUZYXMQSTFWURLBARYDVDGEQTZXDLBYL
-GPTTWVPYBNZZAUCUXGPNSWXNTGSSNSMXKKGDRDNM
-ZIIMWHUMTXOEAIWNOTFJPRWMGDOZNAMSGEHBYIUXRHBYIGTJIEEHCFJLVHBW
-QOMJKJCBULGQOJTFIAGNSGBOMVQHXKLHBSRQPOITFZKDJDWJDVKICEGBFLLX
-TZAELPUONDVYIFYNDGWGKRPVRFEAWIIDHULLBZKLXBJWQNCUEE
-NZVTUONWELALQGDDVXWOFKHVZMEXFCYCKPOZKYBMEWKIAAMWII
-SDHSABMLPZBHYYJGFGXIMZXPNAECMIVCYMACAPTZ
-GVFKCLDHTQYGRCRJBDQMOHFGXAMIGXUGMZEFBZXKREYGCEXBKW
-DCPQMOVIGOFHSEOEJVPIYHHLELEHYVMSUSWDGYGTRVPPWLBRRX
-UUEBSOMZQAMSLCRECYBTHHJOKRQDYV
-BDPASGMEEAZFHYAREGDE
-DTGMHHCCMMBJEQCYDPCWYUPISABGVGRFGCXFKDWQHOKVDPYFLM
-LYAEFPBGZOHOUYXKWHJZDJQRZQJORPOJPNECZFGH
-YPBGKBORRWIAMKZQNAMRGUURIJBXVURVNSSIYZNF
-RVLYCVSIZAVHCEEBQUYGWINMYGCMIOYKKYAFKJWGYYAECOZJXNWSIEWPYJUR
-NXPCZFUDNMWRRWXZYRUEKZIOBFBXPI
-NEHFFLBFEAVWICFSOABXLDEYUGORCN
-KONDRAHMAVLNANCTBHTYMTSFJSPVAZISMLQKWZQMAVLPMUVUIG
-OKGNWHAFSPMETQQMSJUDZBAZAASGAWTXHFPXYWMEVHNXMETPWL
-HJAPPZIHKDMLKSXKOSPYJTLGOTTKPUPVAUMOJNFGNULGJGSASH
-ILLGXQLKTQDFYIAZZMRC
-VBIFVBAYRQXSTUVXVVWMCMUQWVXJZN
-TKUQUKLGKBXDDXFJNXJSLMYWFUDFMPCERZGOFICYNUTIVPQIYI
-WOMAUVHKYIPLTKWVZATCGWQGFJFVOXFNXLBVIUBJAKINLCFKGONANSEQWSIF
-HFABBYQKNOUGNMHHZBNFOWFJNCTOHAIIBTPROBEUWUSKFVQOQBVOMBQZMQSU
-STICIDLHHKOQZIEWORVQLNXOGBTSJPYAUURIBGLJ
-LIGOBYPIIFJGCOARILVB
-CCNOFGLMZEWVPYANFPKG
-XUDTXPKKWV
-KZPLDCFHFCLZCUDROLDJLNVCSJJEOWTJGKRXMFNKGZQFPPUEZGCTIKZJRZUG
-XGPNOYFVFLIYPRMGYBDE
-YAINNKVWKAKVYDGFFUFPMIGHXSTTXNIULSAZYEFTKGJELFDVUI
-MTPYWCXRQBMZDOTPCOWZLOIPGMKPFSWGXBMAUJNUGZFRFLVCKUVVLJWRQALT
-VUVBAAEPMKCLVISZKSUJIUISDAZLVEZVAYWWNXMO
-WRZPRTRZQCTLNYQNZINS
-BNBZIISNCQ
-CBHEUJYVNUVMVNJCNDOJWRMSYKDHSMYHAFRQNUFGQGOJIZLHCKHZTQVLTIID
-QDGCSGNHGOBVXSLUDMSEEAYZNMTMEDMKQQCPFJMP
-DNVPBIMGPVXWMFTETLJSBWMUJVIGPGZSALBGBLNU
-XMHHPRODZYUBYJCYKKKDHJYGCHTRUUWUBZUGFTHLSGKYSUHZQK
-MOECTKKVEDARCOCTIVQM
-IYKVWKTHLYGJWLMEQLUJRINOUGNOKMTOZWBGXWOE
-JEBQKCWPCFLHBGGDSUGUYAYLSLLNJG
-SFADSSZZDAHVTWQQLYLIVYCAJLAVQAKSHJFROSPRINKSLXCDBS
-WIFOVCLILDGJISKJFOAEUVECHCHMEMDNNTWRQZAWHFRPVNQSZZ
-BSVDLXQOTUJWXCVZXIYS
-UJRHTXOJILOWLEZEPMLVLXLHWZWYJAFMMILYSLTKJWGHEEPWAHMIJKPBKPPP
-SSZSMSFXGPGZOQMTJHYYVDNTULUDDSYTJAGFEQRRMWDVAHQENJ
-HXOIZTYOWHCEEHXOVKUAKQRHMWLLOMFOZWCUOTCZ
-LFTNIOYKXOYJSFGMRMEOATUQQPVSVRYADKZTUQUY
-TNUTQUJRXHIUVFWVCFJI
-KAVGZTLMCH
-CTZBMDSASBCGVVBOYVSUOEXQUVPANE
-YFVVWPVNTNMZCRKJEPNIRCYWIHVJME
-XNKCRYAWWW
-XIQXOZYWENMKLQNTGRORUYYUOEYRJWKWPKXFLVUH
-YSDGUSELAJPATIJASNMLEXANQVRPGK
-GDQQBNWFDNJJWPVVUNYBYDRKNCPHJN
-IWZHVOHEFEGLDAQXFVMACMLXZNCHLRTUBZYAACPJYSKDBWVOYYUIHPKRKMGF
-VLSICBYYXC
-KCUHJKWUPDJLQCQYCJIEFHPMRJDOKDVFVPITZODSPGBLABYMYBYWDPHDOLAP
-JKIFWFBLJGDFYFTFYWCAGXEIPFQENRGJWXUTPQEPRUFUPNVOSN
-HMEWRUVJCHIGRWKMTDPQXVUSCECIIEMEXQEGAKJIHUTUYEOCUXUVBMXQMRJW
-LLNIHEVCAQBIJCGJDSDSLBUIRUGKIQTCQXORREPTOOEERCQHILFNLQOCQMEM
-SGSJODUBYU
-YXSLXLQLTCJCYJFDMVQNPHLIALJHEJAIOCBEJHVU
-NAQMNKFPIJQLCMDSUSKDQTYFWCRBAXMVICNBFKUT
-TWLVQNVUQOKXHNBXEPKD
-PHZHWRSCFGNZSYVMZQOKZLWUEZJBXZRQDXLWJIGESKFXQWMYBT
-UZSFICSBVCCUYGYJMTHBNVQNCQUABIUWFYVYYWMP
-TYMQQQPUQZEDTBYMKFNJUBDLKGNGJE
-MIDCXLYPOIHOPVBVLIUUCOQOIDWTKT
-RDSGZYRGEHDRJHKVLMJPDVFJVLGZBP
-ROJCPTSCAN
-NEJBQALXQDOTNUEVRIIDVRSGTXFDJLHUATKJVWVEPRBYQGJBAR
-RZFZEZQZIPFFOLJNJZCZDOGBOSZMCU
-VOVILVSGFBGWGNJWXZGZSDRINLXNXGGYTIXWSKKUGYEXKGTNRQ
-ATFKYCBXGXTWRNROIPSWGBMVMGVJEKQHOJYZWVUZMLTFPSPABZ
-LPGLLBQZXROHYDENTNTGTMVHFGHFDEFUNDYYGNINAVLFZGPUSY
-IBSIUCUHYRBUAIKUTIHFKKZWHDBHDJ
-SZIOTSIJOPOMGULEOHGBXZZKKPGAKYFNMDEOEPFZMKYNYRSASILGGHAZAKII
-ZBBPDZCMJRAFAXRVPETHPWBVSQWUOQXWMEAGWMNFQJQCZDZUMR
-FQAOIIXOZBEENDUEZJXE
-JFNXZDOUCREABCXAEFWGYUJDMGVUHO
-ZMGMTWIXJTQAKZINQNEQQMTWQMOVWN
-GYRZFYTBCUTAZYLCXERFHAPKJMRHLWVCMUCLIUGHPLLRTJNPTZ
-KJXYXJKRIL
-MWYIRNGDHJSGIJSHXROBTVMIALKEJHWXZNSAAEMH
-LGTBSHJWIPTHNGINYPRGQXRMYIACTT
-QEYRUGATFGASDFOOOCVYACAYCV
-QKINMDRVCZ
-OQLFFVWZIVHEQHXCHRMRNXDILWSISSBVRQZBVCLJBANJVPOLRTAIGCGQLFTU
-BGWJXFLDJZ
-UWSWVKCBJGJCZRTJJJDSABHBYMZVCEYHSNRDTLGOSEJGOZZUBOJNUVGPPNNB
-MVCCPYIJGGRRGSOUATZL
-JYGMYYQJNXDECPTECWZV
-COTEXKBEPBEQVAOVXCCHUZSIQODSDN
-AKNRJGOPOMMKNVBTZXRKPDKCDTBMLR
-ZIJRGEDKCGLWNMRMEZPRVFNCFJLYMGUSSYKTOLGRZBDTESDMON
-PLRXDFHQSKYMBRQRKGZEXNCDKLVVQLQOUSFDNLEM
-BKUTTMYGTSJCTXYVMVRPVOFQKGYJNEDJHOXZXTTEHEWHRNIKHO
-EQCVYWUWABPQGIHVCDGXILLRLLTDKOIEYSJRIFIBZBNTWHLWEJLZLYAAYLQL""".split(
-    "\n"
-)
 
-q2_words3 = "EZZNGABKZV,LGDHVKTHSF,PVNO,N,D,DED,JP,IM,DZVTIGQPXH,DLXC,XFEI,ICDX,KEWC,BDZFFBHVUQ,UQCEEDHQSK,ZY,ISBIHRJAED,BBJVFILJPC,KYOBSEVPVM,OQQKVXYWMI,VPI,JYGO,FQQ,AGTNLUAPZK,UDIEILMPAI,ZSK,KKUSBZMQLA,KM,LS,XZHBFNDFOE,PNZ,ST,RON,NU,YWQ,G,HDQ,LHQ,MEBD,XZVQ,BM,EDV,GEQLQFJXAT,XJ,LYW,KDX,T,PEKI,DNZB,UZZEVHFWHN,YYBT,EHY,J,OKZC,WFC,SXRX,LO,GN,XRMTDYNONI,XLIY,H,RPWQ,RBPSSUNVJL,AT,PF,Q,RVDFEERSSP,ANDN,SUXA,CAD,PX,EB,LOL,F,Z,KJOP,LIU,K,OO,LOSMKEKNCM,PS,RIP,FBJ,NR,AM,XMU,GWYC,ND,YAZQ,BZ,PWZBJJDBDQ,KMH,FH"
+def _comma_separated(text: str) -> list[str]:
+    return text.split(",")
 
-q3_armor3 = """HXAZCVVIPZXLDHZNMSOSUAPYHTEQMSTNYIONYJZISZPRGAROGHHZUEBJNVSMNIQASTHPZHJNUSXDNDKCVIORMHJKEBCGOJVOORTSAQGICKBEOXUWHOJUZLOSAHRKFGODNFDPEQGLJWHPMLAYMFQPFCWHYBKHPRUZNTLHJLJSNBXSUIMXNZBJEZOBZMFPDDBRZDTMYHHT
-IIRPISCANKFINRAEYBJIYBDFDFARXYHQATNMTXBTMRJSYQECTQMXONKJDJKFTXHAFRMEMHFIHXTATPNJRNZLENBDRDKSLUGWJKZSAWAUAVUTYUUVFQJDLWEFZBFJVGOBTMSIQHNMKJQHFRGMYEFEBYRNYXDJMIXPAWTUKJPKBRQZGAIIKQEHFVKTHRKNCLRRDXPXACPV
-CVODPBJROOZBPNUGEWBYTIYBBREIEFDKRCSYQKDAEVMTUARUDLNVXCSXSPSWSENCTJHZUDBKKJWRAVOQYDSFICRIBIUCDJGXYWLKZUENQKZAVJJTGRFPZMHXFMCDCRNSDHPTDKKXEFETNYHQGKOBNZCESMJWUFDUJEVCTPTETUAHUOHQYAAIYNMWNWPCHIWBEPUTZNMS
-NAYPPKTHKMHDSDIENBVYZNHVTWAPAFGBGTHNWBUHHJHIQTNTKFIYJZPNKEEHTSREMFUVHNFRVTZRZACIEWIYMQORXSQNKTIGBTCOQGOSXTAVYZQSOFABRNQOLQHJRUZEGEVZHUSWPFCSYODLHKQLSOXPLSUSSMPTYNWKLLGFOFWKDWTHFVUWHETFWUXJKOHINGJSGUKM
-BPWCGJRYOZHIDDCJSOGNTWZLSJSWWTCJXBFBLDLRHRKNMRINOSVANQRLTSGDFZAPYPTDFKYMHBCCXLFBMKQMBIUAWUVNZQKJHGKWLGEZJOKRZUGOGCQBZUNQLHHGLIEWLUIIDPGXIVMSIHYJXWZUYCBURYUYLIQUJRDZXRTHQSJPAACOWSKNICVJJICKJFFJTNYTHVIH
-WKLMBKEETQTKFKYVDWPEUAADSMBBYHWYGUMNHFKTOCMLOJHOGAGIKFTRVASJHDDWCXEXYFVLPTLLOGASCPZTYINREJTKOCKPJQTADVMFYQYXNPKPOKYHFBQYRLAAITYMFLLRGIPJJPPXYXLPSVDXNJVMIMWTIYSWHXSCLSHRJKLXNWOXTOHKWHBSAMYUUGDDUCAZNITO
-GYNVLJSJEWOGEFOQDEZEXYMMFEQFEHXQMYSCLDZPISQIZTBSZQBATSUXMZTKRMVNMTNQZLFGITIRPZJGLJBZREGLJFKTXLBUKHFSSLNQMJIRQKRMKXVJDDXYEVVAOBCDAORRXQDTIWECGWFFIEWSMKTIVXVNABCNBBPVUMNBZILZANEYWZYVATYHTHOXSRMCNXOJZCSO
-CIAEAPDXEIMNAXLZNBHCMOTYARBREZHMPZTGOEYJOGIJNUNPQLXWYMIMJQUNUHCIYKVHAIIDIIPSSLOXUZRLVSQIQCGTGLPCUGIXDHHYMUYXYVZXABPVMLVVAPHYLSMQJJLGPVTHZTDAPMBXAKGSMESFLRLGAERVZSIGVOMYPLFPZMQWSUAEFSXUXHRVMWEUCYTBBXAL
-HAXFWGHJFQDUHNHCGWOLPONNQNGRVRFMOWFBINUNYPVFPHGDUBQRGBAHOVOECPPBCGQMELQNCAYHLIKRWZIBCQDPIIYJVIRIGBOFPYSIXORCLXTWQITVIXIGKPQTNRLFYADSVGVLBSWNQOWTOLOZGAJJCNIVXGJEVXRASXABNJGJEOEDFHAGKMDCBJEUOYDVCWIHHKBS
-XZOWVQLZPIIGUUDBLDQTQAZUIRGDHOYMQMVNTMZQVRUTHNBUJNBMNJGNLIIFWLURFGFPZSLXBOGCUEYOCFCMHWCKZRTPYFNNKBWBWOGXTSFMUBMTRNREFSFLDTKIUDULANPSWCSUNRKOIEAAHCKDGTBPBRWKSAFBRWZTELSIARDEEHJXREWWVPEYGCIBLFKQNAURUQSF
-YSQRBCEMERYCOKZOLCLOKRCJZMSOPOHFVZMAWVAQIXYBLBRTADFPTXWUCFWBABXLDVDCONLAMQDGEUANYQQHPZBPAQVGWIZVZWMKBOKBAERCTRLGLKWPFPLTYETLCXZYMXOOXZKETKDWHALCGNUEMZPQEDDEQAVKLJMKTOLZZUSXKASTJBELIDFXVVCINFYMSLOVPYXO
-XMGXEIWZSWOVTNQMCSNMNATZITLWQMVETSTAYZAVRLVIUQFZJROANMTOSJBWLFXQZSQBSIXYVBOWOEEVOVWCPQTYOPDTJMWMMZDHYVUWGQCJWNAPPADWSJYDYBMFZQLMGFOJKIVLHSKDQXWPOYLEJSMNUAFEMPBBXPDZSNWTTOYRNEWIJQDPZEJXLNWDEDOUGQSOQSIJ
-NIBDWFSTJTMBEGPSGYWFDUGVHQXBUTRMKQCSBMBAHLUOVGNOKJPHURADRMBDLVLAQJJYHJBYVCXSOGAHFUDVDLJCZZVVHQIKVEWKYJMYHDUYZAYFLBOBTBBSBXRQMHEHCKRRJNTFDLKAKOKBTDOGGKBHPIQQKATABNZOOXFCUZBPJXEFPJBTLZVVSVMIJQAPKMPYONKF
-OQLZODDLZMFFTVSHYQBFQPNWILNHCAYFJZSODRJTRZVNVAGITICPYDTPGVOJJTCFZEYZXHBJLKXTSMVGVJCXSFPQHYPAYXSIBDLRZZMCCCMEPYGYCQXTCKBRJPMCUPLHQGJZHWCZUJIAFKWWMOXPQOOJTXBKWENHMGTJMNTWAOLGZIAKQBISGYSABSFNZAMZNDYFLWUC
-TOBTQFQPRVYKXRTSYCBFMFGGMRJPDRWWWDBWROCJVILBQNCVAHRFQVEJBMJQKAWWUTLQPTNOCOESWHREIHYOSYRUGZQSOHMMPABCPGDZGZDXVLOTUGLFZMTDGQHWCEIXNSVCQBDPQEACYQTUOBEJXVHGVJORELAVELKGOOZEZUERJKJMSFRWRHIMBAIMUSYIMYZMXCPI
-GYZAKDZIKERCTBWAOKUQBWIMXMCTFIDXVYCBCDMMWNDENCVQKLTCWYUEEFOLDUJTRYSKRYVDLWNFFKNDZPVWJGJIUXVYOXVWLTXQJJJTFUMQAVVRMNIWJRBPWVYBOJEXDFAZAIUQYPCAFWJFYMNEWFIVVMAMOHCLNAAVLLQRUHKPCNUSEILUQZRSWFAXQMDUUDSUVRQX
-TJOHJCTZVFHZFYTKRSLKWINXTEETUBMJSOTTCOOXCCGHZKEPCWXIQGQAGJHLWCOHXFUSWWJJNYLBTJXTZXOVWDHUBVZEUOMIEYHOJSWCGSBJNFSZAHFJZHSPHUTAZUAGCFNZNMCVPILUNEMUIZGWBAZHEJYQADGQDFTYVSEJBMEKBSUXZWGZDPLKENFGGURTPEGRBGHB
-NFTEPGIBRHZKDPITKYJUMSWLRVEFASEWUKLIEIIWFOHWAVTRXZQCXQWSYCXMSYDOIZRFLWHMITHPXYWFBKUHXIIWOCDINLAKLZFEVRHYEADRSBFCKEWCDQHGJGEAFHCVYQMLMCMPXLYXMHGADYBOBFOMOYWCGYKYJMBTVDEAJGEBPUQOLIYQUDVZWEYWPGZGPFLCDNCX
-ICSHSJXTNYXTOKEHLIWKFOXKUYUQKNUSOTRYFHLQYTOCNIGTHBADNFUZVKATSHMCIXCVBXRHEKJEVPRJAWNVXBMVUAXSHLTVNXZCOAGCWYARRZNYCWGCQCQRCHFXMCBHMQZNFIDNEMPNVEPQCDJNNCCYQUVSOKZMCDYAWPZRNSQVDWHTOOFGQMORXFOTRYAVUQKNIPDL
-BECLDMFHVFGNMCUJIARQJQFGOOHUZUZECQSTVMPPFHRRXLOGYCQEUJFIQNZXIKEBACWOAIMYVBUXVRRJJYOKKSPBNPMJHFLJCIBOPZKJBOBFMGWOZKNGANQNKFOYQBFHELIEGDNEDHSFEZVEYHSBPWPCJMLSOORMXLSEVTAXYWHUIXCSXUSVYVJFSBKOHAJCZIDWTTXQ
-SQVBUREWDPLOCSDFQRUDMHUMFOJEQSPSODDLMFXLRTJTUKZZRAZAGZHGUUBXMKAFQIGTBIUUSSORYLWEKRJHYGMBSPRTOGPHVXZFJFRYCFGFVSSNLHCUZJRKAMPCWOIKPWTEBAASJQNORLWMQOCFBWYLLRZTTCJWOEHPFBJSDXPNEKVUICUCFGFHKAISMLPGXMJVBCTC
-KLSFISEJHMKYJZBOQSNXBRSFEBUMEIAXZYLXSOARSSJGYRSSCSJBEMEIEIIPBMPHBAXYGEPVTYAOAPVFIMIXOAZTDUHBMODHYTHIRSYSYJNNUZNMBIHQIUFTMNPQJLHJAZILJWUBYQFJKIIKCKZXMHPZOWRGINAQFSQVRNAKJYVPJFGYSBTXGASYVSGYOMUSDIRTZDEB
-UWRPSHGSXPIFSVCPEQJJZVSZVKBXCFSPCMSQDPMVCORNCRBOTEBUAFXVTIXCJJTCMCOPTWGHDKMGVUKVGVRFLJYEGTHXIWUHCEPTSTZUXLJERFSSFMKFADWXGERBMOJJWYZDXTMJZGDIRMLWRVFPAZIIZODMYMRLAULZQDPNUNQGPTXUVNDWSMWUJBKQAZQBALELAPAI
-CNVOGMZSIAVMZSIGHCUKOFOLKGUDMRBXHPKKOEEDYCNYEERKJXHEJAOHEXNYZNNSYOQPMHTTLCSUIHCDRXHNBGDQRLECOTJIWHGHUFGEWWSKNZGOWVHJKLUJDUZAYAXGQJGIEUTIQDEWXEDUFYQETTFRGZGGTZDMBYGWFREVXZPPFGQLBDUYDKYMLBLQHXWSUDCURTMT
-PVLVSDQQDYUBJNWJMVUSAKCYSTASYPQKEMPKUREVHNFSRLREZPKUDCDMSZQFNAQWHGCYPCWTKEFIZTAEWMWDWJIFAITUWUMTHBSZFJWQJXRFXFTAZLMRASLBIYDOCSUHIKIJLHXWBKUAJJBWZLJINUMVLANMYXUTIMZSGHBRJEITAPDCYGPGEDAYHSUARHDAWCZVDHKD
-HQCOHMNCPEZMOLSEMKXSVMDLKYJJUHUYUSMHSWFILKIPBPSHMTCHDJBSCIGWANVPIENABRKQKCMATVFHXFTPWXJISQMTMKHUYYWKUECCUNHCELHXUNJWDALWXCEHVCVUHQIAAZMCHUAICDUMSGUQDRFKWYKMWJCZRZPKIRDPSUWEIYOLACWXYCKMHLCTGQXLUAERKUOM
-DXCTGZGCNJUESFRQAOFIGHKOSNVALYQTHOQTFZZQJLTNXREICAKEOOKONLXISMRPDLOGHHXWIFHPAVVYZATMSAHHHMVCBUIWTIPDFDFWTDPJYXPWXIILQYELQXLRSCJAEBQCWHZHGLZCNSTVGROFIILKCVKMSWXUUCAMSRBGJFKBQHOZVWAJLHPNHSKSHXQBWETCUSMK
-OXZOXHIWOQTLHLGCCZKZPGLOLNTYVMCKMMQMFMAJQNGGFDVBNYSAVFYJEWZDJZLUVXHUJRMNPEVUNQFNHMMEKMQYEGFQRDYLIGEVNFPFNKLXUIBFWQEBDWGKMWRCEJFRAFXNBDBKSVEAEGBJYIZZHXYYPNPSYUTSOTOOYQPJJXJVUCBWFZAZQJXZJOPAGOJOMFKYBQZI
-GKGXARYFNJFREBGJZYWNHHEHCYSRVXTQORWNDNVVVKYAHROCTKCIMTAFKRPDTIFWCRJSJUAAKMHHCGQDWFBBFAADSPDCKFADIBDSVQVLMBQKVVKJMOQNVJFRCZUAKVQUEGLTKKNXDHDEHDCMVFZJILZDYFKQWYFVRHLVXYJWRDVNERIUSPWXHLGGVBKALBTGPIFTZDMP
-RCTCRLMFMUGOZQWWBGGHGKMJRPVEMRYTMJIUISMFVGLCRFIVFNVPLCSCNQPTOTKHNAIVOXVSHBVUYRUOYQOQIXKKUUQNRHQTFYGEUFQTZQPAQPWGXQKONEIWIRVPCJFIDSVDALUBOYCGUMKTOKUXBHXTXVMWEZMTQVWIBSMYZNIMMARRPISTIROKJPYXWKAUONOLNYUB
-XYLCWKCZHAVVOYJBSEESVERQZANKUYIEWHWKIQZSDMJTGPEWYNZFKKLOQITRALOXAKYITJOZHEJHZHJBKQFNFKTKLQTDXBTYMOBFQTXZHTYORAPFKXBKNZXSSFXVZSAWOCXIBTONVTFOOIKITLPUEKGRLIAYXWVQXECZABSHWXCOUXTNTAXTIQDUGUWARWLGPTHWDNYS
-QYWVPPOOJHAGSDXOLCGPQSHMGVRTNPYRMBSMQFGCGSXFYPKKIYLBVOVSAVNOIZDEOWLMKORGLMKWSDCVOEALIMVRTJSTAPHWKRFIKDXKJHCOJPUORNLQVZXPFSKXVCYQQYUARBSTPDLBMJMYCMJQBWCKEBXQMNEDEWAEAWDXNSYJQSSNOCFTAKHSGCMWYWXIVUFUIQPY
-GMNNXVFUOINLMEXEERBIYFRVXAGPBPBNKTSKPEOKGQZDFRSSCQXMFGWIYXQIOAPMTAIBMDBMSRGQWVFASDYKYIHPZUMDBGIAVCZERLERZHCLGRDUYHSWWQXANWJMIWCMWVGELCYIFNEROKJIPUVJOWDFTBMOZBSBBSTJDBENYVVQADSHEEMJWCYVSMDABGAGBABHPSGI
-VJHWWDIYKWAFCYHHSEGGSJEEKYJXPFYUVPLMVQQGZJWCMAWAHQHQJGIKUHHRZTBRMBQRQLHFHTNYFZMOEZYBFVTUYGEMLTEHPBHQJXTOAEAMBSGJSBLAXVDOOXWUEMJXGJYOPGDPFLYMLGBAJICVHYEUQOBFGTLBCSIXHUEZVLOGWPDSARQNQHCXSLXBPDXSYHFHUJGZ
-SQSGDZNNGHHXBOUVUGDTIYLHQKDMARBYVEBTPQPKKTNXJCLVDDXVRZNWHYTKLDDHGKRVXDOKEGFKYQMGBFXARGVOYFEEAAEDSBRFVEQGALLPYTZMVYNBLRDMWQLBMPOZLXNYKBVQXVQDPBOLZYWCZZBPGQBWADWPSSTSBEUIJRISLEANQIMFHDDYSDITWYPRNIMXSFQU
-ZIQCVADBIDQMLLBVBAFSSGOHGLYUWTAKTIMFNBSJPZGBPFANKUPPJGBMKSQNPJOBTLAOBMBBFKFGUFFMVGOXFYGXMEPQAGWNKEJAFRCNCJHJJRQVFZEZHJIICTKYZUMLZRXACGGSXFQQHSSVJJXNEQATETLCNLFMGGRAZPZNQPWNMZDAEAWSOKQLNTVKSLWHINMDZOGE
-FRWLVYBGGSPYNIELLBMEDOWVCKYLYAPVLIQKPCFQMWECCUNUVMBHRLAHXWWEVEJNJZNPKDAHFROUQVKRTUNZBVCIUXUQYHHEYOYRVIDZUSQIKBQMVCOUPRYQDYABYWXFKHCCEIPGEEEDYATBAEKMCFAMNYQTQNARRBVONTQLGNJCOFRNWPKLNDQKSZTDHNDUZOMBNMPK
-VLGXIZICCPOYCSURQJCYWXOWUHJLQMEGHJYODEHPKQNMZNNFCAQICEFUSXGPUXBDZTLNELSDWJOQFTKSSRIZGOHWDZZNELLXIITFBTMHUQDIQGDMVSWOTDVRRYITQEDQGZXHUNEPNCWCJUHZKNXWKHUOLAODMIXPNTWJOPFBEZZLDRCLVEGIUIZMFKLDRUIHSNVORSPI
-HEFIJYCIJPMXZNLFIJAFVGKCGYPXJSBHDOFAHWFOZTHBTFIABPDHUTNEGUSMDQCGSNFIMXMZXLGOGOXJDYLZFGGSKOEWMKMMCNPGHXTPLOKXJQZKCVEIBDKOIESUCSGGIYFUOHOYZTVVTOMNNVVYEIDKKDKSBNZLSRFPIDMDGENSWDVLBRJIJAKZXCVLRFCSOVQXMPDX
-RTKEAKQHYQTAEYPARFZQOWEYWKIRTDZHUILSBEXMYSUZHOEOWXOVTNHAPCQGUMFOAOBNJGPAVPFUSASUGGYABDHKUUKZTXFDFXZMZRNGQQVWLGZALRTOYRTHENQKSJDAYULKCDLREHBXVIWWAJCXAZMQOPHAZZVNNHBBUSVAXMBKMTPPAWNKGJRMEDVTNSXVFMPBGBST
-ZQQSTBSFWIYDSTSVIUFZERPTZKMVSXWZJJEAXMMYHRGNVIMTBVCDLBRUHDIUZSZQEDNIFYIUALZQQTHPEJYMIEEJBYAJRUWTYOPRCJJEOMCXIYCWQTBNZQPWOIVQVNNNCRPGJPUUVHWKWZXJGOWQOVJLPSUCZOREXEANQJOXRCDYTCARWYWSRYCZBELNMLPJLKFYSRTF
-VYSSPWZAKAYBGYFOUXVRRZGKDRSIDNQMUYMILNZVEAYKTYDWSAJWFKANZHQHUHPMPHXICIKJZFHDXNVNCPLUOYKBRRUOTRADKREYHFCUAQTZOGARRUSDXUHMXJANSRYWGRUKTYHGRGVHOUOACICVBNYKGPBUVIUVSDUHFSJUOHOBEPJVKDEQVIMRELBPSKRRMNNDPVHT
-KYJEVSVGFOYZGMULBHIUDAMZBFJFOLCRZTOQMSEDKNCPWFNPAEGQPTKCUVKZZEDKDHKOZCNCOXEIWCURLVBRYYPWHJSJKSRLCYCHFFLMYIMGNWMUMEXCNDISOYRHYTSFNCJVSMKXWCYYUVLXVTIJEGUQWUJEDDOBOASAFGBEFETJPSIVIKOOZJNKNMCUGQJWNPKLHBLD
-IPGZIXOROHBTGJGOPUSCJITSDKPFWGEVRVDEKEXCWBFRIPIQXBEDUHBIZVUBVLIJLQBBSRFPBNRMFGPEWZVUOOWBMTCAZHEOACSJFLQFWEHVQYLYZVANWZTDMRJDOBWPYRQQWHVDXCDBRVNJROJHPDYLBYEXVUVXWMXQFOPONWWERZXJDPCVUQVSFQZPSIHAFVINQLSV
-AWBNPLVGAEFBFRFFSWMEBCKGFZRRQAIQDLCRZAZJICYTSPIKBGZHGNBBRARZTTVPWMIERDDVLFACOBDJMNDQRFRMUHQWJEWBFDRWUDCJZHUHRSUJLQFSYGIELIKVCLKYKZILFIXKDCLDXACOGTDPKHLOGXULOOZIFKAWJGCZWGZEEXPENFIQUBHUMQKSHWEEXJDLDCYY
-XUOOOSEVTQXARBKIKDGGSAZZQAVHDSOTAWWMQWUJSUREBPAAKYJAOBDDPCPXARAEQIRCACZHCXELASWDSQDQYLSXMYTXBOSTDOQDNXNPGMQKGCNQTAGHJSFDTEJWCSGNWTRGTWXTAZGQHXTLTXHXQATEIBPKCRUZTFWIDUSPVIAWFPRJMGBMPCGCHRRXCUPPRUAUVCSC
-NFLKDAYTCQJOMCWTUNCUWUOVHMRFLSBIYSBXSCDXYXMWLUOVKCVBRVWHXBDAPQABDDVBMGXYRZSQKQCXCZBDXUVWCOPBGHBCHYCPKHXLGQQFZCDJGULRJWNXKRPSTVKLPPBODGOPNUIQVKKGEHGSXQEXHGADKQYKHCHZRMUPSHGXYQHAFODCGVZIZYASIUMJGCBQEDJZ
-GWVROVEFCJTIBDSHPNMTJVNQTJUIPODFWGSXHAAEYZRLZRIIZOMCCKGKNIQBWSOUBGCOPXFCEWTXUAGRALTCOTTVEBJMVRYANQYJGMJMHCIUMAKJUDRKIYKYOYHBHGSZECAJASUWHATBNOSRVLMVSLCFROIVXUNPAWMCGWWUPASYBKKOPTWSEDVPDSPYYZHTKGRYUAAX
-NTAUVSPNJUGQXPKHEWXHNAGEULSKNPJDSDUIHTTXWLNSKKHLCELOVIKOCBUEMBMBFXNSTUOODDHFSCJNMZLWFPBPTJDYEOAQZUMELPQQMGWUBIMAZKWHSSGLMUFJAKINLWACUEFHENLENFVBCKQXRRPSMRDXJJPKDDZAQUJUWXIVKZYAGYHDOJALUSPECKSFBRIBOGAP
-ZJJGQRPXWJTUCEPDJMVLKYVYUWNDHZSDGRWATAPKJZYUNDLDKXVZHWWLANJOQDUQFADMLSCKZDZMDWEALVCMTQDTRSPMQRGQVNLGCGEPWBAQTDEAXLUMYQUXKUQEQVOBISJELNDLLONEXVJCEIABYNTHYVPYDIZNNWIBUKRIEKZSZJBAMUHQEBMXJMZMNPKYGPRUVNPQ
-LOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLO
-OLOOOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOOOL
-_OLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOL_
-O______________________________________________________________________________________________________________________________________________________________________________________________________L
-_OLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOL_
-OLOOOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOOOL
-LOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLOLO
-VEWRRSCWGXTMYIKMOQEGLVIMLTFPIGNKMBTTONFRVXKLHKODEIKOUFWUVQOLYKMPAHJROVFEDKMWFDHTGUZKVCGZPHUIYBMLTLEGJVZOGRWEJDWSLTSYGAAQYSPJQWNDRTWINAYHMFBUEUVKBTYBUGOPQYSAAQIGMREZKPDKTGVNVRPRVNTBVIBVACIQIGDCNMRGYKYI
-XRFFRRXPHRKLPJBCDCZEKDVJRSGHALRILBBPYLAYIFEIQXHBECQUPZOUFQJKXRXOVNYFIXKPDEHKDRMVPKYUEFOLCXTEFOZMUBUFPMCEHQFDBNIEJHSSFETPJLDXUKZNRSJXQJVNOMSPRNGTNRKUYPZODUPZGPERIAOYGHDRBIEBGFVZEVMDWIXAWCMPVLRXPBSQQKVT
-FCYWNKLQQHXNYVMKIOSDZERISMHUAMQYUPYYWXOLIFCRRCBBTIGXLNTOZVTIXVCPOVTKVPFQWEOXRZWALXCINZIOZVOLVORPERAMIPIOJKSNGFFDBDKXVDHSPBRVDCUHAWLMFHDNGZDDPEIMXTARJRXBRSPVGSVBUNVLAGTPWSNUWUNXGZFZRQZZGPPXRMDAJKESWAZK
-TSHJDZHXTJEYTZKFKEPSUEGWTLVAWFVPCSLXAQQNPEOLHUOWOWXERMNAFDUZUJEVAOAQHNTXTYPLDPMCSRYQQPBTOQXQEXZAYOWGPSXGPNMUKBMHPMSCPWSFWSEFDQHBORBBIORBMUVZEOOIPGMPATVOGKZSULLJEUECTGPMQZPGXSHGTWUIAPKDBCXGLFYWIRVSGEKY
-VHDSTLGVCBXKHNDIPFVAFNHAKIJSUUXYOBUBOYDTOGAAVZTYPQTUCQWHAIMHCFPIEVTJKGRMSWHUFTNUEKKQGIIMJJYQNWZPQINKPUEJAWARZFQHSFMCOCNRKTTNOXJQNNLRJESVNDIVEMETFSEOXMDABGFTVSZFDHNTCNKQPPOJRNTUAXHHXGMYSLRLVXZVLQWGLLTS
-ZZOWDKGPCXUFOGACBXBZSEPJONBWDATUQGHBFGKNGCMPEDOOCCOURRXWYCTGGTNZBNPIOTDKDGKMKQUZRPJMHFUNRWYFNCYZHHWJSLSSQTRTFNARIYKIILYHCLSOPSJZBMVUAXQMHQUNERBLNOYMJSAFMMHXDKVLDABUZNNPLBZVJAHYNNKUHXPJJSFHEHVHNNEFPIQG
-MVXRTLXLSTLXMSLWXRWMGRGJKJUKPKWHIZWTCOPHTOBUPXFPOUPTYMYNVDHXZQGPCUDLTBQDFHYFMIBBRDEBHUKUJQFFHFLDPFLLFWRULNIPNHQDSCCKARWHFBBELSIJJLCOGQZWVAJHGFWFBUIWJWCXWHKVEEFODXWAUYWQEQWWARWMTUHGOADJAJQIMZDKIRNPQPSA
-CXYIMLLLREKEMBCLNKZHVTCIVJPIPNAITNNGSUHBYWNDYCWETPWWITUWXCKQXAMURZBNWFBIFUGASFXAWCGOUPZEARDZVYRNVDMUACHQINJJRLDRMBHFEZAAGEVRRIDDMOJIJWHFLGTWONMRDCHLZHSZPLKNHMRBYVDPQPUSSBZMWKXCJLPBHHGHJYDCFCJUKXESXWHU
-MZBNJJVOUGQOYBTTJBOKABJGICHGSTNSYOYHMWHXBNLLGKKVYUFKBXGIUPRLMTWWKDBNGXCASTAHJDJEOFPCWXEJQQSPREUXAUSWQXRBLHTYMRTQBUOBSYHDUYJDCOGBVJVOZOEEQRVEGVZUTESEAXNBMCOPBBYMCNHZXPOGXJTQKZUPPMROJTODPTULTAGZDIVMSWBR
-CTEJPGMSPMMKICPUSERDUNIUZTOPKGSBMJJAXCWSRILRTBERVZXCEHTRMMGWSWOMKFRZKQHKZPTZJWEVRSWRVBLBOLWEFBOBOGHRIWYUDECWJAYUNHOKIVHVWYGVGJWYRXPLEFGZNRXBAXRMTLDQCFYRZAJJIPHFPCGLQYHYPPPYCJSDEONRVWSNQNFHDOLWOCYNKWYI
-ORFCWMYOBKFMVJMIEMKTPRBQSGPMUYHAXJWBKBZULCLGYGIJOFLSNNBDMLJSMJTWDNJPHIDQDMALGDLEUDVEPWFONOHHOYMJLAEHREKDFRQDRABRYQZCZPBMPSBEQIOZDGUTCOIXVUKCESYTGHCSHVOVGHGTJYWXVUVXCJAQOKGIDAVFFSMNSRJPUTCEVNLRCOLIXIRV
-QOTTAFWJFZLUZLKXEFPCJHWDDZVCUZIKNENLEULPBOTUYLTLQLRHWKWDTGWYTGILWVRFMPVGANNHOCHUJVSLHYWNIFTCRDLLFXNNJKCTXSREYOQYFPXIDATAPCICTDIZMIDLTKAERAXMEEQZVMXUKZTUHVCBBDIQZDCSSBFBNEPUHVGFMWTQTRLYSEPIIEKJSVOSEERP
-CFKDDTMINVXIKRZUOEMNWVDZYMQCORSZKHKNCGCZCPEBSNNSXMEHMDBWMTMJEPOLSZVWTLNPUFJCBNTPBPQGLUFBVOREGEHLRKIXVBNRISEOTEDEAYHQLIRSIKGKLOIQLNXIKDJCWDIXQXAFJNDYDOUESQKFCPIROPOBHJBUSZRMFRCWMUDUAIZXYBOXYEVTKXAXSAAD
-UMMVSLKERYLSYLSWWAASPPGWHRVAJVGZZHGHBDRDMGZTEJBKSATFGEVKYGGUWQNENCCBZHKIECDFFUYMOJICTILNAAOYVPUKGMJCFXKCSNOJFZFOWBWNVAJZYBJFHTBAZORSORKTAIHZPCPRGBXMFESTKQBNMUBXZOQHOGUGOLOFUGDAAEHPITLASFJAPSXIRCXQJHSJ
-BHHDTZRJJUCIXBOWJGQXFPATTTPMINVHTDXMEOSZKBJYSCFNMJEVPTRJOUIJXTBIRZSSTNAWSOMXVHHTYFGJXOWOOSWVTKGUQPTPLNDXMJELGZIAEIDOUQROCINIHDLYJQAQYNXRZTAQLIAVTLTUJHALRXVSOFRQZLNHVJGFZLWDBBIEVKZEFLQTOGNUQEMYRTLFZZLE
-UJBIKGTOOFSVRDOUKREWBPKRXEIUSKTMHLSRBAJBWKPJMLYDLQZMWBJTIMBNOPQJWNWVMKJUKBHLHHIEIBZOWWELYVKDINCRLGQULNNEBFKLZSXYQRCKZFCGOTLHMQKUHLJPWKKSCVLWEWSERIEGUAGOEPXSOPSDKTZWAIAJDIELDNYRVXMSSWBWZYCHXUWTFNDZBRDW
-OIJPKBIUIAWZNAVSQBOPUUJNLLZRLXIMAYGGCMPJTBXKUNUIVWWPXHTYNSILUXCZEAEIUXOVOSBZAYDABFKUEVMSJHDBEFWLDLPBPWAYLIRNVBGKJDJWXKFMOEBMBJJTCOOJGPVMZZJGKYYLSFVCWDURGQCBRZZGLNRCJKRIFHVFRRXIHOGSYCYOOMAOKGMTVIXSMZWU
-IXDASAVDGDUIMDIZEELVCFQFZVSVOFPOSGSYOPPENJENUWANAEFYJGDXYDQHIEEBBOVZBRZEIOSVCOVFDFDCHHUQXLLBMBEUZECUAYXTNOIHLUYRIBSZBUULIPKWPOELAVITSAKJEJUUOWMTFBNMPCGWBLZGKUUBJRXYZBENZXZCVOYMQKDVESFOWJBRLFBVAFHSAJBD
-BRSFXSPFJLEOUNUZEKCFFUGTSBXCTUTSPQUSLHNWOPJWITIXVUDAMZQEHFBTCXTLDTXMSTSHRAOPGCOUBNCJQIVXEFYDICIKFYSHVYPWQZOWEQRAHVPCRTKHCWJKMKEDLENRUOKACOZLUEKGIZGPOWJFJFNJXPZJTWHNFLWVJQPEJTBEXBOBNPIXDMUEKOTZAMPVYTVC
-GJNGHLVIVYCLFVITBHNCONFMBYUMUZQZNGXBBZSNWJEWYXWGXCHDGFRVIHGDZGAZISUNAHIVDNZTFXMVMMWZJAGMZVQKCDCSJINVMTONMDSXQEHWMLAKQOJBJZQVOPLWGFYHFUKPAEODNJJLZHXUMGZFNGTUPBQSZUENZSRUNFVSANOCKRZCLHUYCRJBBSFJNUCXQBOV
-SHVMSURDMBCZPBANDPPOLACAVDFLLXKOOLZJVNAVNGQQUCISPRKUCUATTZWQINGAMGZKQNTKHSMOXWRCHOOESTXTCKCQIPINVDNOCHTZPEDLCJOXNUIVBLHPPFGNMCFJFIWSHHCCKZUGYMKWJTZXATVQBPOBISRBUNSHJLEEHZANRVQEJTYQUWEGXMLHAVELEAAPMEYV
-PBKNAOAJWTPBQDVQBOCGZVNMAPQECSRFBYWXJKRQCMVALORHLNZDBYUOAQIYYFLDWPNQFHPDCNEIOUIKTZNWOPIQGPNQHTXODVVSGQTSTIVKQVEGKJOKKPYLWOIGIJCZFRJTQKYGELGFCQVXBFNQCIKGUNNKITLFPUIYDSCELSTDMJQYEIRHMAQGFXAJPRYIHELQKPRX
-PVENAZMPDDXKJLLPBTZHBBOIYVCUIPQJJTJAGLAHLZSFFJTJGQHYHBNAKZAYCSBBQQCCPNEJWHLEUQQDIPRCTEMLKHLKNORMHRIIMHFPFBZKLKKLJXVDMBHPNUHXIBUPOJTGNLBFMLNEPXQGJBSGNMOPJAPABGFAJEQZHTJOYTXAUDPLVOPJPLHDUYBBNCTMZQIBYBTN
-KFDVHUIUUBQUFMGWGDLVNYKPRAXSEKVGDQKLXNFNRIOPQBRNACJRDGOJSOWXUOFIERHKQNSUWYRUNWLYTJIGWPCRGTHZCDLPNONPHBEKCIYYJTVORGZXVZSXYXUWZJNCWRKEKTGJGCHZQNLJQFDTJOUMMRDQEJCVFTNQDJUSYOKWOUGSPCJAFJSCOLGVIUBCXTUCKKEK
-QWWZEVRMDRVXHQRSSTYWZJSMGFPKXJGDCVIAFRTBCAGOQRGKVRDRBEYORKMUHIWVMVPRFDIWXHCUWNCZPKDAWHGAXZHOMLWYWETYTPQQTPHNDXEIGIYUAPHBOHWBXRGSCUCQNFPOZLQNNPHHAYHOFAKGABHXUBEYMEQCHQPBJWFKQBUGXMQTMOIVZLFKPSNPZILDAKVV
-ZWVIWFGGAXTFRCPIIXZAVIBXOOGEJUSBHXSGYFWNSKZMIFGQSWKYPTENMEERKNZRGJXKGBHTKKABXRXEIYPCFSAZQZIFETYUAXUFQTSSJZFNWYECWPDNIQHKNBXIVSNIOXMRGFZIPLBLUCGFOUUFFMCICMURSGKXLBCGWUTRRPHFRJTSHJKUBBADPQZEBFMVMOMUACBZ
-SGXVBKAVFYJSLOYTTGYOQUJSDMKWWNIBYWEWAJMWSTDZTNCCHVLGDBFZWBCGXTGHSRCPVTSXBZAAYOBZAAHLABOFIUEELCKQTLCCTXUDIFSSUGYAQDNHWOAWCTAYNAEHFZTXDAAWFVNCYLSCGBGEMJLELKEWTRZTJFMZCNVXVOCNZKBEIYLLHPHYKMFGCEWDKXVSPUGR
-ALLRRXDMHOFNLYYBSTVWCDKSSQPDBGWVGPYJROOPRDFUPLXLNUEMMPXBSRKVKPGVQXFPQHYRXHKRULUDJZLZSBCOTKLLLKZILTEFZPXGLYBAPEEXWCHCMWDFMBZHRZBHXPYXUFZBGAFPTKNFXMLKBLCRXBZQQQHHRKVKJBLMWKCZYVEQEDNYFPEXUSHBMVUNZSQONMSX
-EGWNRHGJPWTQFYVNHMVXVUFIMELGWLJTOYRYOTGVPLCMXIWYYGKNXZTQORWXLNQPYOMDQLQVMBUESNWGVGXJEHRVVZQDOAVEWEIOYZTLSVNAPAHSVQNZLTRZROATRFPPOZWAEFXOZURFJHFTFMNOZAUQQBWQARGHYXWIKTCISJMEXJHMOKUWQVOIETDDODGXYAZRNWWT
-LKJZAMMEZZHSURQAEYEMAJFXJHXGIATGXDBGHBCOKMMPETLZUBUUJOOVPISDUUHFVLIGRJKODEPFBENKUEUFMHIDYYBNOILFZMTSNKAVGRISHZZRNSMIDWEQHXUKJRKTMCFEHINFXNRZFPBVPBZYTYBUCEDMFMAXOOJAABXYMIGAJHTFIRPHPLKXHJVUXOPHBEIDQPVM
-OMOFZSOFKAQGIFJKNWBYARVNTMZKQBTZXNSTZPADBXKXWQMQNGCZTMECUVLOPSGPMEYEZDDWRJSYBHOYIFLAVKKQCYLMORCCBZXDEZHKLKBLVNPNOOTAPKQGMTBTFBSUPCGUIQLAMDDGOXMRTVCZVEGWCVNMOJTXRRIRKOQKWCGGLVBSQDEQJTFCBLTGKZPVIRKPJJHY
-WQQFZYDLAQONVAGKZPQRCNJWUNUZYLYMZUPTXSQYCCVIXBPJVERJPEFNQFXQCHKXSRIDVPHBXWTPJLOUFVEVSMATOUHNPQVQTYUYGXFDWICNTSOGFCERYLVMQNACUEUNJASBLXIOMYNHZOKHUDDITGFFSZKXQANABYBQOBMJXECAAESWVZJEAFUXGDZTTNJSXVLJEAPH
-RCTBQQMHQFVGZZHNCWFHBFGFOKSTVHSCTJIKWZOXFTNPWMVWCZHAHRWBNBDCCKKMBDYGMJPYKJFFXOEBYWEINOTNJZMZUSDEYLHGGULBQFDKXRGJKKQRWWIBRTPPARMUDTQZYQSYIOSJBIVYHAKOBKKOVGBLPSOITNWRFLDGZAAHOZQMOCMIRNMPEJBALUCXYJUOVIZK
-FFGPIJMJZDKJDMMEDKWSMOTKTXVUHMYHFNVQMOGUXFWNLSUNMXPWIKYRAFJNJWARTGQGIFZVQBNBFBUOQQRSXWMJXDRHSPDECSMGEERLPICAJZVOVLXTVYDFAJIYMWOPRCLXAHZEIJNODZDDSHSFSAKRMNAUHTAQQECZNVMKDHBVWQTWFTBXKMSTAWVZZYJOFPGHJKFM
-ADMPXPHJELKWHXIRCFCSEGMFJXOIQDYZPJBMPVVDNTAETLLVGWEVEAKUPLSPEHCPGRENQQVMNHOAUSGNGCGGRLISCYKRGDKPJHTEZRRPUVGSOLBDNTGGIXKFIOAQONVZHFNKJWYUBWGOIQJJIIQRKXVQETMJYCUFGFZDGYFCDDDLLGJUEETRSWLCLCWORSEZZBBRBWTJ
-UOMOSJYDVTSBWCOMIDPMNOPJCHVFJJYXHWGNVDJGGMHBGPTGYFFTOVWSWJTATJRDMHWXUYJBKXSSCYZIQZGKVKDXVONVHIUIVVYGBPMNGTGADOBHTIFBOSVUZUJKNEDTGHIRCFQLURFQPAUMNZUZADRNWQFWMCIIQGGEKPGDRHCGXYVBVEYMJOSYNVKOYQKHNZYKSGQV
-DJNDWGROOJQYGOAGLPFUNIVLEBNKPIPZLSRZJKKEKSVYIBRIIOHJESOIYAXINNPYFTPVWDNQLEHDQDKSSSXURQMNKOIJVVGDJFQOGDPBZJGSGGWXEVSDKNQUZHZOEAQRWYUWJQBDCHUWNINHLVDDMRZWVDRZAQKBNNAXSSLOSZOWGJEYYZSDBNSWZDKPNQQBIZKWMEQM
-LJVQINDBJFWVQALSVLUINUAIOAXWUGEVITZTVNWAXGNZTBUHPNRDYOHSWXIZZDQKWPAEIJCVTYJYDZZZWOSDONYVENDKLVOPUWMAADEUTBXEQWUXTBIVUKINVCTZKOVMGXZRGRORIREYXAXGCYEYSGEGSNPQTUIUHYNSJXJWOVUYRKAOHUKSOVGOOJZOFBEVGCLWZZCC
-TNWJQBJMPITTWTALODFDZBJSEQJMGDAXDUUOZFFPHPLLBSXQSYXRTMLFJZPDJJEUQRAVYOGWWZZSUQPXNNDIPEFHSXGTIKRBHTISCJQKQOOGHDCBIUUNPGGWUGVLSVBUVEWXIUILWVMCYIYCCJOUFWQIYVYVPGAIQBRGQOOYAHKTQPQKJYTGOHRJOQTVMKGTZTDKMOCP
-MHFMTDDQKSCBUJFTSCANWYTAPMKRQRVUYFZAXQXSNIVTKCIZEWDAZOXYYDPYLVQZXRRLDVYLOSVXIEFNBIQYZOYDTAXJGSCTLNCHGZLKKNCEJPCOVWPZHBPXCALYGUDXQTPPNXWMMSHRRLQHODPITKPENOXPNHCDTJLUSCCMBWMVQQAXJHRJNCUWAHSAMTOWBFSMWEOG
-DLGWXLZNHLHSEUQQIQNQFIFQBKZOZWGPIZQHIXCSSSPDVLGAJHVBXUETOPPJATBOLIHXZDREMSHUFSFTFNZDZPVKANWTSFKDGLZJEICHRALETLAMUALMPVRCPMEWFPBLPCFWXDAMRJRAQUTWVUSKRFFOIDWSMLINJGAYWANYTGTCVYDHGMHOZPLCKARJZVZEBNDDIRPN
-NOJMWVPDEQJQOQVTBHYAIVGLWLHSGQNOJSCQLGZZHASGKXLRFBLLJISCPVJWQDYOTIIICYLZPCKOJDPXJEKKJHQNUIOINLQFVLAQFMUEPPMQMRTJDBIMWTUOGHEFUXAHJQDHSTVTZBVQYVXHWOPEJTKNGASPSODYTXCJLUWXWOXCUWRSQKQQEXOBRKGAEOBMPIRGJQDM
-MJGCTLXTWTAYQODTLKQTLFWNYHXOLCZZPDAPONITAIQMICNGSTHTIJZUHTILMMZIAWZKNNIHYWBICLVVTHNBBTGUGULKEYUCIQKOPHZHEJLVOGEZVKDOHMYJAZOWWIEJFWDSYDCWJVYDPKIPFWNQVZTBEYDETVGAXPSKCIRBDNAZBMZIEMKUEHVVJHQGVKLPISQZIXEF
-RYJOECDBFAVPOHAWEHTYCARKOZKRMLRPWNTCYSRWIMNQCSRJCZWMROTTEFTEPTZHBQSEIVFWKPBMHGFVVRGDUGTXCHTUXBQEGOJYGMJQUJIFFZILUSENTDWYSSZCJISNYAUVTFEKDXZWPYXICVKNPJBFZVJUJYBEUHHFFVEAZCTQCYUAAXOMBMQZSSQKOFERTTURHDVI
-QMYHIZRXODOWBLUOMBMHTMORGEYSGYFHGQCCMGIOYDFBXJRLGOUTRGIZNAYHHMAPREBBTSWWUCORJBXJHLZDKSVFOWXNUCBKPSLVKJYXSHQQKUDHVQHJIMEFRFMHNHMIFINPISKCYURJBMTVKWEHBJWPZVSMVCMOPVCJLDJJHMWYEICTTRIHKTILOQAQCPTOYDJBOWHP
-FDDUFCLFNNMBWGFMQEFDLJZJFYJYMHEILHGNEWNDLEGCRCQTYIJWTCCXYCQMVQMABWPHBRGBZLUXKARQUTAULMQJJNBRZBTNTINPDTRWHEEURBVXKKJZAQZMZYCPNRFJMMTXGDTGEFRZJBZKLMJOCHUISHTOVMMMOLXUBIUPSAODMCWSCOBJJSRTAJACTLXRSIAMGWFP
-NCKZEESOXLJVRBTJVKCKBXGEYINCAHRIXVGVPTVLJXZIPZWXGESWKVIDDBNEHVKHEFZCKRVSNRDWFUTDTMOEUGYMEOAWXZCSJPUJGBJMBDPOGDOVFOFLZGLBBKHJPGLIKIDFPFVFNFLWFANUDJAASNXNSROSCVYFZTTECSBFJGYDPLRZNEGCDSYCXTKELMEMRNHFWJFL
-USQSRGTZTDZSXAQBGGMSYKPFOSOGCKABGWWBXGMGAOSBGHPXPQUSFRVOLBWNKMVAUIOQTJKKRPFXWSTJPBMXJPGMFJSTMJDYGUBGNOFFASMESLTMCJALNUTAXWUUTQJYJGLWCKEMRLRWRPFUMGROWERBJQUMXPKZPNMAGBJHBXQPUYAKIOOYBJWGKJHCVKAFEGZWKOOS
-LOIFDMPEXBZDOKQGHUANMATCIZSIQVBOTGYSMZKNMLYQQMQEMBFYGUDUJBEBYNYADUOHZZIPQAEAPFXSKNYVLYETNOBWQPIOILWDXQWBVZEGFEEVHYFADTBDDSBJLQIALCYRMQQLHVNRWXJNDBWWHYACTNCMARCCAJSCFISBYIZXLYJVQIOPOHJQKALYQTCAHOQXKRIX
-ABHZGRBTPIPCIDFBCEHCNIZVRONEAQRTHBZSQCTTJGBWHQDQIAUKYCCUVVICNRPSZPFWTTHJMJZPRXSCPSMKLVZULNGQAQEJXSFSONIVELSZICJKBDVNSQNQLSNCWNNKLAXLYCIKEWIJRPEEXZPDSRLGGACQQJYGXDPJIBYMMQEHFFWNGBTLMOYBZPMHLDWAQMHLCBYY"""
 
+def _lines(text: str) -> list[str]:
+    return text.split("\n")
 
-# QUEST 3
 
-q3_example = """..........
-..###.##..
-...####...
-..######..
-..######..
-...####...
-.........."""
+# The quests expect these inputs pre-parsed rather than as raw text
+PARSERS = {
+    "q2_words1": _comma_separated,
+    "q2_words2": _comma_separated,
+    "q2_shield2": _lines,
+    "q2_words3": _comma_separated,
+    # the scale armor for q2 part 3, despite the name
+    "q3_armor3": _lines,
+    "q4_input1": _ints,
+    "q4_input2": _ints,
+    "q4_input3": _ints,
+}
 
-q3_input1 = """..............................
-..............................
-...............##.............
-...............##..#..........
-........#.....#######.........
-........##.###########........
-.......###############........
-......################........
-......#.#..#########..........
-............####...#..........
-...................#..........
-..............................
-..............................
-.............................."""
 
-q3_input2 = (
-    input2
-) = """......................................................................
-......................................................................
-............................####.#.##.................................
-............................###..#####................................
-.............................###########..............................
-...........................##############.............................
-.......................#..################............................
-.......................###################............................
-.......................###################...##.......................
-.......................###################.#####......................
-.......................##########################.....................
-....................#############################.....................
-....................############################......................
-....................###########################.......................
-......................##########################......................
-...................##############################.....................
-..................###############################.....................
-................###################..################.................
-...................###############################....................
-..................###############################.....................
-.................#################################....................
-.............#..################################......................
-.............#####################################....................
-.............#.###################################....................
-................################################......................
-................##...#..########################......................
-................##......#..####################.......................
-........................##..##.##############.........................
-.........................#.....###########............................
-..................................#######.............................
-..................................###..#..............................
-...................................#..................................
-......................................................................
-......................................................................
-......................................................................"""
+def input_path(name: str) -> Path:
+    path = INPUT_DIR / f"{name}.txt"
+    if not path.is_file():
+        raise KeyError(f"No input named {name} in {INPUT_DIR}")
+    return path
 
-q3_input3 = (
-    input3
-) = """####################.........................................................................................................#.###############
-#.###################......................................................................................................#################.#
-######################.........................................###.........................................................###################
-################....#...........................................###........###......#......................................###################
-#################........................................#......###......#####..#...#......................................###################
-###################.....................................###...#####.......###...#..##.....................................####################
-################.....................................#...##..#.#######.##.##############...................................###################
-##############.......................................#####..#############################..................................###################
-##############....................................##.####################################...................................#.################
-############.......................................######################################...................................##################
-#############....................................#########################################...................................#################
-#############....................................########################################....................................#################
-#############...................................###########################################..................................#################
-##############..................................########################################.....................................#################
-#############................................############################################.#..................................#.###############
-##############.............................################################################....................................###############
-##########.###........................####.#################################################...................................###############
-##########...........................####.#################################################.........................................#########.
-###########.........................#########.#############################################.........................................#########.
-###########.............................####################################################........................................##########
-########................................####################################################..........................................####.##.
-######.................................####################################################..........................................##..##...
-.#####...................................##################################################..............................................##...
-.####...................................#############################......################...................................................
-.#......................................#.##########################.######.##################................................................
-........................................###########################.###..###.################.................................................
-........................................###########################.###..###.################.................................................
-..........................................#.########################.######.##################................................................
-....##......................................#########################......###################................................................
-...###..#...................................###############################################...................................................
-##.###..##...................................##############################################..........................................#....##..
-###########..................................#############################################..........................................########..
-###########...................................############################################........................................###..#####..
-#############..................................#.######################################...........................................#########...
-############...................................########################################...........................................############
-##########........................................#######################################........................................####.#######.
-###########........................................##.###################################.......................................#####..#######
-##########......................................#########################################.........................................############
-############.......................................#....#################################.......................................##############
-############.......................................#.....#################################......................................##############
-#############..#.........................................#################################.................................####.##############
-############..##..........................................##############################...................................#.#################
-################.............................................###########################..................................####################
-#################...........................................########################.###.................................#####################
-###################...........................................##########################.................................#####################
-##################............................................#############.#####......................................#######################
-##################.###.......................................##############.#.##.......................................#######################
-#######################.......................................########.###..............................................######################
-######################..................................................................................................#..###################
-#######################...............................................................................................##.#####################
-#.######################...............................................................................................#####################.#
-#######################...............................................................................................##.#####################"""
 
+def input_names() -> list[str]:
+    return sorted(path.stem for path in INPUT_DIR.glob("*.txt"))
 
-# QUEST 4
 
-q4_input1 = [
-    int(i)
-    for i in """18
-18
-18
-7
-16
-12
-19
-15
-10
-13
-19""".split(
-        "\n"
-    )
-]
+@cache
+def input_text(name: str) -> str:
+    """Raw text of one input, minus the trailing newline its file ends with."""
+    text = input_path(name).read_text()
+    return text[:-1] if text.endswith("\n") else text
 
 
-q4_input2 = [
-    int(i)
-    for i in """7533
-9315
-6002
-1209
-7690
-6517
-8592
-8807
-8097
-2465
-1698
-6869
-2854
-9967
-6679
-2950
-4323
-8403
-9358
-8930
-1651
-3905
-2366
-1642
-7325
-7417
-6165
-8743
-6614
-9900
-5095
-1939
-1449
-5689
-9012
-4238
-7164
-7991
-1634
-4839
-9274
-9983
-5282
-8087
-6002
-6431
-6589
-7256
-3210
-6637
-1060
-4797
-8977
-5885
-9137
-9595
-5519
-3655
-4563
-8187
-8859
-8016
-4379
-7630
-1525
-3831
-6383
-9749
-9594
-4521
-9503
-3175
-2927
-5105
-1758
-7464
-5201
-1710
-9167
-1375
-3510
-7523
-7653
-4782
-6579
-9146
-6324
-6636
-5068
-5996
-2311
-1434
-1135
-9524
-7352
-8343
-2592
-8883
-4585
-9284
-2790
-7901
-7660
-2504
-6237
-5584
-4268
-8454
-3836
-7234
-8096
-8245
-9024
-3152
-6443
-9692
-6852
-7503
-9591
-4052
-4142
-9361
-2099
-3080
-2125
-8894
-3181
-5140
-8606
-8691
-8598
-9178
-7497
-2438
-6009
-2672
-6677
-9183
-6597
-9887
-1886
-9202
-5188
-2317
-4926
-8064
-2026
-2395
-5460
-6034
-1790
-4978
-7672
-4482
-8392
-9384
-7269
-9592
-7063
-4220
-6040
-1939
-4495
-6227
-6942
-8294
-9775
-8340
-3361
-4723
-4579
-8131
-4919
-3903
-1472
-6373
-3790
-4905
-1028
-3948
-3452
-4043
-4240
-8822
-5090
-7597
-8565
-8065
-9231
-6219
-3985
-9278
-9482
-7385
-5540
-1993
-8937
-4059
-6738
-8465""".split(
-        "\n"
-    )
-]
+def get_input(name: str):
+    """One input, parsed the way the quests expect it. Parsed values are
+    rebuilt on every call so that a quest mutating its list can't leak into
+    another caller; the underlying text is only ever read once."""
+    text = input_text(name)
+    parser = PARSERS.get(name)
+    return parser(text) if parser else text
 
-q4_input3 = [
-    int(i)
-    for i in """27499330
-27853457
-27269446
-27253987
-27917158
-27197073
-27286763
-27131694
-27023388
-27642851
-27952735
-27331015
-27023117
-27734197
-27557270
-27420658
-27170617
-27205673
-27174984
-27832546
-27040998
-27198642
-27127881
-27540474
-27662371
-27949838
-27063542
-27393365
-27392338
-27768918
-27291192
-27107876
-27501225
-27284622
-27724427
-27743826
-27225943
-27092477
-27491397
-27410824
-27126733
-27641714
-27410441
-27007397
-27591402
-27766264
-27109710
-27524091
-27626816
-27890903
-27727425
-27434637
-27069664
-27760052
-27674147
-27322926
-27634780
-27606553
-27978225
-27526248
-27095935
-27079387
-27908759
-27070272
-27877314
-27315852
-27664632
-27985524
-27014951
-27418076
-27495257
-27722574
-27308194
-27777907
-27301173
-27380445
-27549833
-27979852
-27304562
-27843871
-27849259
-27373705
-27684070
-27912302
-27227775
-27575084
-27087171
-27535648
-27035627
-27633201
-27779585
-27821252
-27000244
-27819384
-27763201
-27769065
-27014428
-27395468
-27282528
-27081979
-27536580
-27209510
-27036762
-27666551
-27558673
-27766348
-27131806
-27353629
-27166582
-27184583
-27741536
-27341024
-27952556
-27458806
-27277588
-27710223
-27069537
-27426724
-27050359
-27239535
-27411189
-27244095
-27326750
-27695672
-27078727
-27759338
-27243936
-27892132
-27618924
-27334798
-27071134
-27122889
-27509396
-27573234
-27758616
-27502044
-27351826
-27269390
-27679542
-27137928
-27320697
-27747155
-27931868
-27415629
-27088391
-27862709
-27556965
-27566397
-27479953
-27085862
-27023989
-27164853
-27516237
-27982543
-27307610
-27875743
-27863811
-27556808
-27968941
-27380221
-27075255
-27467046
-27796881
-27256554
-27860346
-27371020
-27589826
-27348600
-27695334
-27573454
-27262364
-27077362
-27923591
-27137418
-27762327
-27040008
-27598629
-27453012
-27209771
-27039661
-27616933
-27732334
-27261587
-27174354
-27434500
-27048793
-27538918
-27140465
-27509954
-27040255
-27163367
-27840263
-27450175
-27751108
-27509235
-27481294
-27369621
-27671463
-27270322
-27810004
-27148566
-27330077
-27537421
-27105960
-27998583
-27905326
-27263517
-27705401
-27533673
-27537583
-27944019
-27420815
-27880737
-27310697
-27519020
-27070121
-27537316
-27567791
-27541979
-27567400
-27496627
-27929418
-27854042
-27462317
-27845548
-27163733
-27112043
-27535127
-27962624
-27176492
-27089525
-27867664
-27184711
-27010995
-27355655
-27629364
-27529004
-27276550
-27095878
-27411504
-27511463
-27555055
-27102573
-27926960
-27724909
-27389241
-27570998
-27899739
-27714970
-27841458
-27249719
-27178413
-27990100
-27109094
-27491628
-27354490
-27858908
-27475996
-27544331
-27633570
-27311238
-27073989
-27870186
-27272748
-27122608
-27965931
-27392096
-27549035
-27109358
-27264331
-27083364
-27765203
-27877175
-27118663
-27690461
-27720403
-27692902
-27748441
-27570159
-27100134
-27278402
-27235712
-27761617
-27809993
-27111815
-27850627
-27546659
-27731515
-27842315
-27878072
-27643041
-27959690
-27465020
-27802490
-27879090
-27064667
-27912473
-27158640
-27215325
-27805447
-27862703
-27761366
-27303722
-27596240
-27906120
-27341558
-27511583
-27755263
-27376285
-27547459
-27356621
-27204397
-27737763
-27036246
-27624410
-27188694
-27733618
-27774438
-27184977
-27502724
-27789981
-27227480
-27079391
-27123367
-27104272
-27059090
-27535204
-27005745
-27124823
-27802538
-27929756
-27868036
-27986210
-27788045
-27790296
-27920362
-27435637
-27211533
-27166107
-27102699
-27434812
-27472203
-27000996
-27183227
-27891989
-27798397
-27285841
-27314834
-27740160
-27323901
-27676951
-27464614
-27869295
-27220838
-27371594
-27851450
-27477205
-27413028
-27605126
-27525618
-27788838
-27531582
-27263128
-27958110
-27112661
-27459612
-27392108
-27910608
-27264685
-27899232
-27222551
-27350559
-27729507
-27874477
-27368041
-27883695
-27191599
-27418243
-27867797
-27781844
-27318352
-27427786
-27746033
-27033697
-27389650
-27487445
-27891877
-27281459
-27315912
-27915415
-27566915
-27500301
-27199895
-27119790
-27174915
-27307256
-27053011
-27076325
-27540671
-27903493
-27617578
-27258045
-27238843
-27403138
-27840012
-27215257
-27754654
-27568846
-27934970
-27992551
-27262373
-27020684
-27453803
-27518357
-27402245
-27802916
-27600244
-27148288
-27994101
-27994165
-27232605
-27268390
-27096007
-27323338
-27968304
-27534632
-27947539
-27722948
-27255815
-27544487
-27810800
-27016600
-27100383
-27102473
-27984775
-27367564
-27980933
-27280628
-27372108
-27110746
-27061811
-27442416
-27819565
-27935719
-27249141
-27498183
-27197099
-27653392
-27229848
-27956877
-27332767
-27355611
-27826390
-27964964
-27008685
-27227496
-27975084
-27906680
-27206063
-27023732
-27149495
-27470182
-27692789
-27164152
-27045786
-27358311
-27654189
-27935282
-27764240
-27471710
-27021698
-27059298
-27058868
-27171417
-27566247
-27666358
-27653235
-27608936
-27090777
-27565685
-27259149
-27941743
-27941774
-27052009
-27763582
-27274215
-27516772
-27968297
-27237400
-27515611
-27918104
-27892932
-27807079
-27838807
-27816153
-27941509
-27088081
-27071316
-27096199
-27235665""".split(
-        "\n"
-    )
-]
 
+def __getattr__(name: str):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    try:
+        return get_input(name)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no input {name!r}") from None
 
-# QUEST 5
 
-q5_input1 = """5 4 2 5
-3 3 3 2
-3 2 4 5
-2 4 4 3
-5 4 2 5"""
-
-q5_input2 = """87 23 55 30
-52 33 38 86
-77 45 34 61
-36 36 94 20
-33 44 42 53
-10 55 48 71
-28 43 52 10
-18 73 25 98
-19 94 43 29
-77 23 54 68
-15 88 77 50
-92 99 47 84
-53 97 16 89
-70 18 66 81
-47 75 37 65
-78 17 21 85
-83 46 64 82
-19 65 78 17
-40 31 23 57
-49 40 22 46
-24 75 16 39
-30 17 35 80
-27 66 16 52
-88 15 82 32
-96 68 21 10
-18 59 42 74
-61 38 39 22
-99 12 57 70
-64 93 63 87
-49 26 31 23
-34 54 47 51
-77 70 86 44
-72 22 13 44
-72 86 36 95
-28 50 13 51
-47 67 11 22
-45 12 97 30
-37 82 44 20
-56 63 75 43
-49 65 60 76
-69 54 89 98
-81 72 90 25
-38 11 21 67
-14 90 85 60
-37 79 24 42
-89 58 41 37
-45 83 26 11
-76 40 40 92
-16 82 60 45
-93 19 19 88
-63 69 85 33
-12 92 15 34
-59 85 13 98
-96 39 11 73
-18 30 27 49
-11 89 35 55
-62 74 27 51
-69 67 42 64
-68 84 43 48
-92 97 55 28
-81 59 98 20
-81 84 91 61
-58 54 13 69
-15 34 66 70
-13 26 38 53
-27 95 86 35
-88 30 93 68
-31 83 52 80
-24 31 26 32
-14 99 62 35
-14 17 74 23
-40 75 64 12
-38 79 22 59
-65 32 71 96
-76 95 29 35
-78 63 21 71
-29 95 20 83
-25 33 62 90
-56 21 41 57
-87 97 87 91
-74 50 45 12
-56 79 20 33
-31 41 80 32
-46 71 28 76
-36 42 25 61
-50 93 41 72
-56 60 91 32
-19 53 66 18
-25 58 90 17
-46 28 26 29
-34 41 48 15
-37 73 27 46
-99 24 96 84
-58 94 39 14
-80 62 79 67
-39 24 43 16
-78 14 91 44
-94 73 48 57
-29 36 51 10"""
-
-q5_input3 = """7193 1004 1005 1002
-6521 1003 2428 1005
-1005 1001 1003 1007
-1009 1000 1005 1000
-1006 1003 1000 6065
-1001 1001 5401 1008
-1009 1002 1000 1008
-1004 1000 1002 1000
-1000 1004 1003 1002
-1003 1002 1005 1004
-1002 1009 1001 1007
-1000 1006 1005 1003
-1002 1007 1004 1004
-1000 1008 1001 1006
-1003 1008 1007 3644
-1009 1008 1007 1000
-1000 1002 1004 1007
-1007 1005 1008 1002
-8214 1005 1000 7742
-9581 1005 1008 1006
-1004 1004 1005 1006
-1001 1009 1003 1008
-1007 1008 1002 1009
-1004 1002 1007 1008
-1002 8528 1002 1001
-7324 1008 1009 1009
-1002 1000 1004 7456
-1007 1001 1002 1009
-1008 1006 1001 1000
-1008 1007 1009 1002
-4159 1005 1005 1007
-1000 7874 1000 1000
-1000 1003 1001 1009
-1007 1005 1009 1001
-1003 1000 1004 1006
-1003 1007 1009 1003
-1001 1005 1008 1007
-4855 1009 1000 1000
-1003 1001 1004 1000
-1008 1003 1005 1001
-1003 1006 1000 1007
-1006 1001 1000 1008
-1009 1009 1005 1001
-1005 1001 1002 6122
-1002 1006 9663 1002
-1009 1002 1006 1001
-1004 1008 1005 1007
-1006 1001 1001 9959
-1002 1000 1007 1000
-1005 1009 2752 5660"""
-
-
-# QUEST 6
-
-q6_input1 = """PG:PL,WH,@
-KN:JD
-PB:@
-HK:TJ
-ZN:RW,SZ
-RV:XD,TK
-HV:KK,WW
-JG:FG,ST
-HP:@
-HW:VP,HT
-RT:GQ,MP
-QZ:HP,PB,@
-WF:QZ,ZN,@
-NF:RT,HW
-CQ:SV
-JD:CQ,TT
-DR:QF
-GW:JG
-RR:XC,DR,KN
-WH:ZJ,@
-ZJ:RZ,HV,@
-QF:GW,HK,@
-RZ:XR,KT
-RC:QG,SL
-XC:PG
-PL:WF,@
-QX:XJ,MJ
-NZ:NW,PM
-ST:BT,CM
-TJ:NZ,QX
-TT:NF
-FG:HZ,HH
-SV:RV,RC"""
-
-q6_input2 = """CFCH:QSKF,RSHW,BQFW,KBWL
-RMQC:FQQB,LLGT,MLLX,JNZR
-DSSW:@
-XSHS:LKJN,SJLS,QFFH,FVNS
-ZWPL:SKGH,PRQX,BHDH,TSPK
-JXDC:NNLB,XZCX,JMCZ
-HXWF:VKVS,DCCV,NSVF,ZTGM
-KBVG:VQZD,FJBH,DFHX,BZQR
-PMGZ:JRSG,KXWQ,KVWP,FNNZ
-WDST:VMSM,XZNW,TXDX,JTVC
-RXMB:SPLH,FLKS,QNPM
-PBZT:@
-RXPB:XSBR,FLVZ,PCMD,VMDK
-WLNQ:THSJ,ZRLM,RZZT,XJXW
-FLPG:RFVQ,GPMQ,JQLJ,XZSK
-QKWW:ZMLQ,MCPV,VVXM,BFCX
-QCWD:ZSDJ,CJSV,DXNW,JVGJ
-KSTW:FKQF,WGRJ,VJTJ,QHHX
-BTVM:RTWJ,RCJR,HHTR,TGNV
-JWLS:MPWG,HXQW,MJFR,FRCN
-MHFT:WKLF,SQFS,MJWH,MQBB
-DJNH:CLWG,QGML,QWFC,BFHX
-DGBR:DNFD,JTFW,DZNS
-PGKV:KGZN,XGWC,CQRN,MSJQ
-TFML:XJTZ,GCMV,WWHM,CBWT
-GVBS:KGSN,RHJX,GCSS,LFZF
-KNML:ZJQF,SBLF,FCZP
-VNZS:NVGD,MFPT,DBHV,VCJL
-CKQR:DRJC,SLZQ,TPHZ,LVRG
-LLGW:KNZH,CCFQ,ZKKK
-LDDK:ZXHZ,KXJC,FXRD,GVHR
-SNDV:VRWT,FNJT,KSBN,JJTR
-TPJX:PNGK,CJKB,QVFZ,QDJG
-PSSG:DCCT,SQFQ,VLJC,QPWD
-BZQR:GWCJ,HCCK,VXLQ,VDDW
-JKBK:FWWM,SKXV,XRVS,XLDJ
-MNDB:GKKT,WBRM,HWNH,CSMD
-SMPC:MTVK,KMND,FWKL,CHXH
-VDWK:VDDV,PFMM,XJWF,ZCGN
-BFTL:CXKD,ZTSZ,VPLL
-HNND:GRRQ,QWXW,FJXP,MJCZ
-XCJR:KLCX,WPQW,BKDW,QHND
-NSGF:RGJC,SQQQ,FZZG,JNLR
-WHJB:KLZZ,KKCQ,PWWW,PCTW
-MJFN:QLHC,DLBM,ZCFX
-TDLV:GBBT,ZRXJ,SHZD
-MVNM:JBLQ,VVCN,CBZK,JPSG
-TBFC:ZBQD,SBMR,CTML,GVVV
-ZMZP:JGZS,PNMP,ZLCF,CTPM
-XHGD:KPJR,VNZS,WSVN
-XHVP:FQKZ,WPCT,PHFS,VGKX
-ZLDS:JXDC,KJSG,WKJG,FMHX
-FNLH:NPVB,DGBR,KWVW,CDRM
-CVVF:FSGJ,FBCM,BFQS,HXWF
-MMRR:KMCQ,WJXZ,QLVC,MHWV
-FVBC:QWLX,GZBS,MJGX,@
-GHPW:NGKZ,WNFF,DJPM,XQBW
-QDRB:RDZL,BMZF,CZNM
-BQHB:WVNG,QPNL,MNDB
-PQXJ:QKNQ,VGCT,SCFH,ZSKH
-MHGG:TQMV,XSHS,BVXS,TBFC
-ZJBX:QKNF,NFRK,KXRR,XBKN
-PVXD:RLPM,VMFT,JFDM,QGJC
-XQGQ:JHLX,PNPX,BTBB,DXGL
-NZTZ:GGHR,MLXH,QFPW,PCPK
-DNMR:WVHB,TNQX,NHQQ,PKHH
-HFHB:RZGF,GGNV,NJHK,GVBS
-KDHH:LNZN,ZRPB,JPJB,RLVD
-FWSH:VLZJ,RCXV,ZZTK,QCLW
-GNQL:KVQB,VWFS,LSCQ,LTDR
-ZTZZ:GTPD,GTZG,HTKD,KLFV
-LKLC:PDND,ZQKT,JGNS,WLJH
-FNKP:VKPJ,PCCM,BMBX,CJTH
-LXTB:SRRW,SLWM,VLBB,TBWR
-MJCZ:LGJB,FPWD,BPDX,QPNM
-KXMQ:JNLW,JDJD,GLRQ,TSFX
-VGWN:LVCM,GPRC,HCCB,LLMV
-QKKS:@
-MMGB:DGHL,SVKQ,SJQG,CKHW
-VGCT:QNMD,NVLZ,RQTH,KWTW
-PQNC:RXJZ,KNCN,GLKL,WHHP
-FDQB:TFJT,TCSK,TXNM,HZGN
-XWDT:XWRN,RNLP,MRGH
-FRCN:XSKQ,CGZN,BDNR
-TKQP:JCCZ,MCSB,ZTVP,KLRF
-NGHQ:ZQBJ,KRCR,MGZM,BCMP
-KDRD:PZGK,LRKL,XHTF,QJZQ
-NKCS:CVVF,CDWF,VRNG
-GNXK:VLVM,VTBN,RGTV,SKSN
-NPVB:DFVF,LBXH,CLBS
-NLHQ:XRLH,SGVQ,PTHP,ZTZZ
-CCBM:SFGJ,PHFD,NKTC,TBMJ
-THVT:VPGG,FCQV,PBSV,QKDT
-ZNBD:MTSK,FXNJ,RWFR,XQPS
-RNNN:VTQF,HRJB,XKBC,PPFZ
-NBXT:QWCK,PDCX,LSDL,KHVZ
-MDRC:HFQP,HCGW,DFJL,TJVQ
-MJGX:LLQQ,MMRR,VPQP,XQWM
-MFPT:NHFC,ZGSB,MSSD,SLPL
-WFVP:SKDF,WFLJ,TZSD,QGMC
-THDX:MHFT,BBDZ,TQGF
-DDSV:KSGS,RMKW,SVMM,TLNC
-VXBR:GJJF,VNSD,HNRS,MBTN
-QPWD:DCZX,BTHV,PSJX,FSBX
-HGDB:LDRV,FQRB,XWZT
-KFGB:VCMS,SZGQ,KSQX,RZTQ
-DXNW:FHZM,PQXJ,RCBV
-DWHQ:LZNF,XVJH,QWWB,NZTZ
-ZCGN:KTWC,STQG,LTJW,SSSP
-LVQK:TFQW,BFXL,VRLX,BJWS
-QPTL:HDKK,NSSR,NRCT,HXHR
-WZCR:WNZL,PNSM,JNZD,BSJR
-QNKQ:JXCW,MGPQ,QGKJ,WHJB
-LWKQ:PKBH,WCHQ,BSPL,KJBF
-DZNS:JQNL,SWVT,KHLK,LTWS
-PRQX:XSMZ,NGNB,SBLZ,ZGKZ
-LBVK:FDNG,LTLP,SWCD,PHPB
-TCLB:JVTT,STRR,PRZK,PKCN
-PHHZ:PWFF,GKNJ,HQXT,NCVN
-FRRV:XNBT,WHDC,FDVX,XHFW
-VRNG:TWWQ,KTPB,CZTH,KFKN
-KSBR:GMFH,LHDX,CSHM,HMTC
-FWQS:PQJC,JKQS,CDJZ,JMRF
-GKBL:XWDT,KNML,TZSF,KFDC
-MJFM:SFST,XHFP,DCNK
-NPSM:BHPR,CVNB,CPXW,HRNT
-TBMJ:MTVD,SNMN,TGKW,KXWR
-CQMT:DBCF,BDPB,BRMS,ZWQW
-FHKL:SCJQ,PFMR,NFRZ,MWWD
-GKLR:NCPJ,QRCD,JHZG,NDGV
-VJTB:RQKS,BSSN,JRMB,FQQT
-MJFR:DXPP,SMDL,QVKK
-MGPQ:NTPD,XMJS,HJKW,MWGG
-RZTQ:CCDR,LZGD,JQTN,PRHG
-RHGQ:HCKS,GDSC,SFBD,RJCQ
-NBWH:ZJCZ,PJPT,LKQB,SHDF
-DCNK:BKXL,HJZT,ZBGB,WLNQ
-TWFM:@
-TSQG:GZQZ,RRNW,CHMD,QNRH
-TDXB:KGXQ,PHHZ,TPQS
-KJSX:BKLG,FDNX,LRSB,RXPB
-DXMZ:QKZD,PGBT,FRLP
-DJPW:XRWN,QTCR,RLPC,DVRQ
-NDGV:PQPN,GVMX,KHJK,HRTW
-MMSR:LBCB,KBVG,RGDX
-SKXV:BQBS,FCRD,QMTD,BRNR
-HMQP:MPXF,BGBZ,DTPH,FLKT
-XPST:TLMT,TQCQ,WJZW,HXCR
-XVJH:DJHB,NMDG,XSXG,PHFB
-FMHG:QVGD,FVBC,CJHJ,DXMZ,@
-TNGZ:HRBG,CRXK,WMWR
-RHKF:MFHR,RHRF,BGDB,CXPV
-BDRN:BXHT,KGBV,PSSG
-HHSK:RGHH,FKBB,PHQH,NGPZ
-SMDL:DDFR,FMVM,WRLT,VVNF
-SGVM:KSMQ,FQJL,QZHW,DPTS
-LFRR:RCHS,FNKP,PGNW,TTDD
-DFNL:DZTZ,FTWN,TBQM,MJMV
-DHDZ:CZJS,PDDG,LDQJ,WRGD
-QDRG:TRZG,FXBC,DHSF,NBXT
-JBVC:MPDP,VRHG,DJPW
-DRXW:BFMZ,HMDB,QPZM,CZGT
-FQJW:QTPT,SJNF,SSCG,GXZH
-JFQZ:CXNS,DWDS,CCMR
-WSHB:PGMW,MGVV,ZBTT,WTBF
-DHSV:JJFW,BFTL,PCTJ,QRHL
-KWVW:LJGX,XHVP,PVLG
-QWLX:CXNP,KXHB,HPHF,KSBR
-VNSD:DKGJ,MCHH,QWCS,MDLF
-WPQW:KSTW,VMCM,QNKQ
-XKBW:KDMQ,LVQK,TSRL,ZMZP
-NVRS:WDMG,PNPW,DLWQ,ZFQK
-SZGQ:RXSM,PVSC,ZBVM,DZJW
-KBWL:QQHB,TGSM,JNXS,JKNX
-RJFW:CSTG,TLGX,TCMC,FPTB
-KPSJ:XTRZ,GFPH,FHZV,ZTWJ
-XQWM:SRMF,DQBL,RMWQ,DXSL
-SBRH:BLHC,CLFN,XPTR
-ZVMN:RRZN,ZMRT,ZKTD,RJGK
-LKCQ:SVBG,NFQT,QTSC,QSGB
-KNMQ:DDLK,MSRQ,JKHH,ZDHC
-HKBS:TDST,NGFL,RGMQ,PBRF
-TVKF:QFMM,CGBS,DTWM,JSMR
-KPTS:XHGD,HQPF,ZMQP,SFRZ
-RVPR:KLRG,QSMS,LTTP
-QKZD:HXLW,ZGBT,BBQP,XSBL
-SWST:TSFT,SRTC,KQLS
-DLMM:NQMC,HLFV,LKLB,XSQM
-JXHN:RGWS,WLSM,QZMH,TTGW
-QRCD:DMVS,DCSH,ZGFB,VVFK
-LTKM:PKVD,PJBL,ZLSH,QZST
-HMWL:JBMC,NTLP,DQGF,MBPH
-HGBQ:TLWF,LBVK,MRGC,PMGZ
-CSBC:HLZR,WTBK,CPBG,SHXZ
-CDRM:RCTQ,JBGD,SXZN
-JGGT:QCWD,KNVZ,RCFQ
-QWXW:TDNF,ZLQQ,VNRX,HQGP
-THKM:QXKD,ZMZB,NCXK,NSKC
-RR:VLCB,RVPR,VMMF
-JMJS:ZFZV,XNJF,ZVSK,QHNB
-KKSQ:WVTX,FSCN,HHTF,DJKW
-LPDB:XFLS,WHZG,HNDZ,DLRK
-MCSD:ZGFR,HMQP,MPQZ,QPTL
-JVQP:KXVM,DWFG,VJLX,DNSD
-GKMF:TWTH,VFJH,BDND
-NTWJ:VGHP,JWBX,BMLM,DMBH
-MNVM:LCWW,GXKT,PJMG,GFMP
-HRXW:CBSM,GKLR,SFFN
-KLCX:DTCW,DLMM,MGBD
-WHZG:CLHP,GZCL,RLHR,TXND
-XZCX:WFKB,SVVL,KDWB,LRSH
-XFXQ:GHMB,BKRT,PJHR,MDHL
-SPRK:LFMD,ZCTP,ZFGJ,RQXL
-TTQK:CFTQ,BRLS,HPDB
-SCBS:LRCC,VDWK,KLGL
-RCXV:ZDXH,PQNH,VPWC,TSJG
-TTSK:HNND,KWWH,NTWJ
-KXVR:TRBN,HVTK,JVQP
-XLDJ:TGMQ,PKWT,VQPB,MBPJ
-KMXK:FNQQ,FMHG,PMTD,@
-MGNT:MXLJ,LFWX,CDBQ,GNQR
-TSPK:ZKKG,ZXWX,DJGJ,JDVT
-PJPT:PMHN,WFFF,MQDR,PBFD
-JWBX:GNNV,QTNS,RXZV,QQSW
-MPWG:FDLM,JZRR,SPKG
-WXHV:GVDS,THKW,FJKV,RDQW
-PBCT:HDRD,HHGL,WHMR,DSWT
-KJWP:HHKT,XCJR,DTPQ
-RVFL:BTCF,GTTT,TMBZ,BCMD
-DZLL:BMZN,VXBM,NVGS,RJFW
-DVRQ:QVWG,LBVC,KSSB,HGBS
-DWFG:SQMB,XTHX,HRBT,GPTL
-RRNW:ZBWP,PJZN,MKVS,JHLV
-RCTQ:ZTDL,LWKQ,TMQQ,KDHH
-LBXH:QCNJ,LKCQ,RSTN,RGSH
-ZRKF:JZQL,GCVF,LBQR,FRRV
-KSCV:HGBQ,BNRQ,NBZM
-MHTT:WDNG,PWMN,RHSG,VRVH
-MSJQ:FSHG,PRSN,NRPL,PCJD
-FHDM:NFCN,XSPG,NFFW,SKRH
-SKPF:CGDR,VBHP,BNKS,KDPC
-GGBV:PWBT,JFWZ,WVNV
-TQSC:CCTS,QZLB,KMNR,QSHK
-XNWZ:WHVG,FDFL,BLNC,MRLW
-SFTF:TGDJ,GNXK,SWZV,JLFW
-JMTQ:TDVZ,VGWN,XRTQ,NSGF
-GBQK:GLFC,BLJQ,NPWF
-LGKV:JWVT,XBWH,GCNB,ZGPW
-MPDP:GGWR,XQGQ,NSNZ,XDJJ
-PBJM:ZTKF,KSCV,CPQN,LBQS
-FRLP:RHBG,ZKJV,TKBS,BCTW
-WMBN:HBHT,FNRS,NRRQ
-KZMM:KLKC,JWWD,CPQM,PQMS
-XSKQ:PRDR,MDRC,PCHK,GNZQ
-WNFF:JNNL,BMFR,MSBV,KZTQ
-SXZN:QCSW,ZJXZ,VNVC,GKSV
-NVSB:KBCP,JBVC,TNGZ,THDX
-JLBP:RSRW,JCWC,HQWC,FBZT
-THHM:CCFT,RKQH,ZLVQ,CZLD
-XZNW:HNCN,ZBSF,THQB,PLLX
-ZGBT:QWHC,WQMR,DBLF,STFL
-WWWP:KCMQ,MLRD,VNVQ,NVXV
-GGNV:QXRC,KKCV,JBDZ,RMWD
-MTLX:RQDV,QSBX,TZVH,HHSK
-GWMN:DMVG,QMLC,TNDW,SLBZ
-VBKZ:GBQK,BPBR,DVMV,RNCR
-TZSF:JNZZ,ZWPL,MLFN
-WXWP:FWLV,KJSX,SWGR
-DFRG:HRXW,VFKP,TXSG,GGBV
-PNZQ:RRDV,FTZD,SFLW,XSLT
-KJBB:PHQB,PPJP,FCWF,LKLC
-SRTC:BLSJ,QDWH,LJDV,BTLC
-RNRT:DBLJ,XNWZ,NMWQ,LSDF
-PLVK:KKNB,DQHR,JXZR,JWHF
-QLTK:QPBG,FHLG,XFSF,NSQZ
-KFDC:PVXD,GPWV,LPDB
-BMGS:ZXWM,WFTG,XBCW,BFKL
-GFWF:HKFV,CBVK,PVRT,VBPW
-CSMD:WGZQ,QBGK,HZJZ,VMBR
-HLSQ:WCBD,QFBX,FSNR
-TWTH:CTRR,SRRZ,ZZTG,TQSC
-RSHW:KRSJ,WLMB,QMZK,HFJQ
-SRRZ:KFJJ,HKJW,TLNP,BTTK
-DKPL:HHSG,MHQR,DDJD,HPZC
-QSMS:@
-WFWG:MJJR,HGLX,VBXJ,RSXS
-VVNF:DGXW,MPCX,VWQD,ZKPD
-NCLV:HGDB,LWXW,BHST,KXQQ
-XQBW:ZHGG,MSCB,KMXB,LWZG
-ZDQL:NFWG,QLTK,RJHJ,QMFC
-LRWG:XWDZ,DLCR,HGHS,DDSV
-DVMV:MDLB,NBTJ,RWBR
-DLBM:HWKM,QNCX,FCTR,CQMT
-QHHX:MJJW,LKCL,BRXP,VVKC
-FSCN:NLRN,SSKS,CVJG,SPXN
-SQFQ:KVQJ,KZMR,XCDD,SQCH
-RNCR:RNRT,RFNW,WXHV
-GFMP:LXMC,GTMM,VLFX,DDLH
-PVRM:MJFN,BQHB,RXMB,LLGW
-BHHJ:RMQC,CPLR,LSMJ
-MJMV:HGDT,GJBZ,CFTC,JNSZ
-GCVF:BSNC,PWTP,BDFP,QKJJ
-HTWT:CWRH,NTSQ,GCXH,JGSH
-PPJP:JNRP,XTTZ,RDHQ,BZRF
-FMVM:NCFN,LNXM,SMMC,MBCL
-LGLC:WBJS,QQCW,PBHD,RFQL
-JWWD:VTMW,NGXH,SHCH
-BMRL:LPFC,KJBB,KZXL
-SQFS:GZJK,ZGQN,NCRD,ZSZZ
-DQHR:VWQL,SLVG,MZWK,LSMD
-FWDX:LQKT,JJRT,TFVZ,NCXB
-KFKN:FTWG,SZXN,LPJJ,TWSG
-XGWC:DQLD,SQRS,PNDB,HJSR
-SFRZ:LFRR,QVGF,JKBK
-ZRPQ:MZKZ,ZWDC,SWST,JQNN
-LKZJ:GGCP,KQJN,PSLJ
-ZWDC:LRWG,PXLM,FJFL
-XDJJ:MJPV,DTZF,KBST,ZZXS
-JTVC:XZCC,LRXN,BTGD,XTDH
-WGRJ:WGQN,WJGP,CGKK,PNQS
-TBRL:NBWH,WDFW,TMPR
-VGKX:TFTC,BZDB,CNQW,GRPP
-RBQC:JRQP,WVHJ,XFTL,WFVP
-QGJC:RRFD,PPKD,MFQG,HTRX
-DQMZ:MRDT,HHMC,VLBG,SPNM
-VFKP:DFNL,FKQJ,SFTF
-BXHT:SZVP,THVT,SQNP,NPWW
-CDMQ:HBKR,SVRG,KMXF,HZFJ
-CWZS:SPCM,RDSF,JWVL
-RDSF:TJSV,KNBK,VTRV,CKQR
-LTTP:FDCR,ZJBX,PTRF,MCSD
-FNRS:JFQZ,THRN,LKZJ,GKMF
-KBBN:FQQH,QZFB,WCQV,ZVWB
-QKGK:KZMM,VSQD,QJSH
-JXLP:DSSW,BNNQ,JGVL,BRNF,@
-BLJQ:RRLK,ZBBR,XTTN,WFWG
-ZFVJ:HWJN,TJBJ,PNTP,FNHX
-VRFH:LHVZ,FCFL,FPKD,SGBP
-FFJV:LRQN,GHKW,PDJV
-WVHJ:CSGL,VVBF,QKQT,VZZV
-RLFR:XVZB,TFDV,WDJJ,QDCL
-QJSH:MMSR,MJFM,HLSQ,VMTB
-BDNR:VBKC,TGGT,WNVB,NCNJ
-WVNV:FRLR,QPCX,GKJH,WWHZ
-WFGC:QJVX,TNTZ,KKSQ
-NSSR:QKQR,NCLV,NHKJ
-ZJQF:GFTF,XPST,SQRD,ZSHZ
-BRLS:FVBG,BTVM,BXTB,GNWL
-QDWH:KFNL,VCKL,BSHB,BSDB
-XCZW:@
-CPMG:DJQZ,TCSL,LCBX,PFGM
-XBWH:DCCL,FBLK,WVQH
-GKNJ:QCVM,XKZD,ZFBF,VRSQ
-JLFW:MKQZ,HLKZ,TWCN,QQXK
-NCNJ:DGHX,FLKL,XJQK,GHJH
-BMZF:PSRF,SNDV,JWGB,FLPG
-DNSD:NGJT,FFQK,FSPD,JRVB
-DSFG:RWNB,GKBL,FZJM
-LRSH:ZTXV,JCRF,VSWW,JNBK
-RMNR:XRTX,NDRL,CSJW,BGBR
-KXHB:JMHJ,DLMN,DVZK,QRMJ
-KHWV:GSBM,BTLW,QDXF,XTTL
-TMPR:WKVV,PHZQ,PLCG,KFKM
-JNZR:THSX,CTTL,TDPG,JZNV
-ZSDJ:NPQC,QCMB,MPPP
-QFBX:LXLH,HKBS,ZJJR,LNLJ
-JWHF:GPRP,VDHW,HWMF,QJFC
-DBMT:NJZZ,PWJF,JWNV,BLDF
-HXHR:KPTS,SXRB,SRRP
-XMSX:RFSR,JKMG,SCFT,QSLM
-CRXK:HXCB,RMNR,ZHBP,ZFVJ
-FBLK:SCBS,VBLF,BMRL,TBRL
-QFHP:ZRPQ,TDTF,NVSB
-WSHD:FFDK,ZKPJ,ZBWB,LGKV
-GMVV:CNSS,NVRS,CWNR,WZNM
-FTWN:GTNF,RWLR,VVXS,KBXF
-LLGT:NZSM,XSHV,BQHT,PCSS
-TRMZ:HVDK,GGWS,DFRG
-WCFG:BBNC,TRLQ,SZVT,MTPB
-FCFL:KRZF,RTPX,NBRB,KNRR
-HWZZ:RHFT,XHLW,HSHQ,WGZF
-KBCP:PHGS,TSQG,PDGN
-ZRXJ:SHWZ,FDQB,CMKT,KXMQ
-VFKZ:VFKG,CPMG,CLKS,QJQL
-DMBH:NSTG,LSVK,RGQK,CDKR
-DJKW:XTFH,KLSM,LNTN,MCKX
-JPKX:GZJJ,FMTZ,JCMF,SQPC
-HXHT:RLNV,GCSR,VSNF,ZWFF
-TTDD:PSFR,WRDG,QLNJ,VTDP
-VPLL:WMFX,SPRK,RXWT,MVNM
-FLKS:MHNW,RTJJ,VZXJ,GFWF
-NCVN:ZMXF,RGTC,GQJN,SXZQ
-TRBN:GGPR,CHRJ,GZGF,LXTB
-HSCX:BBHR,BLJT,JBDX,VGSX
-VXBM:GQGF,DXZV,VLJX,MTDW
-CSXC:SHKK,KQTD,CQDH,DRXW
-GHKW:LJWM,DBMT,DRSR,JXHN
-QPCX:WFKK,XWQF,PVHK,DWXZ
-FXBC:GZNC,VFQW,DXSF,FGCV
-QMFC:VBJZ,BCJN,VZQQ,LNBL
-VMFT:WLGR,NVNT,JSSQ,CJFR
-DNFD:WGVP,RHGQ,MSPD,TCLB
-DWHT:HJGN,GJTT,DRGC,TQLP
-JVGJ:FWSH,MLTB,ZDQL
-HTCB:KBDW,JCZJ,QTMQ,VJFC
-VWFS:CDHR,RWMS,JMQD,DCTS
-FMHX:VRFH,TFWX,KFGB
-FLKT:DHSV,FRKW,ZLDS
-NVCB:WWRX,SXZS,LDFD,SBQW
-LBQS:JMTQ,BDVB,LDTN
-QHND:NLHQ,GJPK,GXCH
-XSBL:DXDJ,HQPW,CHJR,KGZZ
-MQBB:FQTT,STNQ,CWWJ,MGGG
-GKSV:JFCG,XLKB,DLCQ,HTGZ
-THRN:SMFM,JLXR,GMVV
-ZBBR:XKDZ,QVCW,LSZK,KPGB
-QKWJ:SVNS,KRRF,MQMK
-JZJX:SZCT,SLVL,ZXQS,BZLR
-HVDK:CWZS,BDRN,QKWJ,KXVR
-BZSQ:MHKL,GVFJ,QVZM,LVVK
-SHCH:MJKT,VJTB,SSJD,BMGS
-TQKQ:VXWX,NDRZ,WXDZ,ZNNN
-THKW:QPVQ,RMVX,KTKV,KBDB
-QTCR:CXCZ,SKQK,VBQS,PHGM
-QSBX:TRHZ,BPCZ,TZRM,XTNQ
-KLRF:DDJC,TPCV,RBSW,SFVW
-SVVL:KJGT,MTCS,JWJT,NFHW
-PKRS:FQBZ,PBJM,RQXV
-GNWL:PBKV,RGKC,XBQL,XPBX
-NNCC:LMJC,GQKV,XSHN,SRDT
-VTMW:NCHD,FQJW,HRWG,DNMR
-GWMW:NCPT,KDRD,JVBG,KNMQ
-BLHC:SQWF,DQMZ,FCNV,KBBN
-RTJJ:SVBX,LMCP,JMFL,BBTM
-HHGL:TVJX,BZQV,CQDG,PTRV
-FBCM:FFNZ,ZSZK,WDSK,PPFC
-NFRK:JKRZ,WMBN,TVJN,DCTX
-VZGP:FLNR,QVNR,FCLJ,HLNB
-WWHZ:WKGW,WGHB,KPLV,JNRF
-FZTK:CZWL,WWWP,BSMG,JLBP
-GCZF:HMPV,GWMN,LNHK,JPKX
-GXKT:CCKD,PVND,KJHM,NBLT
-KXQQ:RCGN,XLSH,GCZF
-TGGT:CQLM,QQGF,LHJN,RWMN
-RVXR:QDQB,LLNM,XRDT,PZVM
-NPWW:SJSZ,TRGS,FZZM,BQHL
-RCGN:RKHG,NPSM,SNMG,HTCB
-KVJC:VWPB,VWSH,MXQQ,KWPD
-BWXL:NNXV,TBHX,VZWM,GZBW
-CJSV:QDRG,RHJJ,VXBR
-HQPF:GNQL,DCCM,DZLL
-BNNQ:PBZT,TWFM,VZTV,ZFJJ
-PHZQ:KNWP,XKHB,GWXB,LRDM
-XQMP:PRMV,SMPC,BDPG,MHTT
-LTDR:FNZX,LQFG,CZVH,GRSB
-QDSH:GBFW,SJXJ,KPZR,CJTM
-WBRM:VXNF,PPWD,TRQS,WNGL
-QNRH:BBFZ,JGTR,SFHR,PSDW
-CPQM:VDRM,WDST,MDXV
-LLFH:DFCM,DRCG,ZGNQ,WHCW
-BHST:GJRJ,CCBM,RRBM
-SWVT:SRMT,WRSC,WHTR,NWSB
-WPCT:BDCB,LPPZ,BDHG,RZBZ
-MNGQ:@
-RNLP:QFWM,LLFH,KZKM,ZDDH
-ZGPW:FNLH,GSFW,SMWV
-ZRLF:VFKZ,LZRV,BPTP
-JPWN:DCGD,RVFL,SKVL,KVJC
-FJBH:NVDR,TXJS,FFFL,BSTJ
-XBKN:GHSJ,KJWP,VXMD,QFHP
-ZKJV:VJTD,TRTC,CSXN,JSBG
-NLBW:LDDX,SGVM,ZXFW,FHKL
-VCJL:TMTG,JSTS,QBFN,WPVC
-BVLS:QWQG,RVXR,JHMF,VZGP
-CPQN:GSSW,CCLN,GTLJ
-FJFL:CDGN,TQQF,HRKW,JMJS
-DCTX:VBKZ,ZNGX,PVRM
-LNLJ:RHNG,XQGB,GHNV,TWND
-BRNF:MPFJ,BFNJ,PBBF,MSMX
-QRHL:BVLS,JHFN,BJPJ
-TCSS:JTFX,THHM,FTMS,NVCB
-ZDDH:MMCR,GJGB,QRHT,ZBGF
-HDWC:NKQQ,KMXK,MHSZ,TRMZ,@
-ZJXZ:XVFZ,XKBZ,MCJQ,ZNCQ
-BPTP:FWTD,DWHT,VPBL,THKM
-HLPZ:ZTLT,DXNL,CFVV,DSQV
-BJPJ:QFVW,XFXQ,ZZHT,PQNC
-LSMJ:VQPM,WSHJ,KNFN,QSRD
-KRRF:FMZJ,MMGB,HZDJ,HTWT
-BKDW:NBGM,CSXC,KZQH
-DFRB:LCCW,TWTQ,DSTC,PHLD
-BGBZ:QHPH,JWLS,FGWN
-WKDQ:CNLK,MRXK,FJTP,NVWJ
-VMTB:RBQC,MTRH,ZVNG
-WRXC:VJRT,KNNB,VMLG,KNWG
-MZKZ:XMRG,GWMW,CMKQ
-TQQF:CJFG,KVNQ,NJRK,XKHS
-ZSHZ:FZFX,QJCL,ZDQH,WHDT
-DWDS:MSWH,XMKK,XSGG,RLFR
-NBTJ:VGVQ,FHDM,BHMX,CDMQ
-RCFQ:QDRB,TTSK,FFJV,WFGC
-CJHJ:MJWC,TCSS,PLSX
-KTPB:ZGJZ,FZFM,XPSQ,VKJX
-SHDF:LSLC,LZHS,PKNK,WDVJ
-QNCX:WFQP,JMBV,DMCL,JKGG
-XPTR:PSQC,WKDQ,KQDT,WCFG
-LSDF:LBDG,RCMH,DKWB,HLNK
-PHLD:QFTW,WXFW,JNHC,TJFM
-WTHL:SDTX,CFMR,GZRN,CQDR
-GNZQ:RMRN,SCBP,PKWJ,GRJM
-QVGD:QKKS,JXLP,SQGG,@
-ZVNG:NVCG,RNNN,QNHS,FDXQ
-XSQM:LFKQ,THVB,WSKV,NTDT
-FDNX:PFLS,RPTS,ZQQL,FWCF
-MCSB:TCGR,TNKN,HLCB,NNSG
-KNZH:GVWL,CJKJ,MWXZ,DJNH
-WVNG:KVFQ,NGHQ,WRFM,WZCR
-BTLC:FRJD,VFNX,QFGP,GZMZ
-WZNM:MMZQ,DGCG,SXQG,LFHM
-DTJV:GJVW,PKRS,DBCJ,QKGK
-KFKM:ZTKC,JGVD,WWWC,QGBQ
-RDQW:FRSS,FVTD,QFHQ,QMXP
-JZRR:LHSZ,MSHF,CPBH,SKPF
-SGBP:LQPX,JSKM,JJQN,QGMB
-BPBR:GHPW,FSZW,PGKV
-KNBK:ZMPB,WMQJ,TBVB,PGVQ
-SFST:GNBM,TQKQ,XBBS,ZRGC
-FDXQ:XDDM,MZWH,WKTB,KBMZ
-LTWS:VGRC,SWVN,VSXL,XRVP
-CBWB:QQXH,PZMF,QDZR,MDTJ
-QJVX:QBBN,JZJX,DHKK,WSHB
-KJSG:XQMP,QTHJ,TKQP
-BCTW:TJCT,NDSN,FMVT,HXRL
-GXCH:NRML,HWZZ,RXGS,KHWV
-XMKK:NSDP,WDWV,LCDG,BQMJ
-BDND:LPHD,HSCX,SNPL,CBWB
-CJKJ:KKLB,VDSM,HKKP,FQVT
-ZTKF:NFLC,XKBW,FJCL
-CCLN:JVLD,NNCC,KDFB,HLPZ
-HXQW:MTLX,MSBT,FTVV
-PFMM:XWKR,HTWF,XMPS,PDRB
-DLRK:KTMQ,QJTP,KDFQ,RSBB
-ZSKH:WDJK,DFLD,QCSS,PLZK
-NCJS:XCZW,HDWC,PNZM,DTJV,@
-MBTN:RBDZ,LGSF,TCRZ,RTXG
-PWBT:RGJT,CXBZ,CBQJ,LTKM
-ZKKK:CVQG,HMWL,CTKX,MGNT
-SNXP:NCCL,GCWM,RJKZ,PTHG
-KLKC:JNWV,CFCH,PSLG
-SDSV:NSLX,FWQS,CRRF,LDDK
-DSWT:CPZW,NPJP,MXTB,QLFX
-SMFM:CHLT,QDSH,ZSFQ,LGLC
-QCLW:QGVQ,GDMJ,XNMH,SXMJ
-ZSWR:JHBP,CSBC,NWZV,PNZQ
-TXSG:XQGP,HFHB,XFKX
-DLCR:MHZH,JGQL,JCDJ,RMKN
-KQJN:PQXZ,ZNBD,DRSP,FWDX
-CHRJ:SSND,VDQZ,ZWLW,GKLS
-FCZP:GGLR,QKWW,FTWH,XMSX
-LWXW:ZSWR,JMSF,PBCT
-SGVQ:ZXNG,WWNH,NWRK,KFXZ
-QCMB:XVXM,BZSQ,KGXN,WRXC
-PHFD:NTRD,SHLK,FKFS,LBPJ
-NBZM:WDSN,DHDZ,GSDK,KPSJ
-CXKD:BBNV,RHKF,ZKVT,ZVMN
-KLRG:MNGQ,NCJS,GHZR,WSHD,@
-TQGF:MQNS,WTHL,FJPL,TVKF
-NKQQ:@
-JJFW:ZKMW,DFRB,LKHP
-FQRB:BJKS,HXHT,CXTJ,DKPL
-HLFV:NKSP,TBSG,TNJQ,TMJF
-PQMS:MNVM,LGWN,JPWN
-FTVV:QSKD,TFML,ZGJJ,TPJX
-ZKPJ:WHKC,DSFG,FKNR,JGGT
-WSHJ:RLWC,VNZL,MXKB,JWBJ
-QSRD:DCHC,SQQB,SVBR,RLTQ
-ZMQP:XHMT,PLVK,HCLD
-ZRGC:LDVN,PFHC,PLTV,KZKP
-WKJG:HTXN,ZRKF,QKLN
-TWTQ:CPTH,BFFM,MGKG,DZDL
-JQNN:NLBW,HXPQ,DWHQ
-QJQL:KWTM,WPKD,FJMN,VSBB
-CXBZ:PHTM,VVKR,JNJK,VKLP
-SMWV:TDXB,NKCS,TDLV,ZRLF
-LDTN:ZTGD,BWXL,MBQT,SNXP
-MSHF:QZFH,ZKJH,LVQF,TZLM
-HJZT:KJFQ,FWJS,HQWP,CGPM
-VBLF:MHGG,FMRD,SDSV
-KQTD:QGFC,CNFP,BVMK,GSPL
-PCTJ:MNML,FZTK,XRHD
-SRRP:TTQK,SBRH,WXWP,BHHJ
-FNQQ:@
-RGSH:TVZM,RHSQ,KLDM,FDFJ"""
-
-q6_input3 = """VQKG:VWXS,KPTL,RSBG,KGBQ
-TJKX:FJWP,XQNF,CRTV,JMWZ
-CQXG:DVBL,KRJR,SQDX
-QJPB:GSQQ,TMGP,XHCQ,XMRJ
-PTRN:GRLG,XBSF,GKRR,TVCL
-HBLD:MRHV,CDGK,MJSV,MPHD
-PDDH:SBRR,QGPB,RPNH,MWMV
-FBWW:DFWJ,XHSW,QDNC,GTJW
-RKWV:GDMQ,SXFC,HSWG,QKFH
-MNDV:LRPT,QNTB,GXHC,XNXV
-PZRF:XJGZ,MVQD,ZVRJ,SFMZ
-KHTR:TPJS,SGSG,XQBJ,BQDN
-WLFT:JJTM,DVNB,TMDF,KKBS
-LTHQ:ZTQD,QRTN,TBCR,KZSN
-RPTZ:FHTT,MSNW,QXSM,MKGB
-WBKN:KDLP,FGBC,SFWR,DNPD
-LXKW:BFWB,DVLQ,THXC,JGBR
-VTNJ:MSMK,DMSJ,BTJL,QQJV
-TNLC:XJZV,KMJK,LDBT,HHQZ
-VQWJ:FWRW,LJWD,KNPN,DZLV
-BTFP:KHTZ,JMPN,WFRW,DLHH
-LZHP:SGXW,NTGH,PZTP,JMDQ
-MPDR:PVCB,FLZT,TCBB,BJCT
-ZKJL:MBPM,CVPV,BJBV
-RSCK:ZSWQ,FTMR,SBVC
-GDXW:KWKR,FJNS,CGNH,DBJP
-NDNK:WCSR,NFKG,FXBV,NNKW
-HNMQ:NQHS,GTJT,GVRB,FRJG
-NKMS:BCKS,NNBM,VQTF,LFRX
-HPKP:FLSL,NZLT,KBJD
-FTXK:CGTZ,TBKH,HDHC,CXFG
-CJPV:HTDR,QHVQ,KFZS,NNFR
-CWGN:PCPJ,HVCP,PBQN,PBJT
-TWSR:QKKX,NWXB,QLLH,SXLP
-CZFW:HVMN,KPWT,TXKP,VTHM
-TGVW:MFQH,TLFG,ZSXH
-PFRF:MBDV,XGBN,MMBD,GLHK
-VNCQ:WBTF,GHDW,DSGB,SVJF
-PFFV:TNKR,TZGM,DQNL,LWGN
-RRKR:XVZK,VJVZ,DVMD,PXJD
-PLZJ:JHGS,VCWJ,FVPT,FZZK
-DMPS:DSWW,FHWF,WGVL,BFSD
-QNXP:DGQR,SDQH,XRKJ,WKHL
-NDNQ:VMKR,LQZN,SJTM,DPHT
-PKNS:MSFG,PMHG,CKWD,BRWH
-LNGK:HVPD,WFTX,ZDRT,FKGF
-GPMC:VPNG,VDZM,MSHS,CSDX
-MLRM:PWWN,VNCQ,HLVV,JGQF
-FWLM:KVKD,TVGW,CZBC
-VJBM:ZQCL,FQWM,PJPP,PXNK
-ZKZH:HVMV,CXPX,JJLG,ZJCT
-MWLS:NNNX,JDBD,PNRG,RCQP
-JQQF:STJV,TFQZ,VGDX,RFTL
-ZSTF:FHTN,KDGF,QCPH,MPJV
-FGFP:HNWF,RMJJ,DPVG,LFQF
-HZVC:FJLX,NCWQ,LPMN,SKQD
-THKK:TPQH,VKSQ,XPMQ,CWFF
-PSFP:LLJC,VLPB,BVDC,WHTW
-JLPT:LRXK,WBLS,TDCJ,ZBSH
-XRJS:GCXH,DPCC,SBJC,GJQX
-FDHV:PHHC,VRQF,QQLC,QRPQ
-WMRH:KJJV,NKTR,HJBQ,XRSN
-ZKHR:MGKH,VPPC,LZWM,ZFWF
-BQST:JDDB,RJLZ,JKLX,JGRQ
-GZGF:PGLV,FQWJ,FXFL,@
-PDKV:RRRS,SPSQ,DPKS,TBZR
-FQKM:XHTK,KKKP,ZLZZ,XJXC
-FDRX:CFCL,VWKK,KFXS,CGFD
-SMMV:KJCL,GFKW,VQBR,CVZV
-SSCR:XLXW,PTFH,SZTQ,HZXZ
-JQRX:NBTS,WWQH,XCHR
-ZQJJ:QVRP,BJBM,XZGF,WQRC
-GJZP:RHQH,NBQL,VGBT,RDHT
-RLPP:ZLHW,DJTB,QSMF,RHVZ
-KXLQ:PWFD,PVPS,CSQD,BFPT
-VJLK:BZNW,GTVJ,PVFN,SWDG
-SSNZ:MVHL,VJTS,QRMW,RHGP
-CKNP:LQHJ,GZGF,CQJZ,VCFB,@
-XHSW:BQZL,XKBC,SWHJ,PPRF
-XHHC:LNVL,LVFR,PHZL,TMPN
-GKCH:DNGL,GDQN,HXPF,PGJV
-DVJR:WKGW,DVCR,HSZQ,NJGQ
-KSJK:MGVV,QCSF,VBSV,KZJD
-FDFJ:QBRH,BRSX,RRDV,FBRG
-DLNF:DSGK,NGZH,GPDB,VGHF
-MSBX:PRGS,FRTV,WMTP,XLZC
-TZWD:FCSC,FJCD,XHCK
-KXGW:ZJDB,GQVL,HWTG,RMWX
-HNBB:DNXH,BCGF,SJNC,MKJX
-XBJF:WTVL,LRBZ,KPGW,MNDF
-RSRF:MSDS,FMQK,BGPC
-JZQN:TVDD,LKQR,RKPN,HBBF
-BGWC:FMBD,WWPB,PMMH,GLCT
-CBPM:PNSX,NGVR,KHMZ,RVRS
-GSWV:GJRH,LKVG,PDNW,GZWP
-ZLZH:HGDC,LJXK,LCXH,PBGD
-BSZM:WNQF,ZGSW,PJNN,NSCN
-LHQL:DBQG,NCTF,ZJJL,MNKC
-SJJQ:QVGG,MMMX,WBTX,BSJL
-RQBW:LXLW,NFQS,VJQQ,BHJK
-MDJD:VSMX,XNHX,LXRX,MZNC
-LSTH:QMMX,HQQT,WXVM
-DQQH:KXZC,LRXQ,VQCH,WDMC
-TNBN:FQRH,BZHS,DHBD,KMWS
-BLKW:NHCP,BVDJ,HTGJ,RHSQ
-RZCV:ZSJF,PNBJ,QDDP,RSNR
-NPPP:XWDJ,FFLZ,HRRX,CSGL
-NPKC:VZCF,GZTM,XBCL,CHSQ
-XBGZ:JVCB,BVBC,NTQT
-BRTG:BHHB,ZCVJ,MZCC,SCJN
-BWFP:GLSN,SLGM,SVZN,GWKF
-HTJT:BNQQ,FMVW,QVZZ,NTKM
-NVGX:VZGF,QWCN,VBZJ,RVHW
-JFQC:KPMD,SXVV,LCSZ,CKZV
-QFMP:JSLZ,XZCM,XWRB,VDKB
-GLZB:RHQV,LLVJ,GFRF,DWMP
-CJQC:GMZJ,NWXH,QDBL,RJTD
-JRCW:RRLS,HSXC,RNZD,NFMC
-GVXN:HNGP,VRVV,NPRT,CPHT
-QKWJ:JBZW,ZQTS,XFLL,KPJQ
-LCLM:WRSS,MBDL,MVPF,QRCD
-ZGSW:SRPG,SQNJ,KPNF,WQCW
-LHVT:DQHZ,TPRS,LWJL,KCVP
-VTHM:CCRX,SXFD,DXDP,GFVH
-MWGJ:JCLQ,LRJB,HBKK,ZJKH
-CFMF:FVMV,KCLJ,LTMJ,SGQQ
-QNTB:WWZR,HHXD,NQNS
-BLVD:BUG,@
-CMVX:WMFN,XWPC,FLKX,VQVM
-QPRH:XJLT,DJXH,NDRD,NQBH
-RVDF:NDJG,QZLD,WTSQ,HJCR
-ZRRZ:FFXH,MNNQ,DRDX,MGLC
-SHNV:ZCNJ,SSZX,DLMD,LNCC
-CJNH:HPWX,MKLT,HMJK,WLBV
-NBMR:NDLL,TNXC,QHWW,PRSQ
-PCDQ:VLRL,HLVX,NQMM,FRPB
-MNGD:DZZC,HLBX,DTWG,NVGX
-PPGZ:CXZR,RKRQ,GZRX,RLWL
-VBZG:RJPS,FBVS,BQDR,CQSN
-JPRK:CKHG,TCMK,GNQQ,DHKJ
-KDBM:PDFP,KJXZ,RBPC,PMHJ
-BLCV:CLTD,MJXC,ZVTG,XSJL
-DPNV:WWZP,NSFR,PFFV
-RVBK:XBSD,NFVH,SPMN,SZVC
-JSDH:ZQPZ,KJVZ,HNZP,XGML
-ZPLV:JQGM,HBXM,QHLV,RRTN
-JCRK:LDDD,CTXG,BPVJ,RHPK
-GFDC:WKWB,PJXL,LRKK,FVLH
-XPZD:ZWCR,JPBT,QPHB,BZBJ
-FRPH:DZJS,QLVF,WDQV,DGCD
-SFNX:GHKF,JJGM,BVCK,CDTB
-VPJC:THFG,CMZP,PGTX,GRWH
-NSRH:GBCC,HDWM,HSLX,ZDVD
-HLWH:DDXB,VDWL,NWDC,NFNR
-XLDP:LWPP,FMBF,HSGZ,MLQG
-FWML:FZZT,MVTV,DWCJ,ZDRB
-XRPK:NRZP,PSMH,TLWS,FXCC
-SHCF:JRRL,HXGR,JVQP,JJCM
-GHDS:WRMQ,HNPH,GNWV,TPZJ
-TVJT:ZGGZ,TCTT,BBSK,JTKH
-LFVV:WGDL,XPZN,BWCX,QWCF
-KXTH:BVTR,XHKK,GRZJ,VNMN
-ZWNV:FGXS,HDLF,DCCR,KTLR
-BGXP:GPBZ,NNFK,CFXS,XSBP
-GLCJ:MTDK,TWPF,WSFW,JZVN
-PRVJ:TPMQ,JCJP,WQZW,QXWN
-CLWL:SNHF,JLQF,HXVM,XPWZ
-JWBW:VDBB,PKCF,VJXT,WRSC
-HQQW:CTKQ,XWTC,JJDX,GTMG
-JVST:RXHN,VJBJ,TPPW,WCTX
-MZGZ:NZRC,KMZT,LXKH,HXVD
-CQGM:LCFP,QVXQ,MWQS,SNXV
-NGDS:HTDL,ZVZJ,SLBC,VMFC
-WQJV:MZSL,GZJB,ZJFL,BTSC
-BRFF:HMRZ,XWRP,QQWK,RRVS
-XTNK:PDPZ,JTKR,BXQP,MCPF
-QHXW:VXCM,KZHV,VDDL,RVML
-BPVH:LZVX,WSDP,FBSZ,RZTT
-DLXN:BWRN,KJWN,GHNN,CSTD
-XWWG:HTFL,SPPB,CDNN,KLJQ
-XCTN:ZJLK,MSFP,TZKK,CPMR
-RSBC:MDHN,QMWT,VKCH,SVXZ
-TWVV:FRBQ,QHMX,CZGM,FZTM
-PBTD:CWSJ,QCWV,FFCL,WTWC
-QRNC:KPBP,VJPG,WKNK,QRTV
-KZQJ:SZHN,NLLD,WGSX,CVNZ
-CPNF:HNNF,QWTG,LJGJ,ZRGT
-PNVT:QWQF,CPHS,SZDG,LMZR
-RLQV:FKPR,HXCL,WNQR,VGJM
-DXLG:WHVT,KTDV,RLZN,HKNJ
-ZQCC:LLKM,XNSQ,PQSB,THRW
-NVKQ:ZPFJ,SFNX,JMFJ,RNSQ
-DBRZ:TPFX,ZXPS,QQKS
-CDGK:LHDK,QBSN,DGNH,SJLR
-MRMR:GVWX,CRWC,CCXJ
-SBCC:LXVJ,CDXP,PFLV,VMLF
-TBVP:KKHP,DDGC,GDLJ,TKJZ
-GDCJ:NTRS,PBHN,MCGJ,BFFK
-FRPD:JXFW,ZZFW,VRZH,HBKC
-VDSR:ZDRV,FPBF,BGFL,XQKP
-MSFP:ZCTP,JPSV,HMSL,SKTJ
-CCNV:JSXC,VBTJ,CTLW,NWFX
-KKLL:KFQF,NPHG,RNXZ,BTKW
-XJRS:KNGZ,DWPV,KPKZ,PPLX
-ZNGM:WCLT,KNBK,MZCH,ZMHQ
-KGHW:RHMD,QHWS,SNRZ,BVGQ
-CKCQ:HPMV,HTHV,FSLS,HXPD
-JXTH:BKRB,VPFD,BTJH,DRGB
-SPJR:DZBS,LQXG,HTBT,GJSS
-BKGD:DFPX,FRPH,FBJF,BCJR
-DLHH:GCGF,LPWZ,SBJP,RRQX
-MWJS:JQXM,LTCF,RZDW,GPQG
-BXVV:RZNX,KXNZ,THSB,JBJX
-MDVV:MJLJ,SVRD,PSWG,VDPS
-QGTB:SMDC,KNRZ,ZNFK,MSBP
-WKVK:LPKH,VRSM,QVWZ,QFCF
-GLTS:ZNJN,DKZW,HRSZ,MFKL
-FRBW:DGMX,PSDW,MMLJ,PTMS
-KSKG:QBDX,FNQH,TRGM,XTTH
-TWSB:VRGT,TXRZ,RBHZ,LVPG
-JWDS:MXQM,ZQNG,PZCV,GLMW
-CHRC:BKHQ,HQSW,ZNBH,KFWL
-NFQS:XKFR,KMLX,QVZB,TXJD
-TPXM:VHKF,TBFP,BPNW,TKHS
-NBCL:NFVL,ZTCC,DWTR,VDFZ
-TFZL:MGRV,RZZF,TXLJ,ZQKX
-KDLT:PZSG,MRSV,PFLG,ZSXD
-SQCH:VHMP,NQWF,PCDZ,VSBG
-TQFN:KBVB,MPPQ,TWBP,FHCH
-FRTH:NDZR,RLVM,CFWP,WWHF
-QZSM:RCVL,BTHJ,XJBH,MXSG
-LTMV:JHXT,FRMX,DWBX,PNHL
-JGQS:ZHPF,XWJH,BZWV,VFVJ
-CGML:WFVC,GLZN,NXNM,CVTZ
-HFVN:BXQV,MLRW,RWPS,CNXT
-ZWWP:VPKR,PDJJ,WMWV,NPKC
-MRXH:PQPD,RLVK,HMMQ,PSZS
-HZFT:NGNW,SHZM,PFBJ,RDSP
-THGD:XKKP,QPGB,PMRR,WLVG
-KGBQ:WMKJ,GTDB,RMVV,BWXN
-ZQMK:HSRZ,TZZG,NRPT,PXHL
-KPWT:QZKZ,LKPK,ZDCF,SFCG
-FNWN:SGVL,VMGT,NNZC,JWXW
-BNNG:CMJP,BGCJ,CLSX,HBXV
-VQXK:QLRF,PFLN,QGMJ,LVXD
-BNWV:QFRB,PXJM,SXQN,QCTD
-HRHX:RCGQ,HFRZ,XTQP,RKVJ
-TPMX:LTSD,LHGB,SCRW,ZRKL
-BHBF:LXPH,TSBR,BHTB,QJNC
-BZKT:QNWJ,ZJCX,BKNQ,WRTV
-GVXK:VPPN,RSSN,ZSDD,HFXV
-RPHP:VQKS,DTPH,KPNS,MZLN
-ZBGP:CCWK,RBRL,QFCV,RFLN
-GZZQ:QQSQ,TZST,CGGH,XLGP
-LFMC:TDRN,MHNJ,ZVWR,ZFSS
-DKFL:ZFWJ,ZRNG,QHKS,PDFV
-RNWB:WMVX,MBLB,KXLT,DWRR
-DRRH:SRCR,HZVC,VKXW,WNFP
-LRWM:JHKW,BXKS,SCPG,BHMD
-TZBG:PFLM,FTWD,ZHTZ,HCKM
-LRKQ:ZWXS,LHCZ,NXSL,CGMW
-PTFH:NDLR,KDTQ,MZPB,QRFW
-JJRX:GHRM,NPWF,LXFX
-VTNF:JHGC,KFPN,MXMP,KGHQ
-SNQL:WJNW,NJRT,PTXF,LDJQ
-WXLD:CGBF,PHRB,VVQF,BFZM
-QWTG:JWJT,PJXR,BGFH,RSLK
-QLTC:HFWW,LFNP,JBKM,DXHF
-ZLDC:TMQG,FKCL,XPPQ,TGVW
-GLMW:LVJM,HDTH,JLSM,DGXP
-CKWV:XWWH,HHZN,WVJH,GBVT
-NNBC:MGZL,SGSS,STQW,HKKC
-FGBG:WSDM,GGPR,FSTK,LCGF
-WKVH:HCRP,FDZR,DKCB,JZQN
-GXSL:PSWP,XGQR,KPXR,JNDS
-LKQR:RPQJ,PPPQ,FHZZ,DFMC
-XGGH:PPRD,ZNGP,FPMV,PKVX
-JTNM:DRGP,TCHD,CLDF,SSGN
-CZWG:NBXT,JQJG,MRJM,SQHL
-TZST:CFDH,ZCHW,MCXD,XRGS
-KKMF:ZBVK,KRVB,XDTB,CJQG
-BTDS:GCHB,PNPT,GZFM,TFZL
-RZLL:TDFS,HJGD,JWSW,XPCW
-SGMH:BJDB,DVJR,LHMP,KQVD
-QCGW:MMGH,FCHS,BBDZ,JVQH
-WSNR:ZDVP,FTXK,HFJG,KLDV
-WTMD:HPKC,MSNH,JHLL,ZCWJ
-JHWX:TKND,MWGJ,RFVF,GXZX
-FKJJ:ZMQB,KCZD,HVQF,ZNPS
-QHDJ:ZPRM,BJLP,NLHG,JWDF
-KPFC:NJLP,VDNR,DBFT,MQSN
-NLNN:RSWJ,ZVMF,BWNR,XTQW
-ZXDW:VZVF,JLXJ,RNTQ,LNLZ
-HHWL:PJPQ,TNNX,RQMK,TKPX
-WCMS:TDDD,TKGC,NDKM,SPPP
-DFCP:MVNK,WVBF,WNTF,JXSJ
-TSWK:CXBT,PNDR,MVWQ,THSF
-LZDL:RBML,NHCT,VMMX,TFCR
-SBDV:TPPX,LHMX,QNLQ,PHNJ
-XKNF:RHFD,SDSJ,MTZL,ZCFG
-BXLN:MHQX,NHKS,GXKW,FVFS
-LLMH:ZCZZ,RRZL,JMLK,MRRP
-MZHX:CPKL,MFRS,FBHD,QNQP
-ZRQW:FHKQ,NSTJ,VGZT,FXPN
-XJQG:ZBDT,QKCV,VLXW,CKPR
-BCGB:QKRR,LLHW,WQZN,QTVJ
-FLHD:VJTT,MRNL,MDHG
-NBHS:SXRV,CRDW,TMQB,PKSC
-KSWN:WCKW,THSC,TNZX,LNKK
-DCMQ:MZKS,FBHH,KRKQ,LJMR
-ZRSW:TXGF,FNBK,TFLG,LVZH
-TCJZ:BVDQ,FRPN,RZXV,RQKH
-JDLP:SDRK,PMXK,WNRV,NDWQ
-CDTS:QKZT,HXTJ,WVXN,KRFC
-HWQL:PWBL,GJJB,QLZP,WFQG
-NRFH:VFLH,HJPW,FVZH,GHFJ
-VGFX:QLBQ,GQGV,FKXL,CHWF
-KXSC:QPKP,PPVT,FJVC,DXGX
-QFCZ:FGCD,TDVQ,ZTVJ,FWWB
-MFRC:WKXD,NVFB,KLCT,FJMC
-MRRR:SSZQ,TPHT,HJJC,MSDK
-ZZJN:BHKT,NDHF,GQHR,JSPR
-BQRB:TNHS,FHSZ,GLHL,RQNJ
-PTRR:VRMH,HXNC,BHWT,VTBT
-XGKH:CZBS,ZGCR,LVFC,FLQB
-FVJL:CVLQ,FGVR,MQDH,BVKT
-DPQX:QRSH,XBJF,PGPT,WBKN
-QTGX:WDFM,SBDV,RLTN,CDCM
-XZWG:RCFW,ZVFD,QRNW,CPSJ
-BQMD:FMRL,CNMW,KZKK,RJJJ
-XFCW:GTRR,BKDW,ZJMZ,FNQJ
-QJNB:GHDF,HZJR,MHDH,CDXL
-MRFR:QTBC,QJZR,TLVB,ZJMK
-ZJRG:MGQB,PFCH,KBMK,LGSM
-LWSW:ZMRZ,TKJX,LQZR,ZLDC,JMSG,DFHR
-PSTQ:ZBSX,NPGX,PNJX,BBHL
-SNTM:LNNV,NHHX,TQZX,KHTR
-BTLK:ZHNX,VXGF,BRWW,TTQW
-PNKR:CGQS,GGZH,DMJB,SRFR
-KNQS:DGKB,VJKD,PTBL,MHJD
-DPQV:CZFB,TMPK,NGJL,GXJG
-TWZD:VNJQ,NXQF,CDBG,PWCC
-WSQF:MVCN,WGPS,NDZL,NZPB
-DJMC:QGDN,GBLW,MBDR,BRKJ
-WHNV:MVTX,WDHJ,QKDM,PFKP
-QNRZ:BLZF,RCVD,FZJC,GZGZ
-GXCK:NPXP,BSDH,KGPL,XGGP
-WMMZ:PKVF,ZMFM,LHHP,ZKGP
-FMDF:ZMBT,STBZ,ZMFQ,VFDR
-GMRM:DGTV,HGDZ,JKXN,LFKF
-BCDX:BQBB,NCHG,JZDT,RZNL
-PZBC:WPDQ,DCVN,SWPP,JSML
-QRRZ:XDCG,TNXJ,LLQK,QDKP
-RQKL:PRSG,GWGV,DRBJ,CRKH
-WKLG:PXBM,FNPH,ZFVL,DVSL
-NRJX:GZJD,VQTS,PCTZ,KVQK
-CWHF:QLBF,DCTX,DXMN,WKTT
-VBXQ:QBLS,TWFP,MXZR,QTGX
-MNWL:KCBR,KNWS,STNS,NFVM
-XNNX:WTGH,PQQF,FFBR,BVPT
-GCSZ:FTLT,LNCQ,HJNR,LTSL
-DMWL:RFSM,MNFD,XRKN,ZFLF
-SLQM:KGTH,JPVT,GGHJ,GDSH
-RCGC:VXGL,GZHL,BCWF,HTXS
-DJWQ:QQPG,DBRC,ZKNT,SFPD
-RJWS:XFRD,HHNM,PSDJ,ZHQM
-CBVK:QPLJ,XMMS,DNHF,HHLH
-MFTB:ZNHT,QCPC,BSSC,KXRZ
-KHDW:HRCF,XWNZ,HJJV,FRQG
-ZMPK:CDMG,NKWP,RQLD,LHNR
-HCCV:HTGV,WQWL,XWRV,VTPJ
-LGKG:TVJM,KWNZ,HTPS,SZKX
-BBQG:CNND,FRGV,NQMF,WGKM
-KCBL:TNWT,STCZ,MHZQ,FLSP
-TLBN:WKVN,CBFW,NFKT,FVPW
-HSKX:SZCD,ZGSX,LVQC,XQTW
-KQGP:GGJJ,CNMM,XSJG,RKLV
-SNPF:VBKJ,SBXW,MTNF,FGDK
-ZHRQ:STFP,RMQS,BFMT,RDSV
-FMMQ:LQKV,KNKP,QKGB,SNPP
-XWBX:FNNP,TCHT,FKPL,XWJS
-HMVH:DLBG,LRFV,BNQP,GCKM
-WDMC:MRSX,ZFZJ,JWCH,DLLF
-SXKQ:PGNZ,NJFC,VSJJ,RSQV
-RTPR:RMPK,BRCS,VXJM,WXFL
-VGDH:GWNV,ZMCX,TDVR,SWTR
-XHPN:BZDX,FCTF,NQKX,KQNC
-WLBX:JGWM,HRPG,DKXF,KLQL
-VCFB:WJTX,DSDS,CCPP
-MZMG:TFGD,RTDH,CSWZ,DJCL
-LPMJ:XNJQ,GXBP,NNZT,XPXP
-PBDC:QCMJ,TNMT,PTVX,DTWC
-WBJH:XMLJ,SKTP,CHKK,SLMN
-CMCJ:ZJKP,DLPK,PVMM,GWKX
-HWMP:ZZZN,DSQQ,RMBJ,MKFQ
-SXZJ:CVLV,LFJZ,SDGN,SPJR
-PXDK:GLHD,FGFP,XGDD,WHCV
-GPXS:HMDV,VTSX,JMRK,JTQC
-BPCR:JQTZ,LFVT,WKCV,TNLM
-SZVC:DMWJ,VKHV,MXWM
-CTGJ:HJLW,FSVV,NJVR,BLKW
-LZZJ:TMRK,WPBC,WFDX,BHRN
-LSLL:DTLB,SRTT,XJWN,HNSC
-JWXW:TTSJ,KDHN,FDXM,RPBB
-SRGP:ZPLS,FXPC,TXTW,PCRZ
-TTJW:TBFQ,VLCZ,BGCZ,RNND
-HMFJ:GHVZ,BHFZ,WLVC,MTQG
-VJMG:BNMW,DJXQ,CKKR,DFJX
-XFVV:BGTD,ZPJH,XDHC,HGVT
-VTZP:HKDS,WKVH,NBCX,HWHC
-JSTW:XSTR,JLXL,FWCX,NPCH
-PTHJ:LDVQ,TQSJ,RDVR
-NMFV:WZCB,HQZD,SLVK,XMTH
-GNXP:VTJF,DKCF,DSHS,JFHJ
-JXMC:XBJD,SKXJ,JHDJ,ZRPG
-TKLB:FVCV,TSFV,NWZL,GJGK
-TSRP:XDDS,WGJF,MCQJ,DGZF
-DHBX:TMRT,GXDN,RKLM,HGGC
-JQGF:GJSK,WCKG,MDVD,LQJN
-LZDF:WHQP,HHSP,ZQNM,LSDC
-WXSW:ZCJW,WVTH,PWDX,KRQT
-RTCV:NHJS,ZLTR,CJKT,FMJM
-NWKV:SKRJ,LNCJ,GTKD,JFPF
-RJPH:ZNSM,VKPH,NTVB,BJRX
-FQDS:ZHDF,ZJKB,ZDKT,XPBT
-PJNP:PZWV,LHKG,KSZL,SVDM
-LXMP:GNGN,ZXLF,RXLD,ZTWW
-VSCV:SFWC,XFHW,LGMJ,NZVP
-HBQW:VZZM,SFHL,TBQH,DNDV
-BZRS:TMPF,PQFP,XDMN,LWJD
-BKRF:VDLD,KSKQ,JVZX,KXZG
-SLML:GWJC,ZFGC,CMTX,TXSC
-VKLN:ZMPL,PDTB,DQPN,WFHK
-GVXG:JLZT,JRKN,DRXK,XKFJ
-DJCB:QLWX,CNHJ,BKVB,LBTG
-GNGB:MCXV,CLVJ,KTLZ,JHWX
-LMKJ:MDGG,HTTG,LJWB,CJBL
-LNLV:VKCV,DRGJ,WTNB,BNWV
-FZWZ:ZKLV,KSTB,SMSR,LMQJ
-QPJT:PTCV,VBMJ,JKVC,DLFW
-GSHH:RFBR,LDBW,WNLH,RCJC
-LQJB:JLFP,CQDZ,LZTJ,NXJT
-XGFR:SVVT,TKQS,PVDV,QFGH
-MZJW:TTBX,KGFQ,JNHN,QJNZ
-SGRK:MPQT,MGVS,PSCQ,VWKL
-CKPR:DPPT,FNTF,RGRN,XWVK
-FKNP:ZJND,XJQG,XDKX,GGPF
-VFJN:TNBT,VPVW,VXBR,MDXF
-PBNN:DDPQ,JKSN,DWMQ,QTKN
-TPSV:VVXZ,NWQD,JZXM,JLPZ
-SSKT:BFFM,VMQG,TDXW,HLFL
-BGWG:LGSS,GVVC,CNCW
-GLJW:RPMG,CDDN,MWHQ,DVMR
-JKTK:CJJR,FHHP,FVZJ,RRSG
-DGNP:SJZM,CXWS,PMXJ,DVTB
-PSQP:ZKMC,HWRX,TDCG,WZFT
-WBKB:GPQW,VBNB,VNGV,TRST
-HJGD:LKFC,MWGT,VLZJ,DGRF
-NVXB:ZNTM,KKBV,SWSZ,BCGM
-MVVP:MDFD,HRCS,VQFC,CRKZ
-TGSQ:WHFD,ZNHF,RLXK,RLPX
-MRZS:TFVL,GLWX,MNSC,RQDF
-NPZH:QXTW,KDLF,THMF,BPWZ
-WKMR:HDNN,XLLX,FWJQ,MLML
-XWNZ:MZRV,KPGB,JGZD,WZGM
-LRBC:MPVX,NMRF,NVXL,LMJF
-FLRR:XVMM,TNMS,KDNC,BJKN
-XSLR:JFGC,VLGL,LFJJ,BHBF
-VKSQ:KKXZ,PGDS,LSDT,WXJH
-TCCM:NLJB,JSQX,MRGL,BDJR
-STXG:BRNN,DJKG,QHHQ,LJQL
-KFRL:HBKM,NJLW,MXKG,TTVM
-RJGS:VPLX,VTXW,NWCP,TXFW
-CNZN:NVML,VZHV,FZFN,MPQG
-VTZQ:ZGDD,QQRW,WHFS,PCVB
-ZGLR:FZCX,XCXT,DZGM,ZFLV
-SLNW:PNGL,HSRK,WXKP,TZRM
-JNTM:KDVV,ZDTQ,SNVK,XLDP
-SMNT:MCZW,XNQC,BVPC,FCGD
-DSTL:@
-LSBX:GSFS,KGXC,FBQD,JTTQ
-KWPS:BRMM,RLBZ,XTJT,SBZR
-BVSQ:XJHS,RRDZ,XZMZ,TCCM
-GCTJ:LPJF,QQFX,FPFR,HMJD
-MGVS:JQLQ,QDCB,LLQR,MGFG
-NWFJ:JRCD,LWMV,QCPF,HWRP
-JPXL:SBCT,HTVR,SSTM,VWCD
-MKBK:HFVJ,QVVJ,DRDG,FSWG
-WNTJ:CPZK,FHZB,MMZQ,HCHT
-GFHT:LCDJ,VLGV,BZJV,BSXN
-WFRX:TSKK,QPRH,HTKM,RCLG
-PQWD:GHBT,PBML,MCFT,NVZD
-WJSF:BVQX,CHVV,VXQZ,MDJR
-CBVW:PLTM,SZVD,ZSZK,KXGW
-MGLZ:KPKG,VMJN,BKLC,NRFH
-RJTD:BKKS,KMTD,WSNX,TSGF
-XHJB:KPTW,GCDJ,MBRN,VGFD
-LVXD:KGHX,RJQS,MSVF,DSST
-MXPN:GNSL,HDMD,ZSGF,KRGS
-TZDF:GBVS,LPKX,PGTQ,VMTR
-KQRN:LCCX,QBRF,JRJV,PGRC
-QRWV:BKWL,TNTF,CFVM,BRDG
-NLMT:ZKPR,RSWT,FJHC,KPKM
-QRTQ:NTWH,SDGV,QKBQ,KNQS
-MWLK:VHCB,JWBW,PFNQ,NBCL
-KKJJ:RSJH,VGCN,KCLP,XZTN
-XKBZ:XHKN,TJFF,SWCF,PRVJ
-BTPS:SBFX,TDCZ,BMNT,VZMN
-TTFF:NKGN,SQRK,TTNR,BKXN
-LFQF:LJGM,NHPL,RFLS,PJJW
-LHVN:VDNL,NLQQ,VHTT,NQQH
-SDQH:NKQB,LWWB,MLDL,VVJQ
-JFJK:KMLR,GVKQ,PTJD,FDGN
-RJFV:BHZP,BKRF,MTGJ,WFXL
-VJFZ:PZJD,KDKH,ZDGX,GMRM
-ZBMN:XJSH,FLHD,VXQP,NLVT
-KLDV:SWKQ,CFMF,MMLP,SLPW
-PRHQ:HCSF,GKTW,MFWN,CMHK
-LRJW:KBTH,KTMM,HLTG,VWCL
-MVNW:RDGH,VKCC,CZVL,CPJW
-PKPP:NRQX,TMDQ,SVHC,WLXP
-BNLH:QXCB,CRFL,VBZB,QCGW
-NWMV:WJWJ,CQKM,XSQH,JSRQ
-PJMK:SLNL,GKGL,WPFJ,NRVP
-BXKS:NVTS,DSHP,HZMC,KTRK
-FCHB:MCLB,XDWQ,JQFX,RSLS
-XHRR:DSPN,FJVB,NLBR,VPMD
-GRCW:VSJQ,HHGZ,QWDV,SWMQ
-VWVS:RLHP,WHKZ,LSQG,DSDW
-PWCH:CBRC,NGDS,ZRFK,RJMH
-FGKJ:DHKG,XDMD,WWNC,XJGF
-XCTJ:PLXB,GZSG,GTLZ,XWKN
-TGCG:JGBN,QGTR,NTGK,@
-SCTF:FNFZ,XQDT,LDDP,ZCPP
-QZSZ:BJJQ,PPDF,BBXG,WGPZ
-XLJC:VVMN,KJHV,WZPC,MRXH
-LPWZ:TPDQ,JRCW,QJHL,XZQJ
-PSND:VPRV,FWBH,KFQC,VTSM
-CKQF:NHZN,JXGV,CWZZ,RSCV
-XDXR:CJHG,CGBT,XTTM,NLXD
-VNTQ:CTXV,ZLZH,BKGK,RLPB
-XCJM:RKQV,DCNG,WRWL,WRKF
-NXJW:JKVW,MRJC,ZQWT,GJXT
-PPRF:MHJS,QDGN,FKQF,VKMP
-VJXP:KSQQ,DSVW,BQBM,RJXN
-ZPNM:LVWG,HSFS,NCRB,MQFF
-JWLM:CVLD,WZJL,LCRN,VPHD
-SNHJ:PNQB,MLDH,LDGV,BRSB
-DBJJ:TDBZ,DZBC,GTQS,PPHG
-FRTV:ZLXS,KPBL,CVBH,HNSF
-XDHB:LRZR,HXMF,VXJS,HVLC
-LNKK:TVHC,PZZV,KWWB,WFHC
-ZWLG:MNXZ,RQPF,VMZD,TDWD
-GXVQ:KCXM,SGHS,RHHP,HSFM
-NGFP:WQMW,KMVL,RGMW,NDFX
-TJCL:FHGT,XSPQ,DMSK,KNNJ
-SPPB:ZTST,MTDC,CFWT,WTQS
-WFVR:ZXRT,CCJD,SNFV,WTBJ
-HWSF:GQBF,GPMV,PSVZ,LCWD
-HLFL:XTDM,VHKM,CJST,JDFN
-RKMT:VCWB,SMTJ,GVNC,JHRL
-TCXQ:VTNN,GBVP,PLNX,SNKX
-VFPQ:TWVV,TJHM,HHZH
-ZBFV:SRNK,NNSB,PTBV
-TQLC:HCBD,MFPS,LWZF,RHRR
-BBRM:SPDQ,HRRM,TJJT,LDHZ
-VTKW:GRZB,ZQDB,XPZS,TSGD
-PZDZ:QPBJ,WJVJ,MDMB,XGRH
-TXHN:VQMS,TPPF,TQCR,ZZHM
-QZQP:FZKP,VKMR,PCLZ,SXKQ
-TZHB:NCLX,HCSN,RMCT,HBSC
-MJFV:SLWK,XGVC,TTZD,NPZN
-XGKX:DPQJ,JJTK,BXFK,WBCQ
-DQNV:GNZJ,CDRX,BNFB,HCTK
-FRHH:WXSP,FCPG,GPQB,HCFP
-NQNS:BGJW,BTJD,BPTK,GCSZ
-FBLJ:VWFR,WRJH,HTLC,PFCQ
-RQDH:WTQW,QKMW,ZHCH,PNFS
-GFKW:DGGT,TGNW,MXJG,VGZR
-DSBS:VTLQ,FNTR,ZMHJ,BTDS
-QDCS:GSCK,RLGB,DKFC,GVJZ
-KGZQ:MMCZ,QPXJ,QHRN,NPGJ
-LFRX:WDRL,ZQWG,TQBM,MKHB
-XBSS:JFWQ,SPMH,GBKJ,LNLV
-ZWJC:TNBV,JZCT,WDRB,NGTD
-NLVZ:PHXN,NJLJ,KPSH,WZRP
-DJSW:FDMD,XDZS,CMRD,GDDL
-QMJT:XRGN,MNWL,NMQP,KRZN
-WZWK:LGDC,SGPQ,BNRF,DBPJ
-RVHX:HKKP,HHLJ,MZDH,XMHX
-VQPH:GLGL,FKCZ,FRDR,SJMM
-MCSM:PQCQ,WBCT,LJGS,BZMD
-DSSF:MBFT,JJGZ,LXDV,PFWK
-WTBH:MFKT,NMTQ,BBCC,PFPH
-TMQL:LWKW,DZWX,NGTQ,SSCN
-JKCK:WSWP,TKPS,KMSP
-WNFP:LCGZ,GKCH,BFMR,TPLW
-NWXH:PMXM,XVJJ,WZJN,GPNX
-NWQD:RTPL,MXTS,PNWV,ZVKW
-XDWQ:PNPG,FKTC,QSHL,KHGN
-BHXC:WPJB,HCCV,MCHG,CSLB
-DRJH:HQRV,ZWBS,RRLG,LRBB
-WQFD:JKKS,FBCF,VGFT,PKFN
-DVDM:MDVM,JSVR,RLVX,TNCW
-NSTJ:DZPG,FRXJ,CZBV,NNFQ
-HBZW:VJFF,RBMP,WXSH,DCCK
-MDDG:LZCC,KCFM,DSQW,FNWN
-XNJL:SRMX,MVSJ,NGHL,VSPK
-ZVBS:SJCD,DXSH,CFKV,BBJW
-WCMF:PVTV,KZGB,JMMT,SZGR
-JPTM:SXKL,RDFP,RKTX,TWDK
-GCXF:NHZC,ZFCP,KSDG,QWHL
-JDBR:LQPL,RXKL,CHHZ,QDPC
-ZJJH:HRSF,WTCN,SVGQ
-RQRW:LPRD,BFKH,NWQX,HQSL
-GHLT:KDQM,RPDL,DLJQ,PBCD
-NLZC:NJGN,WTCT,ZQSW,NKBD
-MZQB:RTXM,PFRF,JSXW,JFBJ
-MCTL:WQJM,XRVZ,DVRD,BLVB
-WLPD:ZTZB,GLSK,HNXH,TVNP
-TQKM:CDRC,XKBW,CNZX,HBZW
-WPTH:NDTZ,WPDR,WRGT,JWWT
-VLGL:CLBR,NLFK,TVWH,NZHB
-KQPH:BCMC,PCRW,LKRD,PCQT
-ZMHQ:DZGB,NSRW,PDFX,WSWT
-FFNV:LFCT,PKMV,LWZM,JGWH
-MCTF:CMZQ,MZMG,PWWX,STWJ
-BZHB:THQK,VJHR,WZFP,DPFM
-BCGM:MFXN,ZVSJ,LNGL,XSTP
-VZGX:GLNK,SKZP,VNGQ,BDLP
-CSVW:XMZZ,HSKN,FMHZ,BBKM
-TVJL:WZRK,WQJV,MRQJ,NLHD
-TCDC:RXDD,BVPZ,WLPV,PWLJ
-WPNV:XJZP,GMPC,QKWP,WPJG
-ZCNV:KDRD,BTLW,LSHP,VVDT
-XCLB:SJSL,FHLB,QFSN,VLSD
-MWRF:TNWV,TPSV,WSJV,WRFP
-TXJL:GRZK,PWPJ,XDTG
-JMZB:KFZN,GSSG,RQFB,PNPF
-KNDB:BCJQ,QZNP,MVZV,CFVW
-HJCC:NXKT,JLDG,CWQK,WZRV
-TMFJ:BSSV,HTRL,GBHJ,KXHX
-XDCD:LKZH,MBSF,STXD,DWWD
-HNFD:SWJN,VFKJ,PKPT,QHTM
-RKLX:BWVQ,NKCK,KWPH,TGBG
-ZJVS:RMZF,WFVB,CVJH,PNVT
-QZCW:ZMHX,MRWQ,FSNX,BWDG
-MNVP:GZVD,DKLF,KNCN,SXCH
-SHXG:ZFBL,PDWL,RSBR,HKDZ
-JNXJ:JNQB,GVCT,PNXG,VCQH
-RKDV:SFLD,XQSD,DCSW,DWBM
-TBKH:CKZW,TDPL,GPGJ,CNKK
-KLXV:VLJF,CBSL,SRJZ,FXBB
-WPDR:WWWT,ZWQP,RDVS,MTHT
-KWCR:KTXF,KBRJ,RPCP,GVJX
-HVPS:GPDF,TWRG,KNKH,SMDK
-ZCMN:CXGS,KPPW,FFLG,FHXJ
-HXNC:GCJT,XLVH,CNPR,LHVT
-JWWT:FNLK,HSSF,KBCD,CQXL
-FRBG:BPQQ,NTKG,MQVP,VWVB
-NJRT:HKPD,JTJQ,WVBX,NVZT
-BRZQ:XVSK,CWHF,KRGV,XVDZ
-CRFL:JZVV,DNJG,PQJQ,THVW
-FSTD:LLXP,XQZR,PHDD,XJSQ
-RWBK:BQWC,PKPP,JHTR,FVGZ
-TJGR:PHWD,LNPK,NLGX,CJLV
-HBHK:ZKWG,QMPH,MLFQ,PWVV
-GPCH:HFXC,KNPT,PMKS,GKCD
-GBPZ:STRZ,ZGHN,PLSG,GLWB
-DLDJ:WPVN,NTGN,CBTV,VMFL
-BJTJ:LSGF,PDNT,NWPG,JRWR
-LJSH:XSRS,DWJN,TTHW,BXQJ
-JTXC:XFHZ,TMQL,SKKW,TQKM
-MKJX:NSJG,ZQFL,WPSF,KLRR
-XJGF:BSDZ,SQCH,NQJT,KLMC
-QCSF:NHML,TMVP,XSXN,MXFJ
-CZTF:JLWQ,FHGB,KTVH,SMBJ
-DXCS:DBCM,VFPQ,CFPT,PTHJ
-HTCK:TLZH,SJQV,BQQQ,RRSM
-NDFK:JCZP,CGHQ,DRBF,VTHX
-RZGR:CVVR,HBBR,MLMR,SSPH
-VWRX:SGBV,MVSB,JBQD,DDVB
-HHZD:DHPD,JRVV,TVTP,PCDR
-JMPN:ZRBB,VDTG,SPHF,KNVZ
-ZJPC:LGJP,JGVW,FTRS,LHVK
-SVMB:DMCJ,BWHP,NRXS,WQST
-TPWD:HWMF,XDZZ,NBKG,XZKT
-BDGB:VMTZ,XBTP,MPFB,WMXC
-MNFM:ZCTC,QJPQ,BGXG,KKNN
-RLPB:PMXH,NLMT,ZRRM,JLHC
-ZSXH:QJCS,TXJL,RTJZ,KNRS
-TNTF:SQVF,CMWC,BDGK,CVFH
-ZTRW:CRSL,DZMM,DNGW,RXDV
-VRQG:RLLL,XVBM,RDSG,JCBD
-THZF:HFWC,ZGHR,BLJH
-BQRC:GKKG,MRQN,LCQT,LTWS
-VQRL:QCST,CPFT,FKJP,TGDZ
-FLSL:LWPK,GZHW,STLF,JWZD
-JRKN:JPDZ,BTZD,TSXQ,RLTP
-SPBC:TRWL,BQNQ,KVPG,CVPX
-TJHJ:VXHD,KCGJ,QBJB,QDSK
-TNGV:SNNX,JNJS,PQHW,LSRW
-HXSL:RKHH,ZBJN,WLSB,BLWD
-XQND:BPWV,HXMV,XZSR,CNXM
-RQZG:WFBP,ZNDW,XNGL,NJNP
-GLWB:TJNN,QLMF,LRDX,WVTW
-DNHX:BLGR,KXLQ,QGHN,WSNR
-NFKG:LTDJ,KCBL,KFNK,LPFZ
-HLFH:JJGR,RJVP,VTHF,KNMF
-VSSZ:RWMJ,LZMB,JDVS,MMHP
-JXRP:QFVQ,RJKX,HGBL,LGKG
-GSTW:XLMC,XFWD,VRRJ,RQKX
-QLWG:GRGK,SHNH,RWKX,WPHL
-NVDT:MQDF,CZJM,SGHW
-KCDB:WZZQ,QRVT,WQZF,RKWC
-MXNV:TTCS,QXST,RMCD,PJHK
-TLGX:NZBV,ZSTH,GLFB,QTLX
-GNQP:SKTD,DKQP,PCTB,WLBX
-VWBZ:CNBH,SVVD,VBML,DSSF
-KJKT:HTMG,VDQH,FNTN,ZBMN,LJDG,NDDV
-LKWQ:SMMN,GTNV,DSWD,CSRD
-ZCVJ:WJCX,QFJH,RGGR,QZNN
-VRCR:LSTP,GRCW,RMHM,QFMP
-SKDQ:MZNG,SQFJ,ZSBL,KNTH
-NGFT:RCFC,PBWF,HWCL,HTNM
-ZVHH:JDHK,CMLS,ZMHG,GKPM
-LGMT:NGCF,QGLG,BWJP,ZVSK
-HNQQ:XVLP,DNVR,ZGQH,QFJB
-DVHF:TWHB,MMJM,BWGK,NXJS
-XZTL:MMKS,JSBW,MFFL,QSSK
-KMXJ:SNCF,ZCLP,ZKHW,SPHH
-ZQNG:FXKJ,VLBH,XGBQ,JQHK
-GXSZ:XHHZ,NQQB,XVNL,GBHK
-BTNC:QHSR,LGPS,MHTX,SVMG
-VDWL:PVBV,JPHW,GDKS,SNBV
-WJTX:KHSQ,VRZT,XHQR,NQXR
-TFWH:QBTH,SSBP,QZXH
-KSTW:DKXJ,JHCK,ZCFT,GNLH
-BTJD:GTFF,RCRN,KVFQ,GNRB
-PNDX:BKNT,BVFR,SRRH,RXPH
-TLMV:WJBZ,GRKS,LDDM,FVXJ
-BQJG:RTSD,QTPR,KVDQ,FHDR
-FVXJ:HWVS,PHJN,FLSZ,GXVK
-SBVC:LGCV,WGNZ,LQQJ,RLTM
-WPCB:VGDG,WRHL,SKFS,JZSV
-WQXB:RBJC,HVCF,PTGN
-FCVM:RHGJ,LVNM,GWFF,BHJD
-WHPB:SFNB,ZTLP,JRXM,QCQJ
-FPRM:KMTX,XMJZ,VNHS
-ZQXT:ZQPW,DPJC,BPGH,NPVN
-XZJB:JTMK,LVMD,GZHB,SPVH
-TJWP:SMSB,FQRZ,XFJB,MNDZ
-MFQH:XSRL,ZLKW,JJRX,FDPK
-VFRT:KSTK,VKKH,XKMJ,STKB
-SKBR:GVNW,MWLK,RKFG,MCJV
-KLHC:BMRQ,CWPS,LPTT,LPMJ
-CCPT:LHTR,FBGP,CGBV,HMZF
-CBZK:RGJJ,HWQQ,FTQX,RPLM
-QSNJ:QDND,VRML,SCNP,RVNS
-NRZL:SVWP,DHBX,KMQW,MNFM
-FDHD:GGTP,LZRR,WJRJ,NTCF
-PSPX:XMZH,PSXH,WKVT,LZDS
-GBHP:JZXW,KCRS,KFLM,LHKL
-JXSH:VBTZ,KDNB,CGHN
-BUG:ANT,ANT,BUG,BUG
-MBHP:BFTT,MPZW,PJRR,SNFH
-MFRS:VZQN,BWCR,LQDW,TQJV
-LTKB:DTGP,NTVG,XLND,XFKS
-THFT:BSNV,WFGW,BKTT,NXDZ
-TJFF:JDWJ,KLLZ,QJSC,KSMJ
-RTLM:VKDX,SDHB,NDMN,RCJJ
-RJWC:XWNF,CQNB,GZDX,LSXH
-LRPT:KKBG,BZKT,VSZD
-DFTH:XSCM,NHTX,VTCP,DKPM
-JKXG:MTDJ,SRZN,LJQQ,SSKJ
-FKGW:XLQX,CQML,HTRT,CBPS
-ZZKH:DFBP,MHBN,TJXN,WMBP
-XWZT:GLZR,VFCT,HVSD,HRXB
-KPWC:GHZM,JNHX,LHRT,PLRN
-PZBM:GNQX,PQQV,SNFF,GMCS
-NJGQ:KPCN,PLZJ,MSHC,BFTD
-NBGX:LWGJ,HPJL,RVRL,TKBT
-SSFD:SQBS,DBBQ,LJLP,CRGZ
-JGJP:NTZS,HQLP,VVBZ,NBGX
-QKXQ:DFWN,DXDG,JDRC,FNLP
-VMGT:CNPX,TGBV,ZPWW,RFHS
-TWZV:ZQNK,HWLC,LSXQ,FRZS
-KDJJ:BFVW,FRXB,WXDD,NBLJ
-PQFF:LFVV,BHTP,PBWB
-XZSJ:MQBN,FPTL,ZTHH,GWCF
-LQHJ:@
-JGBN:PBSZ,JDBR,HTWK,WXMJ
-LXSK:XQKC,KXHR,BBTM
-KSFX:JWQG,PQQQ,VRKX,CXJD
-CCPP:MSTZ,DSRW,SZFX,NVDT
-FRZS:CXLN,PXPQ,BVGZ,HTJC
-KRFS:DTDD,XNXW,FKWL,FCVR
-KQVD:LSVM,KWPS,WRCZ,JSHX
-LBLH:NCPC,KDXS,TGPG,QPZN
-WHKZ:WWJX,SVFG,ZDVW,LCFW
-JVXB:JDVC,VSJX,TTRD,MXNV
-CDGH:QBZT,BQGS,MMRQ,NDNK
-RDPW:QSBV,HVNP,BDFD,KKGS
-KFDK:XNNF,RNDC,TGCX,JPBD
-FSSW:KSPQ,ZWWP,MBVV,RDBR
-NPZN:QQNB,MFWJ,BFJX,ZLFQ
-VDVQ:DZTF,PRFM,GDHG,BZJZ
-MKTC:PHNV,PGVJ,GRKF,HDRS
-GNRB:QGST,XGCP,NCCB,XRWS
-KTFQ:DDJX,JBDV,DVNH,JFCQ
-DBGC:CRQP,PSCW,RKVH,VFGH
-PGNB:MBCS,CSLM,QDBK,NDZG
-WXZX:FTSH,DGJD,TKJB,GJCS
-NTTD:KGNH,DDTK,VKXL,TSPB
-PFWK:HDHB,KNWN,MSSC,QMTN
-RQKX:VCTN,FGPX,SKWB,GBFZ
-VJGG:DCLT,DDHK,DBQZ,DSHD
-XPJS:TMSP,WRTX,NGJM,DQHR
-LCGF:XRFX,NQXG,XNNS,RTLP
-GSRS:ZSLT,WFNB,XPTB,HKXL
-SNLQ:JNTS,TQVK,FNGR,WLZM
-PLHJ:RSXJ,TBKD,HBXG,VLMR
-PWGW:QZNX,DWCW,VJLN,SFPZ
-GZGZ:FLLZ,LDSP,MRSZ,FCML
-XCGK:MNXF,KHRW,HRSX,STBB
-XRTL:FXZM,NBKH,HVJK,QNQR
-BHZZ:KPCL,ZTXZ,PMNK,LTHQ
-NGPJ:JFVD,GDSS,NXHN,HKXN
-BVFR:HFWQ,QTND,NHPH,BXWL
-CJLV:FBGK,RMRN,XLLN,RMKV
-CSMR:HNBK,VMJH,NHZQ,DKGL
-VXFR:XCPH,CDHX,NHBQ,TCJZ
-PWVV:LTVV,HHZD,DFLK,FMJF
-XKBW:BNMK,TNCT,NCQX,PKMC
-RHNB:PTFT,GZPM,MWMC,GRNF
-SWTR:HPXR,LPMC,VPFQ,KBNM
-VHJB:FWZR,SBKJ,WBZJ,NVNK
-ZZTX:CPBT,RHJR,MBRX,GQWZ
-CDCM:GKFJ,JLBB,WBPR,WPCN
-BPNG:MMSG,PTFP,GGXC,GBPJ
-LCXQ:SZPM,WKBS,XWXS,FZKX
-QLXD:DTNZ,JTXV,DXKF,GXCK
-RRSG:GZNP,DRCR,MPPB,QCWC
-ZPLT:PCHT,XLDL,PGHH,MHRZ
-MHHS:MPNW,PHCF,TVHT,WCRV
-HGDF:MVQZ,SZZD,VRMB,CLWM
-GWBW:ZLNG,WJXQ,WRSD,RZQS
-LCCC:GDSM,SHLV,ZMTW,BSZM
-DZXP:RSXL,NNXN,FVKM
-WMKQ:VWVT,BNPZ,TSBN,XWRK
-SMDJ:LFKZ,QLTC,XSNG,BVRP
-XGVC:FHGP,PMTW,GPGX,CCNF
-NQQB:LQRJ,XRQL,FCJZ,RHFR
-TJXD:VCWD,QWPS,PVBT,ZMXK
-MHJD:NWGM,LLMH,HWXJ,QRNC
-QSXC:KTZB,CTBQ,MDSW,NZGF
-SKNS:HMHW,XBWD,NVFD,DBDS
-NFWM:TWZL,BMXS,FMQD,CHSD
-MHLM:MDVT,LHQW,SDQG,PXNB
-RHZW:CFGS,GCNQ,FRNQ,ZSRG
-KQWQ:LZFP,RCZM,FZCK,LBTL
-XSBP:NRDK,RPRV,HFQM,JSCH
-LHBN:BKCN,ZWWD,XBMV,BGBF
-MGRR:PZBQ,GZRB,TVDV,BRXZ
-GWKX:SJMR,WBSC,LCQQ,NBBF
-NNKW:BJVW,QZCW,PFMV,SNLQ
-JDHJ:FTKV,GQHL,TJSW,TFTZ
-FSWJ:XWLK,STVS,XSCL,RMZN
-ZQFL:BXLR,CPKM,BGPP,RKGX
-FMJF:QWKJ,CKQK,XMKD,XCWB
-BTJV:ZQMS,SXZJ,QQHV,CPJX
-CXJD:QKRC,VQLL,TCGH,JXBV
-GFHN:KGWX,SMXL,JBXW,BGPZ
-QFGH:WWLH,BXLN,NNPM,LGMT
-BMBM:ZJFR,FVFC,SXCR,XQDD
-FQTG:KGZG,KQLB,GLMG,KJXL
-ZJHN:MWND,FPTZ,TWLV,GFQG
-XDTG:MRDJ,MBDD,CNSW,GXZV
-PQNB:CRPX,QNDL,KKVB,WHCD
-KJJJ:SNQK,NJRX,DJMT,HNGV
-SRTT:CMNL,QBPR,NXCL,BTSG
-TNKM:SFTN,TGJJ,SHCC,MZHX
-VWCL:XZGB,DVHQ,LCZZ,TPTD
-MPJB:FBTL,SJTP,WXGT,XNGD
-HHNQ:XMFN,TWSB,RGLB,ZGKV
-LDBR:CGSL,BTMP,ZMQC,WJTP
-PKWN:FZSF,GJGQ,HJTZ,SLLQ
-QBRC:RLGK,RHZW,XRNM,SFVC
-HHLH:DZMQ,RRDX,DWXP,DTFS
-NNSB:XPDJ,BMRP,SSDT,CLJZ
-NWDQ:FMQL,BVDS,XHFG,BSLV
-GJJB:JQZD,ZLMZ,WFGV,JNBK
-XBTP:NLMB,BRTT,RTQB
-FWCT:BHMQ,SFGJ,VGWJ,PXMD
-JVDD:NSJB,WLKM,TRBV,WKHV
-MBVC:ZCXS,GXHR,RZBB,ZXWW
-XTTH:WLDX,ZNTC,FVDR,QTKW
-LCXJ:XLQF,FWDV,DQCJ,XZCF
-HQVW:ZNXH,NXWL,KFRK,XDLF
-MFZW:SNKR,SVKD,KBWC,ZGGC
-RJMH:QXFC,QFCZ,KSNR,WQKV
-CNMW:VNLJ,CZCT,CDHV,QNZW
-QHHF:VMPN,PKWP,LKGX,NJSB
-XQGW:LFRW,CVHQ,HRVX,VLBD
-DPJC:FKSG,JBBZ,SPLD,TLFC
-TCHT:BZQW,MCVH,TDFG,VSNP
-RMKV:VCDM,SJXK,VMVP,NMRV
-FCTF:SZZG,KJMZ,JKBK,NLMM
-VRST:RTXN,CWJH,STTL,PQNB
-VQVM:BCMN,DHHN,NCJZ,DMZS
-KZHV:MRLZ,XWLH,FPTJ,MHMQ
-TLKP:NHJN,NNRS,NRRV,RXLG
-HMRZ:BGWX,MRZS,ZFTP
-ZLBM:BBDH,FRBG,VGJZ,FWML
-VSCF:WTDC,PDLM,PTXJ,NBCM
-RDBR:DRLF,MJTL,XZSV,DVRN
-MNXJ:VXCS,VLLB,HDWP,TLCM
-VRWW:VFMV,VHBD,MBXN,FXNT
-NTFD:CGCS,WLCX,DDNX,BRJC
-JFZQ:THVQ,XMSL,ZMGK,RMHP
-FPTL:ZWKX,BCKB,HGSX,BPGZ
-ZSDB:CSDF,PPQW,KKXD,RHKH
-RNDL:CCZP,LWZG,ZHMM,DSMX
-ZNSP:BGZQ,WLPD,PRRH,PPCB
-HBKC:MMDZ,BBPJ,WMTH,DCXL
-MBPM:NLCD,SJMD,WQXB,MGBX
-JTMM:RGQR,VMJL,NNJG,BHRW
-VFKJ:GXGF,LJSH,RGVQ,QVDN
-GDPP:FWLD,KMHT,VZGJ,TXLW
-PKGX:FMXB,JWLQ,LFBW,ZCRG
-VHRM:CJGJ,CFBN,XBJG,ZVMK
-WJRD:BVRR,SDCF,VDZR,QQZL
-XPCL:DHDX,SHLH,HRVS,HVQD
-GRZK:BDLD,MCTL,QVWS,QRHV
-SWDG:DMHX,HWPC,VNSF,RVXC
-MMJM:VPGH,MSTS,KBCV,XKDS
-PVFZ:ZTKN,GTTR,LWTR,QJLF
-XHXH:HVBW,HRZH,TBXC,LCHJ
-LPKX:LWSZ,QQZR,MDDF,ZFLD
-TDWD:BWZT,PBDC,LXSN,LHMR
-FBHH:HMBW,LMWQ,WCSF,VDCD
-XNXV:VSCB,LHTQ,WQCP
-GXHC:FNCD,FRPD,SKNK
-BWRD:HQCC,TLMR,FMFT,XPJS
-FKCL:WKLV,SNXP,TVXZ
-KJRJ:MLBQ,FKNN,GVRV,ZTFS
-WFQB:HPFB,ZVRV,JVNV,CWVT
-XFTX:ZJQJ,XJLM,BHSN,RVMH
-NRDP:LRSR,GVXK,TMPG,GFDC
-TGDZ:KVDT,LNMK,VQHF,LLXH
-VLMR:VHVX,GTVV,GWFP,RVVL
-ZPWG:FNJB,LBRG,QLJC,BSCB
-PGLV:@
-NPGX:GHHR,DRGN,QTKZ,RRLL
-KHSQ:LMPL,ZKZH,NCHV
-QZNN:QWDW,SLLM,MSHF,KVTQ
-SLDP:VBSK,SPQV,ZRXQ,LZDL
-KQPC:PPRX,KHCS,GHKB,DSZW
-PXHL:NTDR,PXFT,NHVB,MFZQ
-LQMK:NRCC,FDPX,NTDT,KSKG
-NLHD:NHJB,KDHW,VZPM,JLQZ
-NCMM:QHPS,BXVV,VXKF,ZJJQ
-VVNS:VTRG,DSRT,KFDB,HRWK
-WMBP:ZZGW,FJFT,ZHDG,QZXG
-LFMK:DXZV,NCQC,TPPL,WMRM
-WRJX:LNXK,VZQQ,KBHQ,ZPGF
-WJTR:QDWS,SDMW,FRDN,LRHW
-PFXS:JVTG,SNPF,GNJQ
-KSTB:ZBFT,NFND,GSNP,FMLD
-VHMX:WVBW,GXQJ,XRWC,DTWZ
-DNRC:XTWB,MMGQ,TPLD,VSTP
-TKJZ:VGWW,LTQF,NVDP,NRTB
-PQML:HBMX,QPNB,ZRFH,QWDL
-SJDC:GGGX,GVDR,QSXJ,XSJN
-HKCS:LXWX,TZQM,NFHK,GQGP
-DRHR:BPVZ,QDRS,DJNS,LRWM
-SVVD:XZCJ,NRRN,DJJP,SHXG
-GJWB:KZHX,NDTL,SGRX,KWGP
-HGVV:NWCC,LQLQ,HLHP,GFTQ
-MHWW:GFWK,TXZT,CDTL,RCDQ
-NBZM:VTDN,ZHJB,SNCW,SWBJ
-XFCX:MFQK,CBJX,SPBG,JGCZ
-NVGF:BNZZ,VJWM,DNZM,RZCV
-ZSFK:CNXV,SGQX,THGS,XNPT
-LGCH:CTWN,GKCB,FCMJ,KFVJ
-HQKZ:RSWW,HMRT,CKZL
-KXQW:FWXD,FMJL,MKMM,GNXF
-FRXB:GKJB,TJGX,BLZS,TJCL
-WRFP:SWJH,SDRX,JQND,FNJT
-BSDH:HNFS,KTBV,BQZX,ZCKC
-VFNW:CQVL,HFVN,BGMJ,NRRL
-SCJN:LSDX,FLRR,BHVX,JRJG
-SGMZ:WQPN,DVDW,LSZL,FXVQ
-SNHB:SJFJ,QWWM,XLKG,WXZX
-VTRC:DKTG,XDZH,QWPC,ZWSM
-KCFM:KNCK,RNDL,DGDS,LZDF
-FZRS:GHFP,ZTHT,FMNC,QZKB
-KRQT:FZZW,PHJX,DPMS,LSQM
-RSCV:BJXB,LLDS,GDKP,SRNB
-TWLK:FRHF,MFFB,NRNC,WMVM
-RRCT:HFCM,CDVL,DXLK,RPZH
-GQGP:JNVD,ZZLP,LDZB,QSMS
-DXSG:MPDK,VJJS,QTBS,TNZK
-HJPK:GPQL,TVJT,DGQK,QDJL
-FMQK:@
-SGJP:XVZH,MFZW,KTKL,SNWM
-QDJL:DXGG,PSQP,JQLN,WXSW
-QNLS:KFDP,PFQQ,KLXD,TRHF
-KPTL:RKXC,GHHJ,ZGJB,QXJW
-VXNM:ZWHJ,SFPC,GRQP,KFLG
-GGPF:BDJC,KDLW,XHMC,XHVL
-XPCW:JMWN,BKMD,PVQG,XGPT
-VJSF:VLLZ,BBHZ,FNND,NBHV
-TKQS:XRSX,FNGJ,SGFJ,CQBD
-GGPR:MQVG,SQJX,SHPP,MBVC
-FNVZ:RWFC,XDSR,JNTV
-PSVG:KDFJ,DXSR,LWQB,BLXC
-ZQFH:NBRN,GVJQ,SSHN,FKZH
-FGDK:DKVG,NWFM,NKLD,PJQQ
-HKNJ:XKFP,QKPC,KQXG,SSMQ
-PQZR:SZWV,XWMS,BSQB,CMNC
-CJTR:GNWR,WLSJ,DVWQ
-RJLS:DHFK,XHHC,XJQN,WKVK
-XMMS:GLCQ,CBKD,QWQX,QDPJ
-QFZD:GJLH,SXTQ,JSZP,ZMRL
-VQTS:STSB,CJFL,KPSF,NXCD
-DWVG:XVRB,PXQT,HHXB,TLKW
-PTZW:MBVR,CGNC,GXGV,DGXJ
-FWDC:PHHW,JCKL,VJBC,LSRB
-QJRV:TDWX,VFQM,GMST,KRGW
-HSXZ:NKJL,LFFH,NDKR,SWBR
-WNND:PSNT,NVWS,QTFN
-GDCK:MGVG,FPLM,NDXQ,QRFZ
-DHZB:DHVR,XLLV,GSGZ,GDRJ
-XSNH:WJBP,RLRH,XWLL,QTMT
-RNDF:QJFM,GSZV,HHJD,XCJL
-BHFZ:ZPTN,WMCH,NGDH,MQMZ
-CCXH:JNJX,NMSS,CCHV,DPMN
-CGNC:DVKW,JVST,WQLL,FKGW
-CFKQ:PCKS,WCBQ,VJQR,BZKH
-RVLQ:WCPN,DTPX,HZPV,ZRSW
-CDHX:WKFP,ZSZM,KWHJ,DBTL
-PKHW:HRMK,XPGQ,FTTW,FKWQ
-VMTR:CNPG,RHNF,LMLK,HWFR
-VDHF:NHMP,PWXL,BVKN,SKZH
-WJXQ:RGHL,XNHB,BKQG,PVSP
-LFTG:PDHP,QKDX,BDHB,QGQF
-RCJT:CXQW,ZBGP,GXFS,MDLS
-LPKL:MNHK,XWXZ,PBBH,MDNN
-JLHC:CFJH,WHVC,VBFT,XHGG
-BDCW:BFMP,KGNT,JSZB,DXRR
-GJCS:RBDR,BGWP,LHBB,MWNN
-QPZN:VFCG,FRQM,CZMM,NKBC
-VNMN:KLXB,QFPL,BSGK,KBWK
-KCGJ:WTWP,GRDG,FLVR,RJWS
-DCXF:MDBR,MXFV,KWHD,XBPN
-BKPX:QFNP,VBZM,KPBJ,GXFJ
-RCJC:DQNJ,DNXP,VFXG,GSMH
-FLZT:GBGH,CXMQ,RLGV,XPGZ
-HXCL:MLZG,RVVJ,WKPT,QJLD
-XKGS:BTCX,KVLK,TWNV,JZRH
-WTBJ:PTNP,VMLZ,QKDV,GGGH
-JMDR:GNPF,MZDX,BHDB,KNDB
-LDJQ:MVJK,GLPL,LLBD,NVPS
-BSXN:DWSL,DSQK,MBCZ,KXPW
-RXNL:CXDF,MWLS,BVSP,BCXT
-SCLP:FHWH,DRKH,WPHX,DXPM
-WFQX:DPWN,RXMD,CCZH,CBDB
-XQCW:MKRJ,MCSM,PGHW,TMFJ
-MWJB:GWWQ,HCNP,RRBZ,JVMB
-GVSD:XGNB,QNPJ,WKNT,RPGR
-ZFVF:SVRW,QSSH,BGKZ,TJLK
-QMCQ:DZXD,KGFH,ZLBN
-GVPK:MRJB,XRJS,XMCS,TJKP
-DGJD:JJJS,GSGT,JLNZ,DZXB
-VHBN:XNCK,NNWX,PRFL,SJLD
-WWXL:TXJS,KWKL,TSWM,DNZS
-NWCS:CLNK,TLKP,RSFV,JTNM
-KLSF:GDLX,LZJT,MMQG,ZLLF
-QLDB:XTFR,KVKJ,GHWP,FLCX
-CMFP:GKSN,LHLL,FBPS,CLPJ
-PQVX:NCHR,CXJW,DBFX,WQCB
-GHRN:DKVV,DSMV,BHGZ,ZMDB
-GLCT:QXBW,RKSS,ZRVT,HNVV
-DDHB:ZCCW,FJRS,PSQR,XVND
-HBDX:BCPJ,WNPF,PFCD,HKCS
-KDCC:PVSG,DHPW,NGFK,TLND
-MBNN:MFPZ,VPHH,XGPW,QQGD
-GFTQ:WDCG,QBHJ,XPPX,WBVM
-XBTS:VFMX,QSKK,RWMP,KBVG
-TWHJ:BFHK,NGRC,WDSZ,KBGQ
-GXHR:HVXP,MGCD,QVHR,RNZM
-PVHP:QFNF,ZRQW,PGQF,SLDP
-PDJJ:DSPK,JCDS,ZLDW,JDCG
-MPFB:JMWB,TPXB,HWZS
-QDKP:MLST,DVHF,WSFQ,DKBS
-ZWXJ:XBMM,FWWV,QWSD,XNVS
-NJZJ:RSDJ,TWZV,GQGZ,GMRX
-KCCR:QKRK,FGZW,KVMG,FNCV
-ZDJR:STGC,VLMH,FFBS,WGTN
-XRQL:TPMK,RJPH,ZQRF,LMBC
-XRTN:THGT,FCDM,FZPX,SZVT
-NPKK:QJDG,SRLF,JGMZ,VWHR
-LGSM:NZFR,BQVN,RBGN,ZHPH
-XWFN:HZZH,WLTW,TZGR,TSLL
-GPKB:RPMM,ZMBR,KMBB,ZZDG
-CDGW:PTXK,RZJK,KNNM,KJRJ
-XJCK:WGLB,SFDQ,QHHG,FPQG
-GZQH:SFXB,XDRD,DPRR,ZKHR
-WTCN:RBQH,WMXH,LBTW,LCCC
-FNQH:WTMZ,XSSX,QTFP,DHHK
-JRBV:BXGL,NSHC,WVDG,TZKG
-WPSN:NSDT,XDHB,NBSF
-NPGQ:WXPM,SDZF,SBTV
-VCKV:TNHX,TMQR,MNWR,GHSC
-JDXP:QRNF,NZXD,VDDR,PWGW
-SSBP:CKBR,MCPG,XGGL,KLXV
-SJLR:NRBR,KBHS,HVXC,QWJZ
-JBFZ:XZHJ,DDJQ,XSGL,LBKJ
-TZQF:JKXQ,QLHG,BQSH,JKSM
-VFCX:PZTF,PWCS,KNWZ,CKFL
-RFPS:RBZC,GPFC,HCPM,TCXQ
-RPZH:VVCQ,PLJB,MFKQ,CJPV
-MQDF:ZBCX,NQNK,MCFM,BRTG
-QXDL:CTLD,KZQK,PVMG,TPKG
-ZVKM:DCPZ,WCMK,XWRH,DNRC
-ZDZM:HZKH,KCGB,JFMR,FPXN
-STBT:WFBZ,SGJP,GNGH,HTJT
-VXKQ:NZRF,CCRJ,BHKX,SBLD
-FNTR:SFLG,LTKB,XRCC,PHKX
-XKGJ:CRVR,RVNG,SCGS,LGQW
-GFQG:NSJR,BHDT,ZKMP,FRXQ
-BZHS:FKSC,DCXF,GLBW,KXPN
-JKMQ:CGHD,BQCB,VFQB,MFXP
-THFJ:JDPZ,WMWH,VVWH,LMWR
-QVDT:@
-NHHX:QWGJ,HQDL,CTKV,PBSV
-SNZH:GKRP,PPLT,GZXN,GDTR
-NLQQ:WSGF,NXJW,HPWM,TCWR
-WBZQ:XPDM,CCKC,CVTM,HPNJ
-NPQJ:FDLG,VJMG,ZDVS,XQND
-KNBK:WWHC,LFMJ,CQHW,HHKJ
-DRLT:SNQQ,WTMS,PSQH,VKHM
-TGJJ:FKMJ,SSFD,FJTV,WMFW
-NBQL:ZWXZ,NRDC,BMRM,MDFK
-BJRR:KMCG,QDVF,XVRM,VDWD
-NFTR:SQBF,BPLP,ZSZS,MPVS
-BVDJ:RZQC,BFLG,GFNS,QBDL
-MSTZ:SCTK,CDGW,NGCD
-GPCL:GVJN,JPRK,FZQC,QSGV
-DQHR:FHJB,VCLB,PCSG,NBDR
-WMPK:MHBD,MCVV,XKFG,CVJV
-LFJZ:JNLJ,DFXG,DCNZ,MPGR
-KHFN:DCLH,DFDD,WTPM,PTRR
-NSCN:RGGG,DKLP,QNCR,MDSS
-JVBR:QHKD,RFTH,BLPD,TJKL
-DDGC:LPHP,DBJJ,TWND,JRLL
-BHMD:ZMSG,KXTX,BGZK,SCVH
-RRDZ:QKCF,JNJJ,HKHZ,ZLWX
-WRTV:FHSW,DSHC,CCKB,HSVF
-MRQN:HMTJ,NMVC,XQRD,RMXS
-SJHT:HQSQ,PGNB,WZFH,HMXR
-DKWT:KBZB,WBVQ,WKSC,XSPK
-FHWF:DHZM,PBNW,PGNN,ZLJJ
-XSMS:SWFV,FKZV,XLHK,LVBX
-XZXD:LCGM,ZDJJ,MQFM,PJXQ
-VFSR:NLSX,CRBV,ZKCZ,DHHH
-VSGP:BBCH,SJML,VPMX,HDQP
-ZNVS:SCRD,JRMF,GXKC,JPBK
-QVMQ:NKVJ,FWHM,VNSH,JSRK
-ZGHN:WQPQ,KLBB,SHGN,ZKZD
-QJCS:MXZF,JTXC,QXNK
-WCHL:WBMP,BCFT,SDBZ,VWKB
-LLTD:RVWS,XQDF,KHLF,PVJC
-CWPD:DLWC,SJWL,CBCX,XGGH
-HBBF:MHGB,MQJG,HWVK,STPC
-WCHQ:HQJQ,VTRM,SGZC,CBQP,@
-VSHZ:SGLV,WRSL,SQLM,VSSZ
-JPSV:QMGL,JJMF,XSBZ,PHVB
-QKCV:BRBS,CFTJ,RCWK,WPVZ
-BLNS:KDTG,GPQT,BFRB,JTBJ
-BRVF:DDJB,FFWF,NFSF,WNFZ
-NKVW:NGHZ,TMJX,BNTF,RJBN
-BHRN:WHTR,JZNW,XHGL,PHSN
-CFBN:PLVC,GVHW,NGJG,KXSC
-BHGJ:DBBS,VZLR,GHNC,QFZD
-PNJR:CTLQ,KCBX,BJDQ,KDCX
-QDMZ:GNVZ,JDLP,CLSW,HXTT
-CPJW:BKVT,FRZD,CRWT,THRM
-KRLB:BCPS,VKNN,STWQ,NFZP
-MBQJ:CSNQ,CGNL,RLKP,LWCD
-GMHK:FZDF,RBGP,ZWJR,DQJS
-SKRS:JQGJ,SFBK,RQBK,XPLM
-DVCR:PRLS,HHMR,MSXR,SPWN
-WKNW:BXJN,QHSM,NDTX,HWBN
-HMSX:TSNQ,NMWH,KXWB,NHHB
-BPXH:HDWV,PLRV,XVFR,KGJP
-DKQP:QWPB,BKGD,SRGN,GLMV
-HHDW:RSFF,NXBT,HTKB,RPDB
-WMXZ:RGJK,XCJK,GCWP,GBMF
-JWTC:RMLR,JQNH,CSVN,MZKF
-ZCWF:VNNL,FDHD,GWNT,ZQFH
-KWHZ:RKNN,GJWB,HKSN,BWFP
-QCLF:KFNS,MXKX,XRHB,NVJJ
-WGGF:ZCGW,KLXW,CHNH,LRJW
-NZHB:MGQT,XSCR,KPKQ,MRRR
-PRHZ:QWQR,ZRGQ,WGWJ
-NBLG:GFRK,DHXZ,BSNG,BTFC
-QFJH:NQVJ,TCDF,CQBL,CFWD
-HXCC:CRMQ,LHLF,CBVN,NSTZ
-RLXV:TMMF,DKFL,ZMCT,TVJL
-BRPS:JGBC,VKTF,MFDL,ZRDF
-LFKX:PJHV,NXQZ,VFDC,QRBS
-NJKP:KXSS,XBHK,SZNB,CFNK
-DKFB:NGMC,JJRK,SPJK,XGPV
-GRZV:LXWC,PBZV,MMHH,ZLXK
-MFWJ:QRFT,FKTS,GTPJ,QQHL
-CCJD:JHQJ,PKQS,QGLL,PFKW
-CFXM:QJWK,SMNT,VQSH,WSQF
-BWKH:FFQW,BRBZ,FGFF,RBGS
-XHCN:SZQS,BPNT,JLLJ,FKGM
-WBRX:RBXK,BDCB,FQBL,QHWV
-LFFH:FPHL,PSFV,DKBQ,HBZZ
-CVNZ:NSTQ,JNCR,LNXG,PFZC
-QQWK:DPZQ,SCSC,DHSL
-JHLT:FVRB,NZKX,JRXH,WXKJ
-KJXL:GKFF,LWSP,CRRW,BJRR
-JPDX:SQVR,BCLS,HGNJ,VXMN
-HRVG:NZNB,JFJG,CBJZ,KSKJ
-DTLV:RQWL,VXNM,QSZM,TLCF
-LTRK:QLVG,RLKW,WBWZ,FFBD
-LLHW:STWF,WZWK,XTBH,KFRL
-ZHPH:JLBR,PBTD,PTPD,ZTZV
-RJRT:MJFS,RTBC,PCLT,QWFM
-JJTK:SWGT,SVGR,RFTK,DXZB
-HCTK:HHRZ,QKXQ,FVNB,CWSZ
-BRSX:RZJD,TLJG,KVPV,FVXM
-SGQX:ZRZD,WKDX,HTHZ,JBFZ
-WQXT:QVZR,XSSB,JPNP,TZKS
-WHCD:FSHL,QBZX,CBHC,CKCQ
-VNVT:WBJT,CJNS,JWNB,QSCP
-DCRG:ZQHH,CJNF,FVLL,QFZS
-BTZD:CDZS,QWRD,CWCS,JLPT
-NLFK:PBCX,QCLF,GFFD,KKBL
-LXHS:PWDR,PMCV,QJZC,DTMP
-RZNP:ZNHD,SJCB,SHVD,QBPB
-BMLB:PJPD,LXBP,FCHF,ZSGR
-KLXW:LZTT,XTPC,TKXS,QHGW
-FWQZ:HPCR,LNHV,WVDC,XKWT
-SWBR:GRKV,DCST,WJNX,WPQL
-VVCH:JJPJ,WHTP,MQJV,JSKC
-LNCQ:GVSM,QDCS,BRGF,VJGG
-XZKT:GPQX,QZSM,GBWJ,FBBS
-WQQS:NSCX,PLCB,NCCT,NRFZ
-DLNG:RTTQ,ZLBM,FBXP,ZMRG
-CNMB:SDNP,GFBC,FSJJ,GVRP
-HHPG:WCCR,RQNL,RHVK
-NVPS:WMMT,LJJC,MKMK,TZKZ
-GDZZ:VWPV,JCVM,ZGQK,MQRQ
-HWVF:NWSH,MTGL,XPBP,MPLJ
-LXTL:CXPJ,PVKW,KCFH,CNJJ
-QRCD:BGQB,LKVK,HQDG
-JJQK:LDDF,GFBR,RMJX,LFMK
-VGBH:VSXT,SGJV,ZVPL,MNCH
-JRLL:HNZG,VGLG,NMXM,BFSG
-GSWX:KJNG,SFZQ,QLJH,VDMF
-VBFM:ZHHT,VPWN,PDVB
-XDRD:RKST,ZFDG,QHWQ,BKJT
-DVRN:SFLL,SGMG,KNSL,NHTT
-GFVL:FXPV,RQSV,BLDX,QZTC
-JRXJ:JRHC,QMVX,MPHT
-HCMK:SGMH,ZSDC,ZJHN
-RXPH:XFWX,HLPV,NZXG,PJWP
-NWXZ:WPFG,SQFB,BCVS,DRJH
-JNXN:FMKR,WBLR,BFMH,CPDX
-KHRW:HJVK,TLFT,SVHV,QVGX
-PGJL:HZKQ,GJVS,XBTR,ZRXK
-DNLG:GCXR,TMSR,RGGC,NXSB
-LTWS:DDKL,DPXR,TPXL,HBBC
-HVCF:XHVK,PTLJ,JDXW,MHRQ
-NSQB:KZML,BDPS,WSPZ,XNNX
-DWWD:QRZQ,LWJB,LPJM,JFFC
-VSFN:WJHV,DWNF,WTZD,PWCQ
-FCTR:PLGB,CVLX,JJZD,HMVH
-RMRJ:QSSN,MCNN,MJMX,XBTS
-PTTN:FVGK,BJBX,FMFM,FHQL
-GRKS:GPQJ,QCQG,LJLT,QHHF
-WMCH:TXVF,WXVN,PCVN,STNZ
-CKZV:LBJL,HNNL,LPHZ,KTVJ
-HRRM:BHMN,JTGR,TBRT,XQHF
-KVQK:BFKF,ZCXM,RJFX,BJFR
-THMZ:FSBM,PFGG,GBRJ,LBZN
-WPQW:FGSC,SKNS,GTXM,FCGZ
-BNGN:NNWD,PVGS,ZMPR,FBCT
-SBZR:PMDD,HFJJ,ZSLM,DSRK
-ZXTG:VHVW,XHKZ,WHZR,RKLX
-HWLH:JBTT,FXPQ,LVWL,ZSQS
-ZMBR:PHFR,ZGFV,WDWF,SWVH
-FDPX:RXJW,BBSD,WTKG,FMDF
-XWJS:QHRR,WNKP,WTSH,GDCJ
-WXFP:RMVL,SSNZ,LQPC,JGVS
-NDWQ:ZGQL,JMSR,QDTZ,MQPP
-VVJS:SRXK,FXQF,NPJT,MKSS
-DLPK:JQHQ,QKCJ,ZKDK,GMBN
-JKSM:DNTN,PBNN,FZCZ,LXTL
-HGVT:RJZM,KPFC,HKHP,KDQG
-HQKJ:RNXW,BDJW,WPRF,JVVZ
-WGFG:FVNS,JSDH,ZHKP,BPQR
-QWQR:QJPC,TGSQ,DGCZ,KJPL
-JRQS:DNRQ,FWQZ,SCTC,MJFV
-WRSL:JRKH,SXGN,RNZN,HBBB
-HLBX:TSNS,NPNC,RCQV,DGGZ
-XLGP:SXJV,QBBV,KXHM,QMNS
-PSFV:LGWQ,GTBH,CNXK,NPCZ
-RWFC:TPCH,XCGK,GXTP,TZQF
-KMVL:NGVS,LGPR,HDMK,QTFD
-JZQR:NVJG,DMBX,HSXN,MHWH
-QBRF:GFPG,ZVVX,LWGB,BWKH
-HBZZ:KMKL,QTFG,FQSB,MFBR
-KJCD:DXTN,MVKX,VZNR,LCTF
-FXTH:DJZN,WLPX,GKJH,LCHM
-NLLD:SZJF,XPWF,ZHXK,LKZF
-CLVJ:KZNZ,CFKF,ZKMS,CQJW
-XZVN:LRKH,SDDZ,GFCL,RVKW
-NKCK:KJLL,HZDX,WTLV,RGQM
-NBTS:NNGD,QLJL,SHVM,QNXP
-WNVB:XDCW,LSLL,XMGT,WBKQ
-DSHC:SXFK,CHWP,KSTP,ZJJB
-PGRC:HBFH,QZNH,MNMV,PJNP
-MGKZ:LCVC,BPGG,RLBN,XKHS
-KTMM:GFFH,LNTL,BWKG,GVLV
-FXWN:SJVN,PPZB,JTMR,RCBK
-CDPP:FMXV,SFKQ,MWXR,HSRN
-HCFV:QVZX,NBFK,DHSJ,TSWK
-LBTL:FKKP,DMPS,BRBX,TZDQ
-KHGF:HXDL,PDPR,QSPJ,NHZZ
-QWWM:ZLCP,ZTRW,NXBX,XNJL
-XNVS:GDQH,JCKN,JWPH,SCFD
-GDBZ:GFGN,VKDW,RVTD,TZWB
-KDGZ:XZSQ,FBSR,XKSR,SFWV
-QSNX:BZKM,LDBR,QKNM,PZDZ
-SMLN:HMXT,HVMC,LKZR,HSRT
-KKQP:KLQR,SMMV,PXHJ,LWKH
-XMRB:TKLJ,PXMT,BPTW,QCVH
-LGSK:RBVK,JCDB,QSMB,JTJC
-VVJQ:KRCK,XPWD,GQXR,BQPX
-RQPF:MFDQ,VGVG,VKKN,CMNP
-GGMR:TSTN,VLPV,GTTT,HVGB
-NQVD:VWKW,HZPP,WDZJ,MWPD
-TNXJ:XDBZ,JGZT,JGXK,LGCH
-KCCL:XMTT,ZLNJ,ZCZK,BXCC
-QDRJ:NXKV,BSPC,BRKP,HWMW
-MQLD:MKZS,NBRF,CDTH,RXRX
-KNNJ:MZJG,CQWN,CVDZ,KKFQ
-MSPG:XRZG,QFZM,JFGH,QLWG
-WRZQ:VVRL,CKBT,BPMS,SHWT
-QSNC:GWLM,VJLK,PXLN,HFTT
-CTXG:TRMG,LSLM,GBPR,FMBW
-WMWH:ZFCB,NTFD,PFTP,ZDZM
-XRFG:KZRV,GHWH,LGQG,TPMX
-FLRM:MNCC,ZCWF,VMSV,BNLH
-SKFG:NCBW,ZSMQ,HJZK,VVST
-NGHD:DWRZ,TZLW,NLWD,WWZF
-LQCP:SGXR,LFMC,NSRF,KPNC
-CMNP:KXFD,KMDS,RBRG,DQDQ
-PMXK:XKKB,WSVW,TMFQ,BPHC
-TLMR:DZQV,FFFC,LZQC,TSRP
-TMBC:VPTL,TJGR,GNND,NKBH
-SBXW:PDLZ,GVPK,VLGD,GNTZ
-HNGV:BTLP,NWCS,SXHP,WJCG
-SDZF:BCGD,JVPJ,QNJZ,XQQM
-LJBM:FGBG,FPJF,HNQQ
-XSSB:ZPFM,ZNLF,SBFR,HXFL
-XMTH:LBSX,BZML,LRMQ,FQVW
-CJPS:HGWG,TLLR,TDNR,RWHF
-PKMV:WTTR,CWBD,PFLX,PGVZ
-JWTZ:RRNX,CWGN,NZVR,GPKB
-LVWV:WNRH,HKZQ,VNNH,XHPN
-HVCP:KZFN,BFZB,PGDT,LJGF
-KMTX:QXFR,HBLD,TTZH,TCNG
-BRBB:PBNL,CXKJ,WSRT,KKJJ
-MCQF:FRXZ,LXKR,QQJT,DNNK
-WXVG:SFCT,WSNW,MTSB,RTLZ
-LWKH:SRQN,JXGP,HHKB,ZQWC
-TSBR:NHSK,GHCC,CQHB,NBFG
-DTLM:FCHT,PWKV,VPZD,DGNP
-DGXJ:ZVQV,CDVQ,KRCV,LXMP
-HHQZ:QWRP,KFHR,RNRR,NWQT
-QKNT:JKKH,XGMZ,VCMM,SJBD
-ZLWQ:FBRM,HDZS,VQQZ,LKPM
-RFTL:ZRRG,TLMP,JTJN,BBJM
-NZSC:NRMM,PQZR,JQBG,RLXV
-XVCP:TDHV,KPMK,VBWR,VRQG
-KDHS:TGPK,BNMF,HQJM,MKVT
-SBXS:NRCW,QDRV,NBFZ,MMLV
-NHHB:ZHXD,ZBVB,HMGW,DHVP
-CRDD:DPBS,HVDF,VPHX,CJTS
-NQBX:QJKZ,FBJN,KMGF,HPNP
-LNHV:ZQMR,GVNK,SJLZ,PZRF
-PZGC:ZLNS,CBVW,ZSBS,TKBJ
-BQDP:WTZP,WCHX,VKFR,ZMFZ
-FTWD:SJHG,WRGS,HDTR,VZTP
-WFWD:TPCM,MGCJ,DRDS,DSWB
-DVWR:HKCL,TMNH,KZND,KPTS
-WVTD:CGVG,CMGV,NCKP,GHCW
-KBWX:SCFK,CJQC,MHKT,JQVN
-MDXW:ZGDL,PZNJ,VCTT,SJMF
-PTLJ:GXSX,VRCR,GSKW,PBZD
-BKSP:HMCT,BJHS,HHMH,CCHX
-QBFH:WBTT,BTGH,HRLJ,GSMZ
-CZRL:MCPH,MWRF,NQPK
-QRFZ:CCSG,GZBD,HMKN,QWSX
-STLF:QQJQ,HXRV,TFSV
-LWKM:TTSR,NSRH,CSRT,LGKS
-GFXC:BXPK,GSXL,BRGM,QKPM
-WLSP:VGLV,PKNQ,SWXV,VZWJ
-FBRG:KJBN,ZRWF,DLGQ,RTKK
-CMGV:GQMX,GTNS,KCNF,WLCM
-THSC:WQMK,CFQM,HMDN,RZFD
-TJCX:GQSL,TZFM,WVXP,TJWP
-RTJZ:XTGQ,GNQP,RMFK
-JNJS:JMTX,DKCT,DVRQ,WVHT
-NBJN:PPGQ,ZHRQ,WDXV,XKHP
-PKNQ:BSTB,DXCS,JKQT
-DRWN:VQHM,KPSL,JHNF,TSTB
-KXHR:PRCM,WMKX,HLHX,FBWW
-PVXW:BKCB,MSLF,QKPF,XBTJ
-CXWS:SWHL,MKLC,DBZS,MJKL
-BMRP:GNMR,BXMH,QLNG,JMXK
-JLPZ:RLJM,JGLH,MSGD,HQLD
-WWPB:ZDML,GVSB,ZXKW,TWZR
-GHCW:BSLK,MTNV,GRHT,CKSR
-PMGQ:PLFH,GVSD,QWFQ,MQXD
-VKGM:JDQP,DBST,THQD,HQZM
-CJVM:WTJM,RTGB,GFRC,QQBC
-PQQV:BSGC,BXSS,JCJG,TBPH
-DVHQ:NCVL,BHNS,LXLD,CRBH
-JTXV:FBJS,BTPS,LDGL,GHTM
-WSXL:ZGCB,CLNW,SDZK,QBVT
-WMXC:XPCL,KZJK,WQGL
-GZPW:ZLHX,ZBMP,ZQDQ,GRZH
-TXLW:MTWG,QSZV,MDZK,KGDV
-WGNZ:ZDCX,WQXT,HJFF,BGQQ
-VHVH:SJLW,XSJZ,PWPD,NBHS
-MFKL:HQHR,MBNN,SZDV,DHWJ
-ZZDG:QPFT,HCPL,XVKC,JKVT
-QQST:KFSG,DCQN,PQGM,KKLL
-SDHR:RNHC,MTTC,JJCR,DVWR
-BZMT:TMMP,DWLB,QSZC,HVCR
-QBPB:MQGM,KVRT,SJLV,HKFW
-NNFK:XLCX,JHHN,NCNC,SRPV
-ZTLP:HRTX,JSPK,BKNB,DGRJ
-MXWM:FQZD,TZXB,QLQK,GZCP
-MQXR:TFVS,XLHF,RRTR
-ZXJS:LVKW,PGPP,LFPQ,HGBR
-CGNL:FQSQ,TDPN,MBDN,CLBK
-RBGV:TMWX,JWCZ,RRZD,BVDL
-ZDNK:FXQX,XKDN,LVCS,XJJB
-FZQZ:KTGD,SRXZ,XTTR,GVJM
-QRHV:KBMM,FQKM,WHPQ,CTHT
-FPDP:NQVX,RQZG,CRNC
-KGFH:PFTV,PVHP,GSRM,GRXT
-VMWS:BTHC,RVRD,NMCH,JWTC
-LKVG:GDGM,RZMS,GCMV,VHCC
-PWSC:ZCNC,QCBG,VHPF,LBFD
-FSGR:MFXZ,LVWQ,QDZR,HHCX
-BVDL:GNDC,TXJP,SBKN,PBZT
-KRZN:VGVJ,DLRC,VJXZ,BMVF
-MTTC:GHHB,FZCT,QZJT,GMNV
-GXFP:FRXP,BQJG,XRTR,XZBS
-XGJT:RNGV,TZDF,FVNZ,ZLSF
-TNLM:HXDZ,VVJK,ZRKH,NLVQ
-FKNN:MGPV,PSVW,TTLT,RFTX
-LJBL:RCXB,WHHP,XQRN,HNFD
-NZTL:QGHP,MDJH,JTSM,BXCL
-LSRW:HQXC,WHMW,KLLF,HXTX
-ZMRG:CGDS,HXQB,SQZZ,SVMB
-HCCG:CTPN,QLWF,ZGBH,MDNC
-FRJG:CDML,WCJN,VHPC,LHDG
-FKJV:TLDG,XLRX,DSGS,CNWP
-PJQQ:CPTB,CSTR,VJMB,CSVW
-NTMH:VLXL,KMXJ,JHTG,VRWW
-FJMG:MNDL,MFZS,QSVQ,NNPX
-HZGP:KWXJ,BGFS,GJRW,JKGD
-GMPC:CHHP,LRPW,XDCX,WRQH
-JJMM:MVRC,HLFH,FDTW,CFXM
-FPTZ:HXTR,SKDQ,MRXQ,BPNG
-QMPH:HPDX,MLBR,ZNVF,ZDJR
-QDVF:BFNP,GNXG,JFQP,XQNR
-KKKP:CRNL,CFGH,CZTC,CNQB
-BTHK:MMSW,QCWH,NVNT,CNKW
-PHKX:KTWR,DQLK,GPMX,NCLG
-FCGZ:PZCJ,VFVN,FWNL,BBGL
-DCXL:LWHD,XRPK,WFBT,FQFV
-VPHD:VFRK,WNBJ,ZNNJ,WMKQ
-CMWC:WCWT,SNZH,QRST,WHZM
-CMLX:FTHN,SFTR,FCZZ,HSVL
-XKBC:PHJL,MFZB,BWTT,GWPW
-TWDK:ZXMD,FHSX,DRLQ,BQLG
-PZXV:THHJ,DJXL,HQNZ,ZVBD
-MJGR:BMQQ,ZHSW,HBWJ,CQMS
-PBHN:FQQH,ZPZM,WMDS,LRJR
-MJNC:FBDZ,STKG,RLSQ,HQHF
-GTMG:BRZX,BPCR,GFGW,PJFP
-MVZQ:QCSJ,RVJV,GNDH,JBXR
-SDMK:WKRQ,RCBX,VBDX,LRRT
-MHRQ:LKKS,LQCP,BLZH,SQBM
-LPDR:BDLS,SDVC,HGLM,TSWG
-QBSN:WQTV,QMSS,LQWG,XWQB
-PNPT:FRGN,XDGX,DTVT,SFNW
-WRQH:LSTF,KPLC,RWSM,VSTL
-NJLJ:SRDV,CCHC,DTRG,VLGJ
-CPHS:SZDP,JHPV,ZLTQ,KWXP
-PFHC:GKMF,QGKG,CNTX,RPCQ
-LRPD:FRZW,FKMM,JKND,QWJX
-LQKZ:RVSV,RMGX,NKKS,LBZJ
-QSGV:BVZH,LLML,DQHG,QSNX
-FSZZ:GXGQ,JNFX,JRBZ,FMGS
-CKHJ:LNBV,NZVW,GVNF,XFRJ
-VLBH:NMCR,BMWG,HLVR,RWWH
-FZWR:DSTL,WCHQ,PZPB,GCCC
-MGNV:BDVP,FWRX,KDGB,CWLC
-RVJV:JCCJ,VFBD,CFGV,PMKK
-KDNB:NZCT,XRJL,CSNB,HSDV
-QHWS:SNZC,JMHG,SPNJ,KTMJ
-QHTM:TFMG,WWHR,FGKD,KCCR
-ZJJD:NRQN,QQBD,MRMX,ZXBF
-JGQF:KPLR,GTLL,VBKB,FXHL
-ZWWD:BDBL,SZNH,DFKP,LZJX
-XLVH:PVSD,NZJR,KKXL,DVVZ
-DKBX:GMLB,QDJF,WSMF,GFSM
-HZXZ:TVRM,KGGW,BPLQ,NDDQ
-WGLR:JFJN,BFWR,PMZM,GMJG
-SJMD:KTWM,RWRL,CGMJ
-BDXD:GQGN,XHDZ,QNVG,NJFG
-WWNJ:QBJX,MVVP,ZBXV,XRTN
-RKRQ:JDXS,TMFD,PHWZ,WDGT
-SQVP:WZSZ,KKQH,FKHN,PGPS
-XZNW:HMCJ,GXMB,VMXK,TMTX
-RFTX:XSLB,XWWK,DHDH,CBWW
-SSLJ:BPLJ,TNZP,JSTZ,FJLP
-WMVS:XBZV,RMGT,SHCK,GKZZ
-HQVP:DJBQ,RHBG,JJCF,GRPH
-ZGKV:CMLM,DDRW,ZCSP,NPZK
-WFBP:KKBR,SBDQ,WSSV
-LCWD:KCPF,LZZJ,KWGQ,KBFL
-SFCG:ZKFM,KPRR,XLBL,QFHW
-QKFH:NVKN,MDVN,BVHG,BRQK
-HHQX:TRXW,BQRK,JHJH,FJJB
-HCGT:KGNQ,TZNW,TZKN,SBVF
-XKQX:KSRG,WSDB,ZJFP,WJDR
-HQFV:PMMG,XRBX,BJCN,ZHKW
-NQQD:DKNS,ZDFJ,TFVT,VWTF
-GTNV:BPZC,FBLJ,QDVD,BZRS
-PSVW:DWDX,VQQR,FBGJ,TWKX
-PKVK:TKKL,MBGB,CXHC,PRLD
-PQZC:HQVL,FZCQ,JCJW,NRCP
-SXFC:DJGF,KPRN,KGQC,PNZS
-FCHF:KLDF,FMMQ,CBVX
-NXJS:BCRJ,QCCT,GSDH,TZVQ
-NFPG:DGVX,BQHV,HHLB,DFPJ
-ZLSF:HPKM,TTJW,WSTF,RPHP
-HQZD:DZSL,SGPG,PKGP,THSP
-QWRD:CWKW,KXPQ,FQMX,KTGR
-SWRZ:JKJR,BFZT,RMDQ,WZSK
-ZSLJ:DVKH,DPCS,DDWN,XWFN
-SNFZ:KHRJ,PKGX,JKPR,GTPV
-QLJL:HKNT,RFPS,QTKF,NPHT
-FMJL:WCPL,ZVZD,PDXN,GXFP
-XBNS:PVPP,LCLM,KJQK,KRXS,WCQQ,XNGW
-MGTV:FKCD,WFHT,SGDG,QZSZ
-XZCC:SLBD,RKBT,HWWC,LWPG
-JRXP:LVXS,CTGV,LVLT,HCLS
-ZNDW:HHDW,LHNS,TMBC
-SRQF:JMJH,DJGX,QVBW,FTPV
-JBXR:QJLQ,GTSQ,MKWD,DKHD
-KLJQ:VVPK,JCPK,FMGT,JKKG
-JTKH:HMMF,HJJW,VZKP,RCPJ
-SWRC:NJVH,KHHL,CQKK,JWMW
-VSJX:XCKH,CXQB,RMHR,KDKL
-KFGN:DVQM,JJHL,XKQS,HWVJ
-LWVX:WZCR,PQXF,FVXR,BCKD
-ZLLJ:KHPB,WTZC,DWKF,NGJB
-JKMM:SZZN,MFCN,PHBR,NGHT
-GTVJ:CXQQ,PSPN,TQCL,HGJD
-SSPH:RLJQ,FWZL,BRHW,QKHF
-LDBW:PMBQ,ZGPQ,SKJK,RNBS
-ZHJB:XSMT,KNNX,WQWX,KQSP
-BJHP:JJZF,PSGT,XRRF,CCLR
-GHWH:NLND,MZHV,NRQS,WPVB
-LSML:CFVJ,LHJR,GNWQ,RJLS
-JZMW:MFTZ,WMLN,SNMF,GDHD
-PXMT:FWVV,CZHL,MBSH,QVMQ
-QPGD:RPVJ,MGNN,FCNX,GJBS
-DNDS:MNCL,WVTD,ZCDM,NTMH
-VDXJ:JWLN,RSCK,DCKC,KXNQ
-RDDC:QNPG,ZWJL,CXMP,QPJT
-ZQSD:GDXS,NVBC,PVZB,ZTDL
-VVMP:VWNC,JVTK,VZHB,SQNB
-GNXF:KHSL,TZBG,WPZP,KJSV
-XFBP:KXSF,TLGH,HJKN,GJNR
-NWQT:GHBN,CZNJ,ZZZS,HFQL
-NQXG:DHDM,JSQV,QMTQ,JVBR
-WKDX:PBVB,NHXK,TMCB,JGJC
-MGBX:LDRG,VLJC,KCDB
-FGFS:GLVM,SKTX,MMRW,MRTS
-WKDF:WVPP,CJFF,JZNK,QNBF
-TGQM:STLR,NFXJ,PGNV,BLLL
-CNPK:QKGJ,FHBJ,KTLW,QCRG
-MCPF:JZWQ,XZPG,RSTN,DPNP
-CBHD:MJTT,TRZX,CGTP,HTCK
-FXBB:WKZB,GCMC,BWHF,DTHS
-VWKL:GZLZ,WHNB,CMJC,RJRT
-BFTD:SRLH,RCCB,WGCF,FDXW
-DVBL:DNZC,BRVG,WPNZ,NJZJ
-RGVC:PPGF,ZBQL,WGHG,ZSFK
-WHZM:RWMD,NCWH,QWJL,BMPJ
-CRJX:CCCR,HRJQ,KZMD,FSCW
-LLWQ:WHCX,DPKX,TJHP,BRNJ
-KGZN:PFLQ,HRZJ,VFTQ,QLGC
-LGFJ:SCJM,HLVL,HWJK,JXPS
-NBNV:WWBS,VXMP,KKNJ,CMFP
-BXDT:MTGP,MSLS,ZNWN,FVNH
-TSTG:DQFF,KDFM,DSXJ,DNPS
-XVBM:JRVZ,MNBZ,WHZH,XTPJ
-HDVD:LXHS,LNZD,GVXG
-HMQH:VLFH,ZKRH,RRZR,WZVR
-GQTC:GDHM,MZSP,WZRQ,BTLK
-XPHR:XRJP,LBDK,WFJW,JPPR
-SFGS:JGPR,NFMK,JTDJ,MSRR
-SFPC:SZTD,HLMN,JQHW,SLXW
-HLZL:RGZD,LRPD,KRVH,ZJQS
-RSKR:HVRZ,QHNB,WZRC,TLGX
-CKDH:FGXP,RKQN,MJSH,ZHGH
-KLJV:KQXC,KWVN,BLSD,MPCT
-KQWZ:KZQW,JXNW,RDJL,FRSR
-LLDS:RMJB,NBLG,FWDP,RKDV
-GFBP:XLXZ,ZGGT,HXSB,PLVM
-GKPC:TPJH,CGPV,KGVR,XLJD
-CKPH:RZRJ,FBTJ,SWFD,MZFL
-WVTH:GZXW,JCFH,TVQX,ZMMB
-SKCH:KGXR,XKNF,NXTF
-RKCW:CVVZ,LJQP,LVNW,VQKG
-HWGX:MKWV,BMCZ,DGVV,HQJS
-HXMF:DTCC,ZQXT,RWTX,BQRB
-CZHL:LGNM,LFLV,QMLB,JVRP
-DMGQ:MHSN,PPZH,ZDRP,CLJR
-XVTD:BFGF,FZHJ,JJWP,HWSZ
-MMXG:SMTC,BHGJ,WQFL,CDTN
-KXHX:NZBW,MBBV,XTMP,LXFG
-DDVB:BFDW,NLWN,JMBK,RMXJ
-FQRT:NGFJ,LSTH,DWWJ,HDVD
-WBVR:PPWF,MDXQ,GRBC,VCXM
-KRZZ:ZWHZ,KDFQ,SPGK,XJCR
-KTWM:ZWQJ,DRZV,BMSM,MGLZ
-KGLZ:LDLK,SSCM,SSGP,TQRT
-TKLP:XDXC,NRDM,RHMB,TRQZ
-CDRX:TBRK,MMBN,JWRW,KDHS
-CPKM:DZJN,KFCF,LHSP,FBDG
-ZRGT:DDVH,QJMF,ZSZX,TDSL
-PDFV:JKJX,WXDJ,RNXM,HBTS
-SWCB:WKCP,GWXF,HGMM,BQPJ
-HFDN:RCKG,FGFS,BWHV,XCTJ
-HTRL:QGTZ,RQZD,MGRH,BMDV
-DXCF:GZVT,LSRJ,NKTQ,FVVF
-GPFC:CFXR,WTBS,FSMH,FQJD
-SLPW:MVFX,DNKN,BTQR,NPQF
-WMKX:BZJJ,DXZS,JKBM,MZJW
-WDRK:QHHR,NQBX,VKMV,HHNQ
-PGPP:VHHV,SBCC,ZBQF,PPDQ
-QKXB:CVHC,HDCT,CMBS,QMTW
-PKMC:VXTF,GKRX,BXZF,SPJM
-NWFM:SKPB,FZFW,LRLL,JCFS
-GRWH:CSNV,RNXT,ZRWN,BDXT
-VZLR:GBZX,RMMZ,NTBH,BNND
-WZRP:GDCD,WNQX,TVCG,MHLM
-ZJRK:DHMV,RPDD,TNRM,MZCS
-NTQT:BZJD,VHNF,HPWG,RJTZ
-BCGF:GWJZ,WHSN,BWLH,GPDR
-HXTT:XCKW,TKZQ,MQPN,DLXN
-KNRS:WGGF,QBLX,BQFK
-VZWX:JWCT,BGKK,HLGF,ZSDB
-NJDF:DGQC,HPMH,QBSW,XFRM
-XHKZ:CWNV,ZKJM,TKGZ,CDSD
-KMHT:ZLLB,RJWC,QKBV,RKMM
-HCHT:PRVW,SJSB,BVMP,SQFR
-WLVP:TJSQ,NLZC,MGXC,GMNB
-SFVC:FSVB,FHCT,XFTS,SPBC
-ZSRG:VRZW,CDBZ,PTRB,KCBZ
-ZWTG:GTZD,LQMK,LNGM,XGJT
-CMRX:NKWC,GDZZ,GCRJ,GLCJ
-NLVT:MSBZ,SWMP,HHKM
-FNSH:HVZH,GSRF,LHFJ,ZWXJ
-NZWW:GTGX,RDMJ,RMBM,HZKF
-TBQL:QMCL,BBDN,MPVK,GDXW
-SHZB:XFJZ,WNLP,WKXV,GGRV
-JGRQ:DTNW,PNKV,ZRKR,SSLJ
-MCCX:NSGQ,KDHR,WHDG,PBGK
-GQGV:HSJX,TSNC,RQCT,VGBF
-GHMH:QRBR,VFNP,ZTTC,TNLC
-XPCF:BRNK,VBRJ,JWMF,FTMB
-XKHS:GLRW,TQPZ,QWCD,HBLC
-LMBC:PGLC,VHMT,TSVS,WSHF
-NJFC:CZVB,RZGH,TQMJ,CKWV
-GLWX:NNBD,HLZL,RPFP,WGFG
-GNSK:NFLR,LXKW,GVXQ,NFTR
-JCBT:BQKP,SZMN,LMWH,XZBD
-PVFF:NNVG,KHSV,HNVZ,MXZM
-DLGK:NQHQ,FRSQ,SDDB,XSLD
-PQCM:TBHM,XZJB,CNNG,LHVN
-HHCK:DFJS,TJTV,KWVJ,CBHD
-VMJW:XFVL,MCTF,PPWX
-BSLV:GJWM,HGDF,RXRK,CSMF
-VDTG:MRNC,VKLN,NFQR,JPXL
-NRJJ:CVQT,DGTK,PQCW,CLNP
-JGVS:XSMQ,KHSN,RCVF,JZXL
-FMVW:DKXV,ZLPH,PBRX,TTSV
-BVGQ:QRTZ,SBXF,ZSQK,GTCB
-JCND:VFLN,MRFR,NCLJ,GHDD
-JSQV:DVNW,BWPV,BRFR,HSJW
-QJWZ:PLZH,TVFS,ZDXL,TPBW
-NBPV:FNVV,KVMB,LVBV,WVWK
-QZQF:VFZL,MGFL,RGTP,ZBXS
-PPDR:ZXTL,TLHQ,WPJV,NCBM
-NWWH:PJZQ,VVMS,KCFR,MSHV
-SFZQ:NCZT,PGVC,GWSH,DXGW
-BZBJ:BMCL,HXRC,NZNM,GCCB
-BGDT:HXDD,HMXG,JMWV,LGRZ
-HPNP:ZVSR,DHSR,RFZB,RQNS
-FGWW:MWFM,ZWZM,GVKG,VMDJ
-KNJG:LFVP,PXDV,LKQW,JXRP
-WCMK:TVQQ,QWSN,RSQK,TZPV
-DGRF:LBWC,ZQDJ,FVHC,JSJR
-XGMZ:GPFQ,NMMS,TSPH,JMDS
-NTSF:SZDB,DWCD,VTTC,QMJQ
-XMSV:RBNK,MGRR,WLPK,VGBH
-GNCB:TJFV,FZWZ,WTVV,PDMN
-VCNL:MSJM,VHCT,PQKN,BCZX
-KCNQ:ZTNM,RDDC,FFDR
-GLZT:FGGD,SNHJ,RNFW,BQRC
-SRND:KFHZ,KNWG,KLGM,CZQP
-LMQJ:NGMV,XGJM,MSKC,DDKD
-VJVZ:DZNK,JZMW,FDGD,FXTH
-BTLW:HHSR,VDXJ,NGMZ
-KQFF:XTGN,PBNJ,GJGF,SRLV
-FBJN:RPVK,KZHZ,QSWD,GPXC
-TMSR:KVRS,WZNM,MMTG,LBRV
-CTBQ:FMHB,FXKZ,TZNZ,WBJW
-SKTJ:XBGT,WVRD,NJNG,LMGD
-QKVF:HQQW,GQJL,CDGH
-CQDC:WNRL,QDDC,QRGH,XBKG
-NRRL:CVJZ,DXJN,THLF,WBPN
-ZCFM:VRZX,FMCD,DFDB,VHXQ
-FBKN:WFMZ,TPLR,TJNM,CTGL
-ZTXZ:QGCK,FLLM,TWJF,NHQK
-RJFC:RCJK,KCHT,VDFK,QQZN
-VDWR:HSST,NBJF,GDFG,NQQD
-WGNQ:TPWW,JZSW,KQZK,XMKN
-SMCV:MHDX,SBMV,JNXF,TLNK
-ZKZD:CFMM,SRGJ,HKLB,RLHR
-BVDS:PJGJ,DXSG,MSVP,XWBK
-WPJG:HDLD,CCNV,WXNX,KTFQ
-TLFT:RMHS,BWMQ,PTNQ,LJGT
-TJWQ:DBKR,GMBF,HDKQ,PWVL
-FXKZ:TZZJ,KBRH,FWPH,HZSL
-NVKW:CSNK,JSWS,RXVK,DQHL
-BKMD:NWTS,LHLZ,NRBT,WDNW
-KVKD:WKSH,KFJW,CRMJ,CLMQ
-PCJM:FWFX,RRKH,RGFS,ZHLM
-MJTL:WBKK,FKQM,PNHK,VDJB
-SJCB:QSNF,KCLG,RGKT,VDWG
-GVLV:VSQF,XTXV,JRTR,DZPP
-DJKG:DRRS,QCPG,GGCD,JGRP
-ZMCX:VWCK,FRTR,DBMB,HSSC
-NBRF:QLFQ,GBRT,SZST,ZDBQ
-RRVS:LQKC,NSPZ,WQFD
-JPHW:BKTZ,KRDD,KNXL,GCTJ
-LMWR:MGSF,WJSF,DWHZ,QBFH
-BGBF:RTVZ,NKDG,DSQX,BWCC
-PCQJ:LJBL,WRCB,ZBCV
-TPKG:MLQM,PJGK,DSCB,JQGF
-HFJX:SFWL,GNDD,ZLMV,BFNW
-XKSV:SZGH,FPHN,NGFS,DHMB
-TLCF:KJKN,FRPK,LSZX,DKWT
-TKBJ:SVKQ,MXPN,BKDT,VSML
-KZBW:CPMF,JKMM,BJMS,FBPP
-XLLX:CQNP,QSSP,TRBH,RQNP
-KCJR:FBTC,XHCN,XSJD,WXVG
-FSDM:HJVT,MVRD,WNBW,LSRG
-WBHF:VCMZ,FNSH,WRNC,HZZN
-KVLK:SLHZ,XZXD,ZCTQ,CRJX
-VHBV:KGDW,FPMF,PTWV,VSCF
-PLMG:SJFF,LZDK,LQDQ,HJFD
-VXMP:QWMJ,TMRW,NZXC,QMHK
-VGCM:RLTT,QPGW,DMRC,RPRN
-ZLKK:KJXF,HQFV,GDWK,RQDH
-FZTM:NKXD,SDHR,XCCL,KMPX
-ZWFD:QRHC,GKBK,SRJB,CXHX
-FNLX:HGTB,MXHV,QQST
-DBLX:KFNW,CNZN,QLPJ,SDJX
-SXVV:MTTF,HPGK,GTHN,MWVQ
-GGPX:PCZH,FWGD,DRRR,XTVG
-VVDT:MNDV,WDDM,JHWT
-LNMK:BGVM,TSFN,ZZWK,ZZQX
-PNKV:PDDS,NZJW,NKHJ,GKCL
-PTFP:XVRJ,VCPK,MLJB,WMPX
-WQVN:KJDS,TNWN,BVGF,GRKJ
-KGGT:RZBL,DDND,KGRZ,QSNC
-BQFK:HPNQ,SWWC,CSRJ,DDCN
-SGHW:GFGR,MCDC,XMFM,BKHK
-MWGT:TGHB,ZDBX,ZQXJ,JXZL
-DRLP:XSSN,SQPJ,HSKM,PWRB
-SQDX:SQGZ,MXGZ,JVPT,NXLV
-CQBD:NXPX,MHQP,SHHL,FCVM
-QNQP:HWVB,HVXV,RXBH,XKQQ
-SNBW:HJGC,SCSM,RSPW,WJWX
-FCTM:FKRQ,HQLN,NGBK,DFKQ
-FBDX:ZPWP,ZRBV,KCQF,TBDL
-GVZK:JBGW,WQLR,QVZL,NQPZ
-QSND:ZHWH,XSLR,GJXG
-WHHP:PCZC,GFHN,FZJX,KXKP
-DBRC:KSND,FQDS,MDXL,JFJK
-HMSG:JPCZ,CVML,MRFC,NNLC
-VSTB:GCDR,FNTL,VWLJ,PLGH
-JCJX:GLTZ,KBLH,GTDP,KHBS
-QJNZ:QMTF,MLHR,PNNZ,NTMD
-KPDR:RGXG,BXDT,TCTS,DRLT
-PDPJ:MLSH,LQJB,LFTH,VZMT
-LCLR:NPCR,SNQL,SNSQ,RNDF
-DCST:FGBK,QPKL,PCSC,RPHX
-RPZW:PBNM,QKWX,CQTR,JSKX
-RJTZ:CFHW,JJQK,ZHBC,FDFJ
-BPRG:HMXM,MKQN,GZFQ,CZVN
-XHKK:XCCC,SMCZ,KTNQ,GGKP
-XRWS:MKRR,JKGG,PRBT,SQKR
-RGQJ:MLKZ,SVHZ,DLBC,JVSQ
-DKBS:RPWZ,SMRL,KTHJ,MJGR
-SPQZ:BKWZ,PPKS,NCVN,DCDB
-HSDV:ZGJZ,JDZN,QGSC,JWBV
-BGQC:KNDP,DSMM,JVNP,BDXD
-VFHN:VNWD,XBKJ,MHCR,CDKB
-QLPQ:KPQH,PQML,VTNB,RLRB
-RZQS:DKNF,SDZL,NSWG,WTBW
-RCBX:ZNPN,ZNSP,PJJS,TXJV
-VZJW:BLKD,DWVX,BXQG,HNJD
-RDSV:PMFP,TSVK,KVZZ,MKVC
-PHCL:HLWH,KXSD,SKKG
-DHHW:HVFD,ZQCR,BBTD,MTZC
-XKWT:HWHZ,KQGP,MNRB,TZKW
-LWPK:RFHX,NFMZ,FWTP
-XDMD:FMDQ,GGSW,ZSCL,GJBD
-HHMR:XKZT,NGQW,MTKP,NLXN
-SLGJ:TZVV,ZMCC,WWNM,ZVLZ
-SWBJ:PVWB,PDVH,TJRG,NSFB
-NVJW:DBBL,DTLW,ZJWC
-FFVF:DBNF,FWDC,SRLJ,XSMS
-GVHW:FKSS,SMCD,XGPM,GWJM
-JSJT:@
-CPSR:RMPV,GSRS,NQVF,GPCH
-NBJF:QSHG,DZSG,PJTD,DSKQ
-HHBV:XLZT,PPWG,NKSK,SVXK
-VHCC:BKCF,ZQQX,MSFD,NRTT
-HMXR:ZQGQ,GZDV,KTNV,DSDM
-BQVN:LRBM,LLWQ,MXZX,WSJQ
-SPQV:XZLV,FZXK,NCXJ,BQJT
-FJBD:SJSK,ZVRM,PXMK,MCJF
-FHZB:VQHW,TQJM,KSDC,ZCBP
-GJBD:FSTM,KVDM,GCBD,PVLT
-CHWF:TMGS,GJNG,JWDC,DTJH
-VKLQ:MRMC,GBQQ,VBJK,VPKF
-MQSN:QKQZ,HVHB,KTZL,HNDL
-JWZD:WBHF,ZFVV,PQCM
-FXFV:KXZS,ZSQH,MDVH,SNTM
-PGFH:XWZX,JLSN,LKDV,FXRZ
-HKPJ:JHBV,KBLP,PXTZ,ZWPD
-RDXN:VNKQ,ZZFQ,JXPC,GPRZ
-NZGF:NLNF,JXLV,FVTG,SHCF
-CJNF:WZVF,MJNC,KDZZ,TXHN
-RCPJ:KPNG,PCLB,SMHZ,JJTF
-WMFW:PTMB,JFHW,QNQF,JDVL
-TFQZ:KKMS,SDRZ,WHLZ,FWGC
-GTPV:BWWD,DDMX,PQXN,WXCM
-VSML:MMDM,GVXR,SZJG,JWFM
-LXBP:TCKW,VXPB,TLMV
-FFLF:XVFN,VFBL,MHHJ,SSSM
-RPDB:ZCXN,QSFS,NXTQ,RZGR
-GZCP:BMZM,NGFL,DQVR,ZNGM
-WVTW:GBDS,JVMT,MMGR,SFBM
-QHMX:WTFH,BRVS,MPVR,MQLD
-TZXB:JWZQ,BMFQ,RDZH,MWNX
-SKXB:KNDD,DPPB,TFVJ,BPZW
-HHGT:WDFS,SKTL,XSPD,QHDJ
-MDLS:GQMQ,ZMXR,JDXK,DVFM
-PFHP:PCKK,CMSD,JWLT,WLFN
-KMVZ:LXQK,MFDD,PJHX,JGDZ
-MBXR:JKCK,FGFT,TFWH,THZF
-FKBD:MJPR,JCRD,VQQG,MWQP
-MQMZ:PWNG,KKMT,ZZBX,FLLP
-FGVG:NZSC,VLHJ,VFKD
-VDGF:BLSX,LTPD,CCJC,JJSZ
-RR:WWMH,RSRF,ZRJT
-XLXR:BRXW,BTFP,RRMZ
-PLTL:CSZL,XPLX,KRKS,QPNH
-BRDG:MJMD,XJGR,BCXP,WDXB
-WVGC:XTFG,XRFG,ZKZG,RPJN
-RHSQ:SMPB,TSPW,FVXG,LBDP
-ZCPP:DJBG,RJTC,HTRP,JVPB
-GMCS:LKSS,GKPL,RFLD,DQKB
-LJLJ:HHBG,RRTL,MJHL,JFJB
-FWHQ:SVZQ,GJWP,FHXP,TNQT
-MQNS:NTQB,LCPS,MDZZ,XTPN
-BQGS:XPPB,HFWN,DBVJ,BQMD
-ZDTQ:TVMG,LDCX,PVDF,DGMG
-WQWB:WTKJ,WHPB,QVTT,DHRK
-HRPG:NVFF,FCKL,NJHK,ZVBS
-RVRS:SQGG,XGBF,XWDZ,BVCN
-XPGN:VSPT,TXPL,NBKC,DQLQ
-ZRNG:TDDW,ZGVD,NPGS,RFTQ
-RJKX:KPTF,PQPB,HZNP,ZNRC
-JXLV:BNWZ,ZRJG,JHCT,WXSC
-JDZN:LTXL,PFSK,LDPG,PWNT
-TKBZ:XFKT,TLTL,JKPH,JWJS
-JFVG:KPNB,HNMG,MRXB,FNCL
-GHNJ:TKSG,MKHP,JWGJ,SSFF
-FBPF:PKMZ,RPFC,DHFZ,KDLZ
-SNXP:CHCG,CJTR,TGDS,SBVS
-SZVD:QRVV,WTCB,TXLL,KZCB
-BCXT:DGPG,FTVW,ZPHR,BVVT
-XMHX:CTGS,TCDC,LDQF,WBKB
-WCQJ:FZVL,ZJPC,ZFLX,NLPV
-WZJL:QGRM,TKLB,LQBH,ZQCC
-SNQJ:XGZQ,FRTH,GBFK,GVDF
-NGJJ:JMHR,RTHG,DCSD,PZDR
-SPVH:VKXF,BBQG,DGJS,HHWL
-GCKJ:KGTB,MGVJ,CHWD,WDPR
-JCFS:MGQX,PQCJ,TMXL,BFHG
-MNDZ:LWRZ,WKQG,VXRV,ZCFM
-KKBP:TBFD,QVWF,SHCB,SLSN
-VJKD:SHVL,NDPX,SSHX,QQTX
-LNLZ:KVHT,PCQR,DPPW,WKBT
-DTHS:WCVX,QLKX,ZDJP,MRKX
-LDGN:JSJT,CKNP,RHQR,ZCNV,TGMT,WLSP,@
-VBLZ:MVHF,PQFF,KCKM,PRHZ
-ZTFM:QFBV,DJCB,ZBTK,NQVD
-WDWC:KZZP,LMLB,RDPT,PLKN
-LMRF:DBLL,HGPL,XRRK,GLTS
-ZQSM:NFLD,HQZL,FZSP,SHKW
-DKKJ:KFCD,QMFL,XSXP,QGKL
-KRVB:FJPR,GZZW,DQTR,KNNG
-XKHP:QJRX,FQDB,RDHD,XCKT
-BKSV:NCVT,WDWC,WBLB,RWFJ
-DBBP:JVTQ,RDPW,KWQT,VFHN
-RLWL:DNWQ,VGLR,FLVS,DRCZ
-PSKN:CZHN,CZGT,WWWM,GKTP
-XCHR:PCHD,LDHJ,MWGP,HWCH
-CCMJ:MFBG,WTMD,QSTD,WBZQ
-TZQM:NDJX,PBCV,XJBR,BFDR
-DJCL:XTSQ,WCMF,WFDM,BGSQ
-LWGZ:RJVN,HHQX,HKDB,BDHJ
-PTWH:ZVCX,XHRR,LMCM,BLTL
-FJMC:QBWJ,XSPL,VXKC,NQGR
-CTHT:MLPT,VVZM,NGPX,LMKK
-SXFD:ZMLS,GBVG,NHMD,WJFP
-RTBC:VLKX,SQXS,LKNT,RVCD
-FCWG:TRPQ,XHXH,JWPK,GNXP
-DRWS:QWVN,KNXC,HZPC,TFTN
-VHSN:PXFH,NKVW,ZCSS,VVNS
-SHLV:KNNR,JNXN,KKPC,JQKC
-PTHZ:BBSZ,JZNF,ZGQX,BWWZ
-VGJM:ZVVG,CXCN,FHVF,BLVK
-RCVD:SKCT,QNPP,GRRD,SKVT
-ZPJH:RDSH,MVNW,WHPC,WWNJ
-FJVB:RMHZ,LNBZ,HJBG,LRKQ
-BPLW:LBJH,RQRW,MSCG,PJMK
-VMKV:MJCW,PTNV,WDHC,WKWJ
-BCKB:JPFF,BWJZ,XKRS,HBVG
-DSBQ:TVVJ,KGHW,KZZC,MLFT
-TBNJ:DKJR,QJXT,TWZF,QJVF
-KMLX:RQRK,KGZN,HVTJ,NGFT
-DWWJ:NBFH,XGKX,MCFD
-STBB:STCW,HBCM,PKTG,QZQF
-VWLK:XQGS,CJNH,BKSH,GVZK
-MWNX:GKTK,BNNG,XFXM,HXSL
-MBLB:QJPW,PSFP,GHCP,KPPG
-TGBG:TSHW,QWZT,XFMR,VPGP
-MDKJ:JTQK,QCDL,VQVS,BVQN
-MRNR:MPDW,CWWR,LLJL,HQVP
-DTTQ:LGLP,BKDZ,DLDQ,VJXR
-HXZX:MXTL,DQQH,KCQW,SWJF
-WQGL:CKDM,ZWJC,PJJP,FVJB
-QSZV:VCQS,WDSC,ZQZB,XKNT
-WVZF:GSRG,RFLR,WFWQ,VQTX
-VHFD:PDJZ,ZJKR,DQQJ,KQPT
-ZXWW:MBJC,KVFN,TPNR,VQXS
-LNHK:JKWV,GRPF,NWCV,XRTF
-BHKC:QVTP,WSPX,LTMB,XPHR
-HNDP:GQXC,LPNL,HMTR,CCFR
-DXZB:LSLD,VQPH,LRKL,JFKX
-JCQH:QFSK,JVPH,LCBB,TFWC
-DZFS:MZJV,JLKX,XMCW,KLSR
-BNLK:TKWW,WNDJ,RDTX,MHPZ
-WQCP:LGQD,VBXQ,TLZB,DBBP
-RHKN:ZVKN,GJRF,LKBD,FGSK
-GTJT:RWPF,LQHC,NGVJ,HQPJ
-LFLX:FZXS,CXTL,FQGM,KCJR
-LNLM:WQSW,GPXS,TFRL,XFKG
-KRXS:FSSG,NVJW,KSJF,RGSW
-RVPT:LLHT,GHSF,TVFQ,PDCW
-KMWS:QSBQ,CLWL,FFWW,DLGK
-SHKD:BZCG,SRNL,SBNJ,JCSN
-CDGL:TBQT,FNXL,RTXP,MSPG
-VCCP:ZMZW,VKQL,ZLXD,TZQC
-JNDF:XNLN,KJJJ,HKMS
-LZDK:GLQF,FKSV,GRZD,KRFS
-LWWB:CXDP,JSCN,CLFQ,JGMR
-TNLB:RTHP,MRBH,LNZG,KPHF
-KCKM:KHZQ,JRQS,BKKW
-FSRL:JXWC,DRTW,DKTT,SPPL
-SDRX:THXK,SHNV,FCTL,RQKL
-MDLZ:JJTP,WMVS,VDLR,QGTB
-FGFT:ZPDL,NRCR,NLVZ
-MPHD:BDRR,GRZV,NWNS,GHRZ
-RJVP:RPML,SPGG,QJGF,MTJG
-DSTT:XNNP,CDJF,PZHC,GCGM
-FDZC:BDXN,BXDR,KXWL,JRDH
-TGDS:SVXC,TKRX,NLTC
-JXGP:CSXR,PFRS,CVMH,XSCJ
-RDFP:JQTS,SDVW,MFWB,FSNC
-RKBT:KGNV,QDGR,NRKX,WMQP
-WHNB:GXWW,SVCJ,PVTJ,TFDR
-PJFP:VPVH,SPFT,PBBM,WVDK
-HFWN:DJXW,NWMV,JPCK,DWJW
-HDRS:DSXB,WLCL,BCZN,WZZD
-LDHZ:MHSR,TQDS,DCBH,WKBD
-XWMS:GRLR,THGD,LZKB,LFTG
-NJSB:DRWR,KZLF,CPXZ,GTPS
-BMXJ:HRQL,GZFV,TNVX,BVJR
-BLVB:TCNK,PDDH,JSQK,PSVG
-QCQG:RBBH,HBQW,GGQV,KSTW
-KCST:KBCL,MLGP,CFLX,JGKM
-CFBT:MQKF,CMZW,RJFG,VSGB
-TPXB:CWKP,DSBQ,TFZZ,WVGC
-KKBV:JRRQ,ZWNV,ZWBJ,QPZL
-RCZM:CGVD,LNBL,VRWQ,XSHF
-WFGW:VNLB,XBMN,FVGF,JNWN
-XSQF:TRDH,MMJQ,GPVF,LNHK
-CFPT:DRRB,BGSK,RBQV
-PTMS:MWFB,FXKB,KDXN,XFCW
-FTFZ:SQZP,VTZQ,QWGW,BPRG
-LHJR:TXMR,VHMX,TXPM,QRZR
-XCKT:NCKL,BCXV,PLLG,CBXH
-GDSH:DXBS,KKBP,NNLP,XMSV
-KJSV:JFVW,HGPJ,TDJK,FWNR
-GLZN:FPVG,VSFN,RMHF,WJGG
-SPSQ:HPFL,WSWM,LSKX,NGQK
-KFMT:LZXP,BRBW,WMSN,BZRH
-FFFC:QMKV,HZGH,KHGL,QNFS
-BZPQ:RZCG,FJQG,JZZM,GBHP
-BGKK:SZTG,WPXF,TSDZ,LLGK
-RSNR:RHDC,ZJHT,LLNJ,JJDT
-WGND:RRFT,JHMX,WCRX,BSTZ
-JVQX:SVJL,HPRL,RHTW,TJQH
-MCTX:SMNK,GWRB,CVLS,FNRR
-MBRF:FWPJ,LQGQ,QGZS,FVJL
-FRXQ:LWTS,JVTD,DCBD,VNVT
-JNTV:HLSM,BQST,NQFT,TLRT
-ZDHJ:WGQB,QQTD,WLMK,NTPQ
-HLJB:CJLL,FZWR,TWXC,GKTR,@
-XHVL:WFHM,NQJB,MSLL,LHFP
-MVJX:PQRQ,FCWG,CPLS,GSTW
-RKJG:CRPZ,QVPT,ZHSP,WDCJ
-GKCB:LSQZ,HXRB,MNNV,QJHM
-VLGJ:GKKP,DVDM,KRSK,ZLWQ
-GDSS:DWVL,NGHD,QJCJ,VHFD
-WXVM:HGLB,CZFW,GLRK,NGWD
-GPMM:VVFV,FTRH,DTHR,KFKR
-DDDS:MHFP,SWMG,XWNT,QSHJ
-QTFN:XKWM,LNHP,FMNP,DQHD
-DGCQ:DSJN,DJCN,GSTV,TPVK
-SMRL:FDFT,JVVL,SQLS,MTKM
-LNBZ:JSNZ,NMXD,SFPS,PRKF
-PFDX:QPDJ,PQBC,BWJK,KPBN
-JDCB:VXVP,QZKX,SGXP,WKNW
-ZPCD:PDKK,PZBC,JCKS,MGPW
-GHTM:KXKV,MMWH,GHVR,WVMK
-LRHW:BRWR,SHKG,LLQV,KLBC
-JFKZ:CWQR,ZJBM,XZJL,XMZK
-XDGD:VDRF,VVMP,MZGW,FKJV
-WQGK:KZRR,XLWW,CSND,VZBJ
-HWCH:QJJJ,GJZP,NWFF,BVSQ
-LGKS:VCKJ,LPQT,CBTX,HSSW
-TCMK:GNFN,WBRX,QKQF,NJDF
-TFTZ:GHQJ,ZKML,LSSL,CWMG
-CNCW:TJSH,TQWX,LQLL,NKMS
-BXCL:HZDD,HZFJ,QJCQ,NKMM
-WJLW:JLLB,RKWV,DCTC,PDKV
-SKQD:QHSZ,GJGT,DDTG,DDZZ
-MQMM:DWCX,GMJM,RCQX,WGND
-LLXH:BXMX,ZJJD,ZPJC,JFZQ
-BRSB:VWZW,STSG,BNGW,HDRQ
-GKTR:SKQM,DBLX,TGFS,WPTH
-DQHD:TDWB,BTNC,HVJW,WJSX
-JFJB:THHQ,NVMW,HSNL,SDRJ
-WMWM:HKRM,ZPTC,ZFDW,WFXJ
-DFDD:NMBW,RTMV,HPJX,SDKP
-TLRT:NPFH,THFT,QMGM,STLC
-DHXT:PKQW,NNLV,GMRZ,DQRN
-HBBR:LVBF,QLZM,DCGR,LZNJ
-TXJV:SLWC,RCGC,CFRG,MGNV
-ZVMN:FWHS,WXSS,NMRT,DMXT
-VVNK:VQRL,QTJP,LCLR
-CPMR:GQTS,DJCR,KNXT,RLJC
-SPFT:DCPQ,TKCB,HCKL,PKNK
-FGQX:PSXT,GHDS,ZBGZ,SLKN
-HTHP:DQNH,GCZD,NWKK,VXKH
-SCSC:ZDRL,ZLRX,NDGC,NVGF
-VDWD:NHTJ,NSDF,DBTB,ZJDJ
-NXBT:ZFVB,TTTQ,VMBK,TDND
-SQBM:ZQWX,DKKJ,RNSK,VCNL
-CHWP:MVDP,WTTK,WQKS,SCVB
-VMTZ:NSZX,SLQM,VWZV
-QMTW:DSDK,MVMK,CBMT,NGBZ
-CWJH:MWMP,PZBM,TLCG,FTFZ
-XQDD:CGKZ,CDHD,VRDG,NKZV
-LWGQ:LMVV,GPMM,WCKF,NPKK
-KDGF:CRDZ,VDHF,WRWG,HKPJ
-XKFJ:DQTZ,MGKZ,LFGP,QVQC
-KLBB:JZLH,SKKJ,FQSK,CFBJ
-CKWG:HMDF,CGML,BWDB,GRWX
-LNTL:NZPW,HMQP,CXFH,XMVS
-PNNK:GPTH,XMPD,WGLW,BWQN
-KNWG:DRVT,CZPQ,TTMQ,FNVC
-STLC:TNKJ,SWJD,KHDD,KXGH
-XMCW:MKZC,HPDD,CXSW
-QSFS:SSGC,WRJX,FTFS,XWTL
-GZBD:BQCQ,XDMK,RRZZ,GBXZ
-MZCV:LXBJ,HBVW,JWWC,HKBQ
-DZWX:TLQZ,PXFR,BZGS,JKXG
-SKKG:GCXM,XCTN,JMKM,NTTD
-MQLX:ZFGW,FSDM,FTNK,HJCC
-NSBC:BCFL,ZBQM,MJPH,BRLP
-BNQK:XTCG,GLJW,LMHK,ZCJQ
-JRRW:RWPH,RCZV,VWTM,ZXSS
-SPMH:WBWD,VDMN,QMSM,MWJS
-LFHH:JZDJ,MSJL,NKDV,JKLD
-TJTV:GJWF,NJKP,KNSF,QWCS
-RHPK:VNKT,JWZR,RNLX,TQNQ
-JLXJ:HJGP,DVXC,ZBFK,BTFL
-JQKC:TBVS,TRQL,GTQF,RBGH
-TQPB:MKJD,NWKV,GVPC,QZTZ
-CWWR:NNKV,BRBB,PWSF,PNVH
-ZTSQ:LKSR,TJWQ,QMHD,SKRS
-XZDC:VMSR,LRFK,QJPX,MWJX
-JFKX:PJWH,WFKC,RQTB,HMNT
-HGBR:QBMC,RMJG,NRTH,GHNJ
-JHWT:NPGQ,VHMS,PFXS,XHHS
-WJGG:JSXJ,HKST,LKXK,BTLQ
-JVZD:VBLZ,KHWZ,FQRT
-PFSK:CTSC,MDRW,TZKT,QZWX
-CCXJ:BRBM,VHRM,ZMNS,HXZX
-VPWN:ZPDC,DRRH,VVKJ,WQWB
-GBHK:RVTJ,VZWX,SNDL,JQQF
-XBKJ:XZBG,VXNT,TXSX,BXGS
-PFVS:XKQG,LZPB,WDSX,CGPL
-WHCV:DDLT,HVPS,XFCM,XHJB
-XSCR:RRPF,XFDT,DJPP,LSVL
-QWCS:RHXG,LSCN,KNZR,DVLT
-RKFJ:LHVQ,NGDG,QWRJ,WHNV
-VJJG:WZML,XTFS,RNMJ,SZHZ
-PPWG:DJFQ,DMWL,WFVW,VXKQ
-GMJM:LDJN,XJGQ,BDXL,BWVZ
-XTPC:NNDX,DHZB,HZHC,NDFK
-NPHT:DXCQ,ZDDC,CBND,NLNN
-JSPR:JSZM,KVGX,JQQN,MLWJ
-RJLZ:SQDC,NTNK,VPJB,TWSR
-MWQP:BWQH,NGFP,SCKX,THDC
-TQWX:GJLJ,PKNS,TVWF,WXFP
-XWBK:NNCT,CVTS,JSHH,WVPQ
-DSMM:WXNC,GKPC,FMHD,TNLB
-BHDT:WJMC,NVKW,DTGJ,GVTM
-WMXH:PVHR,WKMR,NVFX,RHRP
-ZTWG:VNSD,GKJG,XRHJ,WMWM
-ZRSJ:GLNJ,LSLW,MMWV,QGTC
-WQTR:QRRR,BJWW,HQZR,FPKV
-DRKH:LWNB,PWZF,RWNV,NPQN
-MSDS:QVDT,LDGN,NHXG,LWSW,@
-PBJT:BFMC,FFRT,WBJP,KMNX
-BDFQ:ZHKT,GKVM,HNZD,FSRL
-TCDH:FTBS,NZWW,LJHF,CMLX
-RVNG:NMNV,GSHH,PBTS,JLWZ
-QVDN:BRSV,HPZC,MVGK,NHZD
-QCPC:WLZB,SCLP,SCDR,SCTF
-FCCG:VWMK,CKVT,XWBX
-WCQT:QNRM,CWPD,LHFX
-BJKS:MRLF,WSNP,MZQH,FBKN
-VCTM:BJZT,BKSP,GSMC,WNQH
-NLPV:SXRZ,WQRK,QXHP,GZZH
-PPMR:CDKL,RBCS,RNFZ,BTZM
-CVLX:KTKQ,SMLK,KDGC,KFHF
-ZCJQ:PRZH,FKHD,QRRM,CVHK
-NVJX:LBXH,ZNJX,TGHC,VZNC
-LBZN:GFGM,GWBW,BKJQ,KBKS
-FRQG:NHWD,BVBR,KKKL,NFHP
-QXDH:FJSM,FZVH,JRHZ,TBQL
-VDMN:JQZQ,MSTM,NRBL,KVHV
-JCMV:FQSN,KQPC,FZHF,RGMF
-LBKF:DXJC,BKPX,MMKH,KLJV
-GGZW:GRNH,BGLP,GTHD,NNVQ
-WFXJ:BLMV,MFGP,MHDZ,MRWR
-NBLJ:PVNK,QNFB,PQSD,KLMV
-ZSJN:QVPV,DMGQ,WPNJ,RCNK
-NLDJ:VFXW,XKQX,NLQH,MDVV
-CPFJ:KRQM,VVTJ,QCMM,MGPG
-HGKW:DMJD,JJDH,VBBC,CDXM
-VMQG:DJPB,JXPG,ZGFX,KHWS
-JPBT:KVDG,QHNK,SCSX,SFJK
-ZKNF:QWJJ,HBCT,SXGT,MNZZ
-XJGR:VDGW,VJQH,RXSX,WRZQ
-SDDZ:NTTT,NWWH,DLSS,VSGP
-HKXN:PZLF,DJMC,TTBN,RPTZ
-BPSR:CZJN,SQCC,JZLG
-CSDX:HVMR,FCTM,FBPN,WMXV
-GMRX:CXRZ,RJFC,DSGQ,CRDD
-CXLP:JHRD,NLHF,LSZR,GRMZ
-PLJB:SSWH,WFPN,TTFK,KSQH
-VFCT:FHRR,FZRS,GZPQ,CNMB
-JKRG:QCWB,VBGS,THPD,NKQZ
-MXTS:RKZL,GVLT,WXBC,WGXW
-QHGW:GHVL,QJNB,WNSC,NNBC
-SGTV:FWFN,SWRZ,RTNN,HVFR
-NPGN:NXCR,ZXDW,TVPR,NLLR
-MVKX:ZKMK,XCLB,TNNP,BZMT
-KXPN:ZDCR,MMGS,WWGZ,CJFR
-WRRX:GNMS,HHMF,SVMM
-WFXL:TMRM,BPLH,CNST,NQSD
-RWHK:FZDG,WJRC,ZRVZ,LRHH
-JSHX:TZMC,BCDX,HSNF,XFBP
-KDLW:LTNV,ZHMX,KZJB,ZGSJ
-HMDW:LTLM,HMSG,ZWLT,BPLW
-NFXT:LMBR,DSPQ,FDKM,SWSN
-HVFR:QQBZ,WQWN,CRZK,TSCS
-STWJ:ZKTB,TSJN,BTND,ZTSQ
-JQHK:XHXC,SMWC,BXRQ,FMQF
-RXRX:XDDJ,SMTS,GDFW,CWQJ
-STJG:XMPR,RJRH,MGCZ,LJSG
-XRVZ:WJSH,HXCC,WRJF,SHXF
-PQQQ:ZMBL,MMCC,CKRS,DNFJ
-GRDG:PSNF,BTKZ,WZPH,PVNS
-LXJH:KKNL,JTMM,DWZM,QKWS
-RLPX:QSHZ,SVFC,XQLD,TQFN
-VKMR:HGRH,LBKF,QFKZ,NPQJ
-RSLF:FNQC,SVHR,XMFF,CGNG
-LFVT:TGBB,VRXT,KPTM,VKWP
-ZTXR:VLBL,BCGB,PNZG,BZPQ
-RHBG:DWVZ,TJXD,VQTJ,VQQB
-KDGD:WCCD,NJHW,KSLD,XTHL
-LQWV:GTXS,XWWM,SFVT,WLRB
-PTJH:CMZH,ZPGW,PBKZ,PTHV
-CKGB:VTCV,DNJB,SVPD,XTPZ
-JQVN:QVVF,VGKZ,VKMJ,BMBM
-XRJL:FCWC,QHTW,XDWD,CVLZ
-TCWR:KBXK,FRZM,QXDV,CKRF
-JBNH:HVJB,KCST,DNWV,MWJB
-JTJQ:ZWKQ,HSBZ,WGQX,FNGP
-CCFF:QWNP,GBFC,XRTG,KZWV
-FWNK:PJQL,ZQZH,DRBD,DZDS
-DWTN:CQHT,JVQG,RDDV,NHKJ
-JHDZ:BCTB,FGLC,HSBQ,CKBQ
-LHMR:NGML,XCQK,LRWH,FRBZ
-WSJQ:WWPW,LGNT,RHJN,NJGJ
-BLTL:PBHJ,LWGQ,ZJLQ,KKMF
-HJTW:QZVS,NPTQ,BGMZ,KGBZ
-DVWQ:FGST,KGDK,BHHS,PHPC
-LGPS:BQBP,VCFW,SHNZ,DXVJ
-SJBD:TRVV,TSVZ,KQNH,ZFDZ
-VFNP:MDPT,XCJM,KNKK,ZTFM
-QZLQ:MTTP,KGXM,ZRTX,GZLQ
-GFVH:XJMM,LVTJ,HRGK,DLBQ
-RZPZ:TLSF,LCSD,PZTK,PHSG
-DCQN:BTZB,BQKD,WWBZ,CPDR
-PBFK:PGDH,XKSV,THTM,PXQC
-MKHQ:TNPP,HRCM,TGSL,THVV
-WWGP:XGLZ,RSRH,DRJR,QNSJ
-XSTP:MXPC,QTSV,CRCM,PXBW
-GKFN:QVKS,WZBL,JJQP,WJTR
-GSZV:FMLH,ZXKP,QCJT,WCHL
-JSMH:KWJR,CZZS,SCQH,DNFP
-QZTZ:FLDD,MNJC,JHVC,XFZJ
-HQLP:VGVH,JGXQ,HFGR,CLCC
-QFZS:DFBD,XZDC,HBPJ,PGPJ
-BQVW:ZTHG,RJJC,NCZM,QWHX
-DDTK:BKQN,VTNJ,XSWT,SJJQ
-ZDKB:SXPV,JCRJ,PMLR,KZXH
-FDZR:KWMG,PKHW,LPJQ,WTLG
-NQXR:SNQJ,FTVM,ZSCN
-RCLG:RBRB,CXMK,NWTP,BQZP
-XCMB:MWPR,ZQMK,HTLS,BRZQ
-PPDQ:MCSN,RTNR,MLZM,BFZP
-BHLP:JMNB,KLFD,XTVC,NZHJ
-DCCK:QJDW,TXHQ,HNDX,XLKJ
-HVTT:RZKZ,WZVL,RDMT,MHRT
-MHBC:NVXK,TNGV,LMCL,HTZG
-NPHG:SNMV,HWLH,TQLN,JLNM
-RJBB:CHPZ,BMLF,DPDD,GCJL
-FCVT:PDNK,QWZV,WZTG,WTVJ
-QWFM:SBFH,WQKM,VQHB,CKJQ
-SVHW:HXPP,RVRW,ZCSX,NMFV
-CXKJ:LDKR,MFJM,MQVQ,CCTS
-QZNH:FDZF,CRRQ,TLTC,NXNN
-ZJJB:LKHL,DTQN,HCQQ,KXLF
-HJJW:PPBL,LQJH,MTXG,JBBT
-TDND:TKQM,RZPZ,RBCR,TWLK
-FDMW:QKQB,KDLT,FVRF,VDSR
-CRTS:PMSL,BHZZ,GFMK,ZPVC
-MGNF:VQPW,MWXT,JSNM,WZWC
-GPMV:PZCX,PLHJ,ZZHQ,XCZW
-QCVH:JGKC,PSPX,GMXW,PNSJ
-GVTM:ZFDC,LTXP,VZXJ,GMTK
-LNKX:JVTH,FSTD,VFJZ,MNXJ
-MRNV:WPNR,VBXN,KMJJ,CFNT
-NTNK:PLJH,LKWH,PGDB,NDXJ
-FVFS:QPPL,KZMP,ZQQJ,GXKP
-KDQG:GWXR,BDCW,JJZV,RVPT
-FVJB:XJHV,KXTH,NHWP,XLJC
-CVFH:SSGH,BHDP,GNBF,HQKJ
-RGCP:BDNM,TSTG,HNKF,LHHT
-VVST:GGKR,VMKV,DQXD,PFHP
-XWTL:XJLN,BDTX,RSMH,MJQV
-VHMS:QRRZ,LSXN,WJRD
-QTGV:JXFV,ZMLR,GKNW,ZWMM
-PHPC:LCJD,HMSX,TLHH,QMJT
-MRNL:VBFM,CXWL,QVDZ,MGSC
-PJKD:TZRN,LNKT,RCSP,MCHL
-LHGK:JWWP,ZFVF,WSLX,GGZW
-HRXB:KKMH,NVCL,FGPR,BFXP
-DLPJ:PZWK,PPGZ,JBWT,PBFK
-GBPJ:FTKF,DVBN,XHLF,BQMR
-MBSF:SJKD,CXQF,PXVJ,DVVW
-GXZV:LMSD,SJHT,CLGW,DRXS
-RLRB:FTXC,MFVH,FCZG,MKGX
-RRQX:NMPW,BPXH,TKDK,GFVL
-VXZQ:ZMWH,PTNZ,SMKV,NRSH
-BQTC:BUG,@
-CLMQ:BRXC,CMRX,RFNH,CMVX
-GJJS:FNCX,VWLC,GMMW,LQVP
-MQXD:SQGH,ZKHF,KRSL,NHZW
-FWQH:JCZV,GVGV,DRJL,SBHW
-CDKB:CMTG,CSVC,CJJX,RGQC
-WWZP:TDFT,BDFQ,RSCM,SVZZ
-FPMF:TSKV,ZVDH,CBHX,MVLK
-RPLM:RCGF,HMWM,CTQJ,KBKP
-RGMF:FCPM,PPMN,RRGX,BGSG
-ZLHL:JPFL,PPGD,MXJX,MDLZ
-RWFJ:ZNDN,HDRP,HHQM,XRBC
-BTKW:WPTR,TRGZ,GCCQ,MQNS
-ZLRX:MRTB,GSWX,CKRG,KWHZ
-BDFR:LNDH,LGXL,DMBF,VTNF
-XZRM:HPNG,QXSV,JNHP,GFGQ
-DPCS:NSXF,VDMX,FGNB,GZSL
-WGVZ:PNDB,MBZW,BJJF,MRHM
-VPMD:BVZR,DDDS,HNZC,LPDR
-NGTD:GHMM,LRBC,FCNR,BJTJ
-TXJD:TWBZ,RPZW,WVZL,CKDH
-HWLC:GHRT,TGXV,NCJL,TZCF
-VFJX:DQFS,CGNS,BJFQ,WGQP
-NBFG:VHPK,QWMN,BQQH,PDBC
-SNWM:PMLT,DZDZ,NWHG,WBGP
-CZDK:BSDK,PNPK,VZCP,TPZF
-DPVQ:JGDN,FQTR,FRBN,NKLJ
-PBZD:WWKN,BDWB,GGGL,ZBTW
-PSDW:DLJV,ZQSD,LCVF,FDHV
-ZHWQ:BPRQ,GFMX,KKWC,LJKQ
-FRMX:KMDW,QLCX,VJSR,BWBC
-CFKK:FVDT,WTVR,LQTC,TTNF
-MBZW:RDLX,SPBL,QMVL,FGKM
-QVDZ:QBHC,ZJRG,ZCPR
-DZWW:QRGK,WDQP,MXRQ,NBFB
-HQDG:XLXR,HCMK,NPFF,CQXG
-BDHG:PJRP,HWSF,QLBL
-QZNP:QBHN,ZJLW,QQTP,FLVN
-QPZL:LGPT,XDKN,QNJF,JLGP
-SBMV:SDJW,NVFQ,WZVM,GGRR
-SPFH:QGFB,GVBH,DQMT,QLQC
-WCCR:PBXM,XQCW,FMGP,TKLP
-LWGK:LTVC,VPMQ,CLSM,MVQS
-HWRX:GFHK,QQDB,WGKF,PBSP
-FBPP:CCPR,ZJXW,FVKT,PHFL
-GRXT:DPWX,FCHB,BRNL,KGWW
-CCHC:WXGH,WSXL,HFWP,ZGLR
-LWGN:WQGZ,SMDJ,NLSG,ZZKH
-JGLH:NVBJ,TVBK,VJTB,LSNB
-TJQV:MLCG,JBXB,SKSV,RRMN
-CSFW:QWGX,FBDX,GKNJ,WMXZ
-CGBJ:SJSN,HKDD,SNMX
-KGDV:TLKS,DMZR,BRMQ,GFBX
-WJCG:GWTW,KHGF,BXTK,DPVQ
-DGDF:KJZS,FWXJ,DKMT,RHNK
-BHDP:LPLC,QMLM,KCRD,DDQT
-KMKR:GFCM,VFRT,DHDB,HCCG
-QDCB:PLZT,HVBC,QFJR,NDJP
-SVHR:SBMX,RRVT,KHVL,JHLT
-LWCD:PWKS,CRNW,VVKP,ZWZB
-GRPH:ZZFF,BNLK,WXZS,ZZKJ
-KPMK:GZWK,FRJN,FKGK,MKBK
-TKZQ:RJLH,XSXV,BGBX,BXTL
-TCKW:LXDD,BTJV,JTGV,SVHW
-XHCK:ZBFV,CXVW,WRRX,QKVF
-GJVS:TZLP,BXLG,RWQD,JQWV
-DNDK:GKLZ,VGDH,HMKD,JCRK
-HXRV:RPND,HHCK,BBLX,DNDS
-MRCX:BLZD,JDWZ,NNWH
-RMRN:NLMK,VSBW,ZXPJ,ZDGT
-ZWJL:RVWN,FFNV,LVLJ,JFQC
-XLZC:VCLK,BGND,MFXK,VHVK
-LCTF:VLGF,MNVP,THQR,CHJP
-PJGK:VHFP,QRLQ,DHZC,ZKHJ
-MZSP:QFSC,XCGR,ZHFF,JCRZ
-LRRT:PZHW,KPDR,RTGQ,PSTQ
-DSRW:PWND,PLLS,ZNNH
-CXPX:GPXN,HFDN,NLDX,SNFZ
-WTCC:GVDX,TTHF,JPPL,FMMH
-PJHM:VPMB,LMKJ,GXCS,VVJS
-NDPX:FJKJ,FHCQ,MHSX,LLBT
-XZBS:DWHF,QKVN,MRHZ,CJPX
-GCMC:BRBD,DHCL,PJHD,RQPG
-NXDZ:BDBR,HXCT,DMXF,HPKF
-LQZG:JNZS,RSSF,LWML,SWRJ
-GLHK:NLVJ,LTCC,QXJV,RXRQ
-DNZS:QLXH,PHMG,TGGC,WMBC
-RJRH:VFZD,QKWJ,QPGL,KKLP
-KNKP:HSMN,WJVK,HQXF,SVDG
-TKPS:VVWS,XFNM,GWZQ,TJHJ
-BGGF:WSTL,RHCC,ZPZW,XZNW
-DPSN:NRTL,KQJV,ZZCM,MGDP
-ZQWC:SRCT,VGWL,QTQJ,SVPM
-VLQC:QHWM,VBZW,XKWD,MBHT
-LJSG:DSZD,VNQZ,JQTW,QKSJ
-PMTW:FFQN,JKJB,VTPV,STKH
-FHHP:CSMM,PZMV,ZHQR,TNFR
-PLQC:ZCNQ,CNGL,WGCN,WVJL
-RQDF:DJMD,PCJM,SDVP,WGVZ
-ZTFS:NHNS,LGFJ,RBDN,DGWN
-RBMP:MXVM,HHJQ,BPVQ,SNTN
-VZMT:WMCJ,TDSM,VSKG,BQHL
-RJJJ:RVFN,VCQF,CJDN,KDVB
-LRPW:XKQB,SKLC,PNJD,XZJT
-RLTM:FXMN,VWVS,ZMGX,CPSR
-PMSQ:WLSL,TQPB,MJMB,SKJC
-WZFT:PHZR,CPXD,JTCD,QJFD
-LJMR:LLPF,NSFV,VNNT,CQRQ
-LSBH:QMCQ,BGWG,SKCH,DPNV
-FTMB:GFJH,DMDZ,JLJN,GRMQ
-LMZR:BPKL,CFRT,XKCR,CGFJ
-DCKC:CKKK,GXSZ,ZRFV
-GPJQ:DDSK,MSFK,CLRB,TJWB
-ZBCV:PQDL,BGQC,NTPJ,WNVB
-NSQH:VTDB,VJSF,PXKJ,ZQSM
-NKBH:RCFP,NLDJ,ZDRZ,DRJT
-XRRJ:GRDZ,NBJN,DWDM,MZQB
-BDPS:BCGS,PPRV,NDPR,HPJP
-QCHM:SVSN,XRZL,LXRS,MVFT
-FSVV:TPRQ,FWQH,KKZW,ZSSM
-RTLP:PNVD,BQVW,NQLP,DLNF
-XWTC:KNKB,TFJZ,QZCV,MKTC
-BFXP:PSWF,LHGV,DPZZ,WXWV
-LWPG:BVBN,SWQP,CNDG,ZDLM
-SHLH:WJKT,XTNK,DKGB,HVKS
-MRHM:RRDS,ZTXK,HRPR,GFFS
-HQQV:BDSV,NMVQ,TZPX,JJSJ
-LQGV:PSZQ,GDWW,RXSB,GGBX
-HHZH:PJTG,RZLL,HRMS,SKFG
-RKGX:XGKL,MPVG,VQZF,SBDJ
-NFNR:WHRW,RSKR,QJHG,JFKZ
-CDPT:CMWL,XMXB,HMXN,TBNJ
-ZVZD:CQJG,TWHJ,NCXT,HFJX
-MXGZ:XDCM,RMRJ,BLVF,DVHP
-LHHT:BSZW,FWPV,CGHX,BTDW
-GHFJ:JVPD,HPGZ,SHBK,BRWL
-QZBQ:VHDL,HXPQ,PLQX,HHBV
-JGWH:RHXC,DPTF,FPZV,MLWT
-JKWR:PPZL,BKBS,TFFP,XNCD
-NVFB:WNGJ,WVNP,SLKG,GLRB
-WWHR:GZMW,QCKH,MMTF,XRBR
-XCZW:DDHT,FRHH,NLQS,VJJG
-DVHP:WMWL,DWTN,QPCT,ZRSJ
-BFSD:WTPR,TWGG,MZLM,RCHD
-KHSZ:CPFK,RQLL,CZKQ,QWKN
-NJNP:RTPG,JWXT,XRRJ
-CQJW:CCNS,WTCC,GFZS,KPWC
-NHBT:MLHJ,FKJJ,HQMM,BMXJ
-NNBM:MJHB,CCXH,XTQM,FWCT
-KNMG:KXKB,KRZZ,MMWF,VTKW
-KFFX:DSNM,RGNN,NFTK,QDJS
-CXJH:DHSK,GSPV,NVWC,KCCX
-HVNP:MKPN,BGKG,RGDR,PMBR
-MVKG:WGNW,LQGJ,FXJT,WFTK
-VPCB:JQCQ,RDXT,VDBZ,FLWM
-DWGL:XWZF,RVDF,VDFX,CSMR
-XFNM:PRQN,CMVS,NFSH,MVZQ
-MGFG:BQZF,SKLS,LSLV,NBMR
-GNLM:WKBN,XVMT,LFFZ,HDTV
-BJBV:ZJJH,DBRZ,XRRD,VVNK
-VFVT:ZWHW,XFVV,GMWP
-SPPL:QLSJ,FXLD,KNZS,GDNJ
-TPLW:NVQV,RCHL,FHSN,JCJF
-XGCP:WWDH,JFBP,CVLF,GMPQ
-WJSX:NDZP,ZDKB,QKSR,JRRW
-DSDW:CKVL,XTQS,VWFP,CZZM
-NQNK:QHWR,MVKG,PTCJ,RBGV
-LCXG:WFJK,MDKJ,SSBC,DDDX
-BHTM:SSJL,CTMQ,DHCB,QDGH
-SKTL:PDDG,DMJG,TSDP,ZSPG
-VJXH:TKXG,VNQR,MBDH,TQRV
-BRVG:FBGR,TJQV,WHZB,LWGZ
-CZFV:PRXB,NJLF,HWKH,QNXH
-PDMN:KSCH,KLSF,KDRS,PWSC
-JHBT:QJNF,TXBZ,WCZD,GSMQ
-BQKD:FPSL,VDGF,SDQT,RMZR
-ZZGD:GNBM,LCDD,XRDX,FHQG
-SVSH:CQHF,NTLT,SFLZ,GMHN
-KZXT:KWZX,KZQB,NVNG,VKWV
-KJPL:KJDP,CBZK,ZQHN,MSBX
-QFZM:FPTT,GFCX,ZFDF,MGXR
-XRRD:SBRX,JGQS,GKWR
-HQJQ:@
-LHKL:VRJP,VFSH,VRQP,ZRSN
-XKJM:KBWX,SWDH,SGGR
-XDZZ:ZXJB,GCXF,GJKM,BHTM
-ZJJQ:PNQK,WTZH,HRXG,MSJT
-CMVS:WKPF,QJWZ,NZFS,SWRC
-LQKC:PZNN,HSXZ,HSLD,RSLF
-RKWC:CSRQ,MBQJ,ZFLC,VHVH
-TZKW:GKBX,GLDL,KXMZ,MTJW
-PKFN:DCVL,KLHC,QNJB,HHGT
-JPVT:KBHW,VNTZ,XRMS,BHKC
-PWRB:PMMP,CXPC,GCRQ,MWDR
-HFXF:NGMQ,DKBX,XSTX,XZWG
-QTVJ:LWCL,SNBW,BBSM,ZDHJ
-MTQG:TVVN,RTCV,ZHZJ,WKJM
-VKHT:WNLB,GVTK,FHHL,JPJM
-LLFN:KSTR,QQFV,MGLP,MGST
-ZZFW:CQMP,ZJJM,WGKW,WPQW
-ZNNH:LVXQ,JWDS,GQVM,QXDH
-FXPN:CPPW,MZPC,ZPFF,LMQF
-KTDG:VDGB,CWMN,PWJN,MKWF
-XNGW:CTHX,HPLH,WPMZ,ZKJL
-QHTW:HJKW,QWTH,FLQS,HVXF
-ZWQS:KGSN,CWGR,ZWJH,RGCP
-DDDX:MRVG,KVFZ,BQQS,NQMJ
-TWFP:QVZH,SPFH,MXNT,KDBM
-SPWN:QPWJ,GKBJ,XPQP,NBCN
-GCCC:QXGT,LPCJ,CDCG,VFJN
-MXHH:MKGV,FWHQ,MNPP,HCGT
-LCSS:BNJT,NSQH,VVCZ,JBNH
-TPXH:TCRB,TKQN,RVRF,HMLM
-NCWQ:KSBB,TPWB,TZWF,XKKZ
-LRXQ:ZNLS,SFTZ,MBXQ,XNMJ
-PXQT:LFDF,RCPQ,JNHJ,DQDB
-SVJN:SFLM,SRND,LPBV,XZSJ
-DMWJ:WJVG,TNBN,BWBB,WFNV
-SNPP:VJMQ,KSJK,MDCK,QNRZ
-XWJH:SBGQ,FDMW,SPVQ,VQXK
-QNDL:QZLC,PPDR,QDXP,KTBF
-DWZL:JHPL,VVJV,HTRJ,DPTH
-SFPD:ZLRC,QLDB,RGDK,LWGK
-LHNW:HZXD,ZSTF,HRFW,XWZT
-GTJW:DDHQ,DHXT,XJKF,WBJH
-TKJX:QQDH,FPDP,HQRQ,JVZD
-MMJQ:XGTK,VHHF,LGQX,CGPX
-SVZZ:CJVQ,NRJX,JZRJ,BHXC
-RMJG:HPBM,XWSJ,TPRZ,DBXB
-MWQK:WFZN,MRFG,CBFR,LGCM
-KQLB:QJJS,BKSV,WZMD,PMGQ
-XJLM:CZDH,PKKN,WXQV,MQRL
-TCMJ:TBCT,CCQT,NNZB,TZLS
-NRTB:BPSG,JZQT,GMNP,KBTL
-DWRR:ZHBP,VZJW,KPCP,SMPN
-DMVN:ZMNL,ZPWG,JBFC,VBZG
-CPJX:ZNFF,QCHM,VJTW,VLQC
-NHKS:LQLK,BRHM,MFGX,JLTV
-ZSSM:WRCN,PRVT,LXPS,SLTL
-SMXL:JQRJ,GZGG,RGVK,XVHN
-XBMJ:NNCM,GNKR,TDQF,CBZP
-WZKX:ZGDV,XSQF,FSLG,LCXG
-RVML:JMBT,GRSF,WCBM,WTRT
-FXRZ:NPFC,RCBF,GTGZ,TPXM
-DTMP:JRFN,HGVV,DKPF,STXG
-NKRL:BMNL,XJHT,LFDN,CQMW
-WHSN:RZCF,MZGZ,GVMH,HVTT
-DRJT:RTLB,VKLQ,GRWC,JRXP
-ZJJM:RNRW,HTHP,QPKQ,DLDJ
-MTNC:ZGRW,HMWN,JPVZ,LHRQ
-GFBR:PXWH,FVFX,RSXH,ZRZH
-FJQG:JDFT,RHKN,TGZZ,DPSN
-GRWX:SKMW,JKTK,JKZL,LBLH
-CCNF:STMF,VKHF,LRKV,DNWK
-MNTB:MBBL,PXCZ,QFRF,BJJT
-WKQG:HPHV,KJQQ,BBNH,LSFH
-KMJK:NXQN,FJBD,WTNC,XJRS
-VKRN:FVNF,XPCF,WTVT,KHDW
-MMGD:VGCV,DQSW,TCGR,BTTB
-JZRD:ZZHN,KQFF,FDPH,PCDQ
-CDTN:SSNX,BTXP,PNSD,XDXR
-SMPN:QSBL,TCZS,RGGK,VVFM
-ZDCM:FSHK,VHBJ,PPKL,RZWL
-BPZW:FMML,BDFH,QWRG,MFPR
-HLLC:XQFR,LFSX,BZGK,VHQC
-KLMC:TXKM,HMNH,CZBN,GDSP
-VJWM:CXMS,CZWG,WWJZ,TCMJ
-MCNN:SFTP,DGKZ,QCXG,NDNF
-KKLP:BXST,RLQJ,QGPX,HSJT
-VJQH:QSQM,ZWRG,CBKG,ZGKW
-XPLJ:HDVQ,QRKW,VLNM,WDBZ
-CRBV:TFDG,HNDP,KDNN,FJMG
-QDRS:VXML,DMWC,PGHJ,CHRC
-CFVW:FDML,JMRR,QKJM,PZND
-XCJL:ZSQZ,ZPXC,PLJQ,DBGC
-FBBS:JBZF,KFXB,WMSW,SXCW
-TRQZ:SRBQ,PLTL,QFWG,VGCM
-WFQG:VBPT,GSLV,CMXC,HFND
-MCJV:JXGZ,LWVX,KTMR,KKRH
-KHNB:THPF,PDGB,XWRR,DCRG
-DRXS:WZTC,GMHK,LQMV,LCXJ
-BXZB:ZPFS,MPPG,VCFC,ZLGC
-NZXD:CPJC,TBPK,FJRQ,JFJJ
-RRTR:ZHZD,RNWB,JCSJ,VSFG
-KDXS:CXTX,VZHH,XRPZ,SWLJ
-XSJZ:RPGH,HBMR,NMJN,LGZS
-FFZR:XWZH,SMSC,JCVJ,FZFF
-GGSW:RMRW,ZWVN,CJGF,NMBT
-DLFX:DCTW,LJMT,TXMM,BCJS
-JZRH:VTQX,GNQL,BXMM,JXMC
-BSRD:HXSR,GPJQ,DLJD,CKHJ
-CXFG:XSHW,JMBJ,KVLW,HKMV
-JWCZ:XJXK,GRJK,FKXS,WJXG
-RKMM:FMSM,SRDZ,LBZS,XVDQ
-NRDM:LLXV,MCQF,NRHZ,PNJR
-WTLG:VJML,MPMQ,NKGV,RXGT
-WNPB:MKCR,ZQMZ,WSTZ,MFJV
-BFFK:FMWV,VLCQ,BQMQ,KGNM
-ZJKF:WZZR,ZVPF,QQTH,RKLJ
-MCPG:XNWT,CKTS,LBFC,RKFJ
-CGNG:HWPV,QLVD,RBKQ,PLQC
-KGDK:CCHL,MXHH,DVTF,NRZL
-SHRB:CJLB,QNKV,LQKH,QRKC
-QGLG:HLFR,RFRD,PBZW,ZZWM
-KFNL:FMJW,VDWR,BWGM,VJFM
-KFVJ:XRZJ,WWVD,RPSG,DWSF
-JLSN:RQWV,VXZQ,XRMR,ZDDW
-LJQP:DHMC,GZPW,FKGG,QNLS
-FQFV:ZKJR,VLTN,LBKK,FCSV
-ZPDL:RCPR,DQNV,FJLG,QDMZ
-CGMJ:BGBD,CTGJ,BFVG,WZKX
-SBDQ:QVHW,FGHK,KKBX,ZJVS
-DDCN:XWHL,VWRX,NZXV,XFTX
-PFRD:RRZH,RBKV,QWBS,NBQZ
-KJHV:LQKT,FNFH,PKQP,KPLJ
-TSPB:WPKB,JHBT,QPCB,ZPLV
-VBXN:DGMK,MLWD,VZJZ,GTNC
-JBTJ:HTJR,CZFP,BZGR,FXFJ
-RSQV:RNCT,MTCV,LWDZ,GFBP
-RCNK:RHRS,FMNV,RJSF,PDVL
-DNDZ:XDBJ,STCP,MKTG,HXWZ
-CDVL:TSPS,PLPN,ZJTC,DTTQ
-MSBZ:PCRB,LDKC,VMJW,MQXR
-DWTW:VNWS,HLJB,RGNP,@
-XGPT:FDLQ,LQBJ,HWHX,LMXN
-NQRX:LGNS,NFTP,JQBV,NQZC
-PNBJ:GBTJ,RXBT,ZZGC,XKPD
-ZJBM:LGRC,XDVX,WFGM,LVPK
-WFVB:ZBBJ,DSTT,DTRZ,SJDC
-RNXT:KGLB,BRPS,DXPB,WMMZ
-WBCQ:DKMM,PDPJ,DBVV,PNZL
-RTPG:BTHQ,XMRB,LJQW,KVMK
-NJFG:VNCD,DNFF,LQTM,SRMW
-CDVQ:KRJV,HKCX,VPDZ,SZWP
-XJXC:CVSK,LTZH,TJCD,PKST
-RNSQ:PKZN,MZJH,BVTJ,HBMT
-GLTN:MWGQ,FGKJ,CSQV,PWCH
-WPQL:CKCS,TJGB,QCKQ,MMKV
-QQKS:CNVG,GPMC,PCTR,GSWV
-TFDR:SWXN,JZPD,HFDQ,MRWF
-FGHK:XZCK,VHBV,QLZH,HDRL
-XSPQ:DSMH,NBCR,PTDH,CHXD
-MMBN:QDKF,VGSR,CRZB,FNSM
-FXKB:NLJZ,BSHN,SVWN,QVBF
-FGLC:KTZZ,WXFW,MNHM,JTNP
-PBGD:DPQQ,PQVR,CGGR,NFDW
-NDFX:SJFS,BXCG,SXQT,QQFZ
-KTDV:MVLR,LZBD,PGRM,TVLZ
-WSPX:FKFG,BWDF,PZFL,RNKW
-KXRZ:PKVC,NVKQ,KJXG,JVXB
-FCSC:WPSN,LJBM,JXSH,FNVZ
-PXCZ:XLJM,RPST,WLJP,JKRZ
-TKRX:CJRC,WDRK,VGRC,BHZJ
-PJPD:SNCS,MRNR,LLBB
-QMMX:TFLR,DTLM,LCBK,TPWD
-HNSC:PHQS,WQKG,WMMS,TSHB
-KFZX:QKCP,VLRC,WZBS
-DLFF:MQPV,JSMH,FZFJ,RQXG
-SVFC:QBKS,JHKR,FNFL,NDVB
-HGPL:KRDN,QVVL,QNZV,FVTF
-PMHG:FZHS,DRTF,VCHD,GDWT
-DJJK:SLMJ,TWFB,KTFV,XVCP
-GMNB:WBQF,MKCK,SKVX,TDDT
-GHDD:GLQD,KSHW,VSGH,ZCNT
-JLKX:ZTWG,MLVW,HJPK
-FNGJ:FDPQ,CCFF,XGWL,SMLN
-WVDK:BGHQ,KJBC,VNFD,JVKH
-ZTZV:XCXN,TMDG,SGKZ,KKSD
-TNCT:HWLL,WNQP,JDTB,NGLN
-QVVL:GKRF,XVTD,XSWR,LSBX
-RXFS:WNVZ,BTGM,NGPN,FNCS
-GHCC:NSKQ,CQLG,VCFG,CTTS
-MZHG:DHGW,MRZQ,JKDM,PGHN
-QLVD:VNVS,SQXN,FLFH,WVJQ
-KRZD:CMBN,ZLHL,RRPQ,SNHB
-SDGV:BWFD,BJKS,VFGZ,VWLK
-MCVH:MRSJ,JCJX,LPCV,PTJH
-WFNV:QJGC,QQHD,GCRD,ZLKK
-XLVS:XHLW,LZHP,CMXF,LQGV
-NBTN:QSVT,TSBB,JPLF,QCMC
-HHLJ:JJRB,MHWW,QGBC,WDVV
-KLMV:DLHL,HWMP,ZFBW,VPCB
-BJCT:DFHG,TNPG,VCTS,KVTS
-VMFC:GLJS,TFQT,KTDZ,NBNL
-LKFM:DMSL,MHHS,ZDSS,DRGX
-ZSQH:XRTC,PKVK,ZDLR,CXVQ
-KZQK:LHVW,PXFS,HCDG,CKPH
-LFRM:XTTX,WHTK,ZWTL,DFPD
-CXVW:KHNM,GLRZ,KDJJ
-LTJZ:HQMJ,GCTR,DBPM,RLGP
-KKRH:GNDG,SSGF,KHRM,WXNS
-TXSC:GHKG,XQGH,WXTJ,DFNM
-ZSGR:KDGZ,GCMJ,QRTQ
-GNTZ:VVVF,JVDD,DPBB,LHQL
-DHKJ:PZJM,KQPH,FPJQ,FFJQ
-LJSC:LJCJ,GVXN,GFXP,CJPS
-QZKX:FQSP,KLFN,SFJL,XJJZ
-BFPT:GXKB,VJBM,RKMD,CJVM
-SLKN:XSBQ,WCBG,QPLX,TKJR
-MZDX:VCCB,LQKZ,CWLL,BPVH
-WGWJ:JMJG,FXFV,KDBN,DLNG
-QRVT:GPPQ,DXLG,SGLF,GNSK
-PXJD:DRDL,STJX,RMRM,DPQV
-BBDN:PHMD,DWKD,PLDT,BKKG
-CPLW:FCKR,SFNK,ZSVX,BKZR
-PVPS:ZDRJ,HRVG,TCTB,BHLP
-KRDD:RXVP,PXRP,ZTXJ,VGRK
-SQFB:LKDS,CQNK,KMCP,CRKJ
-ZPVC:FHJC,MZHG,MHST,KMVZ
-MGPW:ZGRH,DGKS,VMMM,WMQN
-GHRZ:GFXM,FPXW,KRDW,VXTV
-TQKS:MVCX,KMSM,XVNX,NSQB
-SQPJ:PWSB,KZBQ,WMDM,JJNW
-JVTD:MGZD,RDJR,JPXK,ZMZS
-FWGD:DZTW,ZDQK,GRRL,GKQT
-HSVF:GXTH,TZHB,SQLC,WQVN
-PVXD:LWQS,FFLF,DRSL,LPKL
-JPMW:MTXB,RTLM,BJQP,DHHW
-WHTK:HDDG,LTKL,GCCT,DPQX
-NMWH:QCXZ,GQRZ,FSLB,MXSF
-KMTD:PMHZ,MJSM,JTVD,LRDS
-TPFX:JPZB,FSSW,GLDX,JJMM
-SVXK:KZFQ,SHFX,ZBJH,JKWR
-KLRR:QRRN,RTPR,HTMB,NRJJ
-NQQH:WSJK,RKMT,PRCB,LQWV
-QQHD:VCXV,NDNQ,JFDV,KDGD
-JGZT:TQJN,BLCV,KQGJ,RWHK
-PLWS:WKMV,VKKK,BNZB,FQMP
-JWBV:MLLM,WXLD,KJXH,DNDZ
-NLQL:XFZQ,ZWFN,TMSL,RPJW
-WPFP:RNJH,HGKW,FRWZ,WHKW
-LJQL:QCKD,RMMB,DTKS,DTSX
-TLNK:GTZT,QNDS,NCQK,JCSR
-NLCD:PXQH,SVJN,JZZK
-TFVS:CNCG,HBHK,ZTRF,JMDR
-CHJP:CSMZ,FRJJ,BKNV,NRTQ
-XPZN:PHMZ,RXNL,PPTC,LFPX
-VNWL:MQTQ,NCGV,GBDK,LBCK
-VGHK:ZFFV,CRTS,CVTL,PZGC
-JMXK:NNPH,BJHP,GWVB,JKRG
-QDSK:HXLK,GGMR,XQZD,JSTW
-BGSK:DNMN,MVJX,KCBN,FRBW
-BDWB:RDRT,NRXQ,PTLS,PHKF
-JHBS:MKPV,MRJK,GNPK,RNMW
-XSHF:JKFN,KFDK,NWDZ,KTDG
-BHZJ:MFJT,ZSLJ,NTGP,JGJP
-KVMK:DZCG,HVSZ,BMJN,LNKX
-CVZV:SFLN,JTRV,WTPK,ZCQW
-GVWX:JZJD,LSML,PWCJ,RRDD
-BHJK:LFHN,JDXP,TCNS,QTVQ
-BCFH:QZQZ,GPCL,CCXN
-RZMS:KVJP,XKVK,QMKS,NHRF
-DJCR:ZHVK,PWBT,FNZK,KLHK
-VJFM:WKJH,KDRF,JDCL,LFCJ
-PNSJ:BHPP,VPVN,SSQP,KPJR
-KFLG:XLHZ,VVPG,LTBX,TZZQ
-LQGQ:DMVQ,VPSH,TQMG,PLKM
-HQLD:FDCK,RQMH,DSTC,XDCS
-HXQB:HLDB,ZTVS,XKXG,BFPQ
-MVHF:ZJMF,ZTXR,NQFZ
-VDQH:LZLZ,XDRJ,RPKT,MCQB
-ZSCN:XHFS,NVXB,NBTR,XKGS
-TLKW:LXBW,GQQG,JNDW,WPCW
-BPGG:WGTG,JKFQ,LKHQ,LLSN
-RQCB:CLTT,TFZK,NNPK,PPDZ
-SLSN:FWTK,NPLR,NFJD,LPPD
-MZJV:MSQS,ZWTG,QFZQ
-WPQF:KJZP,CDPT,KPKP,MNTB
-WBJW:MXTP,MRWX,CVFJ,SRQS
-CBQP:QFMR,HDSD,VKTL,VSNF
-SDZW:ZQLJ,JBZP,MKQJ,LKWQ
-PKWP:VZQB,VZHT,BBTJ,SKBM
-TJGX:FDQJ,PFVS,KJZB,NBPV
-TJKP:LXGL,VRNX,RVBS,NWVS
-BRVS:RGGQ,DXCF,WNTX,MCTX
-SXSR:FFDP,RJDL,PKNF,HZNB
-ZVSK:SPNK,MXWC,XJWV,KWVC
-TGXZ:JFGR,DRTB,LCFC,FFSL
-BGQB:KFZX,PCQJ,KZJP,WNND
-WZBL:GHZZ,WFQB,NXLS,BRVF
-GXZX:XHVM,GVGG,KLSP,TCWC
-MLDH:RSTK,KQPX,XTWG,FXHX
-DVTB:TWVT,WNSK,JKRL,HLNB
-PWND:SBJV,GLZT,LGVG,FKNP
-MKHB:HHMJ,LRPS,SDHS,CJSL
-NTKM:RLLS,SXRP,LQPG,RNCF
-SWWC:RBLW,SGTV,ZTNT,WCQJ
-QHNB:DBRR,XCKV,QPLB,ZWPC
-QFJB:LJTD,HFXF,WPRV,WFVR
-HVSZ:DCXQ,PFRD,PLTZ,MPJB
-MRZR:NRZM,XZTL,TBCW,NFPG
-ZSFM:PGJP,QZTX,CFRB,GZZQ
-JTKR:CWDF,JCLR,JDNX,XZBV
-BDXT:XHDT,WGLR,RQHP,XZRM
-PBWB:MLMM,VPNV,XVRX,TQKS
-GKJG:JVMR,VHSN,PMCN,PBSB
-PXQC:PQGL,MFXF,SPRX,QTMF
-XRSF:DSHQ,DLPJ,MNPX,PLMG
-GNWR:LQHN,RVHX,DDJF,ZPNM
-HTPX:CPTG,CGZL,DLXR,XCPW
-SBVS:JHDZ,NHMC,DNHX
-NBFK:TRTJ,DXNL,RTHX,RVRN
-VTRM:BLVD,BQTC,DSZP,VRRV
-BTZM:WHXH,SZCS,FWXS,ZRPM
-NGDG:JJML,XRSB,XTSW,KMNF
-RSWW:CPNM,VWBZ,DQZW,STBT
-PPGD:GNWB,TJKX,JBVK,CDPP
-FWNR:VFDN,HFBS,WCBS,JRJP
-LTQF:BRPG,NKQG,SSTH,BWBM
-QVQC:PZNV,CPLW,TLRG,RLPP
-ZBTW:WTGQ,FSMB,ZNJF,DHZR
-PGPJ:VXWX,GWSL,VVRD,QSFQ
-QBZX:QCBF,GQGX,JPGH,CPRB
-VBNT:QZJX,ZFVR,WVFN,FJCQ
-WRKF:HTCW,HPJC,SBZW,XPQS
-ANT:BUG,@
-KFJW:FLPX,FFVF,RJTP,MFRC
-VVZM:DHJB,TLRM,NDLP,QMQG
-LDKC:RQBW,FMRP,QZQP
-HHMF:SRRP,VNTQ,PNXP,DJWQ
-FHSZ:WDPG,SGKL,JTRJ,LRGJ
-NVZT:GHXB,CQSV,KKFZ,GHSV
-ZVZJ:SNFG,BCBC,DCQB,PDKT
-KBFL:ZFQW,BZHB,JHNM,BQDP
-GPNX:BFGR,HDGK,STRR,NFCL
-LPCJ:JQSX,MQRZ,TMBT,MBKN
-ZZKJ:KTQH,HLRN,VDGL,CVFB
-QKWS:BHNJ,MNFJ,LBVF,VKNQ
-RGLK:MBSS,TXQK,BFPM,BNKF
-XGVL:VXGQ,PNNK,ZSTB,NFWM
-BKHK:DJNM,MQLX,XLWJ,JCND
-NGLK:PMBJ,LVWV,GHXD,GKFN
-FBCF:RXQQ,QHXW,CGVZ,XDCD
-LSCM:DNQS,QKXB,PPJX,FCTR
-HWHC:TMDD,DCMQ,PLMC,GHSK
-WZHJ:XRSF,CHVK,KRZD
-ZBQL:BMZN,XLVS,KJKR,ZPCD
-KXSQ:SKTT,VGRM,HZWV,NNBF
-BPGZ:HVTG,HTVK,SMTP,NTPZ
-WNQH:NGCV,LTNG,BTTN,DBFL
-KZJD:ZNZQ,GFVG,VPJS,JBHV
-ZZMJ:ZNZM,VZGX,DQMN,TPXH
-NVCL:KBTQ,SXSC,TPFF,RVVK
-KGSX:RDHM,SDMK,PJWV
-ZPXC:CJMM,PBCJ,WDPZ,HQWH
-XWDW:XNRF,CQGM,WLQB,TGQM
-CVTZ:RHXJ,PNKR,VDJM,CFBT
-RHVK:SQJT,KFNL,ZXVN,RRCT
-SFWV:TTLN,JCMV,JLCM,QLPQ
-ZHLM:LNLG,KMRB,TXGJ,JLBV
-TCKP:WBQX,PMSQ,JNGZ,DTLV
-RTMV:HKPL,XPGN,VJKT,DHLM
-TTDZ:WLTN,RXFS,ZJCW,VFJX
-CMRQ:BVFT,MNFW,ZQVD,XBSB
-QWCF:VBDL,XWDW,MLGL,PNDX
-DFHR:QDWP,NBPF,BHGS,TZWD
-SKLS:TTQV,CCGB,CMCC,LBSG
-KQNC:CDKJ,ZNLD,HWBZ,VPCT
-JWLN:JNFD,PZRT,MSVB
-MRWR:NLBW,LKBP,RFWH,RKHK
-RLDD:ZZNR,XHXR,ZLDJ,BQRG
-QKSJ:PNTL,SXHT,WSFL,MSTH
-RRDD:JWPN,ZVKM,SBFC,LWKM
-RRTL:PMNM,NXNF,XGKS,SPRP
-HVLC:SMGV,ZSJN,CTXM,CCMJ
-FKSV:ZBDK,HQVH,NQRF,PHNT
-RHCC:LHFB,ZSGM,PNVR,NFFD
-HHKM:VFVT,XKJM,BDHG,FCCG
-FNVC:PKMR,SGMJ,WJFX,SPSF
-XNGL:JSPB,GNGB,JXZT
-WKJM:LBSZ,QGXK,HWCJ,QSJS
-CJQG:RKQD,LVFS,BBQZ,FZMS
-JFBJ:DCNB,DFCP,QCJF,QJRV
-CDSD:GJSZ,LWNZ,RJDB,GRMT
-HVKS:LZPR,PDPW,PSGM,WQTR
-PXNB:QMBP,XCNT,CFPP,RGPF
-VTVN:NLBQ,PBXV,PZVW,FWKG
-DTLW:MRCX,HHPG,LXSK,HQKZ
-ZLKW:KQWQ,WRLZ,FKBD
-CXWL:LHNW,FVJC,LFRM
-ZVVX:XSZW,TTRZ,GWQK,QWWX
-JCRD:MDSR,DWGL,LZRS,VMWS
-ZVFN:ZMRT,JZRD,TJTQ,DWVG
-CZPQ:SGZW,PCSM,TGLB,FVTR
-JSVK:QSQL,GCCL,BHWC,NSWB
-GHSK:SLFL,XGKH,NPJC,FXWN
-TRZX:MKDL,MCWP,RMZB,HJDJ
-NPFF:CQFP,KXQW,TMWP
-TBKD:BSKN,KPQL,JXFL,CLGK
-QRZB:HGCR,QXNC,WJQM,WBQN
-WBCT:SFSN,MLZF,FVSL,VLTX
-VDNR:QHBW,KHPW,MHKX,VHWK
-CWFF:JNXM,MSHL,WLMZ,JSKV
-CMNC:GQDZ,DKFB,TZFX,HWGX
-TLRS:WMQH,SLGJ,VCMJ,JCQH
-SHFX:BNSQ,QWCL,JQXR,MLBC
-DXTR:NBWW,BPTN,WRLC,SDGD
-NRRN:ZVDC,XKQP,XBKP,LJXC
-BWQM:PFTG,XPKN,QGHJ,HDDM
-KLQL:BRSW,JRBV,VTXV,PSND
-FZVH:RTZP,RHNB,RWZW,JRMM
-PWKV:CCZK,MTNC,LPBH,JBTJ
-RVRD:GGNR,JBDN,WVNQ,VCFM
-CZBX:KTBC,GLCP,VGJW,PRNR
-RHRK:GMGG,TZFK,WHGT,WRZK
-HTZG:HZPF,KRLB,MVDL,KXSQ
-QLLM:SPTQ,CQFK,DWDQ,CKJJ
-WDVV:CTQG,GFMW,FGFC,HXRK
-JVCB:BRWJ,ZSFM,FSQR,VKRN
-DMWC:SBLZ,XDCJ,WRWX,THDG
-BTXP:FXVK,CLMD,SRMD,GQNF
-QCQJ:MHPF,SBBQ,VGKQ,VRKT
-SJWL:GSFF,MRZR,MWTD,NCMM
-BZJZ:SXBT,MKFS,QFSW,CTBD
-WRTX:TBPQ,WHGX,JKNG,SXTM
-PNZL:XWNR,JSVK,QWRM,VSTB
-DHHH:ZGJD,RLDD,KHSB,SHKD
-MHBN:PBLP,WZTT,FKMS,QXKX
-KFHR:HTRB,NFDF,FDQK,MNLQ
-SVGR:BNRD,NBTN,PZBR,KFFX
-TZZG:RCRK,MGRN,KNNH,LQVX
-TSGG:QMLX,WSTP,SSHQ,MPNP
-MBDD:ZDCN,VDVQ,PCFP,SMFJ
-CXTL:MKDQ,MZCV,LSPW,DXTR
-WXFW:ZWZV,SLNW,WJNP,PSKN
-VPNV:VXJK,PGJL,PBWH,FGQX
-NWFL:DQLW,TQDZ,RRVV,HGMS
-WDGK:CRNK,NTSF,QNMZ,BMXB
-HLBD:SGJC,SSCR,RWCH,LJLJ
-CPFT:XLJQ,CMCJ,QKPL,SMCV
-WDFB:FLWD,BHQT,MBKM,JRRS
-GQHL:ZXKX,NWZJ,VMWB,LSLT
-CSMF:PFNR,DLNX,KCXD,GNPS
-GZHW:KHFN,CTCW,KGGT
-KDLF:QRQS,ZJKF,QNRH,DFTH
-WWTF:FKBC,HVSR,VWVR,HLSF
-HVQD:VXHZ,SLML,QLPB,RLQV
-DVNB:PTGH,JMZB,MWVL,ZTHQ
-NXLV:WSCB,RCJT,ZKXZ,MGTV
-KTBF:HCRF,PFVL,SHMC,XVFS
-JBXB:PXBP,GDNV,MTWT,QWTW
-VLRC:HPKX,LSCM,CSJR,LCSS
-HDRL:WZLD,DRWS,VSXG,CFKK
-TCNG:SDXG,GGPX,JNVF,WFRX
-MTCV:NJKB,VKWM,KMLW,GHLZ
-PFGG:LTHT,VGFX,VHJN,MQMM
-PMCV:VSFF,XGVL,BZTD,SSKT
-TBZR:CXPL,CRFK,NXWS,XQTL
-LQGJ:SLTP,GZPV,JQCH,TQQC
-KGWW:KLCQ,VXBV,HPXB,FCNP
-HFWC:GRXS,TNKM,TLNX,STJG
-SNBV:BPTR,NSBC,GVLS,ZDNK
-MLBR:NWLC,ZKNB,DPDK,KRVW
-ZCFG:MSQP,NZTL,GTNM,KZBW
-WBKQ:KDXL,VNWL,TZXW,SRGP
-TZDQ:JZLB,PQWD,KTLS,VTRC
-VNHS:HNVT,VFSR,PWFQ,GBPZ
-LFCJ:QGVF,KKDN,WCSV,DXFZ
-XDTH:FGMG,XWDR,SBLB,HZTT
-ZSMQ:QCHV,WWGP,FSNM,JVQX
-RXKL:CNFM,GXSL,QCKC,NGJJ
-CXVQ:VLVR,LTPL,WVBB,KMMD
-JJGZ:TPKR,CKLW,TVKK,GPJW
-KHTL:KSGB,ZQCM,ZRKW,FQSW
-WMSX:WFTM,VFNW,HHJF,XWWG
-LTKL:RHKZ,HQQV,DKJC,CZTF
-BVRP:DXMT,TMWN,MGXP,GCJZ
-WFTK:VHXK,ZHXC,KHTN,HNCL
-RBCS:SRFT,NKGG,XDLS,CFTF
-DHRK:SQMJ,RHRK,RKZQ,SXSR
-WDXB:XQGX,GDBZ,TDNS,JPDX
-LVMD:WFFD,QTGV,GXPN,HRHX
-PFLN:GFNZ,NPCX,GRNZ,RLJS
-VTBT:CSJX,VTVN,VPRB,CCXZ
-FBGF:XCFF,PTRN,QZZM,JKMQ
-GWCF:VVSR,CKGB,DXWK,NWFL
-CLJZ:VNKM,LJSC,DXJR,SKXB
-ZTHQ:RFVZ,DDVC,VXWP,GQSZ
-XFKQ:SPRH,DZNQ,QBCB,GRRV
-CPDR:WKNJ,TCKD,XHPV,GFXC
-WNPF:JJXQ,FDZC,SVKZ,QJPB
-CFNT:KXNP,JCCS,SJZQ,GGGM
-FVNX:SRLL,MDHF,CVTN,TQZM
-KXGH:PMTJ,HCHN,JRZZ,XQKX
-WJVK:CQVN,RKKQ,RDQS,GNLM
-PZRT:PFMS,CHWK,HXDF,XZVN
-ZNZR:MLLW,QXNB,QMJG,BCQK
-JDWZ:DSNN,KKQP,QLQB,WMSX
-NDDV:WMVR,JHSM,JVDW,HPKP
-VFKD:GLQL,QSXC,BVJQ,RRKR
-NGFJ:RDZP,ZMFV,DLXS
-KMPX:SNLR,FFZR,ZDJM,JHBS
-TCKD:QTJC,HFSH,MTFL,ZGST
-RHRP:PRXP,ZVMN,TNKQ,DDHB
-JRJG:TXLZ,NSBQ,HJRG,CHXZ
-BCJR:VHMC,CTDM,XHKB,ZMKW
-TZGM:QHJQ,PJHM,VLNC,XKBZ
-KNZN:MNTX,JZWZ,SKRZ,HBFG
-WWHF:NZZM,DLFX,GQZQ,PLWS
-XMXB:LHHX,QZPR,SFHX,DVKR
-DFPD:XVNS,CSFW,BQPQ,JNTM
-ZKJM:SWWD,SWCK,SBSX,MCZG
-JLNM:MCPJ,QTDX,LVLQ,PCXM
-HCKM:TXMQ,HRJT,FCTC,NMPQ
-RLVM:GMHG,KFMT,HSHK,NWFJ
-CWXC:VMMJ,LKFM,JBGH,WDGK
-CZQP:MXPL,ZMPK,LHNH,LLTD
-LGQW:PGVH,WWBR,SFVG,BGWC
-XFWD:HHNF,VJPK,JDZT,JSWV
-SWJD:QHHZ,WQDS,GFLD,KLDP
-HKZQ:NDDL,PRHQ,FPVS,ZZTX
-WHKW:QFHQ,NLSH,CMBR,ZZDB
-STJX:TVVB,HRSW,BPKV,QSSV
-FNJT:XQNP,PVXW,SBTZ,KGLZ
-JHSM:JCLB,PLQK,DQGF
-VDMF:CKKJ,KSQW,VBRG,GRXH
-QRZS:CGZR,TDPD,WFCM,LCHR
-KZXB:ZGGS,WWSR,MHDR,BHQR
-ZJCT:CDJV,NHBT,GKPK,JPMW
-DKZW:GZGB,ZPLT,QZSR,SHZB
-SRNB:SCCR,HQVW,KVSR,MCCX
-GVNK:LJRC,SPTL,SFLX,TNFX
-VLGV:XWBM,FVKJ,BVXL,QQBH
-JKDF:WFFH,KSXT,ZZCD,CLFC
-VBRJ:RPVG,CBVG,QCFN,FHCG
-HDCT:QFSF,JDLD,ZQFD,JPQT
-FWWV:BDDB,XFVT,CZXB,PXMC
-HDST:GCJN,TVMV,JCVK,SXTD
-MCQB:BJCB,ZKSH,LSBH
-HPLH:PKRD,TBKT,PXQN
-PBSB:ZBDG,RQCB,SHJX,VJXH
-LRJB:VVLN,ZTJC,NBNF,MNSN
-NFMZ:RFNL,KJCD,CXQS,PXDK
-XQQM:KZJM,BDFR,CRXR,DMVN
-RRVT:ZTPL,ZKVV,JLNK,LHQB
-BPWZ:XHJH,QDRJ,QKQJ,DGCQ
-LPFZ:GPZV,TGNZ,FHVR,TZCS
-WWHH:ZHNR,CQGL,WCMN,VGGN
-XNPT:VBXC,KHTL,BSFJ,KHSZ
-QVGX:HJLC,FXPW,TPRC,RPXK
-QJNC:BNKW,FSWL,XCTD,ZRRZ
-HGPJ:XMFB,WFCC,MGPH,QNGL
-DWJW:GXBN,HGMZ,HJQJ,LFBK
-XBSD:DSWR,XGFR,LCCT
-MDJH:PJLV,CMSR,RTJP,VCKS
-ZFGC:FSVC,JBRN,NCMB,FVLT
-VZWJ:MBXR,PXMG,BMLB
-RDVR:VHNQ,PGFH,RFPN,THFJ
-SDMW:QZKG,JSCZ,KFZV,WPHS
-CWSZ:DSZL,ZMWT,DNRM,TPNT
-KCRS:QTGH,SLZK,LBHH,MMWN
-LFPX:JZWW,ZDCM,KSPR,QRZB
-CVLZ:GLDD,LQZG,WWPS,ZKNF
-LGXL:CVXG,WFFJ,DZVQ,TMLH
-WNKP:QTFX,FWNK,GNCN,MRNP
-FKVC:GTBS,DJHC,WFCV,DWTZ
-PFPD:HMCG,RTDD,VTHP,GQKF
-PLQK:KGSX,FNLX,BCFH,WZHJ
-QVWF:KJNQ,SGWR,SFXZ,LBXB
-PGVJ:HVHK,GFCR,DMTM,DMQM
-WQKV:PCXB,GMTT,GCKZ,PMCD
-TTTQ:SGMF,FSWJ,VWCQ,NLQM
-MHQP:LJQH,GNVH,FPPL,KCHR
-DXZS:BZNC,SPQT,LMGG,WBVR
-NDJP:BHPX,BXSK,WMSZ,BJWN
-TZFM:FZSQ,LXJH,KBBZ,CBPM
-RZGH:VGSM,CBCG,QBZF,DWKS
-VBMJ:KWTZ,KZXB,TBDJ,VFCX
-RLBZ:QLWT,JPTD,VMCJ,TMLQ
-FRJN:GGDK,MGWW,KFWR,SQLV
-WGWT:JCTK,LLFN,QXMS,VCCP
-QLHG:DZLX,SVSH,LFVK,NQRX
-MCDC:NWHX,NBNV,QNHV,JDCB
-WSFH:HLSR,PTHZ,RLXF,FBPF
-KDRF:SMCL,DKNV,HSKJ,SFLF
-WNQX:DNBX,XFCX,TKWD,KNZN
-TSGF:TQSW,VSVH,WZWR,MQMH
-NNZM:FFPD,XCMB,RWVV,DSBS
-DRGJ:JVRH,RNTX,TNFV,FMNF
-CSRD:TNCV,NFQM,HFFR,FCVT
-CBSL:WFTZ,RGQJ,FMLJ,VHJB
-LNPK:RKHS,TSGG,PDCH,TWZD
-XWRP:THMZ,XCFS,FQTG
-BMFQ:VSPF,RSSQ,PKQB,VJXP
-QNFB:NRSS,DJSW,QJPR,JNXJ
-VSCB:TZVL,PTZW,MSBR,MHBC
-MRNP:NHHK,SFWP,KWDL,SFLQ
-GQMN:MJVM,VCGZ,KCLV,XTKJ
-PLPN:ZFTB,HKQZ,CQKD,NKZP
-SQFJ:VPBT,MKSL,NNNZ,MBLR
-RLJC:DLXH,BJWM,HNXB,FDFK
-BXMH:GDJK,KZXT,JWHZ,BLNS
-ZJCX:WCMZ,MKTX,HSFX,DNLG
-GLMV:VSPX,QZLQ,HHRT,VHBN
-GVGG:XRLB,LFVQ,GWRP,VVFS
-PFDP:FMPC,WNTJ,MPWJ,LNLM
-VXBV:QTWN,ZTKQ,VGBR,STBR
-HDTH:LVTW,ZZQT,XJGV,ZWQZ
-LDVQ:JGFT,CKKD,SPKR,PFDP
-HPDD:DCCT,GNCB,CBFH,ZWLG
-CSTR:ZLRV,PMWC,PBLV,MQKR
-WPBC:XCBB,GDFV,HGVJ,RQVB
-NTGK:CXGP,DRHR,VLTK,KNJG
-GLPL:MHFK,GWFB,WQDP,BGNL
-RSLS:DFNF,ZXTK,HGMG,WNRP
-RQRQ:WFCF,CCCT,GLQS,VWKM
-SDSJ:GZVF,PPMR,DHMM,WGWT
-XVJJ:TJVD,PWFN,CZDP,SPNW
-NDHF:WBSR,HVNG,ZQTF,MLWB
-KXKP:CJGW,WFWD,LLKK,SWCB
-FRPK:FCDQ,VZDK,SPPR,TLMK
-HVXF:VFBZ,LNKC,WFWK,CHNL
-LDRG:LGHV,NPGN,LDJK,HLBD
-FSWL:PPDB,PGPX,JLCR,CPCM
-XSRL:QQXJ,CKWG,TBNF
-WMXV:BLWS,FPGM,TBLJ,HQGT
-PNVH:HXSZ,SQVP,JCFZ,LNGK
-JLWZ:VZRR,MWBR,SZQK,NPPR
-WLZZ:BVJC,NMXS,NZPM,BRVT
-SVCJ:LBZC,QMCT,DZPB,HVRB
-LGSS:DHMZ,ZVFN,RSPM,CDGL
-KHNM:ZHFV,SKBR,CBWD,XJRH
-QZTX:XLHJ,RJGS,RXNB,MDBW
-TPTD:NGPQ,HLJT,TLBM,RDCJ
-XTVG:CZBJ,RQZN,QPGP,QFLR
-SZFX:MSJQ,TCKP,GPCB
-WXMJ:WRZB,BNQK,NFLL,PXKP
-RMRD:KVFP,DCDX,LBTB,WHGF
-MWBR:CBJG,WFTV,GZGW,FHSB
-VSNP:TQDT,PWHL,JKBP,SPQZ
-PXKP:ZFJZ,WQGK,DWBD,XQGW
-RKKQ:DTCD,MZMS,GQTR,SZGB
-SDKP:VWTN,XJCK,WKHS,WKDF
-LNHP:RLLN,KZQJ,WXJN,DPCH
-KKBL:MSQV,PPGG,ZXFJ,SWCN
-ZZQX:RDSC,FBCV,DPXD,CHCD
-CKBQ:XZTX,JPTM,PLRG,VJFZ
-PHJN:RZXK,GXVQ,CVNB,NPPP
-BDLT:BMGX,SZLQ,KVPR,QVMV
-LMKK:FNXP,TDMH,KZLD,KNQD
-QWSX:ZBHV,JGQR,SMLQ,HHBK
-SHXF:RWZH,KPHW,DVHN,TLCJ
-FHCT:ZMHR,BVRN,KLPT,KJQM
-QQTX:MRQK,LWKQ,KJGD,MMNQ
-DCNG:VDZJ,WCXT,VNKG,XGFZ
-DNVR:KVGB,FBGF,WDQM,ZNQK
-QRZR:JVXD,LRNG,HLZH,HVLW
-TFJZ:RFFL,QSNJ,XFTF,FDRX
-PNHL:WBCM,BFGG,BVMC,VTDZ
-PPNC:FMFF,BWXL,BGLD,KVQM
-QWTH:KRTJ,DVSM,QVFD,KQJQ
-TWFB:HXST,RVLQ,JZTC,XPZD
-JTNP:SXCF,TKBZ,MMRK,ZHWQ
-QTGP:BPVN,DLFF,NDPM,TCDH
-RCRN:DBPT,JCBT,DNNH,SRQF
-RHFR:DTJB,KGZQ,JCPC,SHRB
-JQNN:SWSG,NMLM,XZWV,ZCHT
-BGPZ:QNMC,ZCMV,QFWL,CBHF
-JQCS:PBBV,FSZZ,TTJL,XSNH
-NNLC:KRRT,GTGB,HFWV,RHMT
-CSLB:WRPL,RLZT,QXTG,QBCX
-RZJK:VQVX,CBVK,CRGC,MRNV
-BBSD:PLHC,HJTL,FXPJ,RWJC
-RQXG:LHNT,WLZF,XLPC,HHQT
-SPMN:BFDB,DJJK,WMSB
-PDGB:RFWN,JDHJ,QWGD,VZKG
-NGWD:JXTK,HWQL,XNFG,CPNF
-WSNP:FQQF,PVWC,BZCM,TQRQ
-PRFM:GTNP,DSRB,XFJL,WMXP
-KPPG:XNDR,RWFH,KJRN,ZNMX
-JVPJ:VPTF,MLRM,WLWF,QKNT
-PFCH:QDGQ,WPFP,DFRC,NBZM
-ZNHF:LPKS,GQMN,MNZW,SBXS
-QLMF:RLVG,KZQX,LGQM,JGVZ
-GGGF:HCTC,XBZZ,FCZT,GWQG
-RVKW:TXPP,CXJH,TRTC,CQDC
-RGLD:GFHM,PNJM,NSVZ,JGNR
-KGFQ:FRSJ,DZKT,BFCR,CNLX
-CZBC:SSXV,WPQF,ZSPW,HMDW
-VMJN:HDVV,VSCV,WQJG,CPFJ
-MPJV:KWDQ,RJBB,KBJC,DRWN
-NXSB:NNHN,GJMJ,QZVT,FSPF
-KLSR:RGVC,BNRN,GHMH
-PKVX:WPQV,MBHP,WGDG,CZBX
-KBKS:ZRHW,QLLM,WXRQ,PPNC
-DXPM:CSSP,RKVF,MNGN,HCRX
-ZPTC:QNFX,CNPK,XDSH,RQRQ
-WLQL:SSBK,WWXL,CTHJ,NWXZ
-BGPC:BZCH,XBNS,GVTD,KJKT
-WFHT:CSQZ,MFPM,BHTL,XWNN
-KNVZ:WHVM,NLQL,MFHZ,VCKV
-MLFT:XLZZ,GHRN,LHCL,SGMZ
-RTDH:GMDD,FZQZ,GDHH,CFKQ
-VNWS:@
-FQRZ:VMPD,BTHK,KNHV,HSKX
-HVBC:LKGT,GVZT,GBBB,GHDQ
-LDHJ:KDFG,HNMQ,RGKX,ZZMJ
-FBSR:RTNK,NRDP,QMLQ,KNMG
-CWGR:GCZZ,MGNF,WZJT,PJKD
-RMJJ:VFPZ,XWBQ,PCPZ,SVCH
-HJPW:XMLC,SSPZ,LQCT,DSJL
-CWPS:CFLN,WZZC,CBBX,CXFD
-NTFT:MTBZ,BFXS,KWRW,LJNQ
-FQDB:WVSL,FVCM,QZBG,PHBQ
-VNFK:WQVB,THKK,DRDP,VSHZ
-FVGZ:XDLR,LTCD,SKMH,XKWN
-CKKD:SGDT,RZNP,CXBH,RJFV
-JXGV:LMNV,PVXD,BHWD,BGGF
-FVFC:VCJS,LQWX,TNBH,WLLZ
-SKJC:XWWS,TTFF,MWCC,WQQS
-DCZT:JPTP,WMRH,WDRH,RKJG
-XGGP:MJZG,MXZN,CXDH,XLTW
-ZNQK:FVKW,CXLP,GNHQ,LTJZ
-JBZP:XCZC,BBRM,GPWJ,XDGD
-ZVMK:MLMT,BDLT,FDVH,HWVF
-XWPC:HDBW,PPHW,WCNN,TXHC
-BBHL:WZRJ,SVNS,SLJJ,HFGH
-NLQM:KZGV,FTHQ,TZZM,GBVJ
-XDRJ:MRWN,BDGB,HBBJ
-MJXT:NDVT,XGWZ,ZBHW,NJZD
-LNBL:BLNJ,BWQM,XCVS,SFGS
-SVDG:KLQQ,RGLK,JSHP,ZQJJ
-WKHL:KMDC,GWKW,SNHT,LGSK
-MVSB:QPWX,GKNR,HGSV,THSZ
-FPLM:HRRZ,WFQX,DXQS,CZDK
-VNQZ:HCNJ,RFCK,QRNX,JLWW
-QQZL:MHVK,HQLK,GNXD,DSLP
-GXVK:MNWX,ZWFD,QMFF,GSCF
-KKBS:RLDJ,CCPT,QRCW,TQLC
-HXPQ:TMGN,HCFV,LXZV,MBRF
-GKVM:JXLJ,RMRD,HQGZ,QRZS
-MFGP:KVXH,XRMQ,FQSG,HTZJ
-PPCB:RHHS,MBXK,VVDX,NWSB
-CHWK:FBXZ,BGXP,SCPX,TTDZ
-NCDR:LQDT,MTPN,HSJR,RKBD
-NLMB:PNJK,WLFT,KQWB,GDPP
-VHNF:DMXC,LTMV,MDDQ,VXFR
-BGSQ:RMFL,VGJK,RNMT,QBCJ
-RRMN:TDTX,CSCF,MTMB,NBBR
-QTVQ:PHHF,WTBH,PWBK,DWZL
-DLFW:RPFR,QRQV,CGFK,BGDT
-PCRB:TDQS,VRST,FSST
-VKCC:LDQM,PWQQ,QHLC,HRRK
-RLTP:HPLJ,JXTH,WGSQ,MWQK
-TRGZ:BPPV,QHVN,JSLC,BJHZ
-DPPB:TDBH,CVGX,HPCQ,VCXC
-XHDZ:PRJN,PHTN,XLMQ,WKFF
-VZKG:ZGQC,ZCMN,QSDG,LCXQ
-ZLFQ:ZJDT,HXRD,LNXV,NFTH
-GCNQ:SCQS,RMLS,PWNK,HTPT
-TZKS:HJVH,NPSQ,PSXJ,CQQB
-BGQQ:CGVT,HJTW,DGZZ,PQVX
-SKVM:DWNJ,VGHK,CQHH
-MQFF:ZKDM,CMRQ,RGCN,ZNVS
-FTQJ:PZBV,DRLP,HJPF,TLRS
-RSSQ:CZKX,CDCW,VDFB,CSSX
-GZWP:FRMP,CDTS,VCSB,FVNX
-BRWH:ZVMJ,XJXJ,JBNF,CXQV
-BBPJ:DBRG,KQWZ,VTWB,RZRQ
-THDC:VMSM,WCMS,ZSXR,ZNZR
-JZCT:ZBKQ,TLBN,BFQG,RDXN
-FZFW:LZRN,XTQL,JHVT,PKHT
-ZFNW:VKDZ,XBSS,SKNB,WPNV
-ZVKW:DNGN,WTLH,BGZS,ZDWV
-NPWF:TDPS,QXDL,TQGM,MMXG
-HJFD:BTJJ,TGXZ,CQMX,CZFV
-TBKT:DZXP,XBGZ,WCQT,FWLM
-ZSWQ:TLHS,ZZGD,TCCL,KQRN
-JRMM:RVPF,QDZD,HJPB,XNZJ
-ZVSJ:VZPC,BPPD,DHWT,TWWB
-XGCW:BDFS,MDXW,HQTG,LTRK
-PXFS:DPPZ,HSQD,JCVB,SBDR
-RMQS:CWZF,TRKB,JNCW,DJPS
-VGKZ:SXNF,VBNT,WLBG,WGNQ
-KPNC:JTBX,GKSW,TNFC,PSCT
-CKZL:WHNM,ZXTG,QPLW,HBDX
-NGVR:DFSD,FRMH,VMGV,DGLZ
-RXSL:KPTK,JWPQ,HHHJ,QFSX
-FVTF:HXGT,PZXV,TGKQ,HZGP
-KKGS:DZZQ,PWMW,PRPC,FRPS
-GVDF:CLJS,XGCW,VGWG,DCZT
-FQWJ:DWTW,TGCG,JRXJ,CSWH,@
-MGSC:QZBQ,BJDN,LMRF
-FCNP:ZWBK,MKQW,FTNS,GTCQ
-MKTX:NFWR,XBMJ,PTJW,GGGF
-DRTW:DGZR,DQSF,BHKL,ZMVW
-ZQWG:QKKG,HMRR,HQML,LDDG
-PXFR:BSFZ,HPXH,DTWS,ZGBZ
-VRZT:NNZM,FHFX,SDZW
-WWBR:ZRDB,WNPB,SLRX,ZJRK
-DRZV:RKVZ,WPCB,LLXR,RWBK
-ZTWC:JXPN,GWJP,LJHD,SMZB
-DGXP:SLGQ,PGDQ,DPGL,BWXJ
-SWJF:WWXM,WWTF,VSBV,XDTH
-XZQJ:ZBVX,FCWR,VMLJ,TXNQ
-ZJQS:MMWR,VJTQ,CVCQ,ZVFS
-CCXZ:WQLH,WVDP,BRSL,ZJHB
-CKTS:QXFN,BZKJ,RWXQ,KFGN
-ZDDW:RNGL,VVNN,SXZD,MCSH
-WWZR:LVMP,JWTZ,JJNG,QTGP
-RDHT:XMDX,ZLLR,LRKS,PMQB
-TCWC:VDKR,SPNF,WXPS,DQGL
-ZMFV:TCSX,NGPJ,TMTN,NPZH
-SDCF:ZFFN,KMKR,BZFK,LHBN
-DRGX:NGFF,FDMJ,RWGN,DJNQ
-DPCH:FPWC,FSGR,RSDC,PKWN
-GWKW:RBBT,KLPN,GNFC,JQWC
-JZSV:FRXR,GDRQ,KZPP,QHQD
-MLML:FGSM,WBHJ,DSRX,XSXS
-NLLR:VMWQ,VKHT,LVCR,JKDF
-FXWD:MFMS,KSFX,NCBQ,CSHH
-CSHH:FZSG,KDCC,LFWS,FKVC
-DTPX:ZDQZ,CQVD,VRCG,VCGW
-KJPF:BDHH,DWVT,VCJR,WTXS
-ZRXK:QNGJ,MRBC,GGDN,LWPX
-ZXKP:TNBF,MFFM,KFZF,VNPP
-ZJKH:BPNQ,NNCB,LQCV,CSSM
-BPQR:KMDJ,LWVM,MTPS,PWGF
-PWHL:QPDV,VGWN,BNRX,XPNT
-MBDL:MGZV,DZFS,MHRK
-NBPF:RJBS,RVBK,HVWB
-XHQR:MDVL,CKQF,TDGC
-KNTH:DLDG,VHBL,WHRG,KWQF
-BZMD:RQZC,BZJT,WPMK,HHRH
-DHWJ:CTRZ,DCHN,WGDZ,KLZN
-QDPC:LNBR,DGDF,BDRG,WLZZ
-SSCN:LFZC,RGLD,XLXS,LFHH
-JCBD:DJQF,LFHV,SLNB,SXRD
-XHHS:PTWH,FDTD,XKGJ
-LCDD:WGBB,WDFB,LJXM,XPLJ
-DDND:JRPP,XZCC,GSGH,WSFH
-JJBP:TVKN,HMQH,KBPS,DZWW
-QMVX:WQKB,WJLW,VJDT,MDDG
-HGTB:RVKH,RKCW,RBNH,FTQJ
-SJSN:RZQH,QBRC,MDHP,LFLX
-BJCB:BPSR,FGVG,QSND,FPRM
-NNXN:KDNM,GDCK,JWCV,HMFJ
-XJRH:BGNH,KSWN,PZHF,BSRD
-QRQV:SVDJ,WLHL,PKLR,LSBN
-SQCC:QVPM,FLRM,PPCF,WLQL
-DGWN:XRKK,JBLZ,NVPG,ZFZL
-LQLQ:SDBV,TSQN,BKGL,NTVS
-FFJQ:GFGX,NGLJ,NGDL,DHCF
-TGXC:CZRL,CGBJ,KCNQ,JQRX
-HSFS:SVJH,NTFT,JXZR,BNGN
-PDPW:VXBZ,ZFVX,NNQL,DVDC
-GSRF:THHP,GCKJ,LRKR,XRTL
-RCBF:PWQR,XGMG,MQHD,HWPH
-HWLP:NXCB,PVFZ,WFQK,VVCH
-HZZN:JVXN,HWLP,HMQT,JQCS
-ZDDC:SHXS,SDTR,VRXQ,SFHB
-NFQM:FNSW,SFWX,CBRL,FSDJ
-VWMK:CMQW,BWRD,HDLM,TBVP
-BLJH:DDHG,VNFK,BVGG,QLXD
-MFVQ:XRBK,WLVP,MLDX,JJBP
-RGSW:TGXC,TDRL,BRFF
-BDHJ:LMDV,BCWZ,DRZW,QSDB
-VGVG:CNWC,GKCM,MGRJ,QJHP
-NPPR:PDKN,PGCK,LTLR,JVKP
-XGBN:XJQH,BXBB,MXCF,QPXH
-BMXB:DJZC,NVSM,BBSR,HHTQ
-PSNT:DJJV,DNDK,PWZH,CWXC
-SQJX:LLSZ,VQQN,TDKC,JQNN
-SMFJ:SXQV,PFDX,TPSC,LFKX
-FCKL:LBKQ,CNDF,RJRP,PSTB
-VQQB:KXWJ,CBWX,WLJV,GXLV
-HFTT:FHSF,ZLLJ,VKGL,MKHQ
-FDPK:SGRK,JJRP,NGLK
-WNBJ:SCRL,VQCJ,CMFW,KRVD
-SDJX:WGKV,JTDH,WXSD,HXBC
-LWSP:DCPX,QPGD,PSRF,HZFT
-HQLK:WNGT,HDST,HVHT,MMGD
-PXDV:MPTK,JZQR,WMRN,WKLG
-KDKH:PXRG,ZBWM,GNRG,GXLQ
-RRKH:XJBJ,CQGS,DDSN,LLQC
-TCTT:CBFQ,NFXT,MHFG,PTTN
-TSJN:NSXH,KCCL,XGXB,WVZF
-LJXK:CPPM,SRXP,KJJD,SBSQ
-VFVJ:QGXC,VCTM,MNQT,GZQH
-RTQB:TGJR,FXWD,KRSP,JWLM
-VNTZ:MZFD,BXZB,NPHC,VKGM
-LTSL:QTKQ,HTPX,KVHJ,RXSL
-DHLM:WRTB,DDJK,RPJB,GHDR
-CFKF:GFXS,ZVHH,VGTX,WWHH
-HWQQ:CQDH,LXJV,JDDW,HKFT
-GPDR:XWKZ,KJPF,MZXB,PQZC
-RPJN:CQTG,MJXT,KCFL,NVJX
-DBCM:XCWC,TJCX,QQLG
-DSLP:FXTT,GHLT,BFML,GLZB
-LKPK:WWJS,HVSH,GJWL,BGBH
-KNMF:GCRN,ZZVS,TWRF,LSJJ
-KXNQ:KHNB,MNDJ,GLTN
-SGGR:ZVHP,ZWQS,RGWF,MFVQ
-KBJD:SKVM,MRMR,JNDF,PHCL
-NPVN:PFXZ,KTTD,PSRT,FFTK
-GSCF:ZLDS,MSWN,WFRL,LSFT
-XFKG:ZQFB,SMVT,NSDH,GMTN
-SVMG:VVHT,KKQL,MBQV,PGMT
-TSFN:TFMS,RLDT,RKJF,JLRZ
-VSFG:FCJQ,MPDR,HCWF,ZZJN
-CHCG:LPGB,ZFNW,LDHK
-SNMX:CLXT,NWDQ,FPMD,ZXJS
-RZRQ:TBVF,MLXD,CWJV,JZZH
-XVDZ:VKPB,PSDX,NKBZ,KLCG
-VQQN:MSJG,JQGP,JVHN,CQHC
-RVMH:WLBN,FNRB,BTWD,KZCC
-NGFL:SNPM,XFKQ,TFGV,MDJD
-CSWH:VPJC,TKVS,HNBB
-FHQG:JLDB,RSBC,LBPT,FGWW
-RMZR:HPPV,LHPL,XMDS,TXGL
-BZKJ:VZZZ,MVJW,BXFH,GZMR
-PWNT:HDZJ,ZLKD,BCHF,JNQP
-KZJP:WLGW,QRWV,KHXN
-LHQW:TBRS,ZCRJ,TFMB,JLGS
-RVRW:XSPW,WMPK,THVL,VQWJ
-MDBW:ZKKX,SWGF,KHQV,KJXQ
-KMSM:XLMS,NCDR,MWJN,PFPD
-RQNJ:LSCB,SJQS,TXBB,SBPV
-BJJT:SMPD,FMTR,XMPZ,CKCZ
-LLML:MXDM,GJJS,SZDH,HLLC
-GNQL:LVXR,TLFP,HFZR,CWGV
-CMZP:NXKJ,GFHT,PSKQ,GQTC
-NFVH:VTZP,MPWP,MFTB
-CVML:WTDJ,DRGC,QJHB,JVDS
-WRHL:TMFZ,WMBQ,JSGT,FJKT
-KWKL:TZVM,MTRR,CWNL,TRCL
-ZNGP:JWHW,NKRL,QZCD,ZTWC
-XMZK:FGCJ,GKDF,KZKN,PHXH
-XQDT:MGWS,KPGS,FBHJ,TMRD
-SPQT:NKBF,TXKJ,GMJQ,TDZK
-NJRX:DVQD,MNGD,XHQF,LHGK
-HBCM:XWXQ,GJWQ,DCLB,RCFJ
-VDZM:DKBM,PFHC,SZFC,JFVG
-FNXL:GGTC,PVFF,XWNH,KWCR"""
-
-# QUEST 7
-
-q7_example = """A:+,-,=,=
-B:+,=,-,+
-C:=,-,+,+
-D:=,=,=,+"""
-
-q7_input1 = """D:+,+,+,=,+,-,=,-,-,=
-E:-,-,+,-,=,+,+,=,+,=
-C:=,+,-,=,-,+,=,-,+,+
-A:+,=,+,-,=,+,=,-,-,+
-K:+,-,=,-,+,=,-,=,+,+
-B:-,=,+,+,+,-,+,=,-,=
-J:=,=,-,+,+,+,+,-,=,-
-F:+,+,-,=,-,+,+,=,=,-
-G:-,+,+,=,=,=,-,-,+,+"""
-
-q7_input2 = """E:=,+,+,+,+,-,+,+,+,-,-,=,-,=,-,-,=,=,+,+,-,+,=,+,=,+,-,+,-,+,+,=,-,=,=,+,+,+,+,+
-I:+,-,+,+,=,+,-,-,=,=,-,=,+,=,=,+,-,-,-,-,+,+,+,+,-,+,=,+,+,+,=,+,=,=,+,+,+,+,-,+
-J:=,=,-,+,+,-,-,-,+,+,+,+,=,+,+,+,-,=,-,=,+,+,=,+,=,+,+,-,+,=,+,-,-,=,=,+,+,-,+,+
-A:=,+,-,-,+,+,-,=,+,=,-,-,+,-,+,+,=,=,+,+,+,-,=,=,-,+,+,+,+,-,=,+,+,+,=,+,+,-,=,+
-F:+,+,=,-,=,+,+,=,=,-,-,=,+,+,+,+,=,-,+,-,+,+,=,-,+,-,=,-,+,+,=,+,+,=,-,+,+,+,-,+
-D:-,+,-,-,+,+,-,+,-,=,+,-,+,=,-,+,+,+,+,=,=,+,+,=,=,+,+,+,-,-,+,=,+,=,=,=,+,+,+,-
-C:=,-,-,+,=,-,+,=,-,+,+,-,+,+,-,=,=,+,-,+,-,+,=,-,=,+,=,+,+,+,+,+,+,+,-,=,=,+,+,+
-H:+,+,+,+,-,+,=,-,=,+,-,=,+,+,-,-,+,+,+,+,=,+,+,=,-,=,+,+,-,+,=,=,-,+,-,+,+,=,=,-
-G:+,+,+,=,+,-,=,+,+,-,=,+,+,=,-,-,=,+,+,=,-,+,-,=,+,+,-,+,+,+,-,+,=,+,=,+,+,=,-,-"""
-
-q7_input3 = "A:+,-,=,=,+,+,+,-,=,+,-"
-
-q7_track_example = """S+===
--   +
-=+=-+"""
-
-q7_track2 = """S-=++=-==++=++=-=+=-=+=+=--=-=++=-==++=-+=-=+=-=+=+=++=-+==++=++=-=-=--
--                                                                     -
-=                                                                     =
-+                                                                     +
-=                                                                     +
-+                                                                     =
-=                                                                     =
--                                                                     -
---==++++==+=+++-=+=-=+=-+-=+-=+-=+=-=+=--=+++=++=+++==++==--=+=++==+++-"""
-
-q7_track3 = """S+= +=-== +=++=     =+=+=--=    =-= ++=     +=-  =+=++=-+==+ =++=-=-=--
-- + +   + =   =     =      =   == = - -     - =  =         =-=        -
-= + + +-- =-= ==-==-= --++ +  == == = +     - =  =    ==++=    =++=-=++
-+ + + =     +         =  + + == == ++ =     = =  ==   =   = =++=
-= = + + +== +==     =++ == =+=  =  +  +==-=++ =   =++ --= + =
-+ ==- = + =   = =+= =   =       ++--          +     =   = = =--= ==++==
-=     ==- ==+-- = = = ++= +=--      ==+ ==--= +--+=-= ==- ==   =+=    =
--               = = = =   +  +  ==+ = = +   =        ++    =          -
--               = + + =   +  -  = + = = +   =        +     =          -
---==++++==+=+++-= =-= =-+-=  =+-= =-= =--   +=++=+++==     -=+=++==+++-"""
-
-# QUEST 12
-
-q12_input1 = """.................................
-.C.................T..T.T....T.T.
-.B.................T..T.T....T.T.
-.A.................T..T.T....T.T.
-================================="""
-
-q12_input2 = """...................................................................................................
-...............................................................................TT..TT..TTT..TT..TT.
-...............................................................................TT..TT..TTT..TT..TT.
-..............................................................................TTTTTTTTTTTTTTTTTTTTT
-...............................................................................TTTTTTTTTTTTTTTTHTT.
-...............................................................................TTTTTTTTT.TTTTTTTTT.
-...............................................................................TT.TTTTT...TTTTTHTT.
-...............................................................................TT.TTTTT...TTTTTTTT.
-..............................................................................TTTTTTTTTTTTTTTTTTTTT
-...............................................................................TTHT.HTTHT..T....TT.
-...............................................................................TT..THHHHT.H..HTTTT.
-...............................................................................TTTHH.TTHHH.T.T.HTT.
-...............................................................................TTHHH.T.THTTT..T.TT.
-...............................................................................TTHH.H..H.HHHTHH.TT.
-...............................................................................TTHHH.HHH.TT.T...TT.
-...............................................................................TTHTHTH.H.THHHHT.TT.
-..............................................................................TTTTTTTTTTTTTTTTTTTTT
-.C.............................................................................TT.TTTTT...TTTTT.TT.
-.B.............................................................................TT.TTTT.....TTTTHTT.
-.A.............................................................................TTTTTTT.....TTTTHTT.
-==================================================================================================="""
-
-q12_input3 = (
-    input3
-) = """3844 2688
-3606 2844
-3934 2595
-3991 3069
-3979 2530
-3509 3349
-3745 3468
-3539 3243
-3889 3447
-3891 3322
-3654 2505
-3782 3082
-3671 2803
-3858 2975
-3881 3458
-3989 2970
-3713 3062
-3993 2704
-3538 2542
-3649 2869
-10 10
-3897 3256
-3848 2800
-3609 2769
-3757 3316
-3517 3392
-3941 3164
-3790 3241
-3746 2797
-3823 3366
-3620 3122
-3526 3035
-3686 2761
-3647 2977
-3959 2605
-3581 2917
-3812 2909
-3920 3223
-3688 3304
-3533 2839
-4000 2618
-3879 2593
-3857 2767
-3875 3333
-3870 2666
-3764 3314
-3506 3298
-3691 3166
-3530 3239
-3665 3156
-3819 2780
-3869 2930
-3789 2740
-3550 3277
-3546 2793
-3619 3351
-3768 2564
-3831 3251
-3914 2936
-3595 3445
-3643 3151
-3902 2547
-3822 3498
-3867 2508
-3528 3064
-3690 3300
-3842 2806
-3933 2718
-3836 3197
-3931 3311
-3511 3015
-3932 3398
-3820 2905
-3878 2764
-3809 2744
-3547 3127
-3766 3258
-3593 3455
-3601 2852
-3637 2895
-7198 3600
-3930 2640
-3814 3095
-3696 3221
-3699 3437
-3661 2503
-3535 3077
-3871 2748
-3815 3218
-3970 3028
-3927 3457
-3846 2614
-3813 3110
-3592 2941
-3644 2762
-3555 3080
-3860 3141
-3893 2945
-3854 3198
-3960 2787
-3634 3107
-3863 3129
-3825 3335
-3734 2881
-3515 3157
-3658 2861
-3668 2860
-3900 2647
-3646 2792
-3656 3387
-3629 2978
-3750 2953
-3992 3038
-3965 3030
-3788 3348
-3700 3701
-3732 2590
-3677 2831
-3967 2511
-3915 2687
-3802 3388
-3718 2856
-3571 2907
-3739 2904
-3594 3434
-3673 2602
-3502 2876
-3981 2935
-3748 3005
-3733 3334
-3707 3448
-3518 3467
-3943 3153
-3969 3130
-3653 2984
-3559 2781
-3797 2855
-3948 3428
-3521 3310
-3628 2678
-3884 3175
-3610 3083
-3557 3046
-3938 2931
-3935 2982
-3894 2776
-3896 2758
-3648 3390
-3962 3034
-3806 3160
-3895 2561
-3883 3415
-3700 3700
-3832 2567
-3921 2959
-3558 3368
-3603 3432
-3940 3068
-3730 3125
-3787 3463
-3720 2804
-3584 2732
-3771 3215
-3569 2689
-3818 2681
-3975 2558
-3801 2683
-3639 2734
-3741 2657
-3586 3440
-3874 3173
-3652 2712
-3552 2523
-3988 3269
-3866 3148
-3693 3376
-3698 3373
-3607 3056
-3758 2725
-3954 3099
-3618 3000
-3961 3479
-3978 3089
-3682 3154
-3662 2886
-3795 2883
-3798 2644
-3597 3058
-3599 3441
-3567 2716
-3847 2840
-3926 3169
-3735 3078
-3598 3250
-3946 3092
-3765 3470
-3510 2609
-3525 2923
-3576 3191
-3664 3168
-3709 3350
-3827 2620
-3556 3324
-3589 2873
-3585 3411
-3862 3326
-3600 2639
-3630 2638
-3505 2604
-3807 3183
-3776 2958
-3973 3231
-3791 2724
-3853 3233
-3524 2709
-3830 2520
-3504 3485
-3580 2539
-3545 2566
-3845 2533
-3980 3178
-3700 3443
-3570 3391
-3964 3325
-3775 3190
-3828 3061
-3516 2711
-3544 3385
-3794 2962
-3632 3438
-3604 3119
-3987 2723
-3724 2757
-3784 2979
-3901 2827
-3684 2673
-3995 3466
-3626 2628
-3625 3051
-3667 2513
-3833 3278
-3837 2706
-3977 3066
-3683 3040
-3909 3260
-3916 2755
-3957 3091
-3773 2607
-3811 3149
-3849 2754
-3761 2750
-3541 3023
-3753 3402
-3873 3306
-3527 3381
-3919 3417
-3549 2838
-3752 3189
-3939 3338
-3885 2880
-3694 2835
-3796 3354
-3756 3454
-3947 2892
-3913 3406
-3841 2815
-3706 2719
-3872 2619
-3983 3317
-3749 2634
-3976 2576
-3760 3207
-3738 3462
-3994 2550
-3840 2572
-3591 3109
-3785 2668
-3800 3275
-3624 2817
-3501 3185
-3955 3497
-3774 3483
-3781 3492
-3611 2864
-3808 3276
-3723 3270
-3675 3217
-3660 3102
-3780 3227
-3666 2893
-3851 2910
-3655 3456
-3672 2915
-3575 3364
-3623 2955
-3714 3081
-3924 2993
-3551 2532
-3712 3008
-3622 2818
-3716 2611
-3542 2768
-3944 2648
-3917 3205
-3561 3442
-3554 3124
-3952 2599
-3826 3037
-3990 2650
-3621 2837
-3577 2875
-3904 2925
-3772 2707
-3633 3377
-3799 3242
-3564 3112
-3565 3248
-3835 3426
-3852 2726
-3676 3084
-3817 3114
-3663 2557
-3956 2968
-3534 2642
-3568 3336
-3922 3379
-3583 3144
-3635 3253
-3923 3134
-3890 2760
-3876 2518
-3805 2722
-3708 3113
-3824 2705
-3864 3353
-3692 2865
-3951 3022
-3936 3281
-3717 2922
-3678 2698
-3728 3224
-3759 2884
-3877 2536
-3786 3073
-3548 2655
-3839 3048
-3685 2680
-3563 3009
-3715 2957
-3631 3116
-3651 3201
-3816 2862
-3803 3427
-3608 2990
-3958 3025
-3689 3055
-3762 3424
-3778 2961
-3562 2626
-3792 3186
-3974 3047
-3512 3362
-3743 2694
-3531 2515
-3615 2791
-3572 3232
-3838 3007
-3669 2600
-3536 2773
-3859 2507
-3529 3477
-3687 3171
-3617 3399
-3998 2509
-3925 3403
-3596 3264
-3908 3145
-3911 3444
-3710 3245
-3892 2543
-3519 3152
-3985 3017
-3747 3473
-3726 2756
-3737 2954
-3722 3098
-3537 3274
-3976 1989
-7202 3602
-3727 3408
-3513 2878
-3942 2867
-3731 3052
-3573 2686
-3582 2556
-3821 3318
-3740 3237
-3903 2735
-3725 3345
-3736 3490
-3520 3174
-3888 2911
-3742 2950
-3810 3313
-3886 2541
-3783 3361
-3907 2774
-3627 2585
-3659 2736
-3560 3211
-3605 2545
-3695 3332
-3522 2662
-3566 3460
-3719 3308
-3950 3216
-3905 3395
-3963 3161
-3972 2661
-3928 3060
-3769 2956
-3918 2646
-3912 2819
-3856 3365
-3937 2825
-3754 2833
-3986 2568
-3578 3495
-3614 3079
-3906 3372
-3705 3480
-3616 2699
-3574 3414
-3588 3155
-3674 3323
-3645 3027
-3657 3378
-3777 3357
-3670 2788
-3507 3254
-3680 3436
-3829 3452
-3703 3261
-3553 2637
-3590 3487
-3640 3093
-3700 3702
-3804 2701
-3865 3405
-3982 3301
-3602 2896
-3697 2898
-3751 2810
-3636 2763
-7200 3601
-3770 2814
-3887 2703
-3711 2617
-3929 2594
-3850 3200
-3704 3042
-3523 3044
-3949 2675
-3702 2998
-3984 2939
-3763 3076
-3579 2623
-3679 2697
-3638 2759
-3861 2544
-3767 3229
-3999 2987
-3681 3302
-3855 2598
-3540 2853
-3612 2851
-3882 2924
-3613 3297
-3514 2778
-3650 3204
-3503 2932
-3953 3128
-3880 3147
-3779 2829
-3744 2879
-3834 2583
-3843 3386
-3641 2521
-3508 2562
-3543 2872
-3910 2528
-3868 2963
-3968 2526
-3587 2752
-3945 3138
-3996 3393
-3793 3266
-3898 2992
-3701 2889
-3721 3246
-3532 2739
-3642 2849"""
-
-# QUEST 13
-
-q13_input1 = """#S##  ##########  ##########
-#79#  #22264856#  #95544798#
-#99#  #40187447#  #72956714#
-#35#  #34####39#  #28####51#
-#74#  #27#  #67#  #47#  #03#
-#18####00#  #65####68#  #50#
-#98841662#  #03013609#  #29#
-#71806853#  #57712786#  #98E
-##########  ##########  ####"""
-
-q13_input2 = """#S#################################################################################################################################
-#81697#41190641566264767#493136193#7046568548168#68253733833378007341912765933#542346646#746#9#70302#29863#45889311600#059078398#0#
-#0##12#1#3#65###8259#98#95#2#2###98########4###5##2##9###############4#######02##5#####2#0#5#5#6#2#5###2#1#####2#9#8#8#1#2#7###1#8#
-#23948360821#2#21570#49688#116#7#85222586479#5#985#684258500#735668269#468#1325889#045#574#4#932#5#55321#5#09701#2768050#9#9#908#6#
-#05##46#034339#1##7##6##8803##66############06###7#3#######1#9#####9####81#56######4#2####544##4#56######0#33#2####28##9#6#588###5#
-#57198#332#70486#8#88954#662#75977#223630631185305#18293842974575601797747#1729984#355#65463534048#26180#3#997403298#17614#5#5#896#
-###9##2130#4#####6#7##2##0##36###5#3###0#######1###9#0#3####6##1###3#8#3###5#7#8#8#2#2###1#2###0#1#4#176#7#47####3#9#8#3###455###8#
-#4430686#9#0#2200984#92824650233#18564#2#4283624#84404061028#725#8242823356390#5#37839246968#26204#6#9#5#4#94942#9270904#706335507#
-#9#6#9##06#9#####5###4##4#6##0#204#0#8#141#61#8##9#0#7##2##399###3#####472#0#167##6########12###5##3#4###30##83#41###1###8###6#6###
-#8#2#51066#81865#58429#140201537#9#487#594#02494#8#815#2#860#213#92732#7828947#3047350#623#461#662#1#9#740764631#3#0074368#435#951#
-#1###5#7#######2#857###6#9##8####2#2377###39#4###2#1###9146####80#32#6#5#927#####452###5#3###517###4#4#8###4###21365#####9#1#####3#
-#8#945#0249694#8#02568#743591248#2#1#22574#23733#8#9953790#994213665#4286508#414#72193#1685882#18334#4#47995#5838986#680630098#350#
-#6#2#####5###893#####1#1##910####44773###1#686#7#1#2##15#485#####0#2###9#58##9#4#####4#9######74#4###6#######1#6#7#####5124##733#3#
-#65246#555#5#9#6556785#399#6786098#531833029#0#40240#7#3#2#4#14850#29975#51710#5840583#424#604441938705978#606#918#22482#5#2#603#0#
-#311###0###3#17#####9##2#497#4#0###7#1#9###1##89#####8#6#0#1###4#5####32#######7####39###0#0#729#8#1###1#2#712##4#85#8###6#6#72##3#
-#5#1#61123#832#462735520#9#6325665#2#80266#57919439283#0#616#585#87544#8991411#6916951#178#058#009#5#82123071400656745#788354395#1#
-#8#8#8###083#0#2#6#685###1#####28138###2#7#856#2#8#####8#970#28#02#770#####8###625###4#8#233#0#4###5#####0#70#8###95#1#1#####16#70#
-#110#3#5808430051815#8#7#8947715#9#650#954285336#3808895#242333713#6#17480#78499#2312160#422#0#6#95682583588#12522#5#9#8#951847800#
-#7###24####5##26#5###2#9#68###86#9#2#4##6862###1#6###9#3#######9#22588#983#####1#7###2###5#7#7#0#9#6###2#####4###4##75#4#92####8###
-#0#2#14114#95416#6#266#32288#339#654#6917193#0899916144691548145#5#81600523311#8#820#8#414#949#6914742831481#76418#367#6584230#623#
-#7#7#####9#8#4#####036#####8#4##1############906#4#9#9#5###5#####8###9#3##36#2####64#7#83####8#8#####990###0#0#0#191####8#7##1#0#5#
-#787#88104#67041382718379592#721376643#107#985#7#336834203145011#3797035#344579673357830#251#07048#30351#1#8#5#3515445128520#4#472#
-#5#2#6#9#4#48425#####053###9#41####341#4#0#014#7#####3#3#9#####0#5#######95#####44###2#5#6###4##16#6####09#3#93##4###622##66#50##9#
-#590#0#419#385#49208998981#7#9131071#441#466#8#810#8#2#8#93581#972#11448940713469655#399#626#01117#71887#120#79885303534#930#026#2#
-#4#0#4#8###567#84######3#7#1#2###3#1673#6######4#5#0#265#####3###2###3#9#9#62#####83#0#####7##9386#2#075#8##69###########5779##242#
-#407#6#011#9#7#451#8948921#477#219#6#009663862#825#034#003#13605#110685333#068#613#970#078546406#0#576927157#67515#15614#2#2#04066#
-#3###7#7###8#7921##1#7###9##47#8###3#0##4####4#6###0#####2#6#7#41###7###44###4#5###8###8###1#1#777#####0#######8#9#5#41##0#9#3#471#
-#4#221#98668#4188453#0142384#97810#9#496#45818#020#817#24831#8#42727#250#0#4#2#2#4884278592547#376342234217432#9#521#6625400#3#967#
-#345##39##########8847###016###0#1#1#6#2#5#826###1###0#5###7#5###0#4#3#9#1#0#212#8###9#3#3###6###6#8####03#1#6#6##5##4######83#766#
-#310#6473470258130#6#39651#5714146#0#0#688#2#810#3#8249093#7#98982#7#0#2518304#621#950#30152#46344#2125875#228#563565065#93545#0#0#
-#3#782#########8###73###40#######1###2#36#80#1#1#1#4######99#30##5#3#6#####9#6##00#1##8###68######33###7###2#4#####9#8#5#8#####0#8#
-#8974548357071#1#0831240#46574#798#1248902#677#461#7#91010911780#2#2247198#3#976#6#9#043#890#157045975#53806#85891#44159#8#14695#0#
-#63##3####3#12#4#17##8#789###3#88##89##6#5#5#0#4##75#7####7#8##8#0#####4#5#5#9#5#3#1#3#067###208#####1#####94##6###99####3#6#####4#
-#1#43081#258#0#8#99726#837#788#8066032#557#8#7#1#834#8#9#0441694226535#3#4#466#3#6281864426658653859#550#572#1#564#31537#0#9#60864#
-#2#5#####1#008#8#####59687#4########87#83##9#5#8#0###8#8#41#####36#6###6#2#0###9#2##0#26##13##5##8#4###0##34#18#0416##45#1#870###3#
-#214#1#562#6657252#242#579#14501703002#1#432#4#0162058#2#587#897#517#311883102#0671641#55528#20687#617#387#042#0569004869947704796#
-#8###4#12#9#2#7####6#####1#####9###13####3#5#8##76####40##63#0#30##3#5#####5#7#3#3##1###53#1#46##8393#4##362###6#####9#4#####6#####
-#013#8923195#33495#85730791881#98846#2652458#92904#5249056#0#1#1135566#110#2208310237339#5#7#12016#82306#050#717#75856#8#821#154#9#
-##92#5##1##0#155#4#9#5###1#8#1#388#1#0#4###2#0#9###1#80##6527#0##537##2##1###98########1###7#0#59#6####0##08693##5#3#482#7647##6#7#
-#544540072#01299#71696189034#327#6527400630353#837337005#4713705167050322814#750137853643652#114224837#6571462#085#672#33885176257E
-###################################################################################################################################"""
-
-q13_input3 = """SSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSS
-S0478310#072516413541159663842#10932905946330045#531458632858663#19651321644586818254240#7833767#632#648165486136185#83381#82851464976#69491#30022454735#8965968657963#3990081#84419#0923672804831#3#700297371#58645#8676275#1446628178149532099#575644007S
-S2##82#3###0#072#1##8########2###8#9###4###6#5#5#1###2231##65#5920#0#1#5######6940###8#6#6###4#1#8#2###3###########1#1#1#0#8###08####1#168###7#7#####3#60####471###63##1#6##7##8###9#90##5#4#685#7#0#2#####6##67#62#36#1###3#47####4###1#5#####1#2#9#6#0##S
-S01337#596#7#156#219136982#5865536#20258#233#3#3195450#9439736#611#543#35077#055#169#896#7#4#6#930#87570#781#91151#0#6#6#9#275#651796798834034#2002091#5#80743#65712#012#0353687#013#154#402#8#10317#03257#1#517#634#8#52733#79942#632#1#3#399#345#8#7#655S
-S########0#5#1#4#885#####4#6#3#4###########5#8#4##055###1##4###3#542###150#6#0#4#551#8#6#7#1#92#####9##1#4#9##4##590#4#5###5#6#4#5#9######5####1###5###9#256###7###4#5#######2###89#05#366###8#######5#6###9#71####6#6#4#0#4###6#3#6###3#633#5##8##1#####3S
-S6#838#7100730#577#3249302#553168676796570#6907361#8921783#35458366947#698#8#0#634#0#5#37337#2#322758016#1#046192349#2#520#048#33701964927#298#9#56051#802#1770679#0#2#0026444#0#2#769#277#123#266#495#33347#995#693#285965596#2#7#5#87974#6#70135#519#001S
-S1#3#8#5##58#3###5#####6#2##27###3##7###23###9###340####29#8#8##73####4##4#8#3#22##061#8#4#0#3###838#8#9#9#####0#####8###1#0###6###1#0#3#4#314#5#06###9######7#960###8#38####7#1#090#3###7#8###0#0#6#5#9#7#4###53954#4#755##69#8#7#2#7#1#1###8####8##8#5##S
-S8#99864#698#0#7#0#2#235#7078104#513#262#9#323#871#4605911#128#643106719#9#278#626#4#0246119#2#45901#1#6#745#9#1155876#7#304#22391#0#1#4#7#5#1#6#7478455#4608319#2#825#09302#8#542#7#59572#203#42155#351#9#4#084736136#9#350#62218#623#60563#9074170817926S
-S5802##513###5#5#0#5#9##7422###6###91##2#4#8#9#53#225####8##08##98##0##0#27##1#0###1########43#5#4###9#4###3#7#3###0###9###9###89##0#4#3#0#1#6#7#1340#39#7#9#7###0#6###0#37#10#49639##08#6###4#4#505##6##3#9#76#3####1#6#3#4###3#7#9###63#89###7###9#141#8S
-S9089863337887#8#8#892#3583728#64371#180#469160706#62021#362#764#7#145#6#249030230477693713455#6#657#16041#0#0868701#557572239#3#677#261#056#9#9678807#750#2#740#45064#3#673#4#08910213045#472#0#7#5796993#1#6886509#49070#788#7#3#952#181#8621531#1#0#8#8S
-S8###6##8#6#5##4#2###723#0#3##1##76##2###2#6###2#######4#7#3###48474###3#2##20#######6572######0#4#1#####2#2#79####6#326####797##1###109#45##94275#1#######2#6#6####54#8#4#054#47####522#7#9#640#5#######1#4#1#3#8#2#6##61#8#7#6#6###0###8###9#9###6#4#7#4S
-S21479#2698666#9#771#731#673#473#71906#867#6#029#46079#5#5#530#1341784#0#4#648797512#6#5#157351417#4761505#051#992#485#26200483796#593#537#154#273413885#39783#73746#843#080#246#4#245#466#04765#7#8869187#24076#3767017#4#7#6#593706150#384#087#483#268#7S
-S########5###292#5#6#6##01###7#4#######5#6#2#5#4#4###8#6#42#92#49####075#3#8###7#5#2#0#9#9###97######8#08#####02###5####7886###4#####4#5182##3#3#3#####6#8######5898###2#9#3##08#3#43##1###5#74#3540######4######3#2##942144###5#9#1###1#3##7#93#5#0#662#4S
-S895462686#04556#530#2#0981705578162305223#0#6#8#498#1#89819#7#87009359686#7#3#496#4#04254#74632753160716679#078836267#86806#8350603#984#201#963#00122#4#3#57281594391#596#1370670#8#1#391#9#112#97329#72576654238142819#1#6945196#739#295656975#7#8#9#8#0S
-S2###6#0####1##6#02##55##9###############9#3###3###1#88####097#1#6#####4#240407##4#89#7###89####7####8###4#5#8###91##9980##26####3#60##3#428#51#00###1#6#9#80949###1#5###9#554#4#1#0#2##21#7#8###64##4#######7#999#4#9#0#####0#0###5#8#####4###8#2#372#203S
-S7#51932#311#6#6#461#12164#444805534#988#2080569#903#2#6556145#3#876792177#1#32601305260#03505538832#383#9#39397033191#7#92890#9671120#2#600122208#98519#88241125499#958#975#32485#7#733#579#6#16346#265#942988822#139#429956458#450#805#498#05861#4#36876S
-S8#4#9###713#3#3###0#####0#09##8###1#8#4#114##29#7###0#906#####8##58#8#####085######8##7#7#0#2###0#7#1#9#9##0##8######173####2#0#8###1#5#159#24##0#1#2####2#2##2#9#9###0###4######40###482#22571#4#6###3#6#1#58##8###6#9##2####284##21###0##2##8####8####6S
-S560#54294#3#7#0#8#1#87197#3591533#268388173#32006#2277033#737#14265#15780#8#216366243#8#78752#448351240#9892421#74653680852#194#5463618#5151702#8#6#3#28606281762#63997#306#2324047#996#9#097#2#5#227#73234#583#595#0#059485647#28227#156#671#70250302740S
-S#0#12#####38862#4#8#9#7#3###3###50######9#008#14####5###9#5#6#9##18#862#7#1#########1#8###3#998#6##14##12#6##3##169#6#5###7#####5#####79##0#####9#8#6#4#####3#######3####51#09##0###2###7#1#6#4###512###8#8#1#00##8#5##61#14##2#####8#0###7#723#4#697###1S
-S902#475#725#1#132#660#9#864#19343457926103393#1#6916201#96076#49662#5#348#535#7385448#804#3#296#21954#422#31269761457#4088434047818#581#911#38894#968#31759#1814393#5734721#240#292809794#305#80280247422#269#741#3#46133#392239753#8#16264#234#54503#592S
-S0#9#03##5###9###2###8#53##7#####64#9###5#34#1###3#57##1718#0784####3622###5#516###928###0#4#025#6#####1###8#5#######6###57####9#5##27###6#2#1#########5##77######9826#1#843#9#9#99#4##0#07##6##1#######71#6###1##95###3#7#1#8###3###9#######4#698#0#7#9##S
-S7135030#103417941465702841165234296#98621#6022069#5#258#026#8#410#598#8968595#1#7708375#943#7#476#175#2#5#798#776#7482756#97059#65478#918#2#093#2605389#34716958582582366#7#768#447148028#83244413424#6#0776944715620#7#4959018#379#6#99400#1#496#2916421S
-S8#####7#44########2####28#2###9###81#62#7###796###2#31####9#48##8#8###########0#5#1#7#8####97#######951#8#450#983#4136####8#8#5#65#0#0##541###4#2####42#463#5#7099####4#7###6#3####03###############8#0##8##09##66##2#8#8#####0###0#06##6###8#5#######044S
-S92759#8#818914546#1#084#75154#669055455#3095256#792#991#73593#694#9#858853043968975#5#07473#4#181707298928755#80642#13312160147#701815536081497#3#18896#812#3#2#985#975#474#187#0#697#60281#677350029335303#4#844#786#2#82278262285#656#810#758#43967#285S
-S0##82#8#1#####0#3###2#3#1##8597#8#########858#3#5#####5#89###41###8#9#2#8#3602##7###27###43#9#####491#0#####984#3#9#5######98####9941#41#32#7#2#1#3##40#41268781##1#8#####147#6#0#9###5###4#0##17#8##0##441#671#8#284#2#8#7#7###8#####6#146#84361###6###1S
-S878#64885#16754#42332#987603395#343#4340455300258#70865#7#4534250#261#5#66369#71775#462014210632010#5#364700947#186#278540404#3461045#0#683#6#200#1572566#06588#104#0092274#3456534#194#555#1#510#40933#5301552759798#0681261#949#47805#6#1#2#68086#8#569S
-S9#7#3#964#8#8##8##072##7###93#0#752#8#9#6#0#522###2#####3#######7###5#59668#5###0#7##53#3####756####7#07##3#192#872#21######2#15#410##7#2###9#2###3####6######0#7######6##3#1##7063#60##4#1###4#3#12##9#5#6#########2###7##63#29##7###7##05#250##1##5#322S
-S798#001#871514001#7#2030894611738#277845399537777#283#2#9042759#584#2#5#076#97258#7#822#0#3476024#95677#2#3845301#8781745#5226563#411#8#830#22247#403#55849186114#883#456#4#126#7487757#3#4#220#47813#580723448#1456903#541#6#158#3244302#84638#85433#188S
-S2#####7#8###8#2#1#1#########6#3641###4####93###3##5#8#3#4#5#1#5###49##604##2##5#3#3#0###3#7#####383#7#1#8#0###3###5###4#0#7#2###9##50#257#0###0#####3#8###9###4#5#5#0#1#313###5###8###3#2#6#2#####560#####285#0#8###5#9#7#8#9#4431##2#7#9#1#####1#8#3###0S
-S598#612#9925401#8471710#152183700780513#93390#8421542237424#9#6#5#4479990#90538#3#7#4#916#7#679#163#53130#663#431161783#984#615#8775946#5#8977031099548#859#7132341#443#2#55135#0#97641#645#845#7688842624019#1#03041892483#93407766215#319#922#225#66546S
-S83745#######1#0982####7####70###5#0#3#8#7#0##556######79##4#1#3#16######3#0#####809#6#3###8#4###5#0#2######05#2###6#084671######7#4##6#7514########9##9#1#8#####9####6##68##9###6###7##05###8#8946#3#87#######4#0###9##28#99######88##9#####4#9###7#4###9S
-S4#84451#49246#65470#700#656#2801048#0#3#178#690#382#2#082#600#315222745#2#3#414634044#46706#7#135124782006618#3#30544#3941753#842#6#3374267#7#33899539372#54128#48217#4#515#8#164343057826852#5#967623975#62395#187511419#406#5767926#21781156855#361#076S
-S##1###8#8#####83##0#6#4#0#2######56#4#0#####122#9#5#3#2#####8#1773##378#7#8#8#######7#3####45#9#3#5##5##9###8#3#4#0#2#######2#1#372##9####729#35######3###6###2#####2#1#2#9#070#####3####44###2######91#3474######9#0#4#04#59#740###1484338#####9#####4#5S
-S626#7#0#9965762#99923#451#1570618#111#54483#1#446#4#4968124#4#019520135#7#0#8#020#141#6#7896604#1556135#1#764222697#9#960#1#773#2#45675#76300#2#9905999#145#3#6#472404479#2#138#228#1398842#205112180857022761201#6#238#209#8#4184644#6336266#065#43575#8S
-S0###3#0###31##5#7##6171#####0###5#####6##5363#64##2####70#8###0#6#3###4#7#9#0#3#0#9###3#######9###8#####7#23#####21#3#8#5#3#####7#####1#####5#4#0#3###8#2#0#783#43####039#4##1##5#1###4#####3###4##9##5#1##91###6#0#6#46##1###1#8#0###2#####1#69##72##382S
-S2#662#8#7321553#262#420#560#86901#511#798#3#31051176168#6#769#4#9#776#633#6#397#0#4#9#09237#3921247#446#4#6#4214765#7#7#5679360440290#636#009#5632887#9#584#756#1094988742886#409#452#3653326#019#883#0#2676697#016#53731#7483983#2#166734121834728#244#9S
-S8#8##86#######0#873####32###2#####3#0#5###5###0#2###9#610#6#6#217#065###4#1###57#75#3####7158#2#2#9#0#4#715#8##38###7#0#####4#6####0056#3###########2#16##2#619#4#7###6#5##79#8742##67235###1####485402#######0###4###0#4##6####5#7#8#9###57#2####774#4#2S
-S7#8864914027739#0#5002024#31915653372#2#555#083#9405453#3#081#7#0#9#88409#3#021#309#4328679#132#535#2#399#3#443#174#9#2#2670354#413#401#0533817875038#497#2#821#75247#61247#875#437#2#2150340#585#2#7#0135017#7#84529#4#3#48597#8#573#8030932574919#6#915S
-S2########9####7#5#4#04##5#0#####9##38#40208#072##0####8#4###3###6##7##15##9#2#5#4#41##7##6##0#9###1#0####07###5#4#965#0#1##68#9#549#1#4#6#7#38####49####8#9###9####79##0###0####0#6#5#9#88##4#6#9#90611#####6#0#930#2#7#6#0#3#290#1###5###########3##0###S
-S449057296#589#2#5#220#7#4841655#2#81044#8#5#8#1131074#61302#352#1795351#600#381#78392#8#185#5729486#59393388258#2#4#503#000331295#710#159#6#07107#6#31616588386#407#3#614#3715185#198#5#731#5635978194588#966#025#05682#4#8#7#6#62594#3601080#44595120699S
-S4#1#####3#1##29###7#0#2#7#####8#4#811##62#4#23#8##6###243#8###6#3###9#5#846##75#####438#6##05#1#3#40#8######9###5#9###2###523#5#4#2#####2#0#####2##09#######1###7#7###0#2#6#0########75###468##2####8#2#4###2#####8####65#946#4#5###5#######5#3#####2#0#9S
-S7#217#993#4#844#742#027#1439169#4#75711#7#4#31039#154#506#79295#59667572166#44848#265#2#88645#457#524#4218976#576#84233#0293275457683#2#1#1256236#420415635100186#15660#5#40554#612384509#873444242#089#840#2853798#4#741#2#2#647#54653582924#6791007#3#5S
-S4#7#7#6###3#897#7#####3##0######4#####8#293#0###2###550#6#6#82##7####3350#6#######1###950#####3#353#1495####13####7#####9#2###3###594#1305#1755###83##6###4#6#2#9#####387#479#584###6#6##4#3######5#9#9###1##1###4##4#7###8#8#######40####090#17###72#8#3S
-S77289#0#13555#867#6#31070381512#475207672#5#414#954#274#7#4#6#735487581#5#554329409#068#5850469#987123974#874#360#404#057#372#0962453#5#54558#817#01386#5024394#810#24884721802#309#7#79554663713#7#21604#29856#71592#631#2#914162219978331#882953206#9#9S
-S0#0###4#155###936#1#470#4#1##39##81#98##162#7#4###35#5####8#2###1#####7#54####2#####81##947#4#6#0#3#0#9###8#234#3#1###4#####3#2#6#0#6#144#####3#0#171###3#5#7###7#2#5#####1##51#5###623#6#####35##8##1#####60#40##3##99#836#88###4###9#5##4#####01##6#8#2S
-S4#31558#4#3#331#9#760#43564#6740621390468#341#53603#74221#0#557#6#00510#64884#56489#697#205#6#774#110418157#9#7#3074321#43308#47980#70509#6552064#578#563#9#84083#9#667#596#233599988#1253264#1232246207745#6#260#7053645#489#4#226925731#4#88962221742#0S
-S##6#5#469#5###1#6#6###8#####7#####5##7##0#374#####6##83#5#2###1###0#2#848###2#1#0#20##1####7##4#7##1####8#####3#########647#4###########5###2336##3#6###7#7#5#4#8#2###5#5#7#21##2###5#5###4#2###8#32997#086#2#7#0###6###3###259#20##9#4#3#5###8#3###8#3#6S
-S819#2385507#45959#534#41549#6156700696605#7673935#53331#3#305#808#8#816#3430907#84168#530461236#928065906#959#6#96481#826#581#724#98669#7#503#6#139#173#001#0#8#5029106#8#337#75130#84012#792385464313967#818#1#748#447#779003693#9#154#5#427#629568691#1S
-S44####2#7###6###4#7#5###354#8#9##3#6###55#####6#0######24###615#6#4###9#0#9###7#####45####63####4#1#87####7492943#####6###23##1#2#2##67#0#29#2##8###0#9#2###10##5#5##4##7#0####66#9#0##6#5####5#######0#2#1#077##66#4##444#55#7#9#2#####58##5##9##2#02##0S
-S8#19309#61388#859#802#38697#459#961#6408570#762#692#840919637#176#9577692#56925#136274731#291021427#9894786#019#8720411#2138147#2#304#4#0#3#09599#164260480#331#952#23688#33449#7#4#0#99931#540#634#8848968#928#256#24559#69732#2#59099067314#218#6497524S
-S7#8##52###9###4#026#3#4##7##65751##20#2#6#2#9####1962#####3###6#7###245###8#853#005#####9#1###57####4#65##0#####4#######68##6##25#139#6#5#1#0#7#494###5#0#1#4#07##2#2##80##4##2#1#3#1#4###810###962##80##86###2#5#3#5#2###7#7###4###131###7###0#33##1###8S
-S6#4657918800766#2#6#82830#8#3796382#579#8#890#58821#4#633917068#24143#180#534#8#045#33984#794#6841209#5#530#585#3#5477543#677#0#3#8#50385#234513648#7#001#5#1#1#187#9467788#726#5#3#880073900#181#193370639#3#295#3#765#93597#288#18778#1845973#7#974#7#3S
-S7###5#7##69#7###6#4#31##0#5#5#5###9###500#####5###3#3#5#4###3###0#7#88##3#8562##1#9#9#6###235##2##718#3##89#0#635#8#9#5###6###811###9#5###3#4#9#0#7#1##50#97##825##66#64##327###5#9#3###59####8###8##8####6#3###438#4#1#4##50#6###62#91#4###3#705#4###9#9S
-S272#4#12503#0795254#6#710#498#484#071#951#3365493#1#5#4#052#39172#872#846#6#671537664#6642664#82640#2#93823#9#9423570#65358#2824338#701116277#65176635643#639#66373#654#51746#569#5#5#415#798#9#267#3155843#6#031530273#249#1#6#36717#9#95998#7#467#06159S
-S1#7###6#5######70###499###2#####933###8#6###9###979#7946089#5#9##24###4#0#4#######8#162####10#7####67#3#8###5#1#####0#######3#4###7###9#####0#1##9897#4#7#9#185###46####8###5###6#6#3#3###1#736#####3#0347357#3#######2#2#0#8#4##99#9#5#####6#4#####4#338S
-S962#872#0#31563304711#410#6#52818#91923#770#9#140#91384#8#1#119313127#3#776#940#7#068#99258806110#8#819#3#666#665#2554440#022#658#589#27475#36035#40579#3#62364#5#38775#490#037#9#446054531#5#110#052#000#3#2#744932893#1#0#3#9942734#0799355#9253458#504S
-S##1#3####42###3###5#35##8#9#9#4#7#858353##7#053#7#####0#0#2####4##9#0#5#0###2#8#2#######97######3#5###8#8#19#0061#2###8###4###5#####271#9#6##79#9#1#308#0#2##1660#####7#8#7###3742##1###8###8##94#9###0###3#703##44#3#7#4#4#82#####0##8####1##12########8S
-S537#7#159#1#542#3719921773411#0#157405391#4#2#7798221#0#4#54877861162#1#03603826322#568#56113#671#904129890#049#20416#04862#5#328#104#335#052063386#5#0#285543583#366#977#291#3#24721979394#999#5#4#175#184#378404578#8#5#3#3#057701691707644#59540947735S
-S5#5#9#7#2#3#8#023###7#########0#9#7###7###480#23#7##216#0###3#6402#8897#1#8#5##0547#5#8##8##8#77#99##0######6###8###2###3###03##2#9###2#9#0###3#8#0#960###4####40#1#9#983#4#7#0##00#0#########4#5#0#7#9#7###2######7#33#2###0#5#22#02#6##02#3#5###1#8####S
-S9#80023#287#164692824#453#76025#4#78455#58281#2#6748920#9#53644#5#865#8817501#374#190#41994#6#4#1#383#5909299#3#433#2#262#497883980#937#587#801#9#145#487#666837569#887#38746#0#8#571#74297#9687018#8#66208#4392590230859276836#62113#348#4#5#450#0928912S
-S877#7#######2#0####85#7#0#5#1#6#078#6#024#8###8#######3#7#7#3##56#6#6#8#1#####4#7##4######8#9#3#7#5###7######25#6#6#5#842#1###0####3###7915#76##990#6#7#6####33#7###0#7####9##5#29#5951###2#6##949##1#####47##2#9#4#1#74918#####63114##50#2#6###5#1#0##98S
-S3640703227298#886805287#582#3#4898140#078#622#0#1964593#333#939#018#2#2#70401#7#5#30517#8#4#6#3#133#078#82861#417#050#77073765847#60720#2#2#344325812#5#00313#168#3586665543728#38717#072#1#261#099#95032#14385#735#650#3#78103#2#8#618#8#91991#854#32515S
-S66####2####76#6####1#346####4#####4#4#####2#1#7#7###5#943#2##20#6###3#8#####287#684#3#1#6#9#8#4#2##12#0#3###4#2##9#0#912#6##6#7#340###0#8#6#######8##2##1#####6#225###2###3####7381#5#2#2#6##45###7#####5###3#4########1#9####47254###1#84####5###8136##1S
-S2#1555000359939740155#0#43583#975#624#43279#1#0#2#54100#3#897593057#7#24028120384315684#8954419#614#4#8#1#5#345461849#56106#978#347#277#6#0241505#1211012#19902#6#175#337#37176#5#418#796#95990#7060640#7197490787335386904401014#045706060#68983#0383298S
-S2#3#####3#0#8#7#####5#710###2#7#4#8##3#94#028#2#2#1#####6###0#0#1#5#3#43##9########87#####3#9#6#7#9#77852#9#9#####2#7#####0#0##30#2#3##3##9###567#####6#9#5#2##4####6##16###5#8#3###9#116##9##9##89###8###2###2#8#94##3##9##8#######1#6###8#3#29#386#21#0S
-S9#8#535#583#1#22723#491#5#335#7#239#5890669#7#51918191788#820#2#21331#5521971911333#4105204#808#875#1657645#8108608#570319256#399#7#5727916#122#3255462191742#7723843#646#176#9681094#5#9#1058758#8#9287437#901#1#5#08731509961043913#9#8#2#6#611#28215#6S
-S4#1###6#7#######7#4##9##3###7#4#####8#0####95#5###4#####6#73##0#####5######84###8#6#1###464#00##4#1#7#86#98###24#0###32##12###9#1#4#8#6#5###8###4####35##71###3#######7###9#6#1#5#8###0#909##2530###4###2#478#9###543#####5#####7#95##4#8#1#076#7#######2S
-S5#75184#66473018742#527#198#6#4#18992#9#88790#7#3#43306#7#4#770#26186402164#549#244#91015#0#9284797#1#4682606#6#7773966#626#315#237#1#0#560#459#58052#588154534482646#7#244#1#139#6#671#60892#19197454006#368394356#589256357450012#05066#6075564#679#309S
-S9###4#1##6##73######6#6###27##2###75##1#8#1##6106#3###6#7#2#6#2#4#9#603###9###7#5#####6#2#4#3#######534#####448#1##3##8###9#4###3#8#5####7744#9#2###689###38######9##9271#####5#314#81######8#4######8045###7####9##70############2#1###2####83#3#8#2#2#0S
-S30906272252550599#162#094#77784#862#865#631#480#0#94848#207#1730782920073#5#490#739#961#7#249#562#697#78337#7#8#9#100#962#126#388#3#7834315#4#329#3243971#0#204#309#218#4#98628#46308#1231560#6#9#81963324001#00285#724677205646979#776#4293781#3#0#772#6S
-S5#0###4#0#4#####4#7#3####255####2###2#2###6#3#8#7#1##2##2#0#1#######8#5#098###9###2#1###3###3#8#037##527007#5#9#2#5#85##2#130#7###9#1#######9##26#######4##49#0#985#17##9#3#1##1#8#27###3#29##2#2#8#7####1###44###0#7#######3#0#15##2#366#3#2#7#5#5#59##9S
-S966#694#9#67014969530#368#7157497#297#228#510#872#5157334#764337804#5053925384284#1368976#653#4#223#518#3#2#937#385#19056#4#9#351#815122623#801#7166121076203#1359730#913#763#232975221#8#34785#931#50398#3#473#2#3#1#86771#1#9#9#837#2#02287#623#8546448S
-S##907##10#808#2#######1#3#9####05###30021###64#30#####7#3#3##07#8652######3#995###7#4#####8#9#4#8#8###3#5###6#6#0###4#9#5#106###9#8#93#3##7##7##3#0##85###9##7##4#9###466#9#5##98##1#6397######167##2###1#3#6#158#5#359###5#369#2#5###9#596#6#8#8##5####7S
-S7#420#510#1#13103#80009#798#526#4270815#34998#78989#4#0#147#205#9#4#179001440546134115413#3#428#23145#4#82370#881#176#643#20276731737#030#15433#9#319#7#8337178#5#797#54843385426#13097#121#7928056#5#07790#117#40891#7176635#4#904#9#663#2#1#14523#05661S
-S5##09#2#939##4###32#######6#1#3#1#8#2#############18956##03#7###7#6#####5#6#####949#####3#205#32080#2###3#####5#4#4######5###7##2###2#2#8###5#492###4#229#####7##61#6#0##1####7##63#0#964#2#02######3####65#1#2#9######956202#030#8#298#7#1#48##847#8####S
-S324#3#100148050#253#241013698#5#743#622#879137118#025#4#461#23132#8#23010#58805#551#34242#9#7#4#313#839#66925#693#03325#152#03503667178#315#7#8#503#5#6#7#141#75762#6#5#68224#38678#0#177#5#1#5921115#8653349#77313829350#2#975#5645790200835#734#5146527S
-S9#9#3773156###31493#0#######3#8#4#####4#5#7###5#05####6#4#########1#78###52####7##1#3#####8#8#4#9###4618##2#0#436#####8#3#7###########5###7###71####35753#673##1####996#8#9#4620#90286###23#5#3#8#1###8#####0#1#8###0#1###9#4#576###6##3##1#0#2##19#####5S
-S0#061#504#97965#31244648136#8#9#39784#1#43080#3#1984874#7#081494794#418030446151107#29457#056#1679476#893#98804#12108#9#1#778842989104439438657#899#9#5#330#476398191373789#2#92013#401671618#55926#952#47161#000#522#89448#114#887#24593#423#6#038#488#6S
-S1#3#9###1953####4###2###510#464#####6#2#5#####8##2######6#9##1#2##668#8#5###8###60#53#3#####3###3##47###4##6#12#199###6#12#####5###69#96####8#6#0#7#6#8####2###07#1###81##4#5#890########3####1##65#6###2###5#####5#7#1#5#9#5##9##0#####7#1###5#8#5#7#6#3S
-S796#13994#66466#9#700#7#939#6#189#608#9#3#68606#292#8206532962298471342#656#256#23338#25461#059#59652813978239068#9#330#4#565#4427567#3#884#06100#638#601#277#793#023431940#897#5034330#812#4#350#3#1#355#1479658#9#8#0#6#462#2425081#810#3#58570#443#0#6S
-S486#####0#37##4#2#6###9#4#####7###7###5###7#2###321#2####7##5#6#####04##3#0###7#7#####7#6####51###0###4##4#1##3###9#3#883###167#########648#1#3#05##4###074#0#4#7##53#350#46######7#1#7#4#1#49##36##8#442#2#######8#227#7#####3#6##73###3###1###7#0####47S
-S3#20633#30765#20845#646#81251#4#141#4102199#0744481#471#30254013422910246#256#8#1416168#1#30266#572#841404763034328#0#1#208173057279602#9#1#2#057946064#115#2#1#638#435#875656701#5#8#244#559557374#8#936#300998273#7#111#05919#4156689#53454#956#3662480S
-S21####6#02##455#######32####3#0#1###4#56####8###3#8###28##0#3###9#9#8###068#64189#0###844#0#4###0#0#0##0##9#####2#5#24######5#8#7#####4#7#8168#94#20##6##56###7#1#3####01###9#511#2#39########0###1#620#1##9####42#27###3######13#####4#9499####724#7#1##S
-S0#23696#346#9#4188488#156830506#601525632#077#511#061#42790#4#77954#646#924#38069#560#93442#3#659#21329479198#445#3#5#329#168#190#06486#5#9684488#899#589#1#79680#8#81166176693#32822#0259427#48818#368#6#8676580#84775#5862567#3#739#828#0#253#748#12119S
-S##0###6#32101#7###1#190#20##0#7#4#1###8###2##73#3###2#2##1##6#9###4###7#7##71#####6###8#8#3#0#6###818##3#9#51#41##579#6#918##0##9#568#4#1#5##2##7#5#3##47#4#1###182#7#4###9#5#9##7##877####22###4#1###8#3#####8#680####1######285#7#4###7#6#085#42####0#3S
-S454584756#7#7568920#722#394#39462#975#1589999#45666#4#126#508#637647613#02979#51737164312#9#883#1#826#52377#495#313#632#6733679523536#191#548#08323#587#185#3#397#8#698#472#4#9#16937#3#583#70790965690#559#410#8#997#6656418192981#8528973#4#9692719#259S
-S2##0#0####1#####7#4#7#6#4#1#84###8##2#####8#49####9#829#8#238#7#3#53###0####16##843#7###7#8#4###7#16######7#6###9##9#6#1##5#0003####452#2###1#80##3#4#6#7###439##93#0#7#25#41#7#85405#2#85185#4###0#8#4###780#0#8###0#4#####6##0##5####8#8##4#####619###8S
-S0#3637302#32720#49781#4#0#028#4876665#9983368#01472#910#888#958#04967832255#042#3#5#74166#0#2#3149207218101#9#092#2353612#9120942163219308860#409#7#6#4#557#0#5215667#6#5#44267#0#12547945848#53815#2#03427#1#822#1#756425251#66747#641#32506402312#33331S
-S1#4#####3#7###8#3#######91####96##833#6#43##4902##2#####9#0#4###4##2#8####8###988#7#8#213#0#6#######6#######6#9##03#6###7#9995##137##10#2682##8#1#7#8#2#8#7#2###9#2#4#2#6#3#2###8###69#####77#######0#41####93##8#9#04##5###9#6###8#116#22##9###7#1#3###8S
-S6575869#22239#38163#53808#7360818#04935#519#7#212#2923273#265#47838790848#8#273#0134816#1796368183842#104#028#9#9#28108#892#838#535#45236#861#28999#0#358#704#509#30945#127#164652718380727#4566955#916#9#69745#7#65650833591#1#950#5#44393#926#0#1#27465S
-S5#8#8#0###5##38###33#65###16####2#0####8##0#24#16###8#53##7#####0#4###2#5#7#9##########18#8###9###8#6#393#2##80#4#6###1#9#0###8#####5#51###91#0#######1#5##2##5###0##87#4###6####0####4##05#1#1##755##0#7#6##56#3#5#968###924#2###801##9####3#5#2#1###6#4S
-S1#8#50358#1#27032#376#5269652352971#58884#4#227#91655#657#510697767#1039508#82744#03267#808991981#71406#369#5#7#3#357#7#7755522#733#943819727#9361300#3#171615831#45781#929#651#9190421#512#385#120#213046082#481#0314237#7#8#984#5#436236325#074#091#2#5S
-S8#244###7##12#2#3###3#7#9###3#2####91###5#1###7#####5#9#3#2###9###3#660#0#2#8###5#20##3#2#######1###4##66###7#6#8#0#664#8#496###2#2#####0#1###6#####8286##0#####9##4##798#8#5#2#2#495###2#####0#6#8#643#5#8###246##0#####21####67##80#102#9####0##4#7#461S
-S309#7#9224300#34957#1#1436913#1173496#525#022#427972752#60199#60945#6#916#258#217#502#467584281#27265#958#91100#891#561#9#3#18729#3202260382599622153#6#4384838890494#3760997#55922054643591006#0#934#2#177#535#13161#21817#872#1924696#93248#2344813#148S
-S####0#89##2#####7#3#3#3######2#5######3#####923#############4#0#####4#1796##1#4#2#2#1#4##7###3#54#5#9###7#7##3##7#4#8##86#9###620#0###6#435#####97##5###5###6#97####0#2#######2###4#6#7###0##5##7###1#012#7#4###79##3#3###3#3#20###1#43##12#0#2#########9S
-S93371#57738#769#485#115#496288405#59557#883#731#36370189095#604#4508393#6037100#147#6355866#04823#2#79507#0#195#3#573#3#5#211#3#5488676#8#55471#857#07655#52671#810#400#567#982#47711#4#15606#207#57687#5#2#2#8#04124#4#435#3#137197418#29228#5#43318#199S
-S416#3#9###4#4#0#4###8#9##28#4###1#5#7###1###1#3#94###1###24###0##7#1##3#26########21######5#4#####8#####3#8#9#8#8#368#4#3###1###5#2#7###6###7####96#######4#####7#6#5#####7#8#########3###98##1#507#2###6#0#2#2#5#####140#2#8#6##98#610#4###8#8#7##56504#S
-S4#117#7#76364#7542278305449#3#7#816#121#337884118#72579#9#00087#37388#638#900#548#3001988#6#9#917#55079#1#3#5#2#702#3#16642#5#406#4#76007#752#74155#19487#84216#3#6#7881012#4060180#1#016#7#819#7#16420#725#2#866#54980#228#8#1556833#9#665#3#0#8#8986686S
-S7#6###9193####6###9#70#2##763#8#1#8###2#6#7####3##7###9#1####3##9#4#8#5#8#4#0#0#6#3#####3#2#727#6#27##1###5#3#1###0#54###48#247###3#6#####8###7#6347768######89#9#1###406#####4###2#42##5###9###52###484##0#3#8#######6#5###9##3#5##3#3###243#1#7#1###1#3S
-S84272#7#08108#131#755#7779976#5#3#002#4#6#2#0#88330#3889128#74158#4281491648618#6569761#9#2#1#0#3#095#40325#9#261#338500886#7#0660539#6#69425#5#213#79354915030#08400#519#101#3#822#0216889941038#833770678#5#932869592#85995#44486#7#3#0#19814#9#060#852S
-S####2#2#####6#128#964####2####160##37#3#3#2#6#4#608#8#####1#315########3####636##7#7##2#0#1#5###5#7#0#04##395###0#5###039###4#0###58##5#4##1##90####03##4###3###8##35###3#4#3#1#4##1#1##5#6###8#0#3#9#0#1#1#010###9957##107##70###1712099#3#0###6###6###0S
-S327626352#731#9#2127724#492#2#360#901#8#126#361#542#25582#634#475141942886081#0556768#46446#9118066#0#961143023#9#7#731#76438#366#12625801151#56967#053#91830#4#2#328576959#1#3#5#0207476485794#959#36562#673#264697436#3#965#6#61705#259#7#4739636#06182S
-S7#7######12###7#5#7###7#96314#52##409#6#042#8###7#95#49#3#17442##411###71##54###626#5###2#8#678#####06748#1##19#9#788#615######902824###171#1###731#2#4#######6#0####59#6#86530#5#8#1###6###9#4#######707#####71####0#7#0###1#6#7#######6#611320##3#4####S
-S2#1456474985053#91994#18636#520#75424#4#20480#3#781#681#7#0#06094573290#704#297#1#3391012#6#4#2#817#30279#479#76333#7#4#7690743#818754331#4#665#413#9#520874221#289#7686689839293#251#66690232456294123#8966815#903#65610983859#8983121#943#8#21169#51007S
-S423#2##8##0#4#5#7###0##2##7#3###95##2#7#19##473###7#9###5###4##9####11####28##9675##2#4#7#453#364#932#7#8##18##47#8#3##62#3########0##0#1#8##53#8#018####2####3#7#2####0#73#0#91####0#9#30##23######0##16#7#9#117##98#4#8##4##8#7####04#4#2#797##1##7##74S
-S5#2#642#80647#16729888532#1#248#1#975#6#349#56521#7#6#291#685#346#188#277#038#69782#9186921#5#242#16022#783#4#85889#654#58430#0884712#14253#450#8#937#264#173#3683666386629#655163457#5#1#43278820369#31022#1#7#9256257#8452230#877#243#7#5#106#630#46566S
-S40####7###1###0###98####3#42##6#774#6#5###714###7#7#3#94283###1#305#90858###2#07#60#2#####676#####0###96#76#4155#7##5#7#4#3#5#6#36##3#######12###2870#3#5#656###4#####8##4#286####6###26##2#######31##9#2#66315#4#2#8###0###5#0##2417###6#0##46#7#4#9###2S
-S83456#432#090#52899#72801#8#128#692#8#60325887302#83166#8656041#191#5459351#1#567#3#12630#5#791776807#268#1#517#92006#2#3#8#287#1486914874316#35388#653#714530186#832#1038463#55308#73594#2#8#70170#675#0#5#3#72789#78522#6238206#3#38472#594#5#0#344#025S
-S1###2###9#4#18##5795#78###7#576###9#4##586##2###0##8#04#####2#38#####1##3#0#3#4#654#####3#0####24#7#338#7#2##0##7###309139#29####30#0#0#4#38##248###5###########4###5#####11966#9#5#1#4#9#9#5#7####3#61#9#0#1######62#2##0###1##6#6###7#4###5#3####69#6#8S
-S713#1#746#8#220#2#369533346#1732009#038#699#020039630#338568960#353746395#8#83114#84226#2#3#7#392#103#4#4#750#463680335#951#3#88117#4#361#15702#925#3199742#231#178#754#9#059#296#75716#468#6#709#10151#701#42838#696#1#881#59503#52811#65063#3#75118#4#5S
-S####5#2#720###712#908#0#17##9#####4###5##51#5#1##9##46##9#3#46####3#9###5#4#596#######7#92334#21##2###9#7###2#3###4#1#####592#2###7#625#34####8#7#5#####9#4#237###9#55132####9##7##58#9###5#5###6#1###5#5#9#####0#46####1#3###8###4#44##1###5#4#4#9##67##S
-S49570#7#8#984#70267#9053137#7#705#00540#988#9#54729#685#4235964656274#258848486320269#6#50723#5#177#952#02218#2#33669078048#1#1#237#279#331149610#0#39444#222#566#175#77034314366#524#403757672#5010582#0#577#98043#991#37338#70666#2#12155#4#603#389#629S
-S3#4#8#9#1#5###4####2####638###3#1###1#1#3######93#19##6#3#####7#2##55#9##1######1#7#4#5#####3#9#7###2#####2#3#2#7###########4#0#0#5#7#6###9#62##7#7#3########2##4#######6682##6#3#9#73#8######5#0#4#6##23###3#482#8#4#824###582#####2886####1#######8#028S
-S1#241#9#590#359#227#47621#441#9#0#785#426#59083#2#692#5488032#0#4#0#90859#90356#567#2#4#4591093#3#225#89891#021#7#7#0638688#2#91944#002650534#720#552#896#417#520#7840942647630#333#64499#6#14502121147#170#996500783#1#873#573#972#1125190#5750114#4#9#0S
-S3#8###8#6###3###9#0#1#4#4###64419#6###6#7#8###2#9###346#3#6#5#0#3#739#7#6#40#21#7#7#3#1#5#####7#2#3#094###1###2#613#3#7###1#296###48##8#7#0#4#6#4###584#3#5#2#4###8#7###84##145####424##0#2#7###5#35##6#8###2##79##8##3###2#####7#773##9##5###6###8#7###4S
-S18674#65731#6#291#916#0#2#8#747#161#7494656#8785245#0854653#8#2#423262930#340#8#4#0138217#3594531#7#9#5#9491827#4#279#031#6#9#7188866#8#742#5#7#1616601#301#2#453#3#342522375#01598928298#91064906056#68910#8#36225#8#032#0226190#2#652#2#00036#603#964#3S
-S####7#####553#0#####9#8#6#7#78#####85#0#3###8#####0#6##0#3##890#5#8#2#5###4#8#8#0#31######2###32185#6#9#0#1#4#968#78##7#2#3230##8###6#733#6##24#14#6###26#####0#813#4#8#######4########2##0#1#4015#9######9#346###6#6#9#2#207##8##0#6#3#3#####7#7#45##7#2S
-S24573#76307#65448270784#0#486#6465147#054#962#08545#919502444#5#05538#8#1#588#39948#3589432#005#891#2#0#983#986#862#600#4913103#3#5#6#0#9#207#236#3541867215371#60093#3#69530#614#644#74821#262#713#8193891#39361#9#7#763#3#9#8#729#2#5#222#076222812#370S
-S1###0#9#####163#4####63#8###4#1#######111##65#4658####2#70#3332#87###564507#6#####6###9#9#5#7###7##26#7###4##7#762995#5###4#1#9#920#5#90543#2#7#9#####03##2#5#8#####7#4#8###7###7#7#6######47#4#####3##2########3#0#7#735#7#7#9#1#5#7#3#4###3###22##50##7S
-S4#356794526#4#8#6#34497#3250145#42711#9#416#6#1#127#75334#607#3#32092#5#399#9#541#8517248#1#9#5168549#4440450603197#3#0259745#1#7#847#7229133#3#6#691#6#3#3#9#6160740#7#8#642#4#9#4#032#67200#379586130#1732574#6#312#4#2#005#3#1616822#7220102#7739419#6S
-S0###5#08##6#977#5#5###15###1####0###9#76#59#71##2#4#3#18#47###1###4#2#5#####1#6#53#6#6800#699#4###0#2#6#9###7#3#3#8#9#8#####0#0#7###121##93#9#7#1#0#4#7#7#6#800#9#22#5721###4#2#6#9###1#4###24##7#8###0#7#####7#####9#4##4##3#6##13#7#7##7#5#48#26####213S
-S785#4#932#0#6#5#0#605#0#364317761#484#0#232#636#8#9#69098#593#369#5#921#36465#9886385#3#050249728#7#707#2741374#640#5#01087#443#20616#8#635#0#3#130#3#71303#3#751#2#478#307#243#733#110#6#9083121#936#0#099#2#20731#9#72502#05067#811#6112723#554#0#840#1S
-S2#2#0###3#5#1#4#4###2#8#56##4###0#####1#8##5##8#4#7518####6#735#1##06#4#7#####1##82#485#0#####3#8#8#2#9###1#4##5##7#3#9##22##4##3#069#2#2###1#65#4##5#2###959#####6#4###5#6######401936#2#0#1###9693885###7#1##56###50##9#7#8##81###########7#3#8#3#0###1S
-S549#8#435#820#571#6#5#8#811#32701#43959#148#465#4#221765816#450#42216#436#5#946#5#0#5#338#2177239#045#707#8#1#611#6#36981405564#9#6#152#7#79785041237#5#100#5092712#2#5#2#049#417607073356151#8#730#7#588187142#76384058326#333#77515745575#468915666#122S
-S6###96353#733###8#9#9#296#50271#2#2#2#55584#8#####4###9###9###4##1447#####2#9###2#5#5#2#9#2##4####7#2#4#1#0###650##1##4#1##6##2###6###6#1#5#8######36###3####8#1##6#6#4#5###6#42942#2####95#561#9#8#01###3#1##6###7#####4#1#2#6####0###171#97#####5###0##S
-S076#2#146#73928#3#7#61489#1012030#8#650#1#34225#809#083336018#94263#14326#246#348#197#2#978079693#5#493#4#3205292081050#9900E#692#097#2691447#979#1#5#175#9900371#991#76500#790#087#7#06479#6#85721#6964223#0570390803287#1#688#0488198#432#8#00823#208#7S
-S6#8###3#57#4##249#4#9###7#########3#52786#4##34#9#904#####784##93###5###9#73####5###4#3##4##3###330###3#0###3###1#####7#32##8##15###105#0#1#6#3#2#9#1#923#0###4#2#7###2###5###8#8##60#4#4##04#0#3#####8#455#4#7#2#3#######6##6##10####7#8#3#8##7####5###1S
-S0#176#4008729#9#996#164#6#16934693350#5#0#3#22658#9#3874971#2550510#086#309#2591479#6#958#486#370#883#74122#774#46173#2#3#45221#7#873#904#2#4552293#3#6#7#30335#1#0#00354#914399663#2456164#84293017960#80194#37914#1#279950090#2#66640#8#2#0925888#36760S
-S8###2#7###233#2#####0#6#9#486#5#5#87#97#0#9##0#8##17########5#9##9647#0###1#8#66##9#7###8#6###40######0###9###9#7#0#7#8#5#9#1#0#5#1#7###8#4####32###0#6####82##07#0#8##3##5###1###0#67####5######9####2#75#02#4###2#186#####5#5#2#150#####8#####137#####0S
-S5029472#694#9#2801706#8#0#5#431#051#44149#3346478#1295678#149#4#38360#3#798#0#29579#3#349#0#2#166#293#506#6770233#3#3#2531829#5#64284#718#0#991#3#61039#76480#104#814#912#6521112#5197515#056014940381234#018#82019#47637536676#8#33832626588#108935362#5S
-S3#1####23#66##2#6##1##2#5#1##38###9#40#####9##1#7##4651#562###7#8#7###8#1##81###5#2#453###5#6###1#2#1#2#975#5####63#24#2#####43#3#2#1#6###5#76##8#70#56#4####051######3#3#####9#8###3###6#7#####4##74#######9#541#9#0########23#7##########10#1###0696##9S
-S459#440#5#34978#3#9#68513#7289334#524#62622793959#2087843#01416#5#686#0#3#9#967#1#3#1#5#378#556#106#9#7#129#2#852776578#125#958#7#274#37206#267#9#0#069#48585#259#40019#274886079#87249#8#26281#35359#06143#0#320#12300622464#102#9742068957770#25999#946S
-S##7#8001####8#3#8#6#29##3#3#8###7#4###3###1##3#92#3##3##5##6######0#5#6#867#0#3#0#4#272#53##71######5#####4#8#########5#8#808###8#2#63######7#2#6#2#7##7#8##7###803##5#7########4###0###8###7#6##2#81##60#8#6#3#517#1#9##4######0#3##9#335#####78###500##S
-S6#751#67072833836#0#9667464#920#8152348#734961781#1411418#649088824#309#6#28171#5#1#0789823#079#98200#975#6#837#02137#2#7#389#0524764658624#9#7458170074946#015#423#971563480294029#253792919#050#3351894#4#9#608#8#8#9#2232068#5#63381#1#7357090698574#2S
-S8#3#1##2#04######34#7#######3#11##6#6####81##00#3#4#######6##5#######1##6#5#####7#5####77#3###648###3#7#6#9##42#3###598#3#####98###37#1###6#2#8#1#1#7###2#6#3#5#8###4####678###62#34835##33####39#3#######7#4#1###1#1#018####57348####9##81###6#1##7###05S
-S94234260975#93518583099065053#1580983#8406499#0#4028322#734841002370813#960#99851#5044352#810#7#4#87152#399#2#810#088#467#157#04378#1#1#6#8#02597#9#608#8#6#5#4026917#280#3990641#0304354587770#4#7#3183111#4436849#795#4#363#629#4#194#231#912#571105749S
-S##2###8#6###4#0##5##6#8#7###004#3#690#8###7#8#75#9####0######1########0###7#4###79######406#9#5#6#7###9#####8#####9###4#2#31#35#9#3###0#0#5#5#8##99#2#2#2###7#9#####8#8#8#3#6#############7#3##90#8#38######1###233#4#3#1#1#4####41#4###0###6#8#9###8##02S
-S553#7731330#46313#700820618#72326#5#3723522#618819358#4237050906014670664#874#254946221#7#1799371#894#4#184624769042648#9993993#929301587#2683265#424276450#0#3#345#9#4#7745147#77275#769#526#99526088967004159#3#100#3#4155882#682#194926732#14736#51808S
-S9###2#6###2#5###071##68#4#13######0#####7#2#####5#40#######7##4#9###9#5#7##7##6#0#8#16#62#2#6#052#####141###1#5########89#1#####16##3#####2####85####24##80#7#576#0#3#32#9####9###9#775#1###8#21##28#26#241##81###1#6#55####7#6###006#9#7#########810##27S
-S776#0#08355#0539888#72818#468#326#6680101#424#933819419894107#107#029#2#060077391#60313#9#2#2#344#952#54779#21501503836402176#735#555618616#462#32086#044#137#530#050#300#9723249#4#524#20361116068#373#58412#051#3#050#429849289#782#53106392294#3417766S
-S8#221####4##9#4###4###3#7###1#313###9#1###0#1#76#5181#############0#6#3##5##1###4###8#6#9###3##91#8#3##1##9#7###2##557699###4#4###0###4##46#5#5##5##7#1#9####5#88###4###3#9#####5###6#####54#7#4##297#3##7##52##8#4#69##4##344##235#12#7########0#2###2#4S
-S8#5#7#17316167016#649#59066#9#3#28623#9652837#284#2777666590591#449#5911755#833#3#945#4#635#671#694#540#735#588#6#738#978#855#3#4#1#14204#2#4#824#938#048#77013#0#131#739#452867163296405#1#4436242#934#045#283#7#5#4#88789#301#603#372576580#0130260#114S
-S6#9#3#####8######3#80#2###70##6######92#####4###3#3#####7#275#9#3###29####8#9#4#1#8###1#780###1#64####7#1####2##5###8##41#2###308#2#950#7#9#0##93#5#7#7#769###62##9#4#3#9#3######14#####0#1#85######0#0#4#9#39##9#0##16##9#59#30####7170#4##744##27#05170S
-S088#84800#30846#310#1#1#1441252#5054814#683#5#066#1#2090430#19121#793#6245492789024904193#9#356#3#346#3#081218918214096#3#2894210#2#387#6#2#9#335395036#451#6839314#1#455#6#689#50305#84495#715#783379385#94577#0#7#74928279185#1#7626655#297#89090#489#8S
-S9#89####6#9###7#9#9#1#7#73##5###2###3#3#4#553#265#8###6###7####0##81##0#6####13####42#####9#39#47#2#588##4##4###0###873#4######9##7#8##5026#0###9#48######786#0###6#####8#6#2#1#1#8#3#2#4###0#6###47####3#####079#8#3#####7##42#2#7###8#7#0#7#####9#####9S
-S14676313498#0#343#189#9#50212#561#9685657#022#942#3#097#6#5#30705#05825#829#836#506#73673#8#7#2#436#501#901#275#521#5#6#73559#38520#386#15598#09651#57527#2156719923016232462#919#0#3#8298951#839#5773820#976#881#3#1#46934#4#6716566#653#9#493#680#514#9S
-S9#####437###380#######9#####4##0434#4#######5###7#3#4###719#31##6######6205###7#1#6##4##2#1#9#1#4##0#1##0#23###83#3#6#5#1###3#8###0#3#02##7###4###9#0###6#6#####2#6#2###6#3###7#3#1#3##8##7##9286###907###3#3#####0#9#0####92##53###5#####4#2###7#7#6#8#4S
-S4088751#777040684#1788936249089#889#77814#7001785#008#936724673#8#36516#79967#0212401#78728953671#39901#602485100#5#333#6#7658984#1#1#863#11438#0#492#1#536#8#474#3116994527239#8#8#5#771#253#080#0#96332#0#991#97829#25597#002#5#4#1037869#3#9237505#5#2S
-S####5#2#2#36####944#####02###11##5#0####4###3#6#6###286#5##6##6#179##89#43##0####17###3#0#3#9#7##6##8#6#9###6#####054#9###794##683##2###9#8##10#0###7#5#0#6#0#4###8#1#8#47#7####6081##855###9#5456565#88##97#08#6#1###7#0#9#6#1#2#0###15#3#87#0##55#2#053S
-S09119#7#664345302#869#9251180#897435921944073#4#5#472916454#408#0#3#2#9#257#548#5404611#1#314#3692456#1#825#1441571097476#71956#2#467157111541810803516848150#6#94344#16991644614#7#140#016#177#6#2#3#762#254#7#6979297#798#8#8692845#327#771#4#168#002#9S
-S8##68##467####1#9###29##2###8######30#9###9#8#9#5#93#91#4#26960#2#7#8#1#9#790#5#5###7#9#####677#######100#9#5########6##3#918#7#0#8##76#6##5####40#64###26####6#####9#6##0#######09#8#06##4###0#8#3#8#3#6#903#81##9#2###1#3####52###4#81##60##2#9###7###2S
-S207#2#170846772#397#194#1#00957432289044471#5#1#6#168#73638#9#146#3#395#7#6#59720#9#6#25444268572#44938178465#926565885#9#135#312#3#010360408745413#95012#259#12843#4#08183#3017760#890#4#400#4030366#02209#0#0#235#2#72542725191#9#051#825#992#3#4#10259S
-S8#8###3#####6###24#4433#198###0#1#####5##0##5#2#6#####5##76#615###5#5#2#8#5#8#31##3#2###4#8#####8#4#9####05#0#33####4#2#6#47348###022#####7###4###1#6#####8#002#2#3#9###4#3#6##0401###4#518####3##0###9#####3#9#5#9#6#0#23226###0#4###1#6#2#1###5#1####03S
-S8#764#09010745225#98504#3#0#76356#37415#65396#03401#563#471#76964#6#53281#505#5682687472576#59374308407#03434#14694#4#770#531#38641#579#876#332#105#2#59519#151#3#1#82796#6#6#964#724#409#935078364#16304#212#673#6#7#9#546#12202#7880478#4#549#059#174#4S
-S5###6#####5#971###0#3##35#577####96######23#6####81#6###7508####8#4#0#9#8###896########35##601#####62#8#4##43####5##0#1#2###1##7########9###02##2#7#158###6#500###8#####5#7###340###4###2##4########9##78#7#8####81#5#1#2##2##5#8##63###1#4###0###2#9#5#4S
-S898#5996919#9#23920#6221214#1847616#5662597#49678#67357#62464#739#409#2055456#6#197#50662#4718792#3457161#9874733#507#2#0287211350266#445#720#511#775#163#395#2#899#622#4#131#586433862#7#50648#6193019#9#02597#6#613#0#9#85853#646#5#400#176#040#6#0#783S
-S##3#####042#1##96#####7#######43###9##4#5#8#####3###64#6#5#92#52#24#6###6#2#9#9#0#2#3#####8###4#4#329#6#57##063#5#3#9#165920####271#121####66##4##2#3##57#6#2#3#9#3#40##0###1#3#7#37##4#0#8##41#8#1#0#9#4#5##46#6#####5###0###908#4##94####29#9###7#88##5S
-S512912571#0#01676#1526985#710#487554781#3#8#6#57864#01525#746#28717#075872668#481#763#07894#7#3#3444194#309#2#2#2#617#393#7#87291#9#9#1#937#4#1379257#211#7833419#31135#3#845#5#453#968#234#0#2#0#175#8#287#469#65830#66829#937#2#486#1591897#732#9#00809S
-S0###94##1#4#0###0#8####91#598#########4#8#2#2#5#4#2#4###448#######4###4#423#950#1#2#8#08##8#8#0###3#8###1#8###0#3#7#17##040#0#9###2#3#4#5#3#673#####9#4#2#6##3##9###496#9#7###9#9#9#1###9###068##8#91#91####9#####1#7###5##2735#####0###75##0#1#608#0###0S
-S7314677#2#686#3#6#16045#519#6177971#80978#5831475#213#84420#87383#946438279#3792223#425#395#6#14040#022#352#222#9#4#424#9#586#11477#5#152#0#3#1#8#353953157032266318589#4#2#2105279#979256105#86441#2#6#985#475#578#14289#648#8407144#6973760#3#118#177#7S
-S3#6###1#4#6##38#3#2###3####91#6#6#5#0###5#######070#2######06#####6####1##1#2###9###3#8#5###3#####4##9##9##39##03#0###5######2017#3#0#####5584525#3#7#29####1#54#0######368#2#####9#3#53####9#####4###2#2##2##3956##7###8#1876#6###78#5###4#8#6######89#0S
-S9#4#59007#086#9#5#940#517#41199#424#9#12858295194#9#2893941#5875242#91842#3#9#313#992#0#925#41829#9#991#33657#715#761#4#832287441#8#5519401#0#9#9972189#00669#116939871#859#3424730#350#834765871#46512#698#273#50962#573#0#945#17734#920#7#878#740868312S
-S252#1#####5#7#9#4#######8#######2#5#5#1#4#02#####15#4#####73#####09#245#2#7#0#6###1###8###226###6#5#9#9##0#8##8###3###1#6#######3#99######2#5#8#5##02#7#6#######7#####0#59##455#7#4#######21##5#3#46#####74#1###1#506#6###6#6###5##43###0#1###7#2#3#4##50S
-S971#4#58688#290#2797631#187#86810#6#5#1#6#77481#3702294#552#12560#5#1#392#178110776131661#2656196#2#7#25494#3#552#4#5648511#221#20742683278#776#14680#6#6#9511267#27792#72861#83070916844#3794045#3875909#3534454#0#8214510881877#5109718#497#9#214#93412S
-S87324###57############1#1#306#239#3#0#933#####8342##4###1#7#6###5#9#0#9#77########9#8#0######96#1#2#1###0#1#5###7#984##3##3#9#4#1#1#15####4#7###70##3#8#8#2#4#3#790##0#18###97##00######9#9#2######33#2#341###6####0####6###0#######3###4#####4#3#9##2#95S
-S6#3#62956#787#73934#07724#75079#86467#8#643#494#09408#338#783#4#12193#6#244367361#38308#153752866#90122#9#232#8#551014481#85593#402#7#9060043296475#75589540405#4#828253980#91911#583504489#8#89361#249#7#5#626#480034437#46286300106#3495102#4#5#09016#6S
-S7537##0###965#80##8#5#6#8#6###20#2##5###6#795#5#6###6#5###6#8#324###339190#5#0#10####58#76360##31#8#9###5###1#1#1#####5#5#7#7#3#31#61#9######9####6###8####26#0#8#####7###1###35517#9#02#83#01##1#889###9#329##054####1####7#7#########6#7031#1#059##15#6S
-S2#1#2535446#406#51494#706#534#63131736978#094#118#8#7#8#317#893#23729572756244928#85058#2#0325142#8603312#463#5#68328#7#5860493#96690319298#406843438#8#4256135#475634729#307#997#9#9612527#999#9#479#56662#542#280#004#466#635167151056133#031#200#985#4S
-S##1#845###8#####6######96###8#6####4#####1#####8433#2#2#####9#28##41######821#######9###0#1####9###6##8###277#4#####5#9#1#6##1###73#4###862#2##49###242#1###5###0#5#5####67###7#0####6########0#1#1#47##355###3###2#####492#5#######219###7#352#68######1S
-S119#277#948349137796956#0#592#733736928#81751#537#8#9#8635745#404#35594#860#016#845#28694863083#14318#8#1#72805#23670#20887#446763551820467#639#8#41440#190285921#980#697#3#586#777#5927758856792#3#643469289#492488912#78107#352#5#08211#00563#040#97901S
-S8319##9#7####5########99##31####7#8#1#371###0#81##2#9##9###5##248#####6#4#70##2#7#1#7#########9#4#6#7#7#8#4#####9#5#2#8#7#487###0###9#####2###4036##########1#97##1###5787726##9##8#6#0#########0#0#5#5#175###3####0##979#379#8#5#3#4###5#2#82904#360##45S
-S6#479#0#313#298#1426104#155#1#885#580#068#88973#4#77656253929#7#71923#093#278217147#715567797#75059#1#10827#27347#0#028#9757112#17944#3320450#84438#562294525#879#449918717#01194#8#7#1#511002318#2#81692#79143#79970#9#0#4#4#7#4436270#245#0#96111#8#1#5S
-S0#5#33606#1#9#2#4#764#5#1###3#0#5#####5#5#######1#8#####3###51####381#3777##2#####812#8##87#9###8#4#8#5#5###1#####5##4##7#8###6#6963##5#####9#9#9#4#6#######2##3##6#2###16######5#4#7#2#7###8###76######3##0####9###9#8#2#6#780#376###171#3#0###2#0#520#4S
-S8#681663461#2#392#8#5#398#54099#78805#0676928#401#9764603#524#48243#4#460#3102992#48903#982#2#61712#417#10173#341#053224802#748#1#6#300#84745#982#5#9#2970380756154#303#3708466#5870608#2#06070#745150063#82827#828#132#1#659#4269880#1#5#8#033156734#0#3S
-S5##52#######4###415#08##1###4#1#8##0##3#4###9#7##1########4###0#####66####5#####1####7##85##0#771#########6#31#66##67#22##7#0#2###0###0#4#1#1##94#7#8######5##0###5###0190###5##2######16#4#567#####7#8#8#2##55##85##14#8#33####3#9###2#4#2#####0####73#6S
-S6#58852773967#707#2#74891255365#741#640#00705#05192313938#41482#939#9#342260656#454#743#762#484#2#911#44312#65349#3#1#82133#1#5895423#2#4#5#4#3#6#6#089239258#006#4#67829#526239871819861#529#60737#660595601#7990811#9#717#0852091#8162792060128812722#4S
-S7#7#####2#0#45950#3#5###1#####7###3#8#125#####4#5###0#075##8####1#3#4#0#####2#4#3#9#9#3###7#8#####3#6#3##5#4##3#3#0#568#0###2#6#2###8#6###979#1#5#86#10##9##6###5##91#6###3#5##3##9#28####7#7#4#319#4#2#5#1#5#7##37#0#4###2#5#67403#0###9##7##7#0#2#####0S
-S4#71225#8#497#3#635#2#1#2273393#494692426#47604#6#284#910#7324891#276#9650309#85136#5#693#1#0#041#44926#8572976#1#9#8#0#420#180#56445#74955#464#3#113#89353#188#84777#05938#1091348#3315713#8#332#412#1#180#561#80056#480#0#639#910#9#428426915#1#9315396S
-S541####15#####137###6#8#########0#3###0###357##9102###1#8841####7####39###9#6#2#6#1669##4#3#5#7#7#5###3#9#1#7#3#569#3#1#61#95#4#0#6#0#1#####393#5###7#3#0##19#1#4#36##0#4#5#0##63###0#####0#8####2####3#0#9###3#9##1#59#446#0###4###5####0###37#7#1######S
-S589#962#8#400#43404#677#763#4#069#489163198207523#69860#316#1252417317945596005#730#300#858#047#1#00571#8#5#1#44190#271#344#74789#9621430316143#173#9#934#10805#522#84918#070#8587529#43015#8#50071052438#05649#620#222#3#70297#251#441#37673#620#4509208S
-S8###8#1#2#0#7#8###66#34#9#84886###2##90#1#0#####1###########1###2###0###67####4#821###2#####1##50###94697#3#725#8#1####7726#8###9#####3##2##6#####3#1#8###1#1###8#7#3###058###0###9#6####68#8#93####6#####4#4#####3#4#09167##10#4#9###0#1##60#29457#8#5#3S
-S9#781412836#524#3#040#000#198#898#277#4571297208027974115#7192878#725#721#1494976#793#267#127926052#35826#8#58543#7212813#2309020#475#8869865975574#7#1#473#9#085#352#61687#811#284#9122085#6431716714665006977#9#396#9#19338#5#65418#321#0#7#2#599#3#4#1S
-S##6###936#2#7###2###7#0#####569#4#525#####4###1#########3##6#3##0#6###420###0#6###60####0#43##8##9##0#####4###8####58#0#####6#6##691974###6####03###42##4#1###124###6#6#3#4#4###1######2##8#####1#86##3#4###4#7#5#####0#####3#8#0#6#####4#5#9#8###9###031S
-S701#898279314#91692740259#359#1#311#1129966#77962#2000329#64609#3#2#504#97792#2392231#693#8#5#12457#72600#1#381#3968246679094504774712039#4#844#045#686#5806646#8#746#964#6#456#3#59628#9217233#9#37621#1432728#4#907#851149696#1#434002136#355#991738971S
-S7#0#36#3#5##9#6#268###3#3#7###1###5###2###8#3###005#16####1#6527346778##6#6###0#96##4#1#553#8###6#4#####4#0#####36###34#1###0##02#8#79#22#8#9#8#7#5###6#7#####188##3#96#4#7#9#9#63##8#5#7##0##437#3####3####9#3#5#9#1#3#9#8#####3#6#0#6###4#####4##999##2S
-S0#1#2#1090201#8#6#889#328#3#852#8055719434586#134282788#722695532#6#7#14293#24184#032#74623#93108#32713#1#59899#8#39381#0#75141#853#47349#1#7#259#05907829619#3#5#643#4191943#9#177#8#110#82193#5#8#850#843#5#288031031#06585#197#84321#548#00667#510#812S
-S2#0#2#3###1#####9###1#####714#8#1#####3#4#8#3#9##2##0#50967#3#3#1#1#5###5#3#2#0#0#197###1###367###2###2#3###1#3#72#93#8#3##8#89#0#5#8#2##32#5######26#######1#936#8#0###272###7#6#5#81###6####4#9###1#7#8#2#0##17#5713##8##7##0#02######42#39#####6#5#00#S
-S3#152#5#171#0527960#64723#43366#67206#7989316#50435#5#16934#915#81401972748#4037945#8#99884#2#34173#627#0#528309592#419#8157561890994#92688#2769389931535161838#888#3#067#94573#218#386398419#3#18140#3#8#59905#0#139#647882513#3790413#94928#80196#0#0#4S
-S7#1#7#532###7#95##08#8##52611#######3#3###1#8#9##47#6#####9#79####8#2#3#######79##6###4#2#3#7#4#4#5326#638##4#0###9#469#1#6#2#5###3#777#79#8#088######3####0##0#1###1#3#0#0###3#8#####5####71#7#####860#99######53#34#####7#1###6#####6#2#79##0###125#4#9S
-S9#65217#38869#91549#19896#4#4720860#2#69075#474#95360#154#2#59005#0#8#43528388582#3764079#4944493#9967987#733#387#278#24155#53577#2#0#3#7127745#725#2#9#77057406982#7#145#0693665#516#5727304#7949626#4#868626269#4#9051011#68990#79266#25433#79310#0#176S
-S81#07#######7#3#5###7#####09##1#5#547#####986###7###5#1#4#8#####3#2#5#5#########5#3###5#0#01##2###7#######3#####17##2#82##5#7#8###4###5#43######1#3#4#1#3#869#7###4#96043###1##0##6#5#6##8####1##9#20#007######3##8#73##########056##5######6#4##50#2###5S
-S3#96439468341#0#83085973964#41294#98423#459403151#565#4#319#51397#9#7#30860#74441#20239#775#231#87533551743#1596845#7#381997168228200564366259509#526#0#278#7#445#8#0#3#26351#09457#10621#66667#86505#690#8935473612143#106860007#78695#1650599#061#130#4S
-S0#8###9##2###00###583######524########7#1###4#6##91###08##0#2#1#5###281#637#2#0613#3####8#7#2#9#0#0#######176#####715##45####41#6###3##9#4#######26#3602##521#8#8###2#0#######803##45#667#0#0#1#4#0#2#####8#5#1#7#####7#3#0#######9###2###3####4#0####9#1S
-S268#0889377734818#1572167150475966151#8#709#3#4#5422553508588#6524859#0#213#9#36475285829#44882#821563923#3#2#52729#639#2956028#00388#89982#01372#042#433#45992#99949#9#778314006#3#8#3#975#58563#38706#0709124#0#697#9#8#069786388640018357791557291#759S
-S17##556##2##5###1#6###########6#2###0#3###1#3#6#1#########269#1#0##79#5#2#4#6#3#############8##24#553#3##48#1#2###5#8470#378659###328#####4#50467#7#9###4760##83###4##6#9#0#4####8786#1#########7#4###12##6#2###5#8#0##873#####7#0##1###6#0#5#2####42###9S
-S6#373#1#2889107#5#2#17397#805259995#7#48882#837420335261710#3#1#19186#7#058#0#78411#651054518#7693948#0#855#16836#241#1364336#80759#64134#95057#4#795#054#139#43085#665#875#9368026#47485569095#2#88826#13479#0#2#1738542#115642457#666#203#018#848#28721S
-S2#6###8#7###1##5535#2###0#2###9#8#3#3#9#######5#1##6297#77##0###3#2#9#5#214#0####64#3#########0#####8#6#32##8#6#9#7######4##87####743#1#0#2#####9#9#4#9###4#2###9#1###0##10#######2####6##9#0488#99#2##07#37##4#1#2######5##4###4#####89###9####9#6#26##8S
-S1#110#041#4#7#463#364#9#169#7488823#24862472833642604506152#97428#5#049#9#4#1878129474672#385#09506#2#78422#666#5#944#56292529300768938#0081943#155#3#0873324#189#9149566#6798730#85334574528#89231#3510482309095#5#71133#191#455#594#1#43745#1563874#8#2S
-S7#2###3#3#99824##7##3#7#####9#0##89#1#3#6####91#####4#8#4##30#1#######2#663##44###6###6#8#8#5#####1#1#9##706####85##3#78##2#2#########2##6#4##2#6#277######02#913#396###3##2#07#7#94#246####2###17##6#6#1#826###0#8##03#1#2#1#5###5#9#717###617#33##574#7S
-S83898#8#1#2#286#88542901098#14909#737#5204943#6#22786#415#04692916440#755#6#906184459#032#5#017#669#279#4226272#639#738#069#2274825#636744805#6#6#935#02632#5491820#3#6888112#0#8#602#3#856#3#46311#1#06170#158#7#01611#40700#16131#983#177#647984932#8#4S
-S##7#7#2#331###809##2##0#########6#0#####8#8#583#0##734758#3###9#6###0######883##9##77#6##47#1###17##64#68#0#8#1#7#4##5##0###7###74##0###210#8#1#918#642#####0#6#4#5#4#8#0###7#525##3685#4#4#0###0##84#5#499###6#5#2####7##677#4##7##5#####6#9#1#3##3##1#7S
-S763#149#8#8443943#51431#7909430#672#3#850#8#25090#95261#218#694#7#24144028293#7#722#5#6#722#97767#4#47590#234#707#92422#721#56415#386#004#587#6#756#9#963#656#1#084#18976#35933#84582#8#1#9559258#95384#64910#6#1#7354296#608#4904203#73369#609#8#9#19069S
-S0######11#4#1###759###8#887###05##0#5#6###5#####5#5###3###0#9#9#8#2####0#83#0#7###9#0#5###9#5#4###3###140###2#####2#947##49#####9#7##4##3#7#5#144#7898##3#421#3#6##2####1#0#####2#62#5932##380##360###3171##5#24##6#3###3#4##3####0#432##4####235#086####S
-S1915767#353#800#3#1#1#913#72818297966#5#289716325#984#28997#9#348540248#832#148#7#661#688#8#9#8#49233518641#5232067#1#362#23414#8#3#7318229#5#796636408#337#1750578078801#9#892#550#371#92796767400#8#6#298#5#115#9#3#1#305#628#2#9#9#0#302#6713681#76257S
-S#66###2#9#330#284#9#6#####8##2##2####55#97##510#5###5#2#6###1#78####469#0#####6#3#9#####8#2#6#8###0#8#####1###2#9#9#0#######4###666#0#4###8#3#102#7#0#5#7#49####7##98#8###0#623#925#8###5######9#3##1#624#9#####5#7#1#7#4#1#1#2#9643##78503#7#6###6##8#63S
-S01781#4#6#411#330#144#6371781#992352402#1#175#23361#03678#244#63648#7#2#87739#3#2#301895049#4#46548#70986#90453#4#407#03182#20355#78215#45885466661106940#4917908#8009580#1#3#262#4#561#0#4#811#827030346#37458#597#2#38019138625#641#7505365#41407#8#275S
-S75##7#6#6036##9####56#50###60#4#3#6##1#4##6##19#8#8#6####96#6####86##56#####8#3#0######1###88####4549###0###1###7###024###6########0##0#2#6###6###4####2611#2###4#6###775#2#7###8#3###1#0#044#7#0####2###34#3##3##4#1###8#####9###3#2#9#7#####2#4#6#2#8##S
-S9280406#0#214#20221#114#394#3#5#2#993712122074203#63418#307530984#390813870#289397326518212#867#0473311#76865#459#096#217#57289389067#227#8286941805902355004#086#0#8#0#508#2#5#365#81176#2#8#624#8229179#2#2900290#625#7#8720952#7#8#4632537#313#927#586S
-S701###5#8#####16##3###6#5#32#93#9#6#4#5#9###8###2#8##486##0#2#9#1########35#5##9##9###24##1#3#8#7#####5#9###6#87##2#9###2#5####68#7#3#3#847##4##06#7##5#2##1#87###0#0#7#4###6#8##4##689#8#6#2#0#####8##06#####808#####9#0#1#857#9###1#7#####7#3###7####74S
-S1#53054#83042#96604#607#5#5#6101166#30534#106#257#6991464#889#0445369384011#51131#7#71212#376#3#1#992478080#1#7#7475269#312455135017218#2#9420546044231#5133602#4#947#520#053#248768811#6#13828392163#1#1#95290#50930#9#251#5#0#380#57934#791629421599904S
-S8#1########25#3###0#4###8#4#57##76##0#087#9737636###78#75#####92##3#64##5###4##28#749###1######96#4####7##6#397######4616#####3####81##21#2###5#####951#6####24#1#339###9#2###3###64#82#99############5#7#0###4###4#855#6###0#2#5#4##5##0#2###2#0#####2##S
-S643717939#3834262#0#235#0#972#072#962817225#5#765179286708952#192#1#0#09239466840#1#502#776497554#4#16584#7#3#042#9948167#08618285078#793#320#80017#0#9893084#5583177547311#13923#9#853#349#59027#74634#7231292295496#1#26346#637#13636#769#3982062#60719S
-S6#####6#0#4#####0#9###995#2#765##9##1#####6#0#0####3#######396##776#0##93##9##8#9#4###96#7######364#3##4##9#9#8#973#25#6#63#689#0#0#205#####4##04#9##9##1##08#4#6#####2#394#0###1#8#####6#7#76##7####04#1###8#####50##6#44##9###73###42#622######27#####9S
-S071#089#1#6476848#69926#422#5#56029#172#630#2#731086150232969#723#1#218#3#26089#2#952#528405260#5#7#687#1738485#91369908229#549347845#1#313#21762#66786#213#1#521#4631458#1063366#060#44805#519#503#666#92047504614#161#108950587#514#2#64683#1#354919036S
-S##1#5###0##8######821#14##9##3#6##4#0###4###5###########2##4######487#8591#39##46###7#########6#6#4#4#3#2###2#1###6#72######0#2##337152#487#0#77######4#9###718#5#4#0####43#####5###4#9#4#6#7#5##57#5#13######10775#4###############9#49####6#565###13##8S
-S766#064#428684804#009#5618200673507#35974#752#2785724#49178388744#56302#53752#1#5181014694511#10971#208#962#4#64585#150#94977433327#20624#57439#12621#413#829#801#4#78376#83923#390#3876275#6#134#903#559319266#5#9#018205272#4432654#424#101#084#722#475S
-S2##4##2#4####71#037###6###7#8######2#01###7#406#2##8##5###6#0#4#1#8#98####8#7#3#10######93##3#9#0###5####99#3#######984#1#####5#1#####540#5#6#1#####4#5#333#546##7######4#3###96##5####6081###5#1####845####9##74#5#5#######391###3#####6#08##14##78##8#4S
-S33030#788#806#903089967#8#5#4#582030681#022#7#0#44693#8#54201#9#228#2223120#53323#21190#34306#4496732#75648#3639453#1#931#1391102#63718#257#753#4891164#6#770#97883843532#96779#7253541#9#109#4#239#646#3525357307975546823#2#5625059761945#088#343#7#5#1S
-S0##41#6#3#768#4#####3###4#5#707#3###9#3###2#228234225#3#6##2071##35###0#2#####7#3#4###0#7275#########59#######6#507#6#####1#3#####3#19##4#6###2#7#5#7###859#44###7##########4#3#919#83##703#9#1###5#8#775#########148#2#####309396##57985#050###40##0#5#4S
-S11927#6#232#766#911#650#26565#3#478#962#450#61421#0#12069#113#426#3#9#2#543#320#313#41791#2#2145727668831#2735393#732#1#97465#20960#7#030#041#1#2#5#1#079#7#2#257838460576783#7#5#61064#620#0#6#6#5#23606#6#70844#1#252274581#5#81124#213#1#84932160671#6S
-S##26379#######4#766###862#0#8###3#3#####5#9#06##2######6##2#8##58#9#350#5#5#1###0#########5#0#1#9###2##171##1##9######830#1#9#2#####709#8###7#3#7#0#9#2#3###5#64##448##2####2#7#4#####3###2#4#1#4#1###2##60#7#3#7#88#9##0#9#2#6708##8#7##84#4#95##3#6#589S
-S267#7#08167#2#861#276#0#122#88723#167276501#334332616#88407952871#1661109#0#545#9146554#92650#02451#13970#40650727151#375984467#96112#2#157#43826#3#615553079#943#6#3468643#8#8#180#587848390#265#6#111#64929#27138943131#083#5#4#93423#762#5339979#7#3#9S
-S0#4#3#5###0#3####1#78#2##419####040###0##14#981#0###0#2####4######0###5#2#1####27#####2#8###4#####0####3436#########4#####77##4######03#7#4##4##1#2#9##########3##4#4##01#648#7##44#0###61######978#57####18#80##9####5#5###3#814#6#4#2#5#####0###5#6#7#5S
-S8#790#343#56880980973#209#490756578316491582258020187#893821149#194076609#66942#170#951#988#17731250279#8#9#3791865#042551089#386717354#2#1824081#6#418851501#5462195#329#8396525#7#1#58273#24846#1#834#99366#3366842303254946909#101#4438080#249#98158#1S
-S######4#30######1###3###3####58#0#2#####63##04#####1##########8#######62###43#33####5###6#7#887#7#7#0###6#52##7#6######5747#4#1#194##2##5##20#####81335#####408#8#1#510###871##52#0#42####4#4#8###73##9#2###3###5###1###6#4#9#0#1##520####5#0#0#7#0#####4S
-S5228365#353#36304#190#39096#320#066218244#71012#53732870782780394#428#4#23586#0444164#1#182#406#593#91104#306#1#5#9672950#0#885#1#2#237#4#052#456#247#9#851#8#918#89886#99553#72387#2#605#9#9#5478591#9#6#9#08559#002557081#1#39492632760347332#4#4#64361S
-S4###890#5#3#9##3#86###24##0####43##42#######2###87#057######0###7#1#5##50#270#5######09#52#27#7#4#####42####0#4##8379#######44##3#6#404#9#540#7#0#####2#48726#2#5#2#8#5#7#9#8#6###782#0#28##5#1#76#0##8#6#9#3#####1#9#####838#1#70####8#4#1#7#61##204631#S
-S8#425#5758538#301#4#66586#102#338#25665562993538416#8#5#6808887#113#22609#0#012#602777265#24024#2#354745891#8754899#8581368#538#528#14421#8#701114034#1#3#8#38959#4#343#5166522#8213261#61749#3#2#719#144#044623436#6#6389992#874#60534#64372#47255#3#907S
-S3#4#9#####9###7#168#7#1#####6859######4#####7#8#64##3#6#6#78613#57#9#2##3#1#912#6###54##0#4#1###1#7#8#######9#1#####2#7##48#####8###5#4#0#152#1###1#6###2#1#########0###9#####9#5###0#########24##7#7#74967#0#####0##01##1##7###1##64#4#2#####8###5###3#3S
-S9#9#08428881613#4363929#09180#8#90012#208540295#75826#518#64217#0403614#37557#5#558#108#0672680#9#1#298#73749#0920785#163#342639371#7#5#75170#47829#52484#17204656783#573#909#5#3642492068669#5#6686809079712#048#814#589#187#9288050#4#7#1493892#1061383S
-S920###0#4#2#69##014#9###9###9#3#8##92#4#6#######76#2#8##73017#6#####9#7#8###7#5#2##9##87####7#3#1#1##12#4###7#2#6##5##0#8###1####8176#7#0##28#2###6###8#3##2#####7####86##5#0#5##2##########2#1#3###3#####7#6#3#435#7#6###7##59###47##8#3#6#####4#2#1###0S
-S6#0047445#2118105#1#153#162#1#456#096#00996#53837#436364287#4#0#10883864888#4#110#6560173539029#5#1#119#4#548#707#2#293#27997305135#4#8#0669412#6#5#730882379930129#5077043#9#2#0647698400569#23184997787#7#234#618#3935431#6611617987537#3#022#6#1#467#4S
-S76##38####2#8#7#7#530#3###0#####6#7#5#######9####03####1##0#9#5###9######8597#####10####61110#0#6###6#4#6#622##7##1#1#9#####3#8#3###5#3###9#####0065####1#####2###280#2###0###9#5#4#1#5####5######3#1#####5#414####7####4##50#89#####92#41380#881#1###40#S
-S041#0#038#75381#9#029#01639941423#011#7525848#18499#796079242#434#1#6224715#1#5165472468308#8#1536023#5#0#3#8#8261097#986#630#8#0#494#2575056#13792#54495#2488938#7185306#279839636#3#6216381295895042546#573483307379434#676#5#279828749#627#2#77425#326S
-S##3#44055#1###01#09##8##6###7#369#2###5####9#1##8###5##8600####47#3#51######465######92#######1#3###0###2#8###6##1#4##7###9####8003###3##42#2#1###9#435###3#####2#6#####7######7##8#18####6##99###8#####4#7#####9#94##6#2#61##6#5##7##7#4##6#22#5#5#3###2S
-S512#42728#2#337#022#399662355#9#47404#527#5100966#7900045#032#37238#990#19911#8748188#5#7418216#644#7#243#885#4#2077348#904#17950#29490#400#948#460#64721#8#23327#96694#660533231#5#94394#937#2#18583#897#5304888#1#7#7#7#518#0#864#169#826#2#5#22811#623S
-S2#1#####3#3#9###5#135####15#1#5#5###9#9#6#6#45###53#5##3##5#8#8###22##3#69##24####8#4#3#6###8###7#5#549###2#9#7#4#920#4#0#1#16###02###4#1#6###983###9###3#6###13###1##2#########8#0#####7#####7#3868##3#8#5######11#0#274###0#6482##7##4##5#700######89##S
-S4#0341513#11411#8#20441#237#5#848#27117#279#338387132#509#5#437#8952850#4#3612189#0#6#2#375577450#33507#70714#460#875#059#303#162740733#0501906#148756581#538#4573944#2416186367708#337#3622109#4921660#096#044331129#5#652#9#562#069#836#035#8371913#672S
-S5#63######9#6#3#2#7#3#4#552########16###0#######43####3#7#2##7#0031#409#814#####8###9#2#####9#8##4#####08##64###6#56##049#8#882#########7#####9#423###5#3###2###0###4#####1###2###784#29#1###3##4#1#####4#####8#5#3###3###4#######0###1##11#626#36##83#08S
-S5#4#0189203#2#5#2#747#2#8#939173702574815#37812#6591609#3#6520256#107#9#1#6279939#517#19904#0#7310257181849024454#3#858#297#577#9#956899756#61275#9#200848493#55996#8#09714#004223375#042645016#4#5306277#291#3#390378601670972#55675#540#605#4#0#50695#5S
-S3#6#8#9##70#701#0#1#3#7#0#####9###6#####2821##9#4#####6367####882#####8#7#306#####5######2262#####9###3###4###62#7008#7#####7###4#3#####8##38#####4###6###5#2#1#5#7#8##2###66###8#2814###0###560472#####248#9###4#2#####5####14#2###1#9#8#0#643#9#####0#5S
-S751044995#778#45506#3#4#427#944#3#0527467#1#9#9#321#4350490#022268641#4#439#3562639#0689190#261#86342#12325#9835789#1#4445492#416419054378684#79846#050#980#0190768#857539757#3#7#794#990640622#1#76112#047#06479#5#065#487#3567352#4#8#36237#4#699#904#0S
-S1###40##4###9#####1#0#6##01#7##75#5#5#22##2#6#0#8#7#961#63587#4####61#####4#9#1#####339#3####59#2#9#6#5#88721#9#7###1####5####8#2#1#5##51##0###34###9###9#3#75##8######7######2#93474#3#3#7336##2#0#0#1#####67##344#628###0#3#####669#6##4#66#0###2###554S
-S2988131786666#1806876#36393#0#80186#7878401#4#010#7#9#218#672#194770272321192#1#93869#43579#906#170#8773828#560#845#58199#3#056#287#28657#46893#510#6#555#969#590#517#784#127359561#4#37958066575#5#4#9#756#0#393#845#79952#4#09860#6212943#14349#788#6#4S
-S2#9#1###3#0##17##3###40#####4#1###2#401###3#4###359##9##2##6#1###97#########4780132#891#135#89##0#2#9#####862##8##0#1###4#7#7###########4###1#9##5424#8###96#12#5#4528#58#3#########9###582####3##1#6#43703#0#5#971#######7#1#5#########8#1#####83##2#347S
-S71002223562#7375639#032#99166#56117#1#827#38449#6#0#10793#71203248706#2373656#46202#0#08691#1#484#4#67962#516#1#961069057#2475455221859#81802#66611#9#8#57380#4666861415832#3441283348780#9287459#547#287#2#4#4#137#5#56285#8#9#645#22747#41647#52682#408S
-S2####99####21#8##80#2#1#1#54#134##7#09##62##7##16#4#0###31##7###8#5#737####02#6#6#4#9#######9#3#####0#0#######9#6#######5####2######0##2#0982###7#9#4#1###237#4#8#1###6####64##6##9##3######4###3#8#3#7#5787927#3###5#7#02#72#8#161#638#6###7#1#########8S
-S6732099#88639#2#446#3#6#85350#831#46262#62712#9475583#9#706542821#3#0#96762#527#01961886405#7#02141#0491993837439#100#464#583#1642423#89050#0#1232989#9#24521#0#6#8#5#3#849#3#175409905#5187573#6#0#1#583#000#77117#397#06704#364#6#2#739#4#0#0#1886198#9S
-S98452##2###7##452#2#7#8#####7###3#52##7#######5##2####8#7#7#8#8###1####3##6####59#173####70643##2#9#6######0######6#7#####8#3#5###5#4#9#9#002#1#2#30878#16#59#7###6#8#2#1#6#5#0#78#9##1687##9###6#0#1#######6#7#5###23###3##8#8##53#0#####9#7##30#8###8#2S
-S074328781175958#10912#8979375#552#857207881796457777305765110#277#53760891189505392281726#2418184721631700285102747#919661567534557#338422748#03229#03937#18791372732#627#50615276486#3393277645596#11303702252#947230609341707286945176160#301528815#011S
-SSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSSS"""
-
-
-
-# QUEST 17
-
-q17_input1 = """*.........*.........*
-.....................
-..*....*....*........
-.....................
-....*.......*......*.
-.....................
-........*...*........
-.....................
-*.....*...*...*.....*
-.....................
-........*...*........
-.....................
-......*....*......*..
-.....................
-..*....*.......*.....
-.....................
-*.........*.........*"""
-
-q17_input2 = """*..........................*.....................................................*.............*....*
-........................................................................*............................
-........*.....**.**.....*.......................*........*...........*.....*..............*..........
-...................................................*...............................................*.
-...........*...*....................................*.........*...............*..*...................
-...*.............................*..................................*................................
-..........................................*..............*..........................*...........*..*.
-....................*.........................................................*..................*...
-*........................*..................*...*....................................................
-.........................................................*..........*............*.............*.....
-.*..*.................*.*....................................*...*....*.*..................*......*..
-........*................*.*................................*.........*..........*.....*.............
-..........................*.............................*...........................*........*.......
-...............*.*....*........*.....*..........................*.......................*.....*...**.
-...............................*...................................................**........*.......
-...*.*...*......*..................................*.................................................
-.......*............................................................*....................*...........
-........*............*.........................*...............*...*...........*.....................
-..*...........*.....*...............*............*....*.....*...*.........................*..........
-..*....................*.....*.....*.............*...*...........*.......*...........*.**............
-...................*..........*........**.....*.....*.......*........................................
-.......*....................................*.................*......................*.............*.
-...................................................*...........*........*............................
-.............*..................*.......*...............*......*...*.............................*...
-..................................................*..............*..............................*....
-............*....................................***.........................................*.......
-...............*..............................**..*.................*................*...............
-..........*.....*....*.......................*.......................................................
-......*.........................................*.*...................*..............................
-......*...............**............................................*......................*.........
-...*.........................*....*.......*...........................*............*.................
-....*.................*....*.......................................*.........**......................
-......................*................*.......*...........*.................................*.......
-..*....................................................**.......*............*.........*..*..........
-..............*...........................................................................*..........
-.....................*..........*....................**....*....*.......*............*.........*.....
-*......................................................................................*............*
-.......*....*..*......................*............*........................*..............*.........
-..................................*...............................................*..................
-....*....*.................................*...................*...............................*.....
-....*.*...*..*.*........*......*...................................*.................................
-.....*.....**.............*.......*....*..............................*.*...*........*...............
-...*......*............................*..............*..........*...................................
-................................*................*..................*.....................*..........
-.....................*....................................*...*...................*..................
-.................*....................................................*..............................
-...*........*.................................*...............................*...........*.*........
-......................................*...................*.....................*...*................
-............*.....*...................................*......................*..............*........
-..................*.......*....................*.......................*...........................**
-**....*.........*.*......*...**.........................*..............*...........................**"""
-
-q17_input3 = """*......................*....*...*....................................................*...................*......*..........................................................*...........*.............*..*
-......*.................*..*..*....*........................................................................................................*......*..*....*.*...........................*...............
-........................................................*....*.................*..............................*........*.........*................................*........**............................
-................................................................*........*............*....*........................*...........*...............................................*.....*......*...........
-............*.....................*........*......*.*............*.....................*..*.............................................*................................................................
-.................................................................................*.....................*....................................................*.......*............................*.*.....
-........*.......**....*..*......................*........................................*..........................................................*.......*...........*....**.......................*..
-...*.................................*..................*.......................*..........*..........................*...............*.....................................*......................*.....
-...............*.......................................*....*...........*..........*......*...........................*....................................*.*...............................*...........
-.......................*..................*.*..*.............*...............................*............*....*....................................**............................*...............*......
-....................*................*.....*.................................**............*..........................*.....*.............*.................*......................................*..*..
-..*......................**...*...*...*........*................*...................*................*.................................*.................*........*.......*...*.........*................
-......................................................................*......*............*..............................*...............*.......*.....*.....................*................*.......*..
-..........*.................*.......*........*............................................................................**...............................*........*.......*......*......*..............
-...............*...............*..............*.............................*................................**..........................*.*..........*..*......*..........*.............*..............*
-.........*........*.......*.......*...*....*.........*...*..............................................*.*..................................................*........*.......*..................*.......
-..........................*..........**..................................................*.................*.........................*..................*....................*....*.......*..............
-.........................*...*..*........*...................................*............*.*..................................................................*........*......*......*................*.
-.............................*................................................*...............................................*..*...........*............*.....*.............................*..........
-.......................*.......*.......*........................................*................*.....................*..*...............*.*................*...*.......*..*....*...........*...........
-....................................*....*....................................*.....................**.*...............................................*......*......................*...*......*........
-................*.....*...*..*.......*............*.....................................**......*.*...................................................*............**......*......*........*........*....
-........................*...............*.*...........................................................*.................................*................................................................
-.....*.*.*......*...*..**...**.....*......*..*.........................*....**....*.....*..*.................*.........................*......*....*....**...........*......*...*...*................*...
-...*...............*.........................................................................................................*.............*.............................................................
-...................*......**......*.....*.....................................................................*......*................*......*............*.*.........*......**......*...*...............
-.....................................*...........*......*...*..............*......**.........*.............................................................*.....*.*...............*.*...................
-......*...........*......*..*...*.....................*..............*.....*............................*....*......................................*...................*......*......*.................*
-....................................*.....................*...................*....*.......*..............*................*...................*..............*...................*......................
-.................**.....*.....**............................................................................*.............................*........................*.....*.....**......*.*...*...........
-....................................*.*..................*......................................*..*........*.....*.............................................*.........*..............................
-.......*........*......*......*..........*.....................*..........................*.*.........................................................**..................*......*..*...*.*..............
-..............................................*..................................................*.................*........*................*.....................................................**....
-.......*.*.....*......*.....*......*...................*............................................**............................*.....*...................*...............*.....*......*...............
-................................*.........*....*...................*..................................*.*.......................*........................................................................
-.......*......*.....*......*...........*...............*..........*.*...................*........*................*..................................*.*...*.................*.*....*.....*...........*..
-.............................................................................**.......................*..*...............................................................**.........*...............*....
-.*..........**......*..*..*.....*...................*..*..............*..............................*...*.............................*...*.................*..........*.....**.*..*.*....*.............
-............................*.....*...........*...........*..................*..........................*..............*.....................................*..................*...*.........*..........
-............*......*.....*..........**.*..........................*....*.*....................*.................................*.*............................................*.....*......*............
-.....................................................................*...............*....*............................*............*......*........................................*....................
-...........*......*.....*...*..........................................*.....................**.......*.......................*..................*.......*......................*.....*......*...*.......
-....*............................*.................*............*....*.......*...........................................................................................................................
-......*....*.....*.....*..............................*................................*.....*....................................*..........*...................................*.*...*....**...........
-................................*......................**....*.....*.........................................................................................*.......*..*....*..............*............
-..........*.....*..*...*...........*......*..*..................................*..................*........*........*...........*...............................................*......*.*.*.*..........
-.........................*............*...*.*....................*...........*..............................................*....*.............................................*.........................
-.......*.*..*...*.....*....*.......*...**..............*..........*...........*............*............................*............*..........*.............*.............*.....**....*..*...*.........
-....*.........*.....................*...........*..........*................*..........................*..............................................*....................................*.............
-.*.......*.....*.....*.................................*.................*......................................*...................*.............**....*..........................*.*.*.*.....*.......*.
-*..................*...................................................................................................*........................*..............*...........*....................*........
-........*.....*....*.*......*.............*........*........*.....................*....*............*.......................*..*.....*...*.............................*......*....*......*....**........
-................*....................*...............*..*.........*..........................*..*...*..............................................................*.......*.............................
-........*.....*.....*........*...........*..........*....*..............................................*..........................*......................*.........................*.....*..*..*....*...
-*...........*.....................................**....................................*......*......................*..................*..............................................*.......*........
-..*....*.....*.....*........................................................*.....**....*.......*..................*.............*........................................*..........*.....*.....*.......
-.........................*........*........*..............................................................*......*.......................*....*.....................*...........*......*.................
-..*....*...*.*.....*.........*.....................*....*......................................*....................*........*.......................................................*.*...*..*..*.......
-............*....................*.......*.............*.......*.......................*.........*.................*........*......*......*....*............................*..*.........................
-......*.....*......*...........................................................*...............*.*..................................................................*......*.........*....*.*.....*......
-.......*...........................................*..............................................................*......................................................................................
-......*..*..*.....*..........*.....*.....................................................*.................................................*..........*..............*....*...........*.....*.....*..**..
-*......................................*....................*............*...........*.......*.......*............................................*.........................*.........*..................
-......*.....*.....*..........*...*....................*...*......*......................................................*.............................................................*..*..*.....*...*..
-...*...............*.*...*...*....................*.................*......................................................................*...*............*............**..*...........................
-......*.....*.....*............*..................*........*............*.....*..........................................*.......*..............*.........*...........................*..*..*.....*......
-....................*......*...............................*.......................................*.*.*.*.*.*.*.*.*......*..........................*..........*.......*......*.........................
-.....*.....*.....*.................................*.......*...............*...................*.*.*.*.*.*.*.*.*.*.*.*.............*...*.*....*..........................*...........*.*.....*.....*.....
-.....*..............*...........................*............................................*.*.*.*.*.*.*.*.*.*.*.*.*.*.*.............................................................**................
-.....*.....*.....*.........................*...........*....................................*.*.*.*.*.*.*.*.*.*.*.*.*.*.*.*.............................................*.....*........*.....*.....*.....
-........................*.............*....................................................*.*.*.*.*.*.*.*.*.*.*.*.*.*.*.*.*.................*.....................*..................*..............*...
-.....*.....*.....*.....*.......*...................................*............................*.*.*.*.*.*.*.*..**...*.*.*.*..............*......................*......*.............*..****.....*.....
-..............*.............*.........*............*....*....................*.*.*.*.*...........*.*.*.*.*.*.*....*....*.*.*.*............................*............*.........*...*...................
-.....*.....*.....*..........................*......*..........................*.*.*.*.*.*.*.*.....*.*.*.*.*.*...........*.*.*.*.........*.......*.....................*................*.....*.....**....
-...........................*.......*................*............................*.*.*.*.*.*.*.....*.*.*.*.*.*.........*.*.*.*..................*...............*...................................*....
-.....*.....*....*.......................................*.....*............*............*.*.*.*.*...*.*.*.*.*.*.*...*.*.*.*.*.*................*................*............................*.....*.....
-......*.....*..*............................*...........*..........................................*.*.*.*.*.*.*.*.*.*.*.*.*.*........*..........................*......*................................
-.....*.....*.....*.................................................*..**...........*.*.*.*.*.*......*.*.*.*.*.*.*.*.*.*.*.*.*.*.................*................................*.....**....*.....*..**.
-..................................................*.......*..........*....*...........*.*.*.*.*......*.*.*.*.*.*.*.*.*.*.*.*.*......**.......*................................*..*.*.*...........*.....*.
-.....*.....*..*..*......................................*..*..............*..*........................*.*.*.*.*.*.*.*.*.*.*.*.*......**..........*.....................................*.....*.....*.....
-..*........*.........................................................*..................*..............*.*.*.*.*.*.*.*.*.*.*.*......*.......*..........*.................................................
-.....*.....*...*.*................*.......................................................................*.*.*.*.*.*.*.*.*.*..........*.........*................*.....*...*..*.......*...*.*.....*.....
-*...*..............*.................*......*.............................*.....**..*...............*........*.*.*.*.*.*.*.*......*..........*......*.......................*............................
-.....*.....*.....*..........*..*...........................**.................*............*......................*.*.*.*.*............*......*........................................*.....*.....*....*
-....*.....................................*..................*..........*..*......*............*...........*............*................................*................................*..........*...
-......*.....**....*............*.........................................................*..........................................*.*.....**.......................*.......*....*...*.....*.....*..**..
-..............*...................................................................*......................*.........*.........*..*........*..*.........................*..*....*......*....*...*..........
-......*.....*.....*.....*......*...................................*.......................*.....*.......*...........*.....................................................*..........*.....*.....*......
-........................................................*.......*......................*..........*..*.......................................*.............*.......................*....*....*...........
-......*.....*.....*...................................*..........................*......................................*.................*.......*.*............................*....*.....*.....*......
-.................................*............*....**.*.........*............*.*...................*...........*............*..........................*.................*......................*......*.
-......*.....*..*..**..............*...**.........*.*.......*...................................*......*.................*......................*.....................................*......*..*..*..*...
-.........*.........................................................*...........................*............................................*.......*.............*...........*....*.....*...............
-......**.....*.....**........................*........*.................*...........................*...................................*................................*...........*.....*.....**......
-..................*...............*................................*..*.....*..*.*.......................*...................*........**.*.................*............................................*
-.......*....**.....*..*.......................................*.........*................*....*...*..............*..*.......*.................*......................................*.....*....**.......
-.................*........*.....................*..*.................................................................*...........................*...........................**..........................
-........*.....*.....*.............*....................................*..*...........*.....................*..................*...........................*.................*.*....*.....*.....**.......
-...*.........................*...............................*.............................*.....................................*..................................*.........*..........................
-.....*..*.....*......*.......*...*.....*.....*................................................................**..................*..*.....*.*.....................................*......*.....*..*.....
-........................*........................*............................*..............................*...............................*..*......*..........*.....*.......................*....*...
-.....*...*..*..*.....*...................*................*...........*.............*..................................................*....................*......................*.....*.....*.........
-.......*...........................**........*..........................*.........*...............................................................................................................*......
-..*......*......*.....*............*...............*.......*.............................................................**.........*.....*..*...*....*.*....................*....*.....*......*.........
-............................................................................................*.........*....*.*........*.....*..*................................*........................................
-..........*...*.*......*...............*.*................................*...................*......................................*....*..*...................*............**.*......*.....*..........
-......*..........**................*...*......*...........*.....*.*...*..............................*........................*......*..........*.............*.*.*.*....................................
-.....*...*.*.....*.....*...*.*................................................................................................*...*.*...*........................................*.....*....**...........
-............................................*..........*..............*.........................................................................*...................*...............................*.*..
-.*.........*......*..*..*.....*.................*......................................*...................................*.....................*...................*..........*.....**.....*...........
-.................**.................*....................................................................*.*.......*.....*..............*.............................*....*............*................
-............*......**....*....*............................*.............*..............................*....*..............................*...........*......................*.*..**......*............
-......*...*................*..........*..........*...............................*...............................*...........*........*............................*..............*...................*..
-...........*.*....*.*....**....................*...*...................*......*...........*..............................................*.............*........*.............*.....*......**........*...
-...........*.........................*..*......................................................*............................*.....*.............................................*..........*.............
-...........*..*.....*......*.........................................*.........*..................................................**..*.................................*...**......*.....*.............*
-.....*............*.................................................*....*................................*...................*..........**................*..................*.*........................
-...*...........*......*.....*..............*...........................................................*.............................*......................................*.*...*......*...............
-............*.........*..............*.............................................................................................*..............................*......................................
-.*..............*......*.....**...................................................*..**.....................................................................*.........*...*......*......*................
-..*...*.........*..................................................*.................*..........*............................................*....................*.........*............................
-.................*......*....*.*..........*...**.............*.....*........................*...*............................................*...........................*......*...*..*................*
-..........**.....*.*....**.....*...........*................................................*...........................................................................................*................
-..................*......*...*..*....................................*....*.............*.....................*......*..*....*.......................*.........*........*......*......**.......*.........
-.........................................................................................................................*.......................*.........................*...............*.............
-......*......*.....*......*.*.....*................*................*.....*...............................................*............................*.....*.....*..*......**.....**...*.*............*
-.............................................*...................*......*....*...............*..*...............*.*..................*.....................*................*............................
-..............*.....**......*......*......*........................................*............*....................................................................*......*.......*..*.................
-.....*...*...*...........................*....*........................*..........................*..*....................................*.........................................................*..*.
-......................**....**.......*...........*............................*.....**...............*..................*...*..........**............*.......*.....*.......*......*......................
-..........................................*...........................*.*..**............**......................................................*.............................**.........**.............
-........*..*.........*.*.......*.......*.........**.....*....*......................*............................*.........................*..........*.......*..*......**......**................*......
-...........................*.........................*............**..............*........*..*........*.....*..........................*..*......**................................*...........*..*.....
-......*..................*......*........*..............*.............................*.............................*..........*...............................*........*......**.....*........*.........
-...........*.*.............................*......*..............................*..*................................*..........*.*...................................*..................................
-......*...*.........*.....*.......*........*....................................................................*....*........*.........*.................*..*.*......*.......*..........................
-..................*.....................................*......................................................*.........*.............*.*........................*......................................
-............*........*......*.......*........*.................................*.........*........*................*...............*...................*...**..*....**.*....**..*..............*.........
-.*..*.......*.......................................................................................*.....*.............*....*......................*..............*.....................................
-...*...................*......*.......*.*......*.**...............*....*...............*................*.*..............*...............................*......*.*.*.....*....*.................*..*....
-....*.............................................................**.......*...........................*.......*......*............*............*........................................*...............
-...................................*...............*.................................*.......*.*...........................*.....................*..*....................................................
-..*...*......*........*......*....*..................................................................*..*.............................*..................................................................
-.................................**..................*............*..........................*...............................................*..........**..................................**......*....
-.................................*......................................*..............................*..*.............*............*...........*.*.............*.......................................
-................*..............................**.*...........*.............*.......................................*............*.....................*.................*.......................*.......
-................................................*.............................*........*................*.........................*...........................*..................................*.......
-......................................*...............*........................*....................................................................*....................*...............................
-.........*...*......*.....................................*..*.................................................*...................*..*.........................*..............................*.........
-...........*.....................................................................................................*.*.......................*..........................*......*....................*..*.**
-*.....*...............*...........*............*.............*.....................................*.........*.................................................*.....*......*..........................**"""
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + input_names())
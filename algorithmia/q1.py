@@ -1,28 +1,116 @@
-from collections import Counter
-from textwrap import wrap
+from functools import cache
+from itertools import product
+
+import numpy as np
 from input_data import q1_input1, q1_input2, q1_input3
 
 potions_needed = {"A": 0, "B": 1, "C": 3, "D": 5}
+# extra potions for a fight, by how many creatures actually show up to it
+group_bonus = {2: 2, 3: 6}
+
+EMPTY = ord("x")
+# line breaks and such in a battle log aren't spots in any fight
+SKIP = b" \t\r\n"
+# everything else a battle log may hold: creatures and empty spots
+KNOWN = "".join(potions_needed).encode() + bytes([EMPTY])
+
+# Every byte of a battle log becomes a digit: 0 for an empty spot, 1, 2, ...
+# for each kind of creature and UNKNOWN for anything else. A fight's digits,
+# read in base RADIX, then make one number that says all there is to know
+# about the fight, so a whole battle comes down to how often each number
+# turns up.
+UNKNOWN = len(potions_needed) + 1
+RADIX = UNKNOWN + 1
+DIGITS = np.full(256, UNKNOWN, dtype=np.uint8)
+DIGITS[EMPTY] = 0
+for digit, creature in enumerate(potions_needed, 1):
+    DIGITS[ord(creature)] = digit
+
+CHUNK_BYTES = 1 << 24
+# a block's digits and fight numbers are worked out while it's still in cache
+BLOCK_BYTES = 1 << 18
+
+
+@cache
+def fight_potions(fight_size: int) -> np.ndarray:
+    """Potions for every possible fight, indexed by its number; -1 for fights
+    with something unknown in them."""
+    costs = [0, *potions_needed.values()]
+    potions = np.empty(RADIX**fight_size, dtype=np.int64)
+    for number, fight in enumerate(product(range(RADIX), repeat=fight_size)):
+        if UNKNOWN in fight:
+            potions[number] = -1
+        else:
+            creatures = sum(1 for digit in fight if digit)
+            potions[number] = sum(costs[digit] for digit in fight)
+            potions[number] += group_bonus.get(creatures, 0)
+    return potions
 
 
-def potions(fight: str) -> int:
-    needed = 0
-    if len(fight) == 3:
-        needed += 6
-    elif len(fight) == 2:
-        needed += 2
-    for creature in fight:
-        needed += potions_needed[creature]
-    return needed
+def chunk_potions(battle: bytes, fight_size: int) -> int:
+    """Potions for a stretch of the battle whose length is a multiple of the
+    fight size, in one pass over its bytes: each block is turned into digits
+    by table lookup, and its fights into numbers to be tallied."""
+    potions = fight_potions(fight_size)
+    number_type = np.min_scalar_type(len(potions) - 1)
+    tally = np.zeros(len(potions), dtype=np.int64)
+    data = np.frombuffer(battle, dtype=np.uint8)
+    block = BLOCK_BYTES - BLOCK_BYTES % fight_size
+    for start in range(0, len(data), block):
+        digits = DIGITS.take(data[start : start + block]).reshape(-1, fight_size)
+        # adding up the columns is much quicker than working along short rows
+        numbers = digits[:, 0].astype(number_type, copy=False)  # digits is ours
+        for spot in range(1, fight_size):
+            numbers *= RADIX
+            numbers += digits[:, spot]
+        tally += np.bincount(numbers, minlength=len(potions))
+    if tally[potions < 0].any():
+        unknown = bytes(battle).translate(None, KNOWN)
+        raise ValueError(f"Unknown creature in battle log: {chr(unknown[0])!r}")
+    return int(tally @ potions)
 
 
-def fight_all(data: str, fight_size: int = 1):
+def stream_potions(chunks, fight_size: int = 1) -> int:
+    """Total potions for a battle arriving as a series of byte chunks, of any
+    sizes. Only one chunk (plus part of a fight) is held at a time."""
+    total = 0
+    carry = b""
+    for chunk in chunks:
+        chunk = carry + bytes(chunk)
+        if any(byte in chunk for byte in SKIP):
+            chunk = chunk.translate(None, SKIP)
+        usable = len(chunk) - len(chunk) % fight_size
+        total += chunk_potions(chunk[:usable], fight_size)
+        carry = chunk[usable:]
+    if carry:
+        # the last fight may be short a few creatures
+        total += chunk_potions(carry.ljust(fight_size, b"x"), fight_size)
+    return total
+
+
+def fight_all(data: str | bytes, fight_size: int = 1) -> int:
     """Get number of potions needed for all fights in given input."""
-    fights = [i.replace("x", "") for i in wrap(data, fight_size)]
-    potions_by_fight = [potions(fight) for fight in fights]
-    return sum(potions_by_fight)
+    if isinstance(data, str):
+        data = data.encode()
+    data = memoryview(data)
+    chunks = (data[i : i + CHUNK_BYTES] for i in range(0, len(data), CHUNK_BYTES))
+    return stream_potions(chunks, fight_size)
+
+
+def fight_all_from_file(path, fight_size: int = 1, chunk_bytes=CHUNK_BYTES) -> int:
+    """Like fight_all, for a battle log too big to read in whole: it's read
+    chunk_bytes at a time into the same buffer."""
+    buffer = bytearray(chunk_bytes)
+
+    def chunks():
+        with open(path, "rb") as f:
+            while size := f.readinto(buffer):
+                yield memoryview(buffer)[:size]
+
+    return stream_potions(chunks(), fight_size)
 
 
-print(f"Part 1 solution: {fight_all(q1_input1, fight_size=1)}")
-print(f"Part 2 solution: {fight_all(q1_input2, fight_size=2)}")
-print(f"Part 3 solution: {fight_all(q1_input3, fight_size=3)}")
+if __name__ == "__main__":
+    print(f"Part 1 solution: {fight_all(q1_input1, fight_size=1)}")
+    print(f"Part 2 solution: {fight_all(q1_input2, fight_size=2)}")
+    print(f"Part 3 solution: {fight_all(q1_input3, fight_size=3)}")
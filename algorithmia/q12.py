@@ -1,6 +1,7 @@
 import numpy as np
 from math import inf
 from input_data import q12_input1, q12_input2, q12_input3
+from utils import disk_cache, hotspot
 
 np.set_printoptions(linewidth=10000)
 
@@ -135,6 +136,7 @@ def generate_meteor_shower(input):
 p3_segments = {"A": (0, 0), "B": (1, 0), "C": (2, 0)}
 
 
+@hotspot()
 def check_for_hit_at_time(segment: str, meteor_origin: tuple[int, int], shot_time: int):
     """
     Adjust initial position of meteor to account for delay in firing cannon, then
@@ -177,6 +179,7 @@ def get_x_at_time(t, shooting_power, cannon_height):
 
 
 # The order of these helper functions may have to change
+@hotspot()
 def check_for_hit_at_power(
     segment: str, meteor_origin: tuple[int, int], shooting_power: int
 ):
@@ -301,6 +304,7 @@ def quick_shot_stats(segment: str, shooting_power: int) -> tuple[tuple[int, int]
     return start, upward_part_end, flat_part_end, end
 
 
+@disk_cache
 def part3(shower: list[tuple[int, int]]) -> int:
     """Get the highest-altitude, lowest-ranking score for shooting down each meteor
     in input, as described in problem description.
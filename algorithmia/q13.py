@@ -1,39 +1,22 @@
-from itertools import pairwise
+from collections import deque
 from math import inf
 import numpy as np
-import networkx as nx
 import time
 from input_data import q13_input1, q13_input2, q13_input3
-
+from utils import (
+    UNREACHED,
+    CSRGraph,
+    GraphBuilder,
+    dijkstra,
+    disk_cache,
+    neighbor_locs,
+)
 
 q13_input1 = np.array([[char for char in row] for row in q13_input1.split("\n")])
 q13_input2 = np.array([[char for char in row] for row in q13_input2.split("\n")])
 q13_input3 = np.array([[char for char in row] for row in q13_input3.split("\n")])
 
 
-def neighbor_locs(arr, x, y, include_diag=False):
-    """Returns the indices of neighbors of a location in a square array.
-    TODO: Put this in a utils file"""
-    neighbor_locs = []
-    for dx in range(-1, 2):
-        for dy in range(-1, 2):
-            if dx == dy == 0:
-                continue
-            if not include_diag and dx != 0 and dy != 0:
-                continue
-            else:
-                this_x = x + dx
-                this_y = y + dy
-                if (
-                    this_x >= 0
-                    and this_y >= 0
-                    and this_x < len(arr)
-                    and this_y < len(arr[0])
-                ):
-                    neighbor_locs.append((this_x, this_y))
-    return neighbor_locs
-
-
 IMPASSABLE = ["#", " "]
 
 
@@ -53,43 +36,32 @@ def level_change_time(lvl_a: int, lvl_b: int) -> int:
     return min(dist, 10 - dist) + 1
 
 
-def networkify(arr: np.array) -> nx.Graph:
+def networkify(arr: np.array) -> tuple[CSRGraph, list, tuple[int, int]]:
     """Turn an array representation of a labyrinth into a graph representation.
     Also returns the list of all possible starting points and desired endpoint
     for path to the princess."""
     start, end = find_S_and_E(arr)
     arr[arr == "S"] = "0"
     arr[end] = "0"
-    G = nx.Graph()
-    q = [start[0]]
+    G = GraphBuilder()
+    G.add_node(start[0])
+    q = deque([start[0]])
 
     while len(q) > 0:
-        cur_spot = q.pop(0)
-
+        cur_spot = q.popleft()
         x, y = cur_spot
-        cur_lvl = 0 if arr[x][y] in ["S", "E"] else int(arr[x][y])
-        if cur_spot not in G.nodes:
-            G.add_node(cur_spot, ht=cur_lvl)
-
-        neighbors = [
-            spot for spot in neighbor_locs(arr, x, y) if arr[spot] not in IMPASSABLE
-        ]
-
-        for nbr in neighbors:
-            x_nbr, y_nbr = nbr
-            nbr_lvl = 0 if arr[x_nbr][y_nbr] in ["S", "E"] else int(arr[x_nbr][y_nbr])
-            if nbr not in G.nodes:
-                G.add_node(nbr, ht=nbr_lvl)
-            if (cur_spot, nbr) not in G.edges:
-                change_wt = level_change_time(int(arr[cur_spot]), int(arr[nbr]))
-                G.add_edge(cur_spot, nbr, weight=change_wt)
-            else:
+        for nbr in neighbor_locs(arr, x, y):
+            if arr[nbr] in IMPASSABLE or G.has_edge(cur_spot, nbr):
                 continue
-            q.append(nbr)
+            if nbr not in G:
+                q.append(nbr)
+            change_wt = level_change_time(int(arr[cur_spot]), int(arr[nbr]))
+            G.add_edge(cur_spot, nbr, weight=change_wt)
 
-    return G, start, end
+    return G.build(), start, end
 
 
+@disk_cache
 def run(arr):
     """Calculate the length of the shortest possible path from a point labeled S
     to the princess at point labeled E on the map of a labyrinth, testing all
@@ -98,13 +70,15 @@ def run(arr):
     For parts 1 and 2, there is only one possible starting point, so it just
     calculates the desired (i.e. shortest) path from start to finish."""
     G, starts, end = networkify(arr)
+    # Moving between two spots takes as long in either direction, so a single
+    # search out from the end finds the shortest path from every start at once.
+    dist, _ = dijkstra(G, G.id_of(end))
     overall_ans = inf
     for start in starts:
-        result = nx.shortest_path(G, start, end, weight="weight")
-        this_ans = 0
-        for pair in pairwise(result):
-            spot_a, spot_b = pair
-            this_ans += level_change_time(int(arr[spot_a]), int(arr[spot_b]))
+        this_ans = int(dist[G.id_of(start)])
+        if this_ans == UNREACHED:
+            print(f"No path from {start}")
+            continue
 
         if this_ans < overall_ans:
             if overall_ans != inf:
@@ -114,6 +88,8 @@ def run(arr):
             overall_ans = this_ans
         else:
             print(f"Path from {start} not shorter than {overall_ans}")
+    if overall_ans == inf:
+        raise ValueError(f"No path from any start to {end}")
     return overall_ans
 
 
@@ -1,8 +1,6 @@
-import networkx as nx
 import numpy as np
-from itertools import combinations
 from input_data import q17_input1, q17_input2, q17_input3
-
+from utils import CSRGraph, connected_components, minimum_spanning_forest
 
 STAR = "*"
 
@@ -26,22 +24,22 @@ def manhattan_dist(star1: tuple[int, int], star2: tuple[int, int]) -> int:
 BRIGHT_LIMIT = 6
 
 
-def make_star_graph(star_dict: dict, is_part3: bool = False):
-    G = nx.Graph()
-    for k in star_dict.keys():
-        G.add_node(k, spot=star_dict[k])
-    for comb in combinations(star_dict.keys(), 2):
-        star1, star2 = comb
-        mdist = manhattan_dist(G.nodes[star1]["spot"], G.nodes[star2]["spot"])
-        if (not is_part3) or (mdist < BRIGHT_LIMIT):
-            G.add_edge(star1, star2, weight=mdist)
-    return G
+def make_star_graph(star_dict: dict, is_part3: bool = False) -> CSRGraph:
+    stars = list(star_dict.keys())
+    spots = np.array([star_dict[k] for k in stars])
+    # every pair of stars, as indices into `stars`
+    star1, star2 = np.triu_indices(len(stars), k=1)
+    mdist = np.abs(spots[star1] - spots[star2]).sum(axis=1)
+    if is_part3:
+        close = mdist < BRIGHT_LIMIT
+        star1, star2, mdist = star1[close], star2[close], mdist[close]
+    return CSRGraph.from_edges(len(stars), star1, star2, mdist, keys=stars)
 
 
-def constellation_size(T: nx.Graph) -> int:
-    connection_sum = sum([e[2]["weight"] for e in T.edges(data=True)])
-    size = connection_sum + len(T.nodes)
-    return size
+def constellation_size(T: CSRGraph) -> int:
+    connection_sum = T.total_weight()
+    size = connection_sum + T.num_nodes
+    return int(size)
 
 
 # Note: Due to numpy conventions, this adds stars in a different orientation
@@ -50,21 +48,23 @@ def constellation_size(T: nx.Graph) -> int:
 def full_constellation_size(input: str) -> int:
     sd = parse_star_chart(input)
     sG = make_star_graph(sd)
-    T = nx.minimum_spanning_tree(sG)
+    T = minimum_spanning_forest(sG)
     return constellation_size(T)
 
 
 def part3(input: str):
     sd = parse_star_chart(input)
     sG = make_star_graph(sd, is_part3=True)
-    F = nx.minimum_spanning_tree(sG)  # will return a minimum spanning forest
-    bright_constellations = sorted(
-        [F.subgraph(c).copy() for c in nx.connected_components(F)],
-        key=lambda c: constellation_size(c),
-        reverse=True,
-    )
-    c0, c1, c2 = bright_constellations[:3]
-    return constellation_size(c0) * constellation_size(c1) * constellation_size(c2)
+    F = minimum_spanning_forest(sG)
+    # size of each constellation (connected component of the forest) is the
+    # sum of its connection lengths plus its number of stars
+    constellation = connected_components(F)
+    src, _, weights = F.edge_list()
+    stars = np.bincount(constellation)
+    lengths = np.bincount(constellation[src], weights=weights, minlength=len(stars))
+    sizes = (stars + lengths).astype(np.int64)
+    c0, c1, c2 = sorted(sizes.tolist(), reverse=True)[:3]
+    return c0 * c1 * c2
 
 
 part1_solution = full_constellation_size(q17_input1)
@@ -1,43 +1,45 @@
-import re
+from functools import lru_cache
 from input_data import q2_words1, q2_helmet1, q2_words2, q2_shield2
+from input_data import q2_words3, q3_armor3
+from utils import Automaton, Coverage
 
 ### PART 1
 
 
-def count_runic_words(words: list[str], helmet: str):
+@lru_cache
+def runic_automaton(words: tuple[str, ...], with_reversed: bool = False) -> Automaton:
+    """Compile the word list once, however many lines it gets matched against.
+    With with_reversed, words written backwards match as well."""
+    if with_reversed:
+        words = words + tuple(word[::-1] for word in words)
+    return Automaton(list(words))
+
+
+def scan(automaton: Automaton, line: str) -> tuple[int, int]:
+    """One pass over a line: how many runic words it holds, and how many of its
+    symbols are part of at least one of them."""
     count = 0
-    for ix, char in enumerate(helmet):
-        possible_words = [w for w in words if w[0] == char]
-        for pword in possible_words:
-            try:
-                if helmet[ix : ix + len(pword)] == pword:
-                    count += 1
-            except IndexError:
-                continue
-    return count
+    covered = Coverage(len(line))
+    for start, end in automaton.matches(line):
+        count += 1
+        covered.mark(start, end)
+    return count, covered.count()
+
 
+def count_runic_words(words: list[str], helmet: str):
+    count, _ = scan(runic_automaton(tuple(words)), helmet)
+    return count
 
-print(f"Part 1 solution: {count_runic_words(q2_words1, q2_helmet1)}")
 
 ### PART 2
 
 
-def count_runic_symbols(words: list[int], line: str) -> int:
-    symbol_indices = []
-    sdrow = [word[::-1] for word in words]
-    words = words + sdrow
-    for ix, char in enumerate(line):
-        possible_words = [w for w in words if w[0] == char]
-        for pword in possible_words:
-            try:
-                if line[ix : ix + len(pword)] == pword:
-                    symbol_indices = symbol_indices + list(range(ix, ix + len(pword)))
-            except IndexError:
-                continue
-    return len(set(symbol_indices))
+def count_runic_symbols(words: list[str], line: str) -> int:
+    _, num_symbols = scan(runic_automaton(tuple(words), with_reversed=True), line)
+    return num_symbols
 
 
-def count_full_shield(words: list[int], shield: list[str]) -> int:
+def count_full_shield(words: list[str], shield: list[str]) -> int:
     total = 0
     for line in shield:
         line_count = count_runic_symbols(words, line)
@@ -45,6 +47,40 @@ def count_full_shield(words: list[int], shield: list[str]) -> int:
     return total
 
 
-print(f"Part 2 solution: {count_full_shield(q2_words2, q2_shield2)}")
+### PART 3
+
+
+def count_runic_scales(words: list[str], armor: list[str]) -> int:
+    """Count the scales that are part of at least one runic word, reading each
+    row either way round and wrapping past its end, and each column up or down
+    but without wrapping. All the matches of every row and column go into one
+    coverage mask over the whole armor."""
+    automaton = runic_automaton(tuple(words), with_reversed=True)
+    height, width = len(armor), len(armor[0])
+    covered = Coverage(height * width)
+    # to catch words wrapping round the end of a row, read on into the row
+    # again for one symbol less than the longest word
+    wrap = max(len(word) for word in words) - 1
+    copies = -(-(width + wrap) // width)
+    for row_ix, row in enumerate(armor):
+        row_start = row_ix * width
+        for start, end in automaton.matches((row * copies)[: width + wrap]):
+            if start >= width:
+                continue  # found already, starting from the first copy
+            if end - start >= width:
+                covered.mark(row_start, row_start + width)
+            elif end <= width:
+                covered.mark(row_start + start, row_start + end)
+            else:
+                covered.mark(row_start + start, row_start + width)
+                covered.mark(row_start, row_start + end - width)
+    for col_ix, column in enumerate(zip(*armor)):
+        for start, end in automaton.matches("".join(column)):
+            covered.mark(start * width + col_ix, end * width + col_ix, width)
+    return covered.count()
+
 
-### TODO: PART 3
+if __name__ == "__main__":
+    print(f"Part 1 solution: {count_runic_words(q2_words1, q2_helmet1)}")
+    print(f"Part 2 solution: {count_full_shield(q2_words2, q2_shield2)}")
+    print(f"Part 3 solution: {count_runic_scales(q2_words3, q3_armor3)}")
@@ -1,27 +1,6 @@
 import numpy as np
 from input_data import q3_input1, q3_input2, q3_input3
-
-
-def neighbors(
-    gridmap: np.array,
-    index: tuple[int, int],
-    include_diags=False,
-    include_offgrid=False,
-):
-    x, y = index
-    max_x, max_y = gridmap.shape
-    candidates = [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]
-    if include_diags:
-        diags = [(x - 1, y - 1), (x + 1, y + 1), (x - 1, y + 1), (x + 1, y - 1)]
-        candidates += diags
-    neighbor_vals = set()
-    for candidate in candidates:
-        this_x, this_y = candidate
-        if (0 <= this_x < max_x) and (0 <= this_y < max_y):
-            neighbor_vals.add(gridmap[this_x][this_y])
-        elif include_offgrid:
-            neighbor_vals.add(0)
-    return neighbor_vals
+from utils import distance_transform, neighbors, offsets_for, parse_grid
 
 
 def all_neighbors_at_height(
@@ -31,16 +10,21 @@ def all_neighbors_at_height(
     diag: bool = False,
     offgrid: bool = False,
 ) -> bool:
-    neighbor_vals = neighbors(
-        gridmap, index, include_diags=diag, include_offgrid=offgrid
+    x, y = index
+    neighbor_vals = set(
+        neighbors(gridmap, x, y, include_diag=diag, include_offgrid=offgrid)
     )
     return (len(neighbor_vals) == 1) and (hgt in neighbor_vals)
 
 
-def survey(note, diag=False, offgrid=False):
-    note = note.replace(".", "0")
-    note = note.replace("#", "1")
-    grid_map = np.array([[int(char) for char in row] for row in note.split("\n")])
+def parse_note(note: str) -> np.array:
+    """1 for each spot to dig (#), 0 for the rest (.)."""
+    return (parse_grid(note) == ord("#")).astype(np.int64)
+
+
+def dig_by_scanning(grid_map: np.array, diag=False, offgrid=False) -> np.array:
+    """Deepen the mine one level at a time, checking every cell's neighbors
+    each round. Slow, but the most literal reading of the rules."""
     max_x, max_y = grid_map.shape
     depth = 0
     while True:
@@ -57,7 +41,90 @@ def survey(note, diag=False, offgrid=False):
         for spot in to_update:
             x, y = spot
             grid_map[x][y] = depth + 1
-    return sum(grid_map.flatten())
+    return grid_map
+
+
+def dig_by_distance(grid_map: np.array, diag=False, offgrid=False) -> np.array:
+    """A spot ends up one deeper than its shallowest neighbor, so its final
+    depth is just its distance to the nearest undug spot (or to the edge of
+    the map, if off-grid counts as undug)."""
+    undug = grid_map == 0
+    if offgrid:
+        undug = np.pad(undug, 1, constant_values=True)
+    depth = distance_transform(undug, include_diag=diag)
+    if offgrid:
+        depth = depth[1:-1, 1:-1]
+    if (depth < 0).any():
+        raise ValueError(
+            "Nothing to dig down from: the mine would never stop deepening"
+        )
+    return depth
+
+
+def dig_by_erosion(
+    grid_map: np.array, diag=False, offgrid=False, tile_rows: int | None = None
+) -> np.array:
+    """Deepen a whole level per round with no per-spot loop: a spot at the
+    current depth goes one deeper if the map shifted by each neighbor offset
+    is at that depth there too.
+
+    With tile_rows, each round works through the map that many rows at a
+    time, so a band and its shifted copies stay in cache on very large maps.
+    A band's updates wait until the band below has been checked against the
+    old depths."""
+    if not offgrid and not (grid_map == 0).any():
+        raise ValueError(
+            "Nothing to dig down from: the mine would never stop deepening"
+        )
+    height, width = grid_map.shape
+    padded = np.pad(grid_map, 1)
+    offsets = offsets_for(include_diag=diag)
+    tile_rows = tile_rows or height
+    depth = 0
+    while True:
+        depth += 1
+        if not offgrid:
+            # off-grid neighbors don't count, so let them agree with everyone
+            padded[[0, -1], :] = depth
+            padded[:, [0, -1]] = depth
+        deepened = False
+        pending = []
+        for top in range(1, height + 1, tile_rows):
+            bottom = min(top + tile_rows, height + 1)
+            deepen = padded[top:bottom, 1:-1] == depth
+            for dx, dy in offsets:
+                deepen &= (
+                    padded[top + dx : bottom + dx, 1 + dy : width + 1 + dy] == depth
+                )
+            pending.append((top, bottom, deepen))
+            if len(pending) == 2:
+                deepened |= deepen_band(padded, *pending.pop(0), depth)
+        for band in pending:
+            deepened |= deepen_band(padded, *band, depth)
+        if not deepened:  # maximum possible depth reached
+            break
+    return padded[1:-1, 1:-1]
+
+
+def deepen_band(padded: np.array, top: int, bottom: int, deepen, depth: int) -> bool:
+    padded[top:bottom, 1:-1][deepen] = depth + 1
+    return bool(deepen.any())
+
+
+DIG_METHODS = {
+    "scan": dig_by_scanning,
+    "distance": dig_by_distance,
+    "erosion": dig_by_erosion,
+}
+
+
+def survey(note, diag=False, offgrid=False, method="distance", **method_options):
+    """Total depth of the mine, dug by one of DIG_METHODS (they all agree).
+    Any other keyword arguments go to the dig method, e.g. tile_rows."""
+    grid_map = DIG_METHODS[method](
+        parse_note(note), diag=diag, offgrid=offgrid, **method_options
+    )
+    return grid_map.sum()
 
 
 if __name__ == "__main__":
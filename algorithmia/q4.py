@@ -1,8 +1,15 @@
-from statistics import median
+from bisect import bisect_left
+from collections import Counter
+from functools import partial
+
+import numpy as np
 from input_data import q4_input1, q4_input2, q4_input3
+from utils import Fenwick
+
+CHUNK_BYTES = 1 << 24
 
-# Note: in input_data file, each multi-line string has been converted into a list of integers
-# using: [int(i) for i in INPUT.split('\n')]
+# Note: input_data hands these inputs over already converted into lists of integers
+# using: [int(i) for i in INPUT.split('\n')] (see PARSERS in input_data.py)
 
 
 def hammer(nail_heights: list[int]) -> int:
@@ -13,10 +20,140 @@ def hammer(nail_heights: list[int]) -> int:
 def hammer_p3(nail_heights: list[int]) -> int:
     # The optimal height to minimize absolute value error is the height of the median nail.
     # See https://math.stackexchange.com/questions/113270/the-median-minimizes-the-sum-of-absolute-deviations-the-ell-1-norm
-    nail_heights = sorted(nail_heights)
-    mdn = median(nail_heights)
-    m_sum = sum([abs(ht - mdn) for ht in nail_heights])
-    return int(m_sum)
+    return median_strikes(np.array(nail_heights, dtype=np.int64))
+
+
+def median_strikes(heights: np.ndarray) -> int:
+    """Strikes to level every nail to the median, partitioning heights in
+    place. Selection finds the (lower) median in O(n) without a full sort;
+    any level between the two middle nails costs the same."""
+    if not len(heights):
+        raise ValueError("No nails to hammer")
+    mid = (len(heights) - 1) // 2
+    heights.partition(mid)
+    level = int(heights[mid])
+    # everything from mid on is at least the level, everything before it at
+    # most, so no abs() and no temporary array is needed
+    above = int(heights[mid:].sum(dtype=np.int64)) - level * (len(heights) - mid)
+    below = level * mid - int(heights[:mid].sum(dtype=np.int64))
+    return above + below
+
+
+def read_nails(path, chunk_bytes: int = CHUNK_BYTES, dtype=np.int32) -> np.ndarray:
+    """Nail heights from a file with one per line, read chunk_bytes at a time
+    straight into a single array. A first pass counts the lines to size it,
+    so 10^8 nails take 400MB as int32 and are never a list of ints. A height
+    that doesn't fit in dtype is a ValueError rather than wrapping around."""
+    with open(path, "rb") as f:
+        num_lines = 1 + sum(
+            chunk.count(b"\n") for chunk in iter(partial(f.read, chunk_bytes), b"")
+        )
+        f.seek(0)
+        heights = np.empty(num_lines, dtype=dtype)
+        filled = 0
+        carry = b""
+        while chunk := f.read(chunk_bytes):
+            chunk = carry + chunk
+            # a number may be cut off at the end of the chunk
+            cut = chunk.rfind(b"\n") + 1
+            chunk, carry = chunk[:cut], chunk[cut:]
+            filled = _fill(heights, filled, chunk, dtype)
+        filled = _fill(heights, filled, carry, dtype)
+    return heights[:filled]
+
+
+def _fill(heights: np.ndarray, filled: int, text: bytes, dtype) -> int:
+    if not text.strip():
+        # fromstring() reads nothing but whitespace as a single 0
+        return filled
+    values = np.fromstring(text, dtype=np.int64, sep=" ")
+    limits = np.iinfo(dtype)
+    if values.min() < limits.min or values.max() > limits.max:
+        raise ValueError(f"A nail height doesn't fit in {np.dtype(dtype).name}")
+    heights[filled : filled + len(values)] = values
+    return filled + len(values)
+
+
+def hammer_p3_from_file(path, chunk_bytes: int = CHUNK_BYTES) -> int:
+    """hammer_p3 for a list of nails too big to hold as Python ints."""
+    return median_strikes(read_nails(path, chunk_bytes))
+
+
+class NailIndex:
+    """Nails that come and go, answering both hammer rules in O(log n) per
+    change rather than re-sorting every nail each time.
+
+    Nail counts and height sums live in Fenwick trees indexed by rank among
+    every height a nail may ever have: the starting nails' plus any others
+    given as universe. The trees are sized once for those, so no change ever
+    rebuilds them, and a nail of any other height is refused."""
+
+    def __init__(self, nail_heights=(), universe=()):
+        batch = Counter(nail_heights)
+        self.heights = sorted(batch.keys() | set(universe))
+        self.rank = {ht: i for i, ht in enumerate(self.heights)}
+        self.nail_counts = [batch.get(ht, 0) for ht in self.heights]
+        self.counts = Fenwick.from_values(self.nail_counts)
+        self.sums = Fenwick.from_values(
+            ht * n for ht, n in zip(self.heights, self.nail_counts)
+        )
+        self.size = sum(self.nail_counts)
+        self.height_sum = sum(ht * n for ht, n in batch.items())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _rank(self, height: int) -> int:
+        rank = self.rank.get(height)
+        if rank is None:
+            raise ValueError(f"Height {height} is not among this index's heights")
+        return rank
+
+    def _update(self, rank: int, times: int) -> None:
+        height = self.heights[rank]
+        self.nail_counts[rank] += times
+        self.counts.add(rank, times)
+        self.sums.add(rank, times * height)
+        self.size += times
+        self.height_sum += times * height
+
+    def add(self, height: int, times: int = 1) -> None:
+        self._update(self._rank(height), times)
+
+    def add_many(self, nail_heights) -> None:
+        batch = Counter(nail_heights)
+        ranks = [self._rank(height) for height in batch]  # all or nothing
+        for rank, times in zip(ranks, batch.values()):
+            self._update(rank, times)
+
+    def remove(self, height: int, times: int = 1) -> None:
+        rank = self._rank(height)
+        if self.nail_counts[rank] < times:
+            raise ValueError(f"Not enough nails of height {height} to remove")
+        self._update(rank, -times)
+
+    def kth(self, k: int) -> int:
+        """Height of the k-th shortest nail (1-based)."""
+        if not 1 <= k <= self.size:
+            raise ValueError(f"No nail number {k} among {self.size}")
+        return self.heights[self.counts.search(k)]
+
+    def strikes_to(self, level: int) -> int:
+        """Strikes (up or down) to bring every nail to this level."""
+        rank = bisect_left(self.heights, level)
+        below = self.counts.prefix(rank)
+        below_sum = self.sums.prefix(rank)
+        above_sum = self.height_sum - below_sum
+        return level * below - below_sum + above_sum - level * (self.size - below)
+
+    def hammer(self) -> int:
+        """Same as hammer(): everything down to the shortest nail."""
+        return self.height_sum - self.size * self.kth(1)
+
+    def hammer_p3(self) -> int:
+        """Same as hammer_p3(): everything to the median. Any level between
+        the two middle nails costs the same, so the lower one will do."""
+        return self.strikes_to(self.kth((self.size + 1) // 2))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,12 @@
+import copy
+from collections import Counter, deque
+
 import numpy as np
 from input_data import q5_input1, q5_input2, q5_input3
+from utils import MAX, aggregate_rounds, first_to_reach, hotspot
+
+# Part 3's dance never ends; any number of rounds past its first repeat will do
+FOREVER = 10**18
 
 
 def process_input(arr):
@@ -17,108 +24,182 @@ def pprint(arr, v=False):
             print(row)
 
 
-def printv(obj, v=False):
-    if v:
-        print(obj)
+def clap_spot(clapper: int, column_length: int) -> int:
+    """Where in a column a clapper joins it. One dancer per clap, they go down
+    the left side (ending up in front of each dancer in turn), then back up the
+    right side (behind each), and round again, so after every 2 * length claps
+    they're back where they started."""
+    if not column_length:
+        return 0
+    lap = (clapper - 1) % (2 * column_length)
+    if lap < column_length:  # left side, going down
+        return lap
+    return 2 * column_length - lap  # right side, going up
+
+
+# stand-ins for the front and back of a column, next to its first and last
+# dancers (dancers are all positive)
+FRONT = -1
+BACK = -2
+
+
+class DanceFloor:
+    """The dancers in columns, plus which round is next. Columns are deques so
+    the head of a column leaves in O(1).
+
+    fingerprint() is kept up to date as dancers move rather than worked out
+    from the columns: each column's hash is the sum of hash() over every pair
+    of neighbours in it, front and back included, so a dancer leaving or
+    joining only swaps a pair or two. Different arrangements can share a
+    fingerprint, so arrangement() is there to settle it exactly when two
+    do."""
+
+    def __init__(self, arr: list[list[int]], rd: int = 0):
+        self.columns = [deque(col) for col in arr]
+        self.hashes = [
+            sum(map(hash, zip([FRONT, *col], [*col, BACK]))) for col in self.columns
+        ]
+        self.rd = rd
+        # the shout is kept up to date as heads change, digits and all
+        self.heads = [str(col[0]) for col in self.columns]
+        self._shout = int("".join(self.heads))
+
+    def copy(self) -> "DanceFloor":
+        floor = copy.copy(self)
+        floor.columns = [col.copy() for col in self.columns]
+        floor.hashes = self.hashes.copy()
+        floor.heads = self.heads.copy()
+        return floor
+
+    def dance(self, v=False) -> "DanceFloor":
+        """Play the next round: the dancer at the head of that round's column
+        claps their way around the next column and joins it."""
+        self.rd += 1
+        columns, hashes = self.columns, self.hashes
+        cur_col = (self.rd - 1) % len(columns)
+        target_col = (cur_col + 1) % len(columns)
+        # the clapper leaves the front of their column...
+        col = columns[cur_col]
+        cur_clapper = col.popleft()
+        behind = col[0] if col else BACK
+        hashes[cur_col] += (
+            hash((FRONT, behind))
+            - hash((FRONT, cur_clapper))
+            - hash((cur_clapper, behind))
+        )
+        self._new_head(cur_col)
+        # ...and steps in between two neighbours in the next one
+        col = columns[target_col]
+        spot = clap_spot(cur_clapper, len(col))
+        ahead = col[spot - 1] if spot else FRONT
+        behind = col[spot] if spot < len(col) else BACK
+        hashes[target_col] += (
+            hash((ahead, cur_clapper))
+            + hash((cur_clapper, behind))
+            - hash((ahead, behind))
+        )
+        col.insert(spot, cur_clapper)
+        if not spot:
+            self._new_head(target_col)
+        if v:
+            print(f"ROUND {self.rd}")
+            print(f"Current clapper from head of column {cur_col+1}: {cur_clapper}")
+            print(f"Clapper joins column {target_col+1} at index {spot}")
+            pprint([list(col) for col in columns], v)
+        return self
+
+    def _new_head(self, c: int) -> None:
+        old, new = self.heads[c], str(self.columns[c][0])
+        if new == old:
+            return
+        self.heads[c] = new
+        if len(new) == len(old):
+            # same number of digits: just change those digits
+            below = sum(len(head) for head in self.heads[c + 1 :])
+            self._shout += (int(new) - int(old)) * 10**below
+        else:
+            self._shout = int("".join(self.heads))
+
+    def shout(self) -> int:
+        return self._shout
+
+    def fingerprint(self) -> tuple:
+        """Equal for equal arrangements with the same column up next (and
+        only rarely for any others)."""
+        return self.rd % len(self.columns), tuple(self.hashes)
 
+    def arrangement(self) -> tuple:
+        """Equal for equal arrangements with the same column up next, and
+        only for those, but it takes a look at every dancer."""
+        return self.rd % len(self.columns), tuple(map(tuple, self.columns))
 
-def clap_dance(arr, num_rounds=10, print_every_nth=1, v=False, save_state=False):
+
+@hotspot()
+def clap_dance(arr, num_rounds=10, print_every_nth=1, v=False):
     """Simulate the clap dance."""
-    shout_counter = {}
-    max_shout = 0
-    NUM_COLS = len(arr)
-    states = set()
-    # print("Round  Number  Shouts")
-    rd = 0
+    floor = DanceFloor(arr)
+    shout_counter = Counter()
     while True:
-        state = "".join("".join([str(i) for i in arr]))
-        if state in states:  # Part 3 end condition (first cycle detected!)
-            # print(f"First cycle detected! Biggest shout: {max_shout}")
-            return max_shout
-        states.add(state)
-        rd += 1
-        cur_col = (rd - 1) % NUM_COLS
-        cur_clapper = arr[cur_col].pop(0)
-        on_left_side = True
-        going_down = True
-        printv(f"ROUND {rd}", v)
-        printv(f"Current clapper from head of column {cur_col+1}: {cur_clapper}", v)
-        target_col = (cur_col + 1) % NUM_COLS
-        # printv(f"Target column is {target_col}", v)
-        side_spot = -1
-        # printv(f"Going {'left' if on_left_side else 'right'} of column {target_col+1}", v)
-        # TODO: replace this entire for loop by skipping straight to clapper's closed-form final location
-        for clap in range(1, cur_clapper + 1):
-            printv(f"The dancers shout: '{clap}!'", v)
-            if (
-                side_spot == len(arr[target_col]) - 1 and going_down
-            ):  # reached end of column
-                # printv(f"Reached back of column {target_col+1} -- flipping to right side and going up", v)
-                on_left_side = False
-                going_down = False
-            elif side_spot == 0 and not going_down:
-                # Instructions are ambiguous but here's what happens:
-                # clapper continues around SAME column down the left side if they reach the top,
-                # repeating going down and flipping and going up and flipping until they have moved
-                # as many steps as their number
-                # printv(f"Reached front of column {target_col+1} -- flipping to left side and going back down", v)
-                on_left_side = True
-                going_down = True
-            elif going_down:
-                side_spot += 1
-            else:
-                side_spot -= 1
-            printv(
-                f"Clapper is {'left' if on_left_side else 'right'} of value {arr[target_col][side_spot]} at index {side_spot} in column {target_col+1}",
-                v,
-            )
-            if clap == cur_clapper:
-                break
-        # printv("It's absorption time!", v)
-        # printv(f"Clapper is on {'left' if on_left_side else 'right'} side so they absorb {'in front' if on_left_side else 'behind'} person at index {side_spot}", v)
-        if on_left_side:
-            arr[target_col].insert(side_spot, cur_clapper)
-        else:
-            arr[target_col].insert(side_spot + 1, cur_clapper)
-        pprint(arr, v)
-        shout = combine_shout(arr)
-        if shout not in shout_counter:
-            shout_counter[shout] = 0
+        floor.dance(v)
+        rd = floor.rd
+        shout = floor.shout()
         shout_counter[shout] += 1
-        if shout > max_shout:
-            max_shout = shout
         if print_every_nth is not None and rd % print_every_nth == 0:
             print(f"{rd} {shout} {shout_counter[shout]}")
-        printv("\n", v)
         if shout_counter[shout] == 2024:  # Part 2 end condition
             break
         if rd >= num_rounds:
             break
 
-    return rd, combine_shout(arr)
+    return rd, floor.shout()
+
+
+@hotspot()
+def shouted_times(arr, times=2024) -> tuple[int, int]:
+    """The round in which some shout is heard for the `times`-th time, and
+    that shout. Same as clap_dance(arr, num_rounds=forever), but once the
+    dance starts going round in a cycle the answer is worked out in closed
+    form rather than danced out."""
+    return first_to_reach(
+        DanceFloor(arr),
+        DanceFloor.dance,
+        DanceFloor.shout,
+        times,
+        key=DanceFloor.fingerprint,
+        copy=DanceFloor.copy,
+        exact=DanceFloor.arrangement,
+    )
 
 
-def combine_shout(arr: list[list[int]]):
-    return int("".join([str(i[0]) for i in arr]))
+@hotspot()
+def biggest_shout(arr) -> int:
+    """The dance goes on forever, but sooner or later it goes round in a
+    cycle, so the biggest shout ever is the biggest one up to and around it.
+    The floor dances in place, copied only where the cycle finder needs a
+    second one."""
+    return aggregate_rounds(
+        DanceFloor(arr),
+        DanceFloor.dance,
+        FOREVER,
+        DanceFloor.shout,
+        MAX,
+        key=DanceFloor.fingerprint,
+        copy=DanceFloor.copy,
+        exact=DanceFloor.arrangement,
+    )
 
 
 if __name__ == "__main__":
     input1 = process_input(q5_input1)
     input2 = process_input(q5_input2)
     input3 = process_input(q5_input3)
-    VERY_LARGE_NUM = 100000000000
 
     _, last_shout = clap_dance(input1, num_rounds=10, print_every_nth=None, v=False)
     print(f"Part 1 solution: {last_shout}")
 
     print("Now working on Part 2. This could take several minutes...")
-    rd, last_shout = clap_dance(
-        input2, num_rounds=VERY_LARGE_NUM, print_every_nth=None, v=False
-    )
+    rd, last_shout = shouted_times(input2, 2024)
     print(f"Part 2 solution: {rd * last_shout}")
 
     print("Now working on Part 3. This could take several minutes...")
-    biggest_shout = clap_dance(
-        input3, num_rounds=VERY_LARGE_NUM, print_every_nth=None, save_state=True
-    )
-    print(f"Part 3 solution: {biggest_shout}")
+    print(f"Part 3 solution: {biggest_shout(input3)}")
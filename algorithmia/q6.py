@@ -1,54 +1,139 @@
+import io
 from collections import Counter
-import networkx as nx
-import re
+from typing import Iterable, NamedTuple
 
 from input_data import q6_input1, q6_input2, q6_input3
+from utils import UnionFind
 
+FRUIT = "@"
+NO_PARENT = -1
+# Instructions are somewhat unclear: You should entirely ignore any line whose
+# source *or* targets have BUG or ANT *anywhere* in them.
+PESTS = frozenset(["BUG", "ANT"])
+
+
+class Orchard(NamedTuple):
+    """A tree of branches with integer IDs: names[i] is the name of branch i,
+    parent[i] the branch it grows from and fruits[i] how many fruits grow on
+    it."""
+
+    names: list[str]
+    parent: list[int]
+    fruits: list[int]
+    ids: dict[str, int]  # branch name -> ID
+    root: int
+
+
+def parse_input(data: str | Iterable[str], root: str = "RR") -> Orchard:
+    """Create a parent array representation of a tree, from its text or from
+    its lines one at a time (an open file, say), without holding them all.
+
+    A line that would give a branch a second parent (or the root any
+    parent), or close a loop, is rejected as soon as it's read. Keeping a
+    union-find of the branches joined up so far makes the loop check near
+    enough O(1): a branch that hasn't got a parent yet is the top of its own
+    subtree, so hanging it from a branch in that same subtree is the only way
+    to make a loop."""
+    if isinstance(data, str):
+        data = io.StringIO(data)
+    ids = {}
+    names = []
+    parent = []
+    fruits = []
+    joined = UnionFind()
+    # branches without a parent: only the root should be left at the end
+    num_tops = 0
+
+    def branch(name: str) -> int:
+        nonlocal num_tops
+        if name not in ids:
+            ids[name] = joined.add()
+            names.append(name)
+            parent.append(NO_PARENT)
+            fruits.append(0)
+            num_tops += 1
+        return ids[name]
 
-def parse_input(data: str) -> nx.DiGraph:
-    """Create a graph representation of a tree."""
-    G = nx.DiGraph()
-    data = data.split("\n")
-    fruit_id = 0
     for line in data:
+        line = line.strip()
+        if not line:
+            continue
         source, targets = line.split(":")
         targets = targets.split(",")
-        # Instructions are somewhat unclear: You should entirely ignore any
-        # line whose source *or* targets have BUG or ANT *anywhere* in them.
-        if source in ("BUG", "ANT") or "BUG" in targets or "ANT" in targets:
+        if source in PESTS or not PESTS.isdisjoint(targets):
             continue
-        if source not in G.nodes:
-            G.add_node(source)
+        source_id = branch(source)
         for target in targets:
-            if target == "@":
-                # Give each fruit a dummy suffix to disambiguate new nodes
-                target += str(fruit_id)
-                fruit_id += 1
-            G.add_edge(source, target)
-    return G
+            if target == FRUIT:
+                fruits[source_id] += 1
+                continue
+            if target == root:
+                raise ValueError(f"{root} is the root, but grows from {source}")
+            target_id = branch(target)
+            if parent[target_id] != NO_PARENT:
+                raise ValueError(
+                    f"{target} grows from both {names[parent[target_id]]} and {source}"
+                )
+            if not joined.union(source_id, target_id):
+                raise ValueError(f"{source}:{target} makes a loop")
+            parent[target_id] = source_id
+            num_tops -= 1
+
+    if root not in ids:
+        raise ValueError(f"No {root} branch to start from")
+    if num_tops > 1:
+        orphans = [
+            name for name, up in zip(names, parent) if up == NO_PARENT and name != root
+        ]
+        raise ValueError(f"Branches that don't grow from anything: {orphans}")
+    return Orchard(names, parent, fruits, ids, ids[root])
+
+
+def depths(orchard: Orchard, nodes) -> list[int]:
+    """Depth below the root of each of nodes. Each branch's depth is worked
+    out (by walking up to a branch whose depth is known) at most once, so
+    this is linear in the size of the tree."""
+    parent = orchard.parent
+    UNKNOWN = -1
+    depth = [UNKNOWN] * len(parent)
+    depth[orchard.root] = 0
+    for node in nodes:
+        walk = []
+        while depth[node] == UNKNOWN:
+            walk.append(node)
+            node = parent[node]
+            if node == NO_PARENT:
+                top = orchard.names[walk[-1]]
+                raise ValueError(f"{top} doesn't grow from the root")
+        above = depth[node]
+        for node in reversed(walk):
+            above += 1
+            depth[node] = above
+    return [depth[node] for node in nodes]
 
 
-def most_powerful_fruit_path(G: nx.DiGraph, part=1) -> str:
+def most_powerful_fruit_path(orchard: Orchard, part=1) -> str:
     """Find the path to the most powerful fruit, i.e. the string representation
     of the path whose length, from node RR to a leaf marked @, is unique."""
-    all_sps = nx.single_source_all_shortest_paths(G, source="RR")
-    result = []
-    for item in all_sps:
-        _, path = item
-        path = path[0]
-        if part != 1:
-            # preserve only first letter of each node
-            path = [id[0] for id in path]
-        path = "".join([char for char in path if char.isalpha() or "@" in char])
-        if "@" in path:
-            result.append(path)
-    path_lens = {path: len(path) for path in result}
-    len_ctr = Counter(path_lens.values())
-    most_powerful_len = [k for k, v in len_ctr.items() if v == 1][0]
-    ans = [k for k, v in path_lens.items() if v == most_powerful_len][0]
-    # remove fruit id tags if any still present
-    ans = re.sub(r"\d", "", ans)
-    return ans
+    fruity = [i for i, num in enumerate(orchard.fruits) if num]
+    # depths of the branches, so one short of their fruits', which is all the same
+    fruit_depths = depths(orchard, fruity)
+    num_at_depth = Counter()
+    for branch, depth in zip(fruity, fruit_depths):
+        num_at_depth[depth] += orchard.fruits[branch]
+    unique = [d for d, num in num_at_depth.items() if num == 1]
+    if not unique:
+        raise ValueError("No fruit is at a depth all of its own")
+    branch = fruity[fruit_depths.index(min(unique))]
+    # only the winning fruit's path is ever put together
+    path = [branch]
+    while path[-1] != orchard.root:
+        path.append(orchard.parent[path[-1]])
+    path = [orchard.names[node] for node in reversed(path)] + [FRUIT]
+    if part != 1:
+        # preserve only first letter of each node
+        path = [name[0] for name in path]
+    return "".join(path)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 import numpy as np
 
 np.set_printoptions(linewidth=10000)
-from itertools import permutations
-from math import lcm
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator
 
 from input_data import q7_input1, q7_input2, q7_input3, q7_track2, q7_track3
 
@@ -15,6 +16,8 @@ class Chariot:
         self.essence = 0
 
     def execute_action(self, turn: int, terrain="=", v=False):
+        """Play one segment. race() plays them all at once; this is the
+        step-by-step version the tests check it against."""
         action = self.plan[turn % len(self.plan)]
         # Action overridden by terrain
         if terrain == "+":
@@ -42,94 +45,137 @@ def parse_chariots(data):
     return chariots
 
 
+# how each action, or the terrain, changes a chariot's power
+DELTAS = {"+": 1, "-": -1, "=": 0, "S": 0}
+# the same, looked up by byte
+TERRAIN_DELTAS = np.zeros(256, dtype=np.int64)
+TERRAIN_DELTAS[[ord(terrain) for terrain in DELTAS]] = list(DELTAS.values())
+SPACE = ord(" ")
+
+
+def plan_deltas(plans, steps: int) -> np.ndarray:
+    """One row per plan of the power changes it makes over `steps` segments,
+    repeating the plan (np.resize) for as long as it takes."""
+    return np.stack(
+        [np.resize(np.array([DELTAS[a] for a in plan]), steps) for plan in plans]
+    )
+
+
+def race_powers(plans, steps: int, track=None, initial_power=10) -> np.ndarray:
+    """Power of each chariot (a row per plan) after each segment. On a track,
+    any terrain other than = overrides the chariot's action."""
+    deltas = plan_deltas(plans, steps)
+    if track is not None:
+        if isinstance(track, str):
+            track = track.encode()
+        terrain = np.resize(TERRAIN_DELTAS[np.frombuffer(track, dtype=np.uint8)], steps)
+        deltas = np.where(terrain != 0, terrain, deltas)
+    # Power can't drop below 0, which makes it the running sum of the deltas
+    # lifted by however far that sum has ever dipped below -initial_power.
+    walk = np.cumsum(deltas, axis=1)
+    initial_power = np.reshape(initial_power, (-1, 1))
+    return walk + np.maximum(initial_power, -np.minimum.accumulate(walk, axis=1))
+
+
+def race(chariots: list[Chariot], steps: int, track=None) -> list[Chariot]:
+    """Race all the chariots at once, then rank them by essence."""
+    powers = race_powers(
+        [c.plan for c in chariots], steps, track, [c.power for c in chariots]
+    )
+    for c, power in zip(chariots, powers):
+        c.power = int(power[-1])
+        c.essence += int(power.sum())
+    return sorted(chariots, key=lambda c: c.essence, reverse=True)
+
+
 def squire_race(chariots: list[Chariot], segments=10):
-    for segment in range(segments):
-        for c in chariots:
-            c.execute_action(turn=segment)
-    chariots = sorted(chariots, key=lambda c: c.essence, reverse=True)
+    chariots = race(chariots, segments)
     return "".join([c.name for c in chariots])
 
 
-def parse_track(track: str) -> str:
-    track = track.split("\n")
-    width = len(track[0])
-    track = [
-        row.ljust(width) for row in track
-    ]  # some rows of input don't have enough spaces
-    arr = np.array([[char for char in row] for row in track])
-    track_str = ""
-    seen = set()
-    row_cur = 0
-    col_cur = 0
-    while (0, 0) not in seen:
-        neighbors = neighbor_locs(arr, row_cur, col_cur)
-        dirs = {}
-        for neighbor in neighbors:
-            if neighbor == (row_cur - 1, col_cur):
-                dirs["u"] = neighbor
-            elif neighbor == (row_cur, col_cur + 1):
-                dirs["r"] = neighbor
-            elif neighbor == (row_cur + 1, col_cur):
-                dirs["d"] = neighbor
-            elif neighbor == (row_cur, col_cur - 1):
-                dirs["l"] = neighbor
-        # the proper path will always check right first, then down, then left, then up
-        for char in "rdlu":
-            if (
-                char in dirs
-                and dirs[char] not in seen
-                and arr[dirs[char][0]][dirs[char][1]] != " "
-            ):  # found new terrain in this direction
-                row_new, col_new = dirs[char]
+@lru_cache(maxsize=None)
+def parse_track(track: str) -> bytes:
+    """The terrain met going once round the track, starting from S and ending
+    back on it, as bytes. Compiled once per track text and cached.
+
+    The grid is padded with spaces on every side and flattened, so a step
+    right, down, left or up is just adding an offset, with no bounds checks.
+    Where the track touches itself, the proper path will always check right
+    first, then down, then left, then up, for terrain not yet visited."""
+    rows = track.split("\n")
+    # some rows of input don't have enough spaces
+    width = max(len(row) for row in rows) + 2
+    grid = b" " * width
+    grid += b"".join(b" " + row.encode().ljust(width - 2) + b" " for row in rows)
+    grid += b" " * width
+    start = grid.find(b"S")
+    if start < 0:
+        raise ValueError("Track has no start (S)")
+    steps = (1, width, -1, -width)
+    seen = bytearray(len(grid))
+    terrain = bytearray()
+    here = start
+    while True:
+        for step in steps:
+            there = here + step
+            if not seen[there] and grid[there] != SPACE:
                 break
-        seen.add((row_new, col_new))
-        track_str += arr[row_new][col_new]
-        row_cur = row_new
-        col_cur = col_new
-    return track_str
+        else:
+            row, col = divmod(here, width)
+            raise ValueError(f"Track dead-ends at row {row - 1}, column {col - 1}")
+        seen[there] = True
+        terrain.append(grid[there])
+        here = there
+        if here == start:
+            return bytes(terrain)
 
 
 def knight_race(chariots: list[Chariot], track, loops=1):
-    turn = 0
-    for _ in range(loops):
-        for spot in track:
-            for c in chariots:
-                c.execute_action(turn=turn, terrain=spot)
-            turn += 1
-    chariots = sorted(chariots, key=lambda c: c.essence, reverse=True)
+    chariots = race(chariots, loops * len(track), track)
     order_of_finish = "".join([c.name for c in chariots])
     scores = [c.essence for c in chariots]
     return order_of_finish, scores
 
 
-def neighbor_locs(arr, x, y, include_diag=False):
-    """Returns the indices of neighbors of a location in an array."""
-    neighbor_locs = []
-    for dx in range(-1, 2):
-        for dy in range(-1, 2):
-            if dx == dy == 0:
-                continue
-            if not include_diag and dx != 0 and dy != 0:
-                continue
-            else:
-                this_x = x + dx
-                this_y = y + dy
-                if (
-                    this_x >= 0
-                    and this_y >= 0
-                    and this_x < len(arr)
-                    and this_y < len(arr[0])
-                ):
-                    neighbor_locs.append((this_x, this_y))
-    return neighbor_locs
+def multiset_permutations(items) -> Iterator[tuple]:
+    """Every distinct ordering of items, each once and in lexicographic
+    order. Each one is the next permutation of the one before, so repeated
+    items never give duplicates that would need weeding out."""
+    perm = sorted(items)
+    while True:
+        yield tuple(perm)
+        # the last spot with a bigger item somewhere after it
+        i = len(perm) - 2
+        while i >= 0 and perm[i] >= perm[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        # swap in the smallest bigger item from after it, then put everything
+        # after it back in ascending order
+        j = len(perm) - 1
+        while perm[j] <= perm[i]:
+            j -= 1
+        perm[i], perm[j] = perm[j], perm[i]
+        perm[i + 1 :] = reversed(perm[i + 1 :])
+
+
+def plan_essences(plans, track, loops=1, batch=1024) -> np.ndarray:
+    """Essence each plan would earn racing alone, scoring `batch` plans at a
+    time as one (plans x segments) array, so plans can be a lazy iterator of
+    any length."""
+    plans = iter(plans)
+    steps = loops * len(track)
+    scores = []
+    while chunk := list(islice(plans, batch)):
+        scores.append(race_powers(chunk, steps, track).sum(axis=1))
+    return np.concatenate(scores) if scores else np.zeros(0, dtype=np.int64)
 
 
 def part3(track):
     """Run the race repeatedly against the other knight to see how many action plans result in wins.
 
     There are 11! = 39916800 permutations of 11 elements, but given repetition, there are only 9240
-    *unique* permutations needed. Producing them all and then keeping the unique ones (as here)
-    hangs for several seconds. TODO: Is there a more efficient way?
+    *unique* permutations needed, and multiset_permutations() produces just those.
 
     Speedup inspired by Reddit user u/maneatingape: If you know how many laps it takes for the ending
     of a lap and the ending of a plan to coincide, since essence can't go negative, you know that whoever
@@ -141,17 +187,11 @@ def part3(track):
     actions_to_plan = (
         ["+" for _ in range(5)] + ["-" for _ in range(3)] + ["=" for _ in range(3)]
     )
-    all_action_plans = set(permutations(actions_to_plan))
-    wins = 0
     # Chariot A does the same thing every time, so just run it once and compare your score to it.
     a = parse_chariots(q7_input3)[0]
-    _, score_to_beat = knight_race([a], track, loops=11)
-    for _, plan in enumerate(all_action_plans):
-        u = Chariot(name="U", plan=plan)
-        _, your_score = knight_race([u], track, loops=11)
-        if your_score > score_to_beat:  # Python compares sole element for len-1 lists
-            wins += 1
-    return wins
+    _, (score_to_beat,) = knight_race([a], track, loops=11)
+    scores = plan_essences(multiset_permutations(actions_to_plan), track, loops=11)
+    return int(np.count_nonzero(scores > score_to_beat))
 
 
 if __name__ == "__main__":
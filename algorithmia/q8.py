@@ -1,45 +1,125 @@
+from math import isqrt
+from typing import NamedTuple
+
+import numpy as np
+from utils import find_cycle
+
+
 def part1(blocks: int):
-    blocks_left = blocks - 1
-    blocks_in_pyramid = 1
-    layer = 1
-    while blocks_left > 0:
-        layer += 1
-        width = (2 * layer) - 1
-        blocks_left -= width
-        blocks_in_pyramid += width
-    # you needed {-blocks_left} blocks you didn't have!
-    return -blocks_left * width
+    # A pyramid of n layers takes 1 + 3 + 5 + ... + (2n - 1) = n**2 blocks, so
+    # the layer we run out on is the n with (n - 1)**2 < blocks <= n**2.
+    layer = isqrt(blocks - 1) + 1
+    width = (2 * layer) - 1
+    # you needed {layer**2 - blocks} blocks you didn't have!
+    return (layer**2 - blocks) * width
+
+
+class Laps(NamedTuple):
+    count: int
+    blocks: int
 
 
 def part2(blocks: int, num_priests=375, num_acolytes=1111):
+    def next_thickness(thickness: int) -> int:
+        return (thickness * num_priests) % num_acolytes
+
+    # Thickness only ever takes num_acolytes values, so it soon goes round in
+    # a cycle, and whole laps of that cycle can be built at once.
+    start, length = find_cycle(1, next_thickness, key=int)
     blocks_left = blocks - 1
-    blocks_in_pyramid = 1
     layer = 1
     thickness = 1
+    skipped = False
     while blocks_left > 0:
+        if not skipped and layer >= start:
+            skipped = True
+            laps = laps_to_skip(
+                layer + 1, thickness, length, next_thickness, blocks_left
+            )
+            layer += laps.count * length
+            blocks_left -= laps.blocks
         layer += 1
         width = (2 * layer) - 1
-        thickness = (thickness * num_priests) % num_acolytes
+        thickness = next_thickness(thickness)
         new_blocks_needed = width * thickness
         blocks_left -= new_blocks_needed
-        blocks_in_pyramid += new_blocks_needed
     return -blocks_left * width
 
 
-PART1_SUPPLY = 4098012
-part1_solution = part1(PART1_SUPPLY)
-print(f"Part 1 solution: {part1_solution}")
+def laps_to_skip(first, thickness, length, next_thickness, blocks_left) -> Laps:
+    """The most whole laps of the thickness cycle, starting with layer first,
+    that still leave some blocks over, and the blocks they take.
+
+    Layer first + i of a lap is (2 * (first + i) - 1) wide and lap[i] thick.
+    Each later lap starts 2 * length wider, so m laps take
+    m * ((2 * first - 1) * sum(lap) + 2 * sum(i * lap[i])) +
+    length * sum(lap) * m * (m - 1) blocks."""
+    lap = []
+    for _ in range(length):
+        thickness = next_thickness(thickness)
+        lap.append(thickness)
+    per_lap = sum(lap)
+    if not per_lap:
+        raise ValueError("The pyramid has stopped growing: every layer is 0 thick")
+    first_lap = (2 * first - 1) * per_lap + 2 * sum(i * t for i, t in enumerate(lap))
+
+    def blocks_for(m: int) -> int:
+        return m * first_lap + length * per_lap * m * (m - 1)
+
+    # blocks_for(lo) < blocks_left <= blocks_for(hi)
+    lo, hi = 0, 1
+    while blocks_for(hi) < blocks_left:
+        lo, hi = hi, 2 * hi
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if blocks_for(mid) < blocks_left:
+            lo = mid
+        else:
+            hi = mid
+    return Laps(lo, blocks_for(lo))
+
+
+def part3(blocks: int, num_priests=2, num_acolytes=5):
+    """Build up the hollowed-out shrine until it needs more blocks than we
+    have. The height of each column is kept in a numpy array, so each layer
+    is a few array operations however wide the shrine has got.
+
+    The hollowing is worked out mod num_acolytes before multiplying, so it
+    stays under num_acolytes ** 2. Where that, or the blocks, could overflow
+    int64, the heights are kept as Python ints instead."""
+    big = num_acolytes > 1 << 31 or blocks > 1 << 62
+    heights = np.ones(1, dtype=object if big else np.int64)
+    thickness = 1
+    while True:
+        width = len(heights)
+        # every column but the two outermost gets emptied out some
+        factor = (num_priests * width) % num_acolytes
+        hollow = (factor * (heights[1:-1] % num_acolytes)) % num_acolytes
+        needed = int(heights.sum()) - int(hollow.sum())
+        if needed >= blocks:
+            return needed - blocks
+        thickness = (thickness * num_priests) % num_acolytes + num_acolytes
+        heights += thickness
+        heights = np.concatenate(([thickness], heights, [thickness]))
+
 
-PART2_SUPPLY = 20240000
-PART2_PRIESTS = 375
-PART2_ACOLYTES = 1111
-part2_solution = part2(
-    PART2_SUPPLY, num_priests=PART2_PRIESTS, num_acolytes=PART2_ACOLYTES
-)
-print(f"Part 2 solution: {part2_solution}")
+if __name__ == "__main__":
+    PART1_SUPPLY = 4098012
+    part1_solution = part1(PART1_SUPPLY)
+    print(f"Part 1 solution: {part1_solution}")
 
-# TODO: Part 3
+    PART2_SUPPLY = 20240000
+    PART2_PRIESTS = 375
+    PART2_ACOLYTES = 1111
+    part2_solution = part2(
+        PART2_SUPPLY, num_priests=PART2_PRIESTS, num_acolytes=PART2_ACOLYTES
+    )
+    print(f"Part 2 solution: {part2_solution}")
 
-PART3_SUPPLY = 202400000
-PART3_PRIESTS = 931087
-PART3_ACOLYTES = 10
+    PART3_SUPPLY = 202400000
+    PART3_PRIESTS = 931087
+    PART3_ACOLYTES = 10
+    part3_solution = part3(
+        PART3_SUPPLY, num_priests=PART3_PRIESTS, num_acolytes=PART3_ACOLYTES
+    )
+    print(f"Part 3 solution: {part3_solution}")
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Quests import input_data and utils as top-level modules, as they do when run
+# from inside the algorithmia folder.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
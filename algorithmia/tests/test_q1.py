@@ -0,0 +1,31 @@
+import pytest
+
+from algorithmia.q1 import fight_all, fight_all_from_file
+
+battle = "xBxAAABCDxCC\nBA"
+
+
+@pytest.mark.parametrize("fight_size", [1, 2, 3])
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 5, 1 << 10])
+def test_file_matches_in_memory(tmp_path, fight_size, chunk_bytes):
+    path = tmp_path / "battle.txt"
+    for text in (battle, battle + "\n"):
+        path.write_text(text)
+        assert fight_all_from_file(path, fight_size, chunk_bytes) == fight_all(
+            text, fight_size
+        )
+
+
+def test_known_answers():
+    assert fight_all("ABBAC", fight_size=1) == 5
+    assert fight_all("AxBCDDCAxD", fight_size=2) == 28
+    assert fight_all("xBxAAABCDxCC", fight_size=3) == 30
+
+
+def test_unknown_creature_raises(tmp_path):
+    with pytest.raises(ValueError, match="'E'"):
+        fight_all("ABEx", fight_size=2)
+    path = tmp_path / "battle.txt"
+    path.write_text("AB\nxZ")
+    with pytest.raises(ValueError, match="'Z'"):
+        fight_all_from_file(path, fight_size=2, chunk_bytes=1)
@@ -0,0 +1,44 @@
+import random
+
+from algorithmia.q2 import count_runic_scales
+
+
+def brute_force_scales(words: list[str], armor: list[str]) -> int:
+    """Try every word, both ways round, from every scale: along its row
+    (wrapping round as often as it takes) and down its column (not wrapping)."""
+    height, width = len(armor), len(armor[0])
+    covered = set()
+    for word in words + [word[::-1] for word in words]:
+        for x in range(height):
+            for y in range(width):
+                along = [(x, (y + i) % width) for i in range(len(word))]
+                down = [(x + i, y) for i in range(len(word))]
+                for cells in (along, down):
+                    if all(
+                        i < height and armor[i][j] == letter
+                        for (i, j), letter in zip(cells, word)
+                    ):
+                        covered.update(cells)
+    return len(covered)
+
+
+def test_scales_match_brute_force():
+    rng = random.Random(2)
+    for _ in range(300):
+        height, width = rng.randint(1, 6), rng.randint(1, 6)
+        armor = ["".join(rng.choices("AB", k=width)) for _ in range(height)]
+        # some words longer than the armor is wide, to wrap right round
+        words = [
+            "".join(rng.choices("AB", k=rng.randint(1, 8)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        assert count_runic_scales(words, armor) == brute_force_scales(words, armor), (
+            words,
+            armor,
+        )
+
+
+def test_example_armor():
+    words = ["THE", "OWE", "MES", "ROD", "RODEO"]
+    armor = ["HELWORLT", "ENIGWDXL", "TRODEOAL"]
+    assert count_runic_scales(words, armor) == 10
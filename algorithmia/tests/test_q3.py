@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from algorithmia.q3 import dig_by_distance, dig_by_erosion, dig_by_scanning
+
+
+@pytest.mark.parametrize("diag", [False, True])
+@pytest.mark.parametrize("offgrid", [False, True])
+def test_dig_methods_agree(diag, offgrid):
+    rng = np.random.default_rng(3)
+    for _ in range(40):
+        shape = tuple(rng.integers(1, 12, size=2))
+        grid_map = (rng.random(shape) < rng.uniform(0.3, 1)).astype(np.int64)
+        if not offgrid and grid_map.all():
+            grid_map[tuple(rng.integers(0, shape))] = 0  # something to dig from
+        expected = dig_by_scanning(grid_map.copy(), diag=diag, offgrid=offgrid)
+        assert (dig_by_distance(grid_map, diag=diag, offgrid=offgrid) == expected).all()
+        for tile_rows in (None, 1, 2, 5):
+            dug = dig_by_erosion(
+                grid_map.copy(), diag=diag, offgrid=offgrid, tile_rows=tile_rows
+            )
+            assert (dug == expected).all(), tile_rows
+
+
+@pytest.mark.parametrize("method", [dig_by_distance, dig_by_erosion])
+def test_nothing_to_dig_from(method):
+    with pytest.raises(ValueError):
+        method(np.ones((3, 3), dtype=np.int64))
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithmia.q4 import (
+    NailIndex,
+    hammer,
+    hammer_p3,
+    hammer_p3_from_file,
+    read_nails,
+)
+
+
+def test_nail_index_matches_brute_force():
+    rng = random.Random(4)
+    universe = [rng.randrange(-50, 1000) for _ in range(60)]
+    nails = [rng.choice(universe) for _ in range(5)]
+    index = NailIndex(nails, universe=universe)
+    for _ in range(500):
+        move = rng.random()
+        if move < 0.4:
+            height = rng.choice(universe)
+            index.add(height)
+            nails.append(height)
+        elif move < 0.6:
+            batch = [rng.choice(universe) for _ in range(rng.randrange(4))]
+            index.add_many(batch)
+            nails.extend(batch)
+        elif nails:
+            height = rng.choice(nails)
+            index.remove(height)
+            nails.remove(height)
+        assert len(index) == len(nails)
+        if nails:
+            assert index.hammer() == hammer(nails)
+            assert index.hammer_p3() == hammer_p3(nails)
+            k = rng.randrange(1, len(nails) + 1)
+            assert index.kth(k) == sorted(nails)[k - 1]
+
+
+def test_nail_index_refuses_unknown_heights():
+    index = NailIndex([3, 5], universe=[4])
+    index.add(4)
+    with pytest.raises(ValueError):
+        index.add(6)
+    with pytest.raises(ValueError):
+        index.add_many([4, 6])
+    assert len(index) == 3  # the bad batch added nothing
+    with pytest.raises(ValueError):
+        index.remove(5, times=2)
+    with pytest.raises(ValueError):
+        index.remove(7)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 7, 1 << 10])
+@pytest.mark.parametrize("ending", ["", "\n", "\n\n", "\n \n"])
+def test_read_nails_any_chunk_size(tmp_path, chunk_bytes, ending):
+    nails = [10, 20, 3, 3, 987, 0, 15]
+    path = tmp_path / "nails.txt"
+    path.write_text("\n".join(map(str, nails)) + ending)
+    assert read_nails(path, chunk_bytes).tolist() == nails
+    assert hammer_p3_from_file(path, chunk_bytes) == hammer_p3(nails)
+
+
+def test_read_nails_refuses_heights_too_big(tmp_path):
+    path = tmp_path / "nails.txt"
+    path.write_text("1\n3000000000\n")
+    with pytest.raises(ValueError):
+        read_nails(path)
+    assert read_nails(path, dtype=np.int64).tolist() == [1, 3000000000]
@@ -0,0 +1,58 @@
+from algorithmia.q5 import (
+    DanceFloor,
+    biggest_shout,
+    clap_dance,
+    clap_spot,
+    process_input,
+    shouted_times,
+)
+
+example = "2 3 4 5\n6 7 8 9"
+
+
+def walk_to_spot(clapper: int, column_length: int) -> int:
+    """Clap along the column one dancer at a time: down the left side,
+    joining in front of whoever the last clap was next to, then up the right
+    side, joining behind them."""
+    spot, going_down = 0, True
+    for _ in range(clapper - 1):
+        if going_down and spot == column_length - 1:
+            going_down, spot = False, column_length  # round to the right side
+        elif not going_down and spot == 1:
+            going_down, spot = True, 0  # round to the left side again
+        else:
+            spot += 1 if going_down else -1
+    return spot
+
+
+def test_clap_spot_matches_walk():
+    for column_length in range(1, 8):
+        for clapper in range(1, 6 * column_length + 3):
+            assert clap_spot(clapper, column_length) == walk_to_spot(
+                clapper, column_length
+            ), (clapper, column_length)
+
+
+def test_clap_spot_examples():
+    assert clap_spot(2, 4) == 1  # in front of the second dancer
+    assert clap_spot(5, 4) == 4  # behind the last dancer
+    assert clap_spot(8, 4) == 1  # behind the first dancer
+    assert clap_spot(9, 4) == 0  # round again, in front of the first
+    assert clap_spot(1, 0) == 0
+
+
+def test_fingerprint_keeps_up_with_the_dance():
+    floor = DanceFloor(process_input("2 3 4 5\n3 4 5 2\n4 5 2 3\n5 2 3 4"))
+    for _ in range(200):
+        floor.dance()
+        fresh = DanceFloor([list(col) for col in floor.columns], floor.rd)
+        assert floor.fingerprint() == fresh.fingerprint()
+        assert floor.arrangement() == fresh.arrangement()
+        assert floor.shout() == fresh.shout()
+
+
+def test_dance_answers_match_playing_it_out():
+    assert shouted_times(process_input(example)) == clap_dance(
+        process_input(example), num_rounds=10**9, print_every_nth=None
+    )
+    assert biggest_shout(process_input(example)) == 6584
@@ -0,0 +1,41 @@
+import pytest
+
+from algorithmia.q6 import NO_PARENT, Orchard, most_powerful_fruit_path, parse_input
+
+example = """RR:A,B,C
+A:D,E
+B:F,@
+C:G,H
+D:@
+E:@
+F:@
+G:@
+H:@"""
+
+
+def test_example():
+    assert most_powerful_fruit_path(parse_input(example)) == "RRB@"
+    assert most_powerful_fruit_path(parse_input(example), part=2) == "RB@"
+    assert parse_input(example.splitlines()) == parse_input(example)
+
+
+@pytest.mark.parametrize(
+    "lines, problem",
+    [
+        (["RR:A,B", "A:C", "B:C", "C:@"], "grows from both"),  # second parent
+        (["RR:A,@", "B:C", "C:B"], "loop"),
+        (["RR:A,@", "B:@"], "don't grow from anything"),  # orphan
+        (["X:RR,Y", "Y:@", "RR:A", "A:@,@"], "is the root"),
+        (["A:B", "B:@"], "No RR branch"),
+    ],
+)
+def test_malformed_orchards(lines, problem):
+    with pytest.raises(ValueError, match=problem):
+        parse_input("\n".join(lines))
+
+
+def test_depths_refuse_a_detached_branch():
+    # put together by hand, since parse_input won't make one like it
+    orchard = Orchard(["RR", "A"], [NO_PARENT, NO_PARENT], [0, 1], {"RR": 0, "A": 1}, 0)
+    with pytest.raises(ValueError, match="A doesn't grow from the root"):
+        most_powerful_fruit_path(orchard)
@@ -0,0 +1,57 @@
+import random
+from itertools import permutations
+
+from algorithmia.q7 import (
+    Chariot,
+    knight_race,
+    multiset_permutations,
+    parse_chariots,
+    parse_track,
+    race,
+)
+
+example_chariots = "A:+,=,=,=\nB:+,=,-,+\nC:=,-,+,+\nD:=,=,=,+"
+example_track = "S+===\n-   +\n=+=-+"
+
+
+def race_step_by_step(chariots, steps, track=None):
+    for turn in range(steps):
+        terrain = "=" if track is None else chr(track[turn % len(track)])
+        for chariot in chariots:
+            chariot.execute_action(turn, terrain)
+    return chariots
+
+
+def test_race_matches_step_by_step():
+    rng = random.Random(7)
+    for _ in range(200):
+        plans = [rng.choices("+-=", k=rng.randint(1, 6)) for _ in range(3)]
+        track = None
+        if rng.random() < 0.7:
+            track = "".join(rng.choices("+-==", k=rng.randint(1, 9))) + "S"
+            track = track.encode()
+        steps = rng.randint(1, 60)
+        power = rng.randint(0, 3)  # low, so power often bottoms out at 0
+        fast = [Chariot(name, plan, power) for name, plan in zip("ABC", plans)]
+        slow = [Chariot(name, plan, power) for name, plan in zip("ABC", plans)]
+        race(fast, steps, track)
+        race_step_by_step(slow, steps, track)
+        assert [(c.power, c.essence) for c in fast] == [
+            (c.power, c.essence) for c in slow
+        ]
+
+
+def test_multiset_permutations():
+    for items in ["", "a", "aab", "abc", "aabbb", "+++--=="]:
+        perms = list(multiset_permutations(items))
+        assert perms == sorted(set(permutations(items)))
+
+
+def test_parse_track_example():
+    assert parse_track(example_track) == b"+===++-=+=-S"
+
+
+def test_knight_race_example():
+    track = parse_track(example_track)
+    order, _ = knight_race(parse_chariots(example_chariots), track, loops=10)
+    assert order == "DCBA"
@@ -0,0 +1,73 @@
+import random
+from math import gcd
+
+from algorithmia.q8 import part1, part2, part3
+
+
+def part2_layer_by_layer(blocks: int, num_priests: int, num_acolytes: int) -> int:
+    blocks_left = blocks - 1
+    layer = thickness = 1
+    while blocks_left > 0:
+        layer += 1
+        width = 2 * layer - 1
+        thickness = (thickness * num_priests) % num_acolytes
+        blocks_left -= width * thickness
+    return -blocks_left * width
+
+
+def part3_layer_by_layer(blocks: int, num_priests: int, num_acolytes: int) -> int:
+    heights = [1]
+    thickness = 1
+    while True:
+        width = len(heights)
+        hollow = [(num_priests * width * ht) % num_acolytes for ht in heights[1:-1]]
+        needed = sum(heights) - sum(hollow)
+        if needed >= blocks:
+            return needed - blocks
+        thickness = (thickness * num_priests) % num_acolytes + num_acolytes
+        heights = [thickness] + [ht + thickness for ht in heights] + [thickness]
+
+
+def test_examples():
+    assert part1(13) == 21
+    assert part2(50, num_priests=3, num_acolytes=5) == 27
+    assert part3(160, num_priests=2, num_acolytes=5) == 2
+
+
+def test_part1_matches_building_up():
+    for blocks in range(1, 500):
+        layer = used = 0
+        while used < blocks:
+            layer += 1
+            used += 2 * layer - 1
+        assert part1(blocks) == (used - blocks) * (2 * layer - 1)
+
+
+def test_part2_matches_layer_by_layer():
+    rng = random.Random(8)
+    for _ in range(300):
+        num_acolytes = rng.randint(2, 60)
+        num_priests = rng.randint(1, 200)
+        if gcd(num_priests, num_acolytes) != 1:
+            continue  # thickness would hit 0 and the pyramid stop growing
+        blocks = rng.randint(2, 10 ** rng.randint(1, 7))
+        assert part2(blocks, num_priests, num_acolytes) == part2_layer_by_layer(
+            blocks, num_priests, num_acolytes
+        )
+
+
+def test_part3_matches_layer_by_layer():
+    rng = random.Random(9)
+    for _ in range(100):
+        num_acolytes = rng.randint(1, 50)
+        num_priests = rng.randint(1, 10**6)
+        blocks = rng.randint(1, 10**5)
+        assert part3(blocks, num_priests, num_acolytes) == part3_layer_by_layer(
+            blocks, num_priests, num_acolytes
+        )
+
+
+def test_part3_does_not_overflow():
+    # num_priests * width * height is far past int64 here
+    args = (10**9, 10**18 + 9, 10**10 + 7)
+    assert part3(*args) == part3_layer_by_layer(*args)
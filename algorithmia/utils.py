@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# Quest scripts run from inside this folder, so make the repo-level `common`
+# package importable, then re-export the helpers it collects for the quests.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import *  # noqa: E402,F401,F403
@@ -0,0 +1,165 @@
+"""Time every quest on synthetic inputs of growing size and check how it scales.
+
+Usage (from the repo root):
+    python -m benchmarks.bench                       # every case
+    python -m benchmarks.bench algorithmia/q3 q13    # just these quests
+    python -m benchmarks.bench --output bench.json --repeats 5
+
+For each case in benchmarks/cases.py, inputs are generated from a fixed seed
+at each size n, the quest function is timed on them (best of --repeats runs),
+and a power law time ~ c * n ** k is fitted to the timings by least squares on
+a log-log scale. A case fails if the fitted k exceeds the case's max_exponent,
+and the command exits non-zero if any case failed or could not run.
+
+The generated inputs don't need the real puzzle inputs, so where an event
+has none checked out (no `input_data` module, as for song/ here) a stand-in
+that reads every input as "" is imported in its place. A quest that still
+can't be imported fails all of its cases.
+
+Quests are measured in parallel, one fresh process per quest module, using
+run_quests.py's worker pool.
+"""
+
+import argparse
+import importlib
+import io
+import json
+import math
+import os
+import random
+import sys
+import time
+import types
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from benchmarks.cases import CASES, Case
+from run_quests import enter_event, run_pool, select_quests
+
+DEFAULT_SEED = 2024
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Slope of log(time) against log(n), i.e. k in time ~ c * n ** k."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def time_case(module, case: Case, seed: int, repeats: int) -> list[float]:
+    """Best-of-repeats time of the case's function at each of its sizes.
+    Inputs are rebuilt (untimed) before every run, since some quest functions
+    modify their arguments."""
+    function = getattr(module, case.function)
+    best_times = []
+    for n in case.sizes:
+        best = math.inf
+        for _ in range(repeats):
+            rng = random.Random(f"{seed}:{case.label}:{n}")
+            args, kwargs = case.make_input(n, rng)
+            if case.prepare:
+                args = (getattr(module, case.prepare)(args[0]),) + args[1:]
+            start = time.perf_counter()
+            function(*args, **kwargs)
+            best = min(best, time.perf_counter() - start)
+        best_times.append(best)
+    return best_times
+
+
+def _blank_input(name: str) -> str:
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return ""
+
+
+def stand_in_inputs() -> None:
+    """Make `from input_data import anything` give "" for an event with no
+    puzzle inputs checked out."""
+    stub = types.ModuleType("input_data", "Blank stand-in for the puzzle inputs")
+    stub.__getattr__ = _blank_input
+    sys.modules["input_data"] = stub
+
+
+def measure_quest(quest: str, seed: int, repeats: int) -> list[dict]:
+    """Worker: import one quest module from inside its event folder and time
+    all of its cases. Anything the quest prints is thrown away."""
+    event_dir, module_name = enter_event(quest)
+    os.environ["QUEST_CACHE"] = "0"  # time the work, not the cached answers
+    if not (event_dir / "input_data.py").exists():
+        stand_in_inputs()
+    results = []
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        try:
+            module = importlib.import_module(module_name)
+        except BaseException as e:
+            module = None
+            import_status, import_error = "error", f"{type(e).__name__}: {e}"
+        for case in (c for c in CASES if c.quest == quest):
+            result = {"case": case.label, "sizes": list(case.sizes)}
+            if module is None:
+                result.update(status=import_status, error=import_error)
+            else:
+                try:
+                    result["times_s"] = time_case(module, case, seed, repeats)
+                    result["status"] = "ok"
+                except Exception as e:
+                    result.update(status="error", error=f"{type(e).__name__}: {e}")
+            results.append(result)
+    return results
+
+
+def judge(result: dict) -> dict:
+    case = next(c for c in CASES if c.label == result["case"])
+    result["max_exponent"] = case.max_exponent
+    if result["status"] == "ok":
+        exponent = fit_exponent(case.sizes, result["times_s"])
+        result["exponent"] = round(exponent, 3)
+        result["times_s"] = [round(t, 6) for t in result["times_s"]]
+        if exponent > case.max_exponent:
+            result["status"] = "too slow"
+    if case.note:
+        result["note"] = case.note
+    return result
+
+
+def run_benchmarks(quests: list[str], seed: int, repeats: int, jobs=None) -> list:
+    results = []
+    tasks = [(quest, seed, repeats) for quest in quests]
+    for quest_results in run_pool(measure_quest, tasks, jobs):
+        for result in quest_results:
+            result = judge(result)
+            exponent = result.get("exponent", "-")
+            print(
+                f"{result['case']}: {result['status']} (n^{exponent})",
+                file=sys.stderr,
+            )
+            results.append(result)
+    labels = [c.label for c in CASES]
+    return sorted(results, key=lambda r: labels.index(r["case"]))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("quests", nargs="*", help="e.g. algorithmia/q3 or q3")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--output", help="write the JSON results here, not stdout")
+    args = parser.parse_args(argv)
+
+    quests = select_quests(list(dict.fromkeys(c.quest for c in CASES)), args.quests)
+    results = run_benchmarks(quests, args.seed, args.repeats, jobs=args.jobs)
+    report = json.dumps({"seed": args.seed, "cases": results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    else:
+        print(report)
+    return 0 if all(r["status"] == "ok" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
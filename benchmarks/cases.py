@@ -0,0 +1,396 @@
+"""Seeded synthetic inputs for benchmarking every quest at growing sizes.
+
+Each Case names a quest module, the function to time, and a generator that
+builds that function's arguments for a problem of size n from a seeded
+random.Random. `max_exponent` is the largest fitted growth exponent (time ~
+n ** exponent) the case may show before the benchmark fails: set it to the
+complexity the current solution is supposed to have plus some slack for noise,
+so that an O(n) path turning O(n ** 2) gets caught.
+
+`prepare` lets a case reuse the quest's own parser, e.g. to turn generated
+text into the objects the timed function expects.
+"""
+
+import random
+import string
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+
+Args = tuple[tuple, dict]
+
+
+@dataclass
+class Case:
+    quest: str  # e.g. "algorithmia/q1"
+    function: str  # name of the function to time within the quest module
+    make_input: Callable[[int, random.Random], Args]
+    sizes: tuple[int, ...]  # values of n, ideally growing geometrically
+    max_exponent: float
+    # name of a quest function run (untimed) on the first generated argument,
+    # for quests whose timed function takes parsed objects rather than text
+    prepare: str | None = None
+    note: str = ""
+    label: str = field(default="")
+
+    def __post_init__(self):
+        if not self.label:
+            self.label = f"{self.quest}:{self.function}"
+
+
+def geometric(start: int, steps: int = 5, ratio: int = 2) -> tuple[int, ...]:
+    return tuple(start * ratio**k for k in range(steps))
+
+
+def letters(rng: random.Random, n: int, alphabet: str = string.ascii_uppercase):
+    return "".join(rng.choices(alphabet, k=n))
+
+
+def blob_grid(side: int, rng: random.Random, on: str = "#", off: str = ".") -> str:
+    """A side x side map with a rough disc of `on` cells in the middle."""
+    center = (side - 1) / 2
+    radius = side / 2 - 1
+    rows = []
+    for x in range(side):
+        row = ""
+        for y in range(side):
+            wobble = rng.uniform(-1, 1)
+            inside = ((x - center) ** 2 + (y - center) ** 2) ** 0.5 < radius + wobble
+            row += on if inside else off
+        rows.append(row)
+    return "\n".join(rows)
+
+
+### ALGORITHMIA ###############################################################
+
+
+def algorithmia_q1(n, rng):
+    return (letters(rng, 3 * n, "ABCDx"),), {"fight_size": 3}
+
+
+def algorithmia_q2(n, rng):
+    words = list({letters(rng, rng.randint(2, 6)) for _ in range(40)})
+    shield = [letters(rng, 60) for _ in range(n)]
+    return (words, shield), {}
+
+
+def algorithmia_q2_scales(n, rng):
+    """A square armor of about n scales."""
+    words = list({letters(rng, rng.randint(2, 6)) for _ in range(40)})
+    side = int(n**0.5)
+    return (words, [letters(rng, side) for _ in range(side)]), {}
+
+
+def algorithmia_q3(n, rng):
+    side = int(n**0.5)
+    return (blob_grid(side, rng),), {"diag": True, "offgrid": True}
+
+
+def algorithmia_q4(n, rng):
+    return ([rng.randint(0, 10**6) for _ in range(n)],), {}
+
+
+def algorithmia_q5(n, rng):
+    """Four columns of n / 4 distinct dancers, danced for a fixed 100 rounds."""
+    dancers = rng.sample(range(1, 4 * n + 1), 4 * (n // 4))
+    rows = [
+        " ".join(str(d) for d in dancers[i : i + 4]) for i in range(0, len(dancers), 4)
+    ]
+    return ("\n".join(rows),), {"num_rounds": 100, "print_every_nth": None}
+
+
+def algorithmia_q6(n, rng):
+    """A random tree of n branches with fruits in pairs at every depth, plus
+    one fruit at the end of a long branch so exactly one fruit depth is unique."""
+    names = set()
+    while len(names) < n + 64:
+        names.add(letters(rng, 4))
+    names = sorted(names - {"BUG", "ANT"})
+    rng.shuffle(names)
+    children = {"RR": []}
+    nodes = ["RR"]
+    for name in names[:n]:
+        parent = rng.choice(nodes)
+        children[parent].append(name)
+        children[name] = []
+        nodes.append(name)
+    for parent in rng.sample(nodes, k=max(1, n // 4)):
+        children[parent] += ["@", "@"]
+    # a branch longer than anything else in the tree, ending in a lone fruit
+    parent = "RR"
+    for name in names[n:]:
+        children[parent].append(name)
+        children[name] = []
+        parent = name
+    children[parent].append("@")
+    lines = [f"{node}:{','.join(kids)}" for node, kids in children.items() if kids]
+    return ("\n".join(lines),), {}
+
+
+def algorithmia_q7(n, rng):
+    plans = "\n".join(
+        f"{name}:{','.join(rng.choices('+-=', k=10))}" for name in "ABCDEFGHIJ"
+    )
+    track = "S" + "".join(rng.choices("+-=", k=n - 1))
+    return (plans, track), {"loops": 10}
+
+
+def algorithmia_q8(n, rng):
+    return (n,), {}
+
+
+def algorithmia_q12(n, rng):
+    return ([(rng.randint(10, 30), rng.randint(10, 30)) for _ in range(n)],), {}
+
+
+def algorithmia_q13(n, rng):
+    side = int(n**0.5)
+    rows = [list(letters(rng, side, string.digits)) for _ in range(side)]
+    rows[0][0] = "S"
+    rows[-1][-1] = "E"
+    return (np.array(rows),), {}
+
+
+def algorithmia_q17(n, rng):
+    side = 4 * int(n**0.5)
+    chart = [["." for _ in range(side)] for _ in range(side)]
+    for flat in rng.sample(range(side * side), n):
+        chart[flat // side][flat % side] = "*"
+    return ("\n".join("".join(row) for row in chart),), {}
+
+
+### SONG ######################################################################
+
+
+def song_q1(n, rng):
+    names = ",".join(letters(rng, 6) for _ in range(n))
+    steps = ",".join(f"{rng.choice('LR')}{rng.randint(1, 3 * n)}" for _ in range(n))
+    return (f"{names}\n\n{steps}",), {}
+
+
+def song_q2(n, rng):
+    # prepared into ComplexNumber(1, 0), which stays in bounds for every cycle
+    return (1,), {"divisor": 100_000, "cycles": n}
+
+
+def song_q3(n, rng):
+    # crate sizes repeat, as in the puzzle; n distinct ones would time the
+    # dict outgrowing the CPU cache rather than the quest
+    return ([rng.randint(1, 1000) for _ in range(n)],), {}
+
+
+def song_q4(n, rng):
+    gears = [rng.randint(5, 100)]
+    gears += [[rng.randint(5, 100), rng.randint(5, 100)] for _ in range(n - 2)]
+    gears.append(rng.randint(5, 100))
+    return (gears,), {}
+
+
+def song_q5(n, rng):
+    swords = []
+    for sword_id in range(1, n + 1):
+        nums = ",".join(str(rng.randint(1, 9)) for _ in range(10))
+        swords.append(f"{sword_id}:{nums}")
+    return ("\n".join(swords),), {}
+
+
+def song_q6(n, rng):
+    return (letters(rng, n, "AaBbCc"),), {"dist_limit": 10}
+
+
+def song_q7(n, rng):
+    names = ",".join(letters(rng, rng.randint(4, 8), "ABCDEF") for _ in range(n))
+    rules = "\n".join(f"{c} > {','.join(rng.sample('ABCDEF', k=3))}" for c in "ABCDEF")
+    return (f"{names}\n\n{rules}",), {}
+
+
+def song_q8(n, rng):
+    return (",".join(str(rng.randint(1, 256)) for _ in range(n)),), {}
+
+
+def song_q9(n, rng):
+    """n dragons where every third dragon is the child of the two before it."""
+    dnas = []
+    for sn in range(1, n + 1):
+        if sn % 3 == 0:
+            parents = dnas[-2:]
+            dna = "".join(rng.choice(pair) for pair in zip(*parents))
+        else:
+            dna = letters(rng, 40, "ACGT")
+        dnas.append(dna)
+    return ("\n".join(f"{sn}:{dna}" for sn, dna in enumerate(dnas, 1)),), {}
+
+
+def song_q10(n, rng):
+    side = int(n**0.5)
+    board = [[rng.choice("....S#") for _ in range(side)] for _ in range(side)]
+    board[side // 2][side // 2] = "D"
+    return ("\n".join("".join(row) for row in board),), {"n_turns": 4}
+
+
+def song_q11(n, rng):
+    return ([rng.randint(1, 100) for _ in range(n)],), {}
+
+
+def song_q12(n, rng):
+    side = int(n**0.5)
+    grid = "\n".join(letters(rng, side, "56789") for _ in range(side))
+    return (grid,), {}
+
+
+def song_q13(n, rng):
+    starts = [rng.randint(1, 10**6) for _ in range(n)]
+    return ("\n".join(f"{s}-{s + 9}" for s in starts),), {"turns": 10**9}
+
+
+def song_q14(n, rng):
+    side = int(n**0.5)
+    return ("\n".join(letters(rng, side, "#.") for _ in range(side)),), {"rounds": 5}
+
+
+def song_q16(n, rng):
+    spell = sorted(rng.sample(range(1, 40), 8))
+    fragment = [sum(1 for s in spell if col % s == 0) for col in range(1, n + 1)]
+    return (",".join(str(f) for f in fragment),), {}
+
+
+def song_q20(n, rng):
+    """A solid triangle of trampolines about n cells big, with one S and one E."""
+    rows = int(n**0.5)
+    width = 2 * rows - 1
+    floor = []
+    for r in range(rows):
+        inner = "T" * (width - 2 * r)
+        floor.append("." * r + inner + "." * r)
+    floor[0] = "S" + floor[0][1:]
+    last = rows - 1
+    floor[last] = floor[last][:last] + "E" + floor[last][last + 1 :]
+    return ("\n".join(floor),), {}
+
+
+CASES = [
+    Case(
+        "algorithmia/q1",
+        "fight_all",
+        algorithmia_q1,
+        geometric(20_000),
+        1.5,
+    ),
+    Case("algorithmia/q2", "count_full_shield", algorithmia_q2, geometric(20), 1.5),
+    Case(
+        "algorithmia/q2",
+        "count_runic_scales",
+        algorithmia_q2_scales,
+        geometric(10_000, ratio=4),
+        1.5,
+    ),
+    Case(
+        "algorithmia/q3",
+        "survey",
+        algorithmia_q3,
+        geometric(10_000, steps=4, ratio=4),
+        1.5,
+    ),
+    Case("algorithmia/q4", "hammer_p3", algorithmia_q4, geometric(20_000), 1.5),
+    Case(
+        "algorithmia/q5",
+        "clap_dance",
+        algorithmia_q5,
+        geometric(400),
+        1.5,
+        prepare="process_input",
+    ),
+    Case(
+        "algorithmia/q6",
+        "most_powerful_fruit_path",
+        algorithmia_q6,
+        geometric(500),
+        1.3,
+        prepare="parse_input",
+        note="each branch's depth is worked out once: O(branches)",
+    ),
+    Case(
+        "algorithmia/q7",
+        "knight_race",
+        algorithmia_q7,
+        geometric(200),
+        1.5,
+        prepare="parse_chariots",
+    ),
+    Case(
+        "algorithmia/q8",
+        "part1",
+        algorithmia_q8,
+        geometric(10**6, ratio=4),
+        0.5,
+    ),
+    Case("algorithmia/q12", "part3", algorithmia_q12, geometric(5), 1.5),
+    Case(
+        "algorithmia/q13",
+        "run",
+        algorithmia_q13,
+        geometric(400, ratio=4),
+        1.4,
+        note="deque BFS to build the graph, then one Dijkstra from the end: "
+        "O(cells log cells)",
+    ),
+    Case(
+        "algorithmia/q17",
+        "full_constellation_size",
+        algorithmia_q17,
+        geometric(25),
+        2.5,
+        note="complete graph of stars: O(stars ** 2)",
+    ),
+    Case("song/q1", "part3", song_q1, geometric(2_000), 1.5),
+    Case("song/q2", "part1", song_q2, geometric(2_000), 1.5, prepare="ComplexNumber"),
+    Case("song/q3", "part3", song_q3, geometric(20_000), 1.5),
+    Case("song/q4", "part3", song_q4, geometric(20_000), 1.5),
+    Case("song/q5", "part3", song_q5, geometric(200), 1.7),
+    Case("song/q6", "surrounding_mentors", song_q6, geometric(5_000), 1.5),
+    Case("song/q7", "part2", song_q7, geometric(1_000), 1.5),
+    Case(
+        "song/q8",
+        "part2",
+        song_q8,
+        geometric(100),
+        2.5,
+        note="every thread checked against every earlier one: O(n ** 2)",
+    ),
+    Case(
+        "song/q9",
+        "solve",
+        song_q9,
+        geometric(12, steps=4),
+        3.5,
+        note="every pair of candidate parents per child: O(n ** 3)",
+    ),
+    Case("song/q10", "part2", song_q10, geometric(400, ratio=4), 1.5),
+    Case("song/q11", "run_fast_simulation", song_q11, geometric(100), 2.5),
+    Case(
+        "song/q12",
+        "chain_reaction",
+        song_q12,
+        geometric(400, ratio=4),
+        1.5,
+        prepare="gridify",
+    ),
+    Case(
+        "song/q13",
+        "turn_dial",
+        song_q13,
+        geometric(500),
+        2.5,
+        note="counter-clockwise side is rebuilt by list concatenation: O(n ** 2)",
+    ),
+    Case(
+        "song/q14",
+        "total_tiles_across_rounds",
+        song_q14,
+        geometric(400, ratio=4),
+        1.5,
+    ),
+    Case("song/q16", "reverse_engineer_spell", song_q16, geometric(500), 1.5),
+    Case("song/q20", "part2", song_q20, geometric(400, ratio=4), 1.5),
+]
@@ -0,0 +1,49 @@
+"""Helpers shared by the quest solutions in every event folder.
+
+Quest scripts are run from inside their own event folder (so that
+`from input_data import ...` works), which means this package is reached
+through each folder's `utils.py` rather than imported directly. Everything
+the quests use is re-exported here, so a new helper only needs adding once."""
+
+from .cache import disk_cache
+from .cycles import (
+    COUNTER,
+    MAX,
+    MIN,
+    SUM,
+    Aggregate,
+    Cycle,
+    aggregate_rounds,
+    find_cycle,
+    first_to_reach,
+    fingerprint,
+)
+from .fenwick import Fenwick
+from .graph import (
+    UNREACHED,
+    CSRGraph,
+    GraphBuilder,
+    UnionFind,
+    bfs,
+    connected_components,
+    dijkstra,
+    kruskal,
+    minimum_spanning_forest,
+    path_to,
+)
+from .grid import (
+    distance_transform,
+    gridify,
+    neighbor_lists,
+    neighbor_locs,
+    neighbor_table,
+    neighbors,
+    offsets_for,
+    padded_flat,
+    parse_digit_grid,
+    parse_grid,
+    to_flat,
+    to_loc,
+)
+from .matching import Automaton, Coverage
+from .profiling import count, hotspot, timed
@@ -0,0 +1,152 @@
+"""Persistent, content-addressed cache for quest answers.
+
+Decorating a quest function with @disk_cache stores its return value on disk,
+keyed on a hash of its arguments (the puzzle input, usually) together with a
+hash of the source it can depend on: the file that defines it, the utils.py
+beside it and every module of this shared package. Running the same quest on
+the same input again just loads the answer. Editing any of that source changes
+the key, so stale answers are never served; they are simply never looked up
+again and age out of the cache.
+
+The cache lives in .quest_cache/ at the repo root and is kept under a size
+budget by evicting the least recently used entries. Environment variables:
+    QUEST_CACHE=0            turn the cache off (e.g. when benchmarking)
+    QUEST_CACHE_DIR=path     keep the cache somewhere else
+    QUEST_CACHE_MAX_BYTES=n  size budget, 256 MiB by default
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import Counter
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+
+COMMON_DIR = Path(__file__).resolve().parent
+REPO_ROOT = COMMON_DIR.parent
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# calls answered from the cache so far in this process, by function
+hits = Counter()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("QUEST_CACHE", "1") != "0"
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get("QUEST_CACHE_DIR", REPO_ROOT / ".quest_cache"))
+
+
+def max_cache_bytes() -> int:
+    return int(os.environ.get("QUEST_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+
+def _feed(digest, obj) -> None:
+    """Hash an argument by content. Type names go in too, so that e.g. "1"
+    and 1 don't collide."""
+    digest.update(type(obj).__name__.encode())
+    if isinstance(obj, str):
+        digest.update(obj.encode())
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        digest.update(bytes(obj))
+    elif isinstance(obj, np.ndarray):
+        digest.update(f"{obj.dtype.str}{obj.shape}".encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        digest.update(str(len(obj)).encode())
+        for item in obj:
+            _feed(digest, item)
+    elif isinstance(obj, dict):
+        digest.update(str(len(obj)).encode())
+        for key in sorted(obj, key=repr):
+            _feed(digest, key)
+            _feed(digest, obj[key])
+    elif obj is None or isinstance(obj, (bool, int, float, complex)):
+        digest.update(repr(obj).encode())
+    else:
+        digest.update(pickle.dumps(obj))
+
+
+def source_files(func) -> list[Path]:
+    """Files whose edits can change func's answers: the whole file defining
+    it (helpers included), its event folder's utils.py, and the shared
+    modules that utils.py re-exports."""
+    source_file = Path(func.__code__.co_filename).resolve()
+    files = [source_file]
+    utils = source_file.with_name("utils.py")
+    if utils.is_file() and utils != source_file:
+        files.append(utils)
+    files += sorted(COMMON_DIR.glob("*.py"))
+    return files
+
+
+def code_fingerprint(func) -> str:
+    digest = hashlib.sha256(func.__qualname__.encode())
+    for path in source_files(func):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(func, args: tuple, kwargs: dict) -> str:
+    digest = hashlib.sha256(code_fingerprint(func).encode())
+    _feed(digest, args)
+    _feed(digest, kwargs)
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return cache_dir() / key[:2] / f"{key}.pkl"
+
+
+def evict(budget: int | None = None) -> None:
+    """Delete least recently used entries until the cache fits the budget.
+    Hits bump an entry's mtime, so mtime order is LRU order."""
+    budget = max_cache_bytes() if budget is None else budget
+    entries = []
+    for path in cache_dir().glob("*/*.pkl"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # evicted by another process meanwhile
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def disk_cache(func):
+    """Decorator: cache func's return values on disk (see module docstring).
+    Arguments are hashed before the call, so functions that modify their
+    arguments in place are keyed on what they were given."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not cache_enabled():
+            return func(*args, **kwargs)
+        path = _entry_path(cache_key(func, args, kwargs))
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+            hits[func.__qualname__] += 1
+            return result
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            pass
+        result = func(*args, **kwargs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write-then-rename, so a concurrent reader never sees half an entry
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            pickle.dump(result, f)
+        os.replace(f.name, path)
+        evict()
+        return result
+
+    return wrapper
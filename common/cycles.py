@@ -0,0 +1,259 @@
+"""Cycle detection for simulations that would take far too long to run out.
+
+A simulation here is a starting state plus a pure `step` function returning
+the next state (it must not modify its argument). Sooner or later such a
+simulation repeats itself: after `start` rounds it enters a cycle of `length`
+rounds that then goes round forever.
+
+Copying a big state every round can cost more than the round itself, so step
+may instead update the state in place (and return it) if a `copy` function
+is passed too: the few independent states the algorithms need are then made
+with copy(), and the caller's state is left alone.
+
+find_cycle() finds that cycle with Brent's algorithm, which only ever keeps a
+couple of states around and compares them by compact hashed fingerprints.
+A key that is cheap to keep up to date but may collide can be backed by an
+`exact` function: two states then only count as equal if their exact forms
+match too, and exact() is only called when their keys already do (and where
+the tortoise stops, a logarithmic number of times).
+
+aggregate_rounds() folds a per-round value (active tiles, the shout, ...)
+over rounds 1..n, for n as large as you like: it folds in the rounds before
+the cycle as it goes, keeps the values for one trip around the cycle, and
+works out the rest in closed form. Memory is proportional to the cycle
+length, not to the number of states seen. SUM, MAX, MIN and COUNTER cover the
+usual aggregates:
+
+    total = aggregate_rounds(floor, next_round, 1_000_000_000, active_tiles, SUM)
+
+first_to_reach() finds the first round by which some per-round value has come
+up a given number of times, stopping early if that happens before the cycle
+shows itself and working it out in closed form if not.
+"""
+
+import hashlib
+import operator
+from collections import Counter, defaultdict
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+
+
+def fingerprint(state) -> bytes:
+    """A 16-byte hash of a state: a numpy array, str or bytes, or anything
+    (nested lists and tuples of numbers, say) whose repr captures it."""
+    if isinstance(state, np.ndarray):
+        data = f"{state.dtype.str}{state.shape}".encode() + state.tobytes()
+    elif isinstance(state, str):
+        data = state.encode()
+    elif isinstance(state, (bytes, bytearray)):
+        data = bytes(state)
+    else:
+        data = repr(state).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class Cycle(NamedTuple):
+    start: int  # rounds before the first state that is part of the cycle
+    length: int
+
+
+class Aggregate(NamedTuple):
+    """How to fold per-round values together: `empty` makes a fresh
+    accumulator, `add` folds one value into it (in place is fine, as long as
+    it returns it), `merge` combines two accumulators and `repeat` gives the
+    accumulator for k back-to-back runs of the rounds behind one."""
+
+    empty: Callable[[], Any]
+    add: Callable[[Any, Any], Any]
+    merge: Callable[[Any, Any], Any]
+    repeat: Callable[[Any, int], Any]
+
+
+def _keep(pick):
+    def combine(a, b):
+        return b if a is None else a if b is None else pick(a, b)
+
+    return combine
+
+
+def _count(counter: Counter, value) -> Counter:
+    counter[value] += 1
+    return counter
+
+
+SUM = Aggregate(int, operator.add, operator.add, operator.mul)
+MAX = Aggregate(lambda: None, _keep(max), _keep(max), lambda acc, k: acc if k else None)
+MIN = Aggregate(lambda: None, _keep(min), _keep(min), lambda acc, k: acc if k else None)
+COUNTER = Aggregate(
+    Counter,
+    _count,
+    operator.add,
+    lambda acc, k: Counter({value: n * k for value, n in acc.items()}),
+)
+
+
+def _fold(aggregate: Aggregate, values) -> Any:
+    acc = aggregate.empty()
+    for value in values:
+        acc = aggregate.add(acc, value)
+    return acc
+
+
+def _independent(state, copy):
+    return state if copy is None else copy(state)
+
+
+def _mark(state, key, exact):
+    """What a waiting tortoise remembers of its state."""
+    return key(state), None if exact is None else exact(state)
+
+
+def _at(state, mark, key, exact) -> bool:
+    return key(state) == mark[0] and (exact is None or exact(state) == mark[1])
+
+
+def _same(state, other, key, exact) -> bool:
+    return key(state) == key(other) and (exact is None or exact(state) == exact(other))
+
+
+def _cycle_length(state, step, key, copy=None, exact=None) -> int:
+    """Brent's algorithm: the hare runs ahead while the tortoise waits at
+    rounds 1, 2, 4, 8, ... until the hare laps it."""
+    power = length = 1
+    tortoise = _mark(state, key, exact)
+    hare = step(_independent(state, copy))
+    while not _at(hare, tortoise, key, exact):
+        if power == length:
+            tortoise = _mark(hare, key, exact)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+    return length
+
+
+def _cycle_start(state, step, key, length, on_step=None, copy=None, exact=None):
+    """Walk a tortoise from state and a hare `length` rounds ahead of it in
+    lockstep; they first meet where the cycle starts. on_step(state) is called
+    on each of the tortoise's states after the first. Returns the number of
+    rounds before the cycle and the state it starts from."""
+    hare = _independent(state, copy)
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while not _same(state, hare, key, exact):
+        state, hare = step(state), step(hare)
+        start += 1
+        if on_step is not None:
+            on_step(state)
+    return start, state
+
+
+def find_cycle(
+    state,
+    step: Callable,
+    key: Callable = fingerprint,
+    copy: Callable = None,
+    exact: Callable = None,
+) -> Cycle:
+    """Where and how long the cycle of step() starting from state is. States
+    are compared by key(state), so key has to tell apart states that will
+    play out differently, unless exact(state) is there to settle ties."""
+    state = _independent(state, copy)
+    length = _cycle_length(state, step, key, copy, exact)
+    start, _ = _cycle_start(state, step, key, length, copy=copy, exact=exact)
+    return Cycle(start, length)
+
+
+def aggregate_rounds(
+    state,
+    step: Callable,
+    n: int,
+    value: Callable,
+    aggregate: Aggregate = SUM,
+    key: Callable = fingerprint,
+    copy: Callable = None,
+    exact: Callable = None,
+):
+    """Fold value(state after round t) over rounds t = 1..n with aggregate,
+    without playing out more than a few laps of the cycle."""
+    state = _independent(state, copy)
+    length = _cycle_length(state, step, key, copy, exact)
+    # the rounds before the cycle are folded in as the search for its start
+    # walks through them
+    acc = aggregate.empty()
+    rounds = 0
+
+    def fold_in(state):
+        nonlocal acc, rounds
+        rounds += 1
+        if rounds <= n:
+            acc = aggregate.add(acc, value(state))
+
+    start, state = _cycle_start(state, step, key, length, fold_in, copy, exact)
+    if n <= start:
+        return acc
+    lap = []
+    for _ in range(min(length, n - start)):
+        state = step(state)
+        lap.append(value(state))
+    full_laps, extra = divmod(n - start, length)
+    acc = aggregate.merge(acc, aggregate.repeat(_fold(aggregate, lap), full_laps))
+    return aggregate.merge(acc, _fold(aggregate, lap[:extra]))
+
+
+def first_to_reach(
+    state,
+    step: Callable,
+    value: Callable,
+    times: int,
+    key: Callable = fingerprint,
+    copy: Callable = None,
+    exact: Callable = None,
+) -> tuple[int, Any]:
+    """The first round t by which value(state after round t) has come up
+    `times` times, and that value. The rounds are played out while counting
+    values, with Brent's algorithm looking for the cycle along the way. Once
+    it's found, one more lap tells when each value would get there."""
+    state = _independent(state, copy)
+    counts = Counter()
+    rounds = 0
+
+    def play():
+        nonlocal state, rounds
+        state = step(state)
+        rounds += 1
+        played = value(state)
+        counts[played] += 1
+        return played
+
+    power = length = 1
+    tortoise = _mark(state, key, exact)
+    while True:
+        played = play()
+        if counts[played] == times:
+            return rounds, played
+        if _at(state, tortoise, key, exact):
+            break
+        if power == length:
+            tortoise = _mark(state, key, exact)
+            power *= 2
+            length = 0
+        length += 1
+
+    # rounds into a lap at which each value comes up
+    lap = defaultdict(list)
+    for offset in range(1, length + 1):
+        played = play()
+        if counts[played] == times:
+            return rounds, played
+        lap[played].append(offset)
+
+    # from here on the lap repeats forever
+    def reaches(played) -> int:
+        full_laps, i = divmod(times - counts[played] - 1, len(lap[played]))
+        return rounds + full_laps * length + lap[played][i]
+
+    played = min(lap, key=reaches)
+    return reaches(played), played
@@ -0,0 +1,67 @@
+"""Fenwick (binary indexed) trees: prefix sums over an array that keeps
+changing, with O(log n) updates and queries.
+
+    tree = Fenwick.from_values([3, 0, 2, 5])
+    tree.add(1, 4)      # values are now [3, 4, 2, 5]
+    tree.prefix(2)      # 3 + 4 = 7
+    tree.search(8)      # 2: the first index where the running total reaches 8
+
+search() is what makes a tree of counts an order-statistics index: with
+counts per (sorted) value, search(k) is the index of the k-th smallest one.
+"""
+
+
+class Fenwick:
+    def __init__(self, size: int):
+        # tree[i] (1-based) holds the sum of the values at i - lowbit(i) .. i - 1
+        self.tree = [0] * (size + 1)
+
+    @classmethod
+    def from_values(cls, values) -> "Fenwick":
+        """Build a tree over values in O(n) rather than n add() calls."""
+        fenwick = cls(0)
+        tree = [0] + list(values)
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        fenwick.tree = tree
+        return fenwick
+
+    def __len__(self) -> int:
+        return len(self.tree) - 1
+
+    def add(self, index: int, delta) -> None:
+        tree = self.tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, stop: int):
+        """Sum of the values at indices 0 .. stop - 1."""
+        tree = self.tree
+        total = 0
+        i = stop
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        return self.prefix(len(self))
+
+    def search(self, target) -> int:
+        """The smallest index whose prefix sum (itself included) reaches
+        target, or len(self) if none does. Values must not be negative."""
+        tree = self.tree
+        pos = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] < target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
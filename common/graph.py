@@ -0,0 +1,272 @@
+"""Compact graphs for the path-finding and component quests.
+
+Nodes are dense integer ids 0..n-1 and edges live in CSR (compressed sparse
+row) arrays: the out-neighbours of node i are
+
+    indices[indptr[i]:indptr[i + 1]]
+
+with the matching edge weights at the same positions in `weights`. So a graph
+is three numpy arrays rather than a dict of dicts per node. Undirected graphs
+store every edge once in each direction, and don't support self-loops.
+
+Quests that think in tuple keys (grid spots, star numbers, ...) go through
+GraphBuilder, which hands out ids in the order keys are first seen:
+
+    builder = GraphBuilder()                 # GraphBuilder(directed=True)
+    builder.add_edge((0, 0), (0, 1), weight=3)
+    G = builder.build()
+    dist, parent = dijkstra(G, G.id_of((0, 0)))
+    [G.keys[i] for i in path_to(parent, G.id_of((0, 1)))]
+
+Distances use UNREACHED (-1) for nodes that can't be reached from the source.
+"""
+
+import heapq
+import numpy as np
+
+UNREACHED = -1
+
+
+class CSRGraph:
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        directed: bool = False,
+        keys: list | None = None,
+    ):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+        self.keys = list(range(len(indptr) - 1)) if keys is None else keys
+        self._ids = None
+
+    @classmethod
+    def from_edges(
+        cls, n: int, src, dst, weights=None, directed=False, keys=None
+    ) -> "CSRGraph":
+        """Build from parallel arrays of edge endpoints (and weights, 1 each
+        by default) over nodes 0..n-1."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(src), dtype=np.int64)
+        weights = np.asarray(weights)
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            weights = np.concatenate([weights, weights])
+        # stable, so each node's neighbours keep the order they were added in
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(indptr, dst[order], weights[order], directed, keys)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices) if self.directed else len(self.indices) // 2
+
+    def id_of(self, key) -> int:
+        if self._ids is None:
+            self._ids = {key: i for i, key in enumerate(self.keys)}
+        return self._ids[key]
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def edge_list(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(src, dst, weights) arrays with each edge once, even if undirected."""
+        src = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+        if self.directed:
+            return src, self.indices, self.weights
+        once = src < self.indices
+        return src[once], self.indices[once], self.weights[once]
+
+    def total_weight(self):
+        return self.edge_list()[2].sum()
+
+
+class GraphBuilder:
+    """Collects edges between arbitrary hashable keys, then packs them into
+    a CSRGraph. Adding the same edge twice gives a multigraph; quests that can
+    revisit an edge should check has_edge first."""
+
+    def __init__(self, directed: bool = False):
+        self.directed = directed
+        self.ids = {}
+        self.src = []
+        self.dst = []
+        self.weights = []
+        self._edges = set()
+
+    def __contains__(self, key) -> bool:
+        return key in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_node(self, key) -> int:
+        node = self.ids.get(key)
+        if node is None:
+            node = self.ids[key] = len(self.ids)
+        return node
+
+    def add_edge(self, u, v, weight=1) -> None:
+        u, v = self.add_node(u), self.add_node(v)
+        self.src.append(u)
+        self.dst.append(v)
+        self.weights.append(weight)
+        self._edges.add(self._edge_key(u, v))
+
+    def _edge_key(self, u: int, v: int) -> tuple[int, int]:
+        return (u, v) if self.directed or u < v else (v, u)
+
+    def has_edge(self, u, v) -> bool:
+        if u not in self.ids or v not in self.ids:
+            return False
+        return self._edge_key(self.ids[u], self.ids[v]) in self._edges
+
+    def build(self) -> CSRGraph:
+        return CSRGraph.from_edges(
+            len(self.ids),
+            self.src,
+            self.dst,
+            self.weights,
+            directed=self.directed,
+            keys=list(self.ids),
+        )
+
+
+def bfs(graph: CSRGraph, source: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Number of edges on a shortest path from source to every node, each
+    node's predecessor on one such path (UNREACHED for the source itself), and
+    the reached nodes in the order the search reached them."""
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    dist = [UNREACHED] * graph.num_nodes
+    parent = [UNREACHED] * graph.num_nodes
+    dist[source] = 0
+    order = [source]
+    # the order list doubles as the queue: order[head:] is still to visit
+    head = 0
+    while head < len(order):
+        node = order[head]
+        head += 1
+        next_dist = dist[node] + 1
+        for nbr in indices[indptr[node] : indptr[node + 1]]:
+            if dist[nbr] == UNREACHED:
+                dist[nbr] = next_dist
+                parent[nbr] = node
+                order.append(nbr)
+    return np.array(dist), np.array(parent), np.array(order)
+
+
+def dijkstra(
+    graph: CSRGraph, source: int, target: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Like bfs, but summing (non-negative) edge weights. Stops as soon as
+    target is settled, if one is given, leaving other distances tentative."""
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    weights = graph.weights.tolist()
+    dist = [UNREACHED] * graph.num_nodes
+    parent = [UNREACHED] * graph.num_nodes
+    done = [False] * graph.num_nodes
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = True
+        if node == target:
+            break
+        for edge in range(indptr[node], indptr[node + 1]):
+            nbr = indices[edge]
+            nbr_dist = d + weights[edge]
+            if dist[nbr] == UNREACHED or nbr_dist < dist[nbr]:
+                dist[nbr] = nbr_dist
+                parent[nbr] = node
+                heapq.heappush(heap, (nbr_dist, nbr))
+    return np.array(dist), np.array(parent)
+
+
+def path_to(parent: np.ndarray, target: int) -> list[int]:
+    """Walk a bfs/dijkstra parent array back from target to the source."""
+    path = [target]
+    while parent[path[-1]] != UNREACHED:
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+
+class UnionFind:
+    def __init__(self, n: int = 0):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def add(self) -> int:
+        """A new element in a set of its own, for when n isn't known upfront."""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets holding a and b. False if they were already one."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+    def labels(self) -> np.ndarray:
+        """Set number of every element, numbering sets in order of their
+        lowest element."""
+        numbering = {}
+        return np.array(
+            [
+                numbering.setdefault(self.find(x), len(numbering))
+                for x in range(len(self.parent))
+            ],
+            dtype=np.int64,
+        )
+
+
+def kruskal(n: int, src, dst, weights) -> np.ndarray:
+    """Indices of the edges in a minimum spanning forest over nodes 0..n-1.
+    Equal-weight edges are tried in the order given."""
+    order = np.argsort(weights, kind="stable")
+    forest = UnionFind(n)
+    src, dst = np.asarray(src).tolist(), np.asarray(dst).tolist()
+    chosen = [edge for edge in order.tolist() if forest.union(src[edge], dst[edge])]
+    return np.array(chosen, dtype=np.int64)
+
+
+def minimum_spanning_forest(graph: CSRGraph) -> CSRGraph:
+    src, dst, weights = graph.edge_list()
+    chosen = kruskal(graph.num_nodes, src, dst, weights)
+    return CSRGraph.from_edges(
+        graph.num_nodes, src[chosen], dst[chosen], weights[chosen], keys=graph.keys
+    )
+
+
+def connected_components(graph: CSRGraph) -> np.ndarray:
+    """Component number of every node (weakly connected, if directed),
+    numbering components in order of their lowest node id."""
+    components = UnionFind(graph.num_nodes)
+    src, dst, _ = graph.edge_list()
+    for a, b in zip(src.tolist(), dst.tolist()):
+        components.union(a, b)
+    return components.labels()
@@ -0,0 +1,179 @@
+"""Array-backed grid helpers.
+
+Puzzle grids are parsed straight into compact NumPy arrays (one byte per cell)
+instead of arrays of one-character strings, and neighbor lookups go through
+precomputed tables of *flat* indices rather than building tuples for every
+cell visited.
+
+A neighbor table for a grid of shape (H, W) has one row per cell (in row-major
+order, i.e. cell (x, y) is row x * W + y) and one column per neighbor offset.
+Neighbors that would fall off the grid point at index H * W, a padding
+sentinel, so that a flat view of the grid with one extra value appended (see
+padded_flat()) can be indexed by the table directly without bounds checks.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+PLUS_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+DIAG_OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def parse_grid(data: str, fill: str = " ") -> np.ndarray:
+    """Turn puzzle text into a 2D uint8 array of character codes. Rows shorter
+    than the longest row (some inputs lose their trailing spaces) are padded
+    with fill."""
+    rows = data.split("\n")
+    width = max(len(row) for row in rows)
+    text = "".join(row.ljust(width, fill) for row in rows)
+    arr = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return arr.reshape(len(rows), width).copy()
+
+
+def parse_digit_grid(data: str, fill: str = "0") -> np.ndarray:
+    """Turn puzzle text made of digits into a 2D int8 array of their values."""
+    return (parse_grid(data, fill=fill) - ord("0")).astype(np.int8)
+
+
+@lru_cache(maxsize=None)
+def offsets_for(include_diag: bool = False, include_plus: bool = True) -> tuple:
+    """Neighbor offsets in row-major order (top-left first, bottom-right last)."""
+    offsets = []
+    if include_plus:
+        offsets += PLUS_OFFSETS
+    if include_diag:
+        offsets += DIAG_OFFSETS
+    return tuple(sorted(offsets))
+
+
+# a table is k ints per cell, so only keep the last few grids' worth around
+@lru_cache(maxsize=4)
+def neighbor_table(
+    shape: tuple[int, int], include_diag: bool = False, include_plus: bool = True
+) -> np.ndarray:
+    """Get the (H * W, k) table of flat neighbor indices for a grid of this
+    shape, with off-grid neighbors pointing at the padding sentinel H * W.
+    The last few tables are cached per shape and connectivity and returned
+    read-only."""
+    max_x, max_y = shape
+    size = max_x * max_y
+    # int32 halves the table's footprint for anything short of a 46k x 46k grid
+    dtype = np.int32 if size < np.iinfo(np.int32).max else np.int64
+    xs, ys = np.divmod(np.arange(size, dtype=dtype), max_y)
+    columns = []
+    for dx, dy in offsets_for(include_diag, include_plus):
+        nbr_x, nbr_y = xs + dx, ys + dy
+        on_grid = (nbr_x >= 0) & (nbr_x < max_x) & (nbr_y >= 0) & (nbr_y < max_y)
+        columns.append(np.where(on_grid, nbr_x * max_y + nbr_y, size).astype(dtype))
+    table = np.stack(columns, axis=1) if columns else np.empty((size, 0), dtype)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=2)
+def neighbor_lists(
+    shape: tuple[int, int], include_diag: bool = False, include_plus: bool = True
+) -> list[list[int]]:
+    """Same as neighbor_table(), but as plain Python lists, which are much
+    faster than NumPy rows to index one cell at a time from a Python loop.
+    They also take several times the memory (a boxed int per neighbor), so
+    this is for loops that visit most cells, not for a lookup or two."""
+    return neighbor_table(shape, include_diag, include_plus).tolist()
+
+
+def padded_flat(arr: np.ndarray, pad_value=0) -> np.ndarray:
+    """Flatten a grid and append the value an off-grid neighbor should read as,
+    so that padded_flat(arr)[neighbor_table(arr.shape)] is every cell's
+    neighbor values at once."""
+    return np.append(arr.ravel(), np.array([pad_value], dtype=arr.dtype))
+
+
+def to_flat(shape: tuple[int, int], loc: tuple[int, int]) -> int:
+    return loc[0] * shape[1] + loc[1]
+
+
+def to_loc(shape: tuple[int, int], flat: int) -> tuple[int, int]:
+    x, y = divmod(int(flat), shape[1])
+    return x, y
+
+
+def _row_distance(row: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """min over k of row[k] + |j - k|, for every j: a running minimum from the
+    left and one from the right."""
+    from_left = np.minimum.accumulate(row - cols) + cols
+    from_right = np.minimum.accumulate((row + cols)[::-1])[::-1] - cols
+    return np.minimum(from_left, from_right)
+
+
+def distance_transform(is_source: np.ndarray, include_diag: bool = False):
+    """Number of steps from every cell to the nearest source cell, stepping to
+    plus-shaped neighbors (taxicab distance) or to diagonal ones as well
+    (chessboard distance). Cells that can't reach a source get -1.
+
+    Some shortest path to each cell only ever moves down the rows, or only up
+    them, so one sweep down and one back up, each taking a whole row at a
+    time, cover every cell in O(cells)."""
+    height, width = is_source.shape
+    unreached = height + width + 1  # further than any two cells are apart
+    dist = np.where(is_source, 0, unreached).astype(np.int64)
+    cols = np.arange(width)
+    for rows in (range(height), range(height - 1, -1, -1)):
+        prev = None
+        for x in rows:
+            row = dist[x]
+            if prev is not None:
+                prev_nbrs = prev.copy()
+                if include_diag:
+                    np.minimum(prev_nbrs[1:], prev[:-1], out=prev_nbrs[1:])
+                    np.minimum(prev_nbrs[:-1], prev[1:], out=prev_nbrs[:-1])
+                row = np.minimum(row, prev_nbrs + 1)
+            row = _row_distance(row, cols)
+            dist[x] = prev = row
+    dist[dist >= unreached] = -1
+    return dist
+
+
+### Drop-in helpers for quest code written against tuple indices ###############
+
+
+def gridify(data: str, intify: bool = False) -> np.ndarray:
+    """Parse puzzle text into a grid of character codes, or of digit values
+    if intify is set."""
+    return parse_digit_grid(data) if intify else parse_grid(data)
+
+
+# These look at one cell at a time, so they work its neighbors out from the
+# offsets rather than building (and keeping) a table for the whole grid.
+
+
+def neighbor_locs(arr, x, y, include_diag=False) -> list[tuple[int, int]]:
+    """Returns the indices of on-grid neighbors of a location in an array."""
+    max_x, max_y = arr.shape[:2]
+    return [
+        (x + dx, y + dy)
+        for dx, dy in offsets_for(include_diag)
+        if 0 <= x + dx < max_x and 0 <= y + dy < max_y
+    ]
+
+
+def neighbors(
+    arr,
+    x,
+    y,
+    include_diag=False,
+    include_plus=True,
+    include_offgrid=False,
+    offgrid_value=0,
+) -> list:
+    """Returns the values of the neighbors of a location in an array. Off-grid
+    neighbors are skipped, or read as offgrid_value if include_offgrid is set."""
+    max_x, max_y = arr.shape[:2]
+    nbr_vals = []
+    for dx, dy in offsets_for(include_diag, include_plus):
+        nbr_x, nbr_y = x + dx, y + dy
+        if 0 <= nbr_x < max_x and 0 <= nbr_y < max_y:
+            nbr_vals.append(arr[nbr_x, nbr_y])
+        elif include_offgrid:
+            nbr_vals.append(offgrid_value)
+    return nbr_vals
@@ -0,0 +1,99 @@
+"""Multi-pattern string matching (Aho-Corasick), and tracking which cells of a
+text the matches cover.
+
+    automaton = Automaton(["THE", "OWE", "MES", "ROD", "HER"])
+    for start, end in automaton.matches("AWAKEN THE POWER ADORNED WITH"):
+        ...  # text[start:end] is one of the patterns
+
+The automaton is built once per pattern list, then finds every occurrence of
+every pattern, overlapping ones included, in a single left-to-right pass over
+the text, however many patterns there are. A pattern listed twice is reported
+twice at each place it occurs.
+
+Transitions are compiled into one dict per state covering every character
+used in the patterns, so each character of text costs one dict lookup.
+
+Coverage is a byte mask with one byte per cell of a line, or of a whole grid
+flattened row by row, where marking a match is one slice assignment:
+
+    covered = Coverage(len(text))
+    for start, end in automaton.matches(text):
+        covered.mark(start, end)
+    covered.count()
+"""
+
+from collections import deque
+from typing import Iterator
+
+
+class Automaton:
+    def __init__(self, patterns: list[str]):
+        # trie of the patterns: goto[state][char] -> state
+        goto = [{}]
+        # lengths of the patterns ending at each state
+        ends = [[]]
+        for pattern in patterns:
+            if not pattern:
+                raise ValueError("Patterns must not be empty")
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto[state][char] = len(goto)
+                    goto.append({})
+                    ends.append([])
+                state = goto[state][char]
+            ends[state].append(len(pattern))
+
+        alphabet = {char for pattern in patterns for char in pattern}
+        # Breadth-first, so each state's failure state (the longest proper
+        # suffix of its string that is also in the trie) is finished first.
+        # Missing transitions are filled in from the failure state, turning
+        # the trie into a complete automaton over the alphabet.
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        for char in alphabet:
+            delta[0].setdefault(char, 0)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # patterns ending at the failure state end here too
+            ends[state] = ends[state] + ends[fail[state]]
+            for char in alphabet:
+                child = goto[state].get(char)
+                if child is None:
+                    delta[state][char] = delta[fail[state]][char]
+                else:
+                    fail[child] = delta[fail[state]][char]
+                    delta[state][char] = child
+                    queue.append(child)
+        self.delta = delta
+        self.ends = ends
+
+    def matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """(start, end) of every pattern occurrence in text, in order of end."""
+        delta, ends = self.delta, self.ends
+        state = 0
+        for i, char in enumerate(text):
+            # characters in no pattern send us back to the root
+            state = delta[state].get(char, 0)
+            for length in ends[state]:
+                yield i + 1 - length, i + 1
+
+
+class Coverage:
+    def __init__(self, size: int):
+        self.mask = bytearray(size)
+        # ones to copy runs from, only as long as the longest run marked yet
+        self._ones = b""
+
+    def mark(self, start: int, stop: int, step: int = 1) -> None:
+        """Cover cells start, start + step, ... up to (not including) stop. A
+        step of the row width marks a run down a column of a flattened grid."""
+        cells = len(range(start, stop, step))
+        if cells > len(self._ones):
+            self._ones = b"\x01" * cells
+        self.mask[start:stop:step] = memoryview(self._ones)[:cells]
+
+    def count(self) -> int:
+        return self.mask.count(1)
@@ -0,0 +1,174 @@
+"""Opt-in instrumentation for hot spots in quest code.
+
+    @hotspot()                  # or @hotspot("some name")
+    def chain_reaction(...): ...
+
+    with timed("inner loop"):
+        ...
+
+    count("cache misses")
+
+Everything here is off unless QUEST_PROFILE=1 is set when the quest starts.
+When it is off, @hotspot hands back the undecorated function, and timed() and
+count() are no-ops, so instrumented code runs exactly as fast as before.
+
+When it is on, every hot spot records its number of calls and its inclusive
+and self time, keyed by the stack of hot spots it was called from. With
+QUEST_PROFILE_ALLOC=1 as well, tracemalloc is started and each hot spot also
+records how many bytes it left allocated (net of what it freed).
+
+At exit, a summary table goes to stderr and the per-stack self times are
+written in the "collapsed stack" format that flamegraph.pl, speedscope and
+inferno all read, one "outer;inner;innermost <microseconds>" line per stack,
+to QUEST_PROFILE_OUT (profile.collapsed in the working directory by default).
+"""
+
+import atexit
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+PROFILING = os.environ.get("QUEST_PROFILE", "0") == "1"
+PROFILE_ALLOCS = PROFILING and os.environ.get("QUEST_PROFILE_ALLOC", "0") == "1"
+
+# one [name, start time, time spent in child hot spots, bytes at start] per
+# hot spot currently running, outermost first
+_stack = []
+# stack path (tuple of names) -> {"calls", "total_s", "self_s", "alloc_bytes"}
+_stats = defaultdict(
+    lambda: {"calls": 0, "total_s": 0.0, "self_s": 0.0, "alloc_bytes": 0}
+)
+_counts = defaultdict(int)
+
+
+def _allocated() -> int:
+    return tracemalloc.get_traced_memory()[0] if PROFILE_ALLOCS else 0
+
+
+def _enter(name: str) -> None:
+    _stack.append([name, time.perf_counter(), 0.0, _allocated()])
+
+
+def _exit() -> None:
+    name, start, child_time, start_bytes = _stack[-1]
+    elapsed = time.perf_counter() - start
+    stats = _stats[tuple(frame[0] for frame in _stack)]
+    stats["calls"] += 1
+    stats["total_s"] += elapsed
+    stats["self_s"] += elapsed - child_time
+    stats["alloc_bytes"] += _allocated() - start_bytes
+    _stack.pop()
+    if _stack:
+        _stack[-1][2] += elapsed
+
+
+def hotspot(name: str | None = None):
+    """Decorator factory: record calls and time spent in the decorated
+    function under `name` (the function's name by default)."""
+
+    def decorator(func):
+        if not PROFILING:
+            return func
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            _enter(label)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _exit()
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def _timed(name: str):
+    _enter(name)
+    try:
+        yield
+    finally:
+        _exit()
+
+
+_NOT_TIMED = nullcontext()
+
+
+def timed(name: str):
+    """Context manager: record the enclosed block as a hot spot."""
+    return _timed(name) if PROFILING else _NOT_TIMED
+
+
+def count(name: str, n: int = 1) -> None:
+    """Bump a named event counter."""
+    if PROFILING:
+        _counts[name] += n
+
+
+def report() -> dict:
+    """Per-hot-spot totals, summed over every stack each hot spot appeared in."""
+    totals = defaultdict(
+        lambda: {"calls": 0, "total_s": 0.0, "self_s": 0.0, "alloc_bytes": 0}
+    )
+    for path, stats in _stats.items():
+        name = path[-1]
+        totals[name]["calls"] += stats["calls"]
+        totals[name]["self_s"] += stats["self_s"]
+        totals[name]["alloc_bytes"] += stats["alloc_bytes"]
+        # don't count the time of a recursive call twice
+        if name not in path[:-1]:
+            totals[name]["total_s"] += stats["total_s"]
+    return {"hotspots": dict(totals), "counts": dict(_counts)}
+
+
+def collapsed_stacks(metric: str = "self_s") -> list[str]:
+    """Lines of "a;b;c value" for flame graph tools. Times are converted to
+    integer microseconds, since the tools expect integer sample counts."""
+    lines = []
+    for path, stats in sorted(_stats.items()):
+        value = stats[metric]
+        if metric.endswith("_s"):
+            value = round(value * 1_000_000)
+        lines.append(f"{';'.join(path)} {value}")
+    return lines
+
+
+def write_collapsed(path: str, metric: str = "self_s") -> None:
+    with open(path, "w") as f:
+        f.writelines(line + "\n" for line in collapsed_stacks(metric))
+
+
+def _print_summary(out=sys.stderr) -> None:
+    totals = report()
+    print(f"{'hot spot':<32}{'calls':>12}{'total s':>12}{'self s':>12}", file=out)
+    for name, stats in sorted(
+        totals["hotspots"].items(), key=lambda item: -item[1]["total_s"]
+    ):
+        print(
+            f"{name:<32}{stats['calls']:>12}{stats['total_s']:>12.4f}"
+            f"{stats['self_s']:>12.4f}",
+            file=out,
+        )
+        if PROFILE_ALLOCS:
+            print(f"{'':<32}{stats['alloc_bytes']:>12} bytes left allocated", file=out)
+    for name, n in sorted(totals["counts"].items()):
+        print(f"{name:<32}{n:>12}", file=out)
+
+
+def _at_exit() -> None:
+    if not _stats and not _counts:
+        return
+    _print_summary()
+    write_collapsed(os.environ.get("QUEST_PROFILE_OUT", "profile.collapsed"))
+
+
+if PROFILING:
+    if PROFILE_ALLOCS:
+        tracemalloc.start()
+    atexit.register(_at_exit)
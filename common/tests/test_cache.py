@@ -0,0 +1,75 @@
+import numpy as np
+
+from common import cache
+from common.cache import disk_cache
+
+calls = []
+
+
+@disk_cache
+def slow_square_sum(arr, offset=0):
+    calls.append(1)
+    return int((arr**2).sum()) + offset
+
+
+def test_disk_cache_hits_and_misses(tmp_path, monkeypatch):
+    monkeypatch.setenv("QUEST_CACHE_DIR", str(tmp_path))
+    calls.clear()
+    arr = np.arange(10)
+    assert slow_square_sum(arr) == 285
+    assert slow_square_sum(arr.copy()) == 285  # same content, same key
+    assert len(calls) == 1
+    assert slow_square_sum(arr, offset=1) == 286
+    assert slow_square_sum(arr.astype(np.int32)) == 285  # dtype is part of the key
+    assert len(calls) == 3
+
+
+def test_disk_cache_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("QUEST_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("QUEST_CACHE", "0")
+    calls.clear()
+    slow_square_sum(np.arange(3))
+    slow_square_sum(np.arange(3))
+    assert len(calls) == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_evict_drops_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setenv("QUEST_CACHE_DIR", str(tmp_path))
+    for i in range(3):
+        slow_square_sum(np.arange(i + 1))
+    entries = sorted(tmp_path.glob("*/*.pkl"), key=lambda p: p.stat().st_mtime)
+    entry_size = entries[0].stat().st_size
+    cache.evict(budget=2 * entry_size)
+    remaining = list(tmp_path.glob("*/*.pkl"))
+    assert len(remaining) == 2 and entries[0] not in remaining
+
+
+def test_editing_shared_code_changes_the_key(tmp_path, monkeypatch):
+    common_dir = tmp_path / "common"
+    common_dir.mkdir()
+    helper = common_dir / "helper.py"
+    helper.write_text("def helper(): return 1\n")
+    monkeypatch.setattr(cache, "COMMON_DIR", common_dir)
+    assert helper in cache.source_files(slow_square_sum)
+    before = cache.code_fingerprint(slow_square_sum)
+    helper.write_text("def helper(): return 2\n")
+    assert cache.code_fingerprint(slow_square_sum) != before
+
+
+@disk_cache
+def drain(arr):
+    calls.append(1)
+    total = int(arr.sum())
+    arr[:] = 0
+    return total
+
+
+def test_key_is_taken_before_the_call_modifies_its_arguments(tmp_path, monkeypatch):
+    monkeypatch.setenv("QUEST_CACHE_DIR", str(tmp_path))
+    calls.clear()
+    cache.hits.clear()
+    assert drain(np.arange(5)) == 10
+    assert drain(np.arange(5)) == 10
+    assert len(calls) == 1
+    assert cache.hits == {"drain": 1}
@@ -0,0 +1,93 @@
+from collections import Counter
+
+import numpy as np
+
+from common.cycles import (
+    COUNTER,
+    MAX,
+    SUM,
+    Cycle,
+    aggregate_rounds,
+    find_cycle,
+    fingerprint,
+    first_to_reach,
+)
+
+# 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 3 -> ...: a 3-round cycle starting from 3
+NEXT = [1, 2, 3, 4, 5, 3]
+VALUES = [0, 10, 20, 1, 2, 3]
+
+
+def step(state: int) -> int:
+    return NEXT[state]
+
+
+def brute_force(n: int) -> list[int]:
+    state, values = 0, []
+    for _ in range(n):
+        state = step(state)
+        values.append(VALUES[state])
+    return values
+
+
+def test_find_cycle():
+    assert find_cycle(0, step) == Cycle(start=3, length=3)
+    assert find_cycle(3, step) == Cycle(start=0, length=3)
+
+
+def test_aggregate_rounds_matches_brute_force():
+    for n in [0, 1, 2, 3, 4, 7, 50]:
+        values = brute_force(n)
+        assert aggregate_rounds(0, step, n, VALUES.__getitem__, SUM) == sum(values)
+        assert aggregate_rounds(0, step, n, VALUES.__getitem__, COUNTER) == Counter(
+            values
+        )
+    assert aggregate_rounds(0, step, 10**18, VALUES.__getitem__, MAX) == 20
+    big = aggregate_rounds(0, step, 10**18, VALUES.__getitem__, SUM)
+    # rounds 1 and 2 (10 + 20), then 1 + 2 + 3 + 1 + 2 + 3 + ... from round 3 on
+    assert big == 30 + (10**18 - 2) // 3 * 6 + (1 + 2)
+
+
+def test_fingerprint():
+    arr = np.zeros((2, 2), dtype=np.uint8)
+    assert fingerprint(arr) == fingerprint(arr.copy())
+    assert fingerprint(arr) != fingerprint(arr.astype(np.int8))
+    assert len(fingerprint([[1, 2], [3]])) == 16
+
+
+def test_in_place_steps_with_copy():
+    def step_in_place(state: list) -> list:
+        state[0] = NEXT[state[0]]
+        return state
+
+    state = [0]
+    assert find_cycle(state, step_in_place, key=tuple, copy=list.copy) == Cycle(3, 3)
+    total = aggregate_rounds(
+        state, step_in_place, 50, lambda s: VALUES[s[0]], key=tuple, copy=list.copy
+    )
+    assert total == sum(brute_force(50))
+    assert state == [0]
+
+
+def test_first_to_reach_matches_brute_force():
+    for times in [1, 2, 5, 100]:
+        values = brute_force(400)
+        counts = Counter()
+        for rounds, value in enumerate(values, 1):
+            counts[value] += 1
+            if counts[value] == times:
+                break
+        assert first_to_reach(0, step, VALUES.__getitem__, times) == (rounds, value)
+
+
+def test_exact_settles_key_collisions():
+    def parity(state: int) -> int:
+        return state % 2  # 1 and 3 collide, and so do 2 and 4
+
+    assert find_cycle(0, step, key=parity) != Cycle(3, 3)
+    assert find_cycle(0, step, key=parity, exact=int) == Cycle(3, 3)
+    total = aggregate_rounds(0, step, 50, VALUES.__getitem__, key=parity, exact=int)
+    assert total == sum(brute_force(50))
+    assert first_to_reach(
+        0, step, VALUES.__getitem__, 5, key=parity, exact=int
+    ) == first_to_reach(0, step, VALUES.__getitem__, 5)
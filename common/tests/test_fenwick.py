@@ -0,0 +1,31 @@
+import random
+
+from common.fenwick import Fenwick
+
+
+def test_prefix_and_search_match_brute_force():
+    rng = random.Random(0)
+    values = [rng.randint(0, 5) for _ in range(37)]
+    tree = Fenwick.from_values(values)
+    for _ in range(100):
+        i = rng.randrange(len(values))
+        delta = rng.randint(-values[i], 5)
+        values[i] += delta
+        tree.add(i, delta)
+    assert [tree.prefix(i) for i in range(len(values) + 1)] == [
+        sum(values[:i]) for i in range(len(values) + 1)
+    ]
+    for target in range(1, sum(values) + 2):
+        expected = next(
+            (i for i in range(len(values)) if sum(values[: i + 1]) >= target),
+            len(values),
+        )
+        assert tree.search(target) == expected
+
+
+def test_add_matches_from_values():
+    tree = Fenwick(4)
+    for i, value in enumerate([3, 0, 2, 5]):
+        tree.add(i, value)
+    assert tree.tree == Fenwick.from_values([3, 0, 2, 5]).tree
+    assert len(tree) == 4 and tree.total() == 10
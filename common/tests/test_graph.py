@@ -0,0 +1,64 @@
+import numpy as np
+
+from common.graph import (
+    UNREACHED,
+    CSRGraph,
+    GraphBuilder,
+    UnionFind,
+    bfs,
+    connected_components,
+    dijkstra,
+    minimum_spanning_forest,
+    path_to,
+)
+
+
+def square_with_tail():
+    """a - b - c - d in a square (a-d is the long way round), plus e - f."""
+    G = GraphBuilder()
+    G.add_edge("a", "b", weight=1)
+    G.add_edge("b", "c", weight=1)
+    G.add_edge("c", "d", weight=1)
+    G.add_edge("a", "d", weight=5)
+    G.add_edge("e", "f", weight=2)
+    return G
+
+
+def test_builder_and_csr_layout():
+    builder = square_with_tail()
+    assert "a" in builder and "z" not in builder
+    assert builder.has_edge("d", "a") and not builder.has_edge("a", "c")
+    G = builder.build()
+    assert G.keys == ["a", "b", "c", "d", "e", "f"]
+    assert G.num_nodes == 6 and G.num_edges == 5
+    assert G.indptr.tolist() == [0, 2, 4, 6, 8, 9, 10]
+    assert G.neighbors(G.id_of("a")).tolist() == [1, 3]
+    assert G.total_weight() == 10
+
+    directed = CSRGraph.from_edges(3, [0, 1], [1, 2], directed=True)
+    assert directed.num_edges == 2 and directed.neighbors(2).tolist() == []
+
+
+def test_shortest_paths():
+    G = square_with_tail().build()
+    dist, parent, order = bfs(G, 0)
+    assert dist.tolist() == [0, 1, 2, 1, UNREACHED, UNREACHED]
+    assert order.tolist() == [0, 1, 3, 2]
+    dist, parent = dijkstra(G, 0)
+    assert dist.tolist() == [0, 1, 2, 3, UNREACHED, UNREACHED]
+    assert [G.keys[i] for i in path_to(parent, 3)] == ["a", "b", "c", "d"]
+
+
+def test_spanning_forest_and_components():
+    G = square_with_tail().build()
+    F = minimum_spanning_forest(G)
+    assert F.num_edges == 4 and F.total_weight() == 5
+    assert connected_components(F).tolist() == [0, 0, 0, 0, 1, 1]
+    assert np.array_equal(connected_components(G), connected_components(F))
+
+
+def test_union_find_grows():
+    sets = UnionFind(2)
+    assert sets.add() == 2 and sets.add() == 3
+    assert sets.union(0, 3) and sets.union(3, 2) and not sets.union(2, 0)
+    assert sets.labels().tolist() == [0, 1, 0, 0]
@@ -0,0 +1,77 @@
+import numpy as np
+
+from common.grid import (
+    distance_transform,
+    gridify,
+    neighbor_locs,
+    neighbor_table,
+    neighbors,
+    padded_flat,
+    parse_grid,
+)
+
+grid = """#.#
+.##"""
+
+
+def test_parse_grid():
+    arr = parse_grid(grid)
+    assert arr.dtype == np.uint8 and arr.shape == (2, 3)
+    assert bytes(arr[0]) == b"#.#"
+    # short rows get padded out to the full width
+    assert bytes(parse_grid("ab\nc")[1]) == b"c "
+    assert gridify("12\n90", intify=True).tolist() == [[1, 2], [9, 0]]
+
+
+def test_neighbor_table():
+    table = neighbor_table((2, 3))
+    assert table.shape == (6, 4)
+    # cell (0, 0): up and left are off-grid, right is (0, 1), down is (1, 0)
+    assert table[0].tolist() == [6, 6, 1, 3]
+    assert neighbor_table((2, 3), include_diag=True).shape == (6, 8)
+    diag_only = neighbor_table((2, 3), include_diag=True, include_plus=False)
+    assert diag_only[0].tolist() == [6, 6, 6, 4]
+
+
+def test_padded_lookup_matches_tuple_helpers():
+    arr = gridify(grid)
+    flat = padded_flat(arr, pad_value=0)
+    table = neighbor_table(arr.shape, include_diag=True)
+    for x in range(2):
+        for y in range(3):
+            nbr_vals = flat[table[x * 3 + y]].tolist()
+            expected = neighbors(arr, x, y, include_diag=True, include_offgrid=True)
+            assert nbr_vals == expected
+    assert neighbor_locs(arr, 0, 0) == [(0, 1), (1, 0)]
+    assert sorted(neighbor_locs(arr, 1, 1, include_diag=True)) == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 0),
+        (1, 2),
+    ]
+
+
+def test_single_cell_helpers_build_no_table():
+    neighbor_table.cache_clear()
+    arr = np.zeros((10_000, 10_000), dtype=np.uint8)
+    arr[9_998, 9_999] = 7
+    assert neighbors(arr, 9_999, 9_999) == [7, 0]
+    assert neighbor_locs(arr, 0, 5) == [(0, 4), (0, 6), (1, 5)]
+    assert neighbor_table.cache_info().currsize == 0
+
+
+def test_distance_transform():
+    is_source = np.zeros((3, 5), dtype=bool)
+    is_source[0, 0] = True
+    assert distance_transform(is_source).tolist() == [
+        [0, 1, 2, 3, 4],
+        [1, 2, 3, 4, 5],
+        [2, 3, 4, 5, 6],
+    ]
+    assert distance_transform(is_source, include_diag=True).tolist() == [
+        [0, 1, 2, 3, 4],
+        [1, 1, 2, 3, 4],
+        [2, 2, 2, 3, 4],
+    ]
+    assert (distance_transform(np.zeros((2, 2), dtype=bool)) == -1).all()
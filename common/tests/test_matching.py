@@ -0,0 +1,36 @@
+from common.matching import Automaton, Coverage
+
+
+def brute_force(patterns, text):
+    return sorted(
+        (start, start + len(p))
+        for p in patterns
+        for start in range(len(text) - len(p) + 1)
+        if text.startswith(p, start)
+    )
+
+
+def test_matches_every_occurrence():
+    patterns = ["THE", "OWE", "MES", "ROD", "HER"]
+    text = "AWAKEN THE POWE ADORNED WITH THE FLAMES BRIGHT IRE"
+    found = list(Automaton(patterns).matches(text))
+    assert [text[start:end] for start, end in found] == ["THE", "OWE", "THE", "MES"]
+    # overlapping matches, patterns inside other patterns, repeated patterns
+    patterns = ["ABA", "BA", "A", "ABABA", "BA"]
+    text = "CABABABAC"
+    found = list(Automaton(patterns).matches(text))
+    assert sorted(found) == brute_force(patterns, text)
+    assert [end for _, end in found] == sorted(end for _, end in found)
+
+
+def test_coverage():
+    covered = Coverage(12)
+    covered.mark(1, 4)
+    covered.mark(3, 6)
+    assert covered.count() == 5
+    # every fourth cell from 2 on: a column of a 3x4 grid
+    covered.mark(2, 12, 4)
+    assert covered.count() == 7
+    assert bytes(covered.mask) == bytes([0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 0])
+    # the run buffer only grows to the longest run marked
+    assert len(covered._ones) == 3
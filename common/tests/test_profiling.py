@@ -0,0 +1,86 @@
+import pytest
+
+from common import profiling
+from common.profiling import count, hotspot, timed
+
+
+@pytest.fixture
+def fresh_stats(monkeypatch):
+    stats = profiling.defaultdict(profiling._stats.default_factory)
+    monkeypatch.setattr(profiling, "_stats", stats)
+    monkeypatch.setattr(profiling, "_counts", profiling.defaultdict(int))
+
+
+def test_disabled_profiling_changes_nothing(fresh_stats, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILING", False)
+
+    def work():
+        return 1
+
+    assert hotspot()(work) is work
+    with timed("block"):
+        work()
+    count("events")
+    assert profiling.report() == {"hotspots": {}, "counts": {}}
+    assert profiling.collapsed_stacks() == []
+
+
+def test_calls_and_collapsed_stacks(fresh_stats, monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILING", True)
+
+    @hotspot("inner")
+    def inner():
+        count("inner calls")
+
+    @hotspot()
+    def outer(n):
+        for _ in range(n):
+            inner()
+        with timed("tail"):
+            inner()
+
+    outer(3)
+    outer(1)
+    count("batches", 2)
+
+    totals = profiling.report()
+    assert {name: stats["calls"] for name, stats in totals["hotspots"].items()} == {
+        "outer": 2,
+        "inner": 6,
+        "tail": 2,
+    }
+    assert totals["counts"] == {"inner calls": 6, "batches": 2}
+    # nested time is inclusive: outer's total covers everything under it
+    outer_stats = totals["hotspots"]["outer"]
+    assert outer_stats["total_s"] >= outer_stats["self_s"] >= 0
+
+    assert profiling.collapsed_stacks("calls") == [
+        "outer 2",
+        "outer;inner 4",
+        "outer;tail 2",
+        "outer;tail;inner 2",
+    ]
+    out = tmp_path / "profile.collapsed"
+    profiling.write_collapsed(str(out))
+    lines = out.read_text().splitlines()
+    assert [line.rsplit(" ", 1)[0] for line in lines] == [
+        "outer",
+        "outer;inner",
+        "outer;tail",
+        "outer;tail;inner",
+    ]
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_recursion_is_not_counted_twice(fresh_stats, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILING", True)
+
+    @hotspot()
+    def countdown(n):
+        if n:
+            countdown(n - 1)
+
+    countdown(2)
+    stats = profiling.report()["hotspots"]["countdown"]
+    assert stats["calls"] == 3
+    assert stats["total_s"] == profiling._stats[("countdown",)]["total_s"]
@@ -0,0 +1,215 @@
+"""Run every quest solution in parallel and report how long each part took.
+
+Usage:
+    python run_quests.py                      # every quest in every event
+    python run_quests.py algorithmia/q5 q12   # just these (q12 matches both events)
+    python run_quests.py --jobs 4 --output timings.json
+    python run_quests.py --cache              # let @disk_cache answer too
+
+Each quest module runs as `__main__` from inside its own event folder (so its
+`from input_data import ...` resolves the way it does when run by hand), in a
+fresh worker process of a process pool. Its output is watched line by line:
+every "Part N solution/answer" line closes off part N, and the wall time, CPU
+time and memory at that moment are recorded against it.
+
+The unit of parallelism is the module, not the part: a quest script computes
+its parts one after another, often reusing what an earlier part parsed or
+built, so they can't be pulled apart into separate tasks. Modules run
+concurrently, so the whole suite takes about as long as its slowest module.
+
+The summary is JSON: one record per quest with its status, total timings,
+anything it wrote to stderr (and the traceback if it failed), and a list of
+per-part records. Memory can only be measured as the process's high-water
+mark, so a part's `cumulative_peak_rss_kib` covers every part before it too;
+`rss_growth_kib` is how far that mark rose during the part itself (0 if the
+part never needed more than an earlier one had).
+
+The disk cache (common/cache.py) is off unless --cache is given, so the
+timings are of the work itself. With it on, each quest's record lists its
+`cache_hits`: the functions answered from the cache, whose parts' timings
+are then just the lookup.
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import re
+import resource
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+EVENTS = ("algorithmia", "song")
+QUEST_FILE = re.compile(r"q\d+\.py")
+# keep only the end of a quest's stderr, where any trouble will be
+STDERR_LIMIT = 20_000
+PART_LINE = re.compile(r"Part (\d+) (?:solution|answer|test)[^:]*:\s*(.*)")
+
+
+def discover_quests(events=EVENTS) -> list[str]:
+    """All quest modules, as "event/qN" names, in event then quest order."""
+    quests = []
+    for event in events:
+        paths = [
+            p for p in (REPO_ROOT / event).glob("q*.py") if QUEST_FILE.match(p.name)
+        ]
+        for path in sorted(paths, key=lambda p: int(p.stem[1:])):
+            quests.append(f"{event}/{path.stem}")
+    return quests
+
+
+def select_quests(quests: list[str], wanted: list[str]) -> list[str]:
+    if not wanted:
+        return quests
+    return [q for q in quests if q in wanted or q.split("/")[1] in wanted]
+
+
+def peak_rss_kib() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class PartTimer(io.TextIOBase):
+    """Stand-in for stdout that timestamps each "Part N ..." line as it is
+    printed, then throws the text away."""
+
+    def __init__(self):
+        self.parts = []
+        self.pending = ""
+        self.start_wall = self.last_wall = time.perf_counter()
+        self.start_cpu = self.last_cpu = time.process_time()
+        self.last_peak = peak_rss_kib()
+
+    def writable(self):
+        return True
+
+    def write(self, text: str) -> int:
+        self.pending += text
+        *lines, self.pending = self.pending.split("\n")
+        for line in lines:
+            match = PART_LINE.search(line)
+            if match:
+                self.record(int(match.group(1)), match.group(2).strip())
+        return len(text)
+
+    def record(self, part: int, answer: str):
+        wall, cpu, peak = time.perf_counter(), time.process_time(), peak_rss_kib()
+        self.parts.append(
+            {
+                "part": part,
+                "answer": answer,
+                "wall_s": round(wall - self.last_wall, 4),
+                "cpu_s": round(cpu - self.last_cpu, 4),
+                "cumulative_peak_rss_kib": peak,
+                "rss_growth_kib": peak - self.last_peak,
+            }
+        )
+        self.last_wall, self.last_cpu, self.last_peak = wall, cpu, peak
+
+    def totals(self) -> dict:
+        return {
+            "wall_s": round(time.perf_counter() - self.start_wall, 4),
+            "cpu_s": round(time.process_time() - self.start_cpu, 4),
+            "cumulative_peak_rss_kib": peak_rss_kib(),
+        }
+
+
+def enter_event(quest: str) -> tuple[Path, str]:
+    """In a worker process: work from inside the quest's event folder, with
+    it first on sys.path, as when the quest is run by hand. Returns the folder
+    and the quest's module name."""
+    event, module = quest.split("/")
+    event_dir = REPO_ROOT / event
+    os.chdir(event_dir)
+    sys.path.insert(0, str(event_dir))
+    return event_dir, module
+
+
+def run_pool(worker, tasks: list[tuple], jobs: int | None = None):
+    """Yield worker(*task) for each task as it finishes. Every task gets a
+    fresh spawned process, which keeps each event's `input_data` and `utils`
+    modules apart and makes every task's peak RSS its own."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=context, max_tasks_per_child=1
+    ) as pool:
+        futures = [pool.submit(worker, *task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_quest(quest: str, cache: bool = False) -> dict:
+    """Worker: run one quest module as a script and time its parts."""
+    event_dir, module = enter_event(quest)
+    os.environ["QUEST_CACHE"] = "1" if cache else "0"
+    sys.argv = [f"{module}.py"]
+    timer = PartTimer()
+    stderr = io.StringIO()
+    result = {"quest": quest, "status": "ok"}
+    try:
+        with redirect_stdout(timer), redirect_stderr(stderr):
+            runpy.run_path(str(event_dir / f"{module}.py"), run_name="__main__")
+    except BaseException as e:  # report SystemExit and friends too, don't die
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    result.update(timer.totals())
+    cache_module = sys.modules.get("common.cache")
+    if cache_module is not None and cache_module.hits:
+        result["cache_hits"] = dict(cache_module.hits)
+    if stderr.getvalue():
+        # warnings, progress bars and the like
+        result["stderr"] = stderr.getvalue()[-STDERR_LIMIT:]
+    result["parts"] = timer.parts
+    return result
+
+
+def run_all(
+    quests: list[str], jobs: int | None = None, cache: bool = False
+) -> list[dict]:
+    results = []
+    tasks = [(quest, cache) for quest in quests]
+    for result in run_pool(run_quest, tasks, jobs):
+        print(
+            f"{result['quest']}: {result['status']} in {result['wall_s']:.2f}s",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return sorted(results, key=lambda r: quests.index(r["quest"]))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("quests", nargs="*", help="e.g. algorithmia/q5 or q5")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--output", help="write the JSON summary here, not stdout")
+    parser.add_argument(
+        "--cache", action="store_true", help="use the disk cache (off by default)"
+    )
+    args = parser.parse_args(argv)
+
+    quests = select_quests(discover_quests(), args.quests)
+    started = time.perf_counter()
+    results = run_all(quests, jobs=args.jobs, cache=args.cache)
+    summary = {
+        "wall_s": round(time.perf_counter() - started, 4),
+        "quests": results,
+    }
+    report = json.dumps(summary, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    else:
+        print(report)
+    return 0 if all(r["status"] == "ok" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from input_data import qten_p1, qten_p2, qten_p3
+from utils import hotspot
 
 
 from copy import deepcopy
@@ -351,6 +352,7 @@ as an argument.
 memo = {}
 
 
+@hotspot()
 def num_dragon_win_seqs(game: DragonChessGame) -> int:
     """
     Consider the 'game tree' descending from this game's state, where this node
@@ -1,14 +1,16 @@
+from collections import deque
 import numpy as np
 from typing import List, Tuple
 
 from input_data import q_12_p1, q_12_p2, q_12_p3
-from utils import gridify, neighbor_locs
+from utils import disk_cache, gridify, hotspot, neighbor_lists, to_flat
 
 # Problem statement: https://everybody.codes/event/2025/quests/12
 
 EMPTY = -1
 
 
+@hotspot()
 def chain_reaction(
     arr: np.array, start: List[Tuple[int, int]] = [(0, 0)], actually_do_it: bool = False
 ) -> int:
@@ -18,31 +20,38 @@ def chain_reaction(
     If actually_do_it is set to True, arr is modified IN-PLACE to give each
     location where a barrel would explode a dummy variable indicating that the
     location is now empty (i.e. that the barrel has exploded).
+
+    Works on flat indices with a precomputed neighbor table, so no tuples are
+    built per barrel.
     """
-    ignited = start
-    kaboomed = set()
+    table = neighbor_lists(arr.shape)
+    sizes = arr.reshape(-1)
+    offgrid = len(sizes)
+    ignited = deque(to_flat(arr.shape, loc) for loc in start)
+    seen = set(ignited)
+    kaboomed = []
 
     while ignited:
-        barrel_loc = ignited.pop(0)
-        x, y = barrel_loc
-        barrel_size = arr[x][y]
-        for neighbor_loc in neighbor_locs(arr, x, y):
+        barrel = ignited.popleft()
+        barrel_size = sizes[barrel]
+        for nbr in table[barrel]:
             if (
-                neighbor_loc not in ignited
-                and neighbor_loc not in kaboomed
-                and arr[neighbor_loc] != EMPTY
-                and arr[neighbor_loc] <= barrel_size
+                nbr != offgrid
+                and nbr not in seen
+                and sizes[nbr] != EMPTY
+                and sizes[nbr] <= barrel_size
             ):
-                ignited.append(neighbor_loc)
-        kaboomed.add(barrel_loc)
+                seen.add(nbr)
+                ignited.append(nbr)
+        kaboomed.append(barrel)
 
     if actually_do_it:
-        for spot in kaboomed:
-            arr[spot] = EMPTY
+        sizes[kaboomed] = EMPTY
 
     return len(kaboomed)
 
 
+@hotspot()
 def best_fireball_spot(arr: np.array):
     """"""
     max_kabooms = 0
@@ -61,7 +70,11 @@ def best_fireball_spot(arr: np.array):
     return best_spot
 
 
+@disk_cache
 def part3(arr: np.array) -> int:
+    # the rounds knock barrels out of the grid; leave the caller's alone, so a
+    # cache hit and a miss leave it the same
+    arr = arr.copy()
     total_kaboomed = 0
     for round in range(3):
         print(f"\nRound {round+1} of 3... This may take a few minutes...")
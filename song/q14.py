@@ -1,13 +1,20 @@
 import numpy as np
 from copy import deepcopy
 from tqdm import tqdm
-from utils import gridify, neighbors
+from utils import (
+    SUM,
+    aggregate_rounds,
+    gridify,
+    neighbor_table,
+    neighbors,
+    padded_flat,
+)
 
 from input_data import q14_p1, q14_p2, q14_p3
 
-
-ON = "#"
-OFF = "."
+# gridify() stores each tile as its character code
+ON = ord("#")
+OFF = ord(".")
 
 
 def num_active_diag_neighbors(arr, x, y) -> int:
@@ -28,13 +35,14 @@ def tile_next_round(arr, x, y) -> str:
 
 
 def next_round(arr: np.array) -> np.array:
-    max_x, max_y = arr.shape
-    next_arr = deepcopy(arr)
-    # TODO: this in a less loopy manner
-    for x in range(max_x):
-        for y in range(max_y):
-            next_arr[x][y] = tile_next_round(arr, x, y)
-    return next_arr
+    """Advance every tile at once: look up each tile's four diagonal neighbors
+    through a flat neighbor table (off-grid neighbors count as inactive), then
+    apply the same parity rule as tile_next_round()."""
+    table = neighbor_table(arr.shape, include_diag=True, include_plus=False)
+    active = padded_flat(arr == ON, pad_value=False)
+    odd_active_nbrs = active[table].sum(axis=1) % 2 == 1
+    now_on = np.where(active[:-1], odd_active_nbrs, ~odd_active_nbrs)
+    return np.where(now_on, ON, OFF).astype(arr.dtype).reshape(arr.shape)
 
 
 def total_tiles_across_rounds(data: str, rounds: int = 10) -> int:
@@ -98,112 +106,18 @@ P3_ROUNDS = 1_000_000_000
 
 
 def part3(rounds: int = P3_ROUNDS, pattern: str = q14_p3):
+    """Total the active tiles over every round whose center matches the
+    pattern. The floor settles into a cycle long before the last round, so
+    the cycle finder can work out the total without playing them all."""
     arr = gridify(ALL_OFF)
     pattern = gridify(pattern)
-    center_pattern_states = {}
-    intervals = []
-    last_match_rd = None
-    in_check_mode = False
 
-    # Set things up as if to get the answer "the long way". But we'll stop early
-    for r in tqdm(range(1, rounds + 1)):
-        arr = next_round(arr)
-        center = center_n_by_n(arr, n=8)
-        if (center == pattern).all():
-            # Ding ding! the pattern matches in the center.
-            # Save how many intervals it took between the last round with a match
-            # and this one
-            interval = None if not intervals else (r - last_match_rd)
-            intervals.append(interval)
-            last_match_rd = r
-            # Save a snapshot of what the whole floor looks like right now
-            center_pattern_states[r] = deepcopy(arr)
-
-            """Key insight: The floor will eventually reach a periodic oscillation
-            of the same states, i.e. a cycle. We need to detect when that happens.
-            When it does, we can calculate how many active tiles
-            appear during all pattern-match rounds in one cycle, and multiply
-            by how many cycles occur within the full number of rounds.
-            That (plus some edge case stuff to account for pre-cycle rounds and
-            a potentially incomplete cycle at the end) will be our answer."""
-            # Cycle detection stage 1: see if the current interval list matches
-            # any previous intervals
-            if not in_check_mode:
-                for i, old_interval in enumerate(intervals):
-                    if interval == old_interval and i != len(intervals) - 1:
-                        # Bingo! a repeat.
-                        in_check_mode = True
-                        # The length of the cycle, if this turns out to be a cycle,
-                        # is the number of rounds (or intervals) between the first
-                        # instance and this one.
-
-                        potential_cycle_len = len(intervals) - 1 - i
-                        potential_cycle_start_ix = i
-                        length_to_check_until = len(intervals) + len(intervals) - 1 - i
-            if in_check_mode and len(intervals) == length_to_check_until:
-                # Cycle detection stage 2: check that many rounds ahead
-                # and make sure the intervals all exactly match
-                first_cycle_candidate = intervals[
-                    potential_cycle_start_ix : potential_cycle_start_ix
-                    + potential_cycle_len
-                ]
-                second_cycle_candidate = intervals[
-                    potential_cycle_start_ix + potential_cycle_len : -1
-                ]
-                if first_cycle_candidate == second_cycle_candidate:
-                    # Cycle detection stage 3: Check that the actual patterns
-                    # at each stage of both sequences are the same
-                    first_cycle_indices = list(center_pattern_states.keys())[
-                        potential_cycle_start_ix : potential_cycle_start_ix
-                        + potential_cycle_len
-                    ]
-                    second_cycle_indices = list(center_pattern_states.keys())[
-                        potential_cycle_start_ix
-                        + potential_cycle_len : potential_cycle_start_ix
-                        + (2 * potential_cycle_len)
-                    ]
-                    for i in range(len(first_cycle_indices)):
-                        assert (
-                            center_pattern_states[first_cycle_indices[i]]
-                            == center_pattern_states[second_cycle_indices[i]]
-                        ).all()
-                    # Okay, we're pretty confident now that this represents a
-                    # real cycle of floor states.
-                    # # TODO: I'm not convinced that this is
-                    # provably true in all cases, though... say we find
-                    # [3, 3, 6, 3, 3, 6] but the real cycle is [3, 3, 6, 3, 3, 6, 60]?
-                    # prove that this approach actually works for all possible
-                    # input patterns; doesn't just get lucky on test case & my input
-
-                    # Calculate how long a cycle is and how many active tiles there
-                    # are on pattern-matching rounds within a cycle
-                    cycle_round_length = first_cycle_indices[-1] - min(
-                        center_pattern_states.keys()
-                    )
-                    num_cycle_occurrences = rounds // cycle_round_length
-                    patterns_in_cycle = [
-                        center_pattern_states[rd] for rd in first_cycle_indices
-                    ]
-                    active_tiles_per_cycle = sum(
-                        [len(np.argwhere(arr == ON)) for arr in patterns_in_cycle]
-                    )
-                    rough_answer = active_tiles_per_cycle * num_cycle_occurrences
-                    # go through the pre-full-cycle rounds and count out how
-                    # many active tiles show up in the pattern through that
-                    # much of a cycle
-                    remainder = rounds % num_cycle_occurrences
-
-                    patterns_in_remainder = [
-                        center_pattern_states[key]
-                        for key in list(center_pattern_states.keys())
-                        if key < remainder
-                    ]
-                    active_tiles_in_remainder = sum(
-                        [len(np.argwhere(arr == ON)) for arr in patterns_in_remainder]
-                    )
-                    # Get your final answer
-                    answer = rough_answer + active_tiles_in_remainder
-                    return answer
+    def tiles_if_matching(arr: np.array) -> int:
+        if (center_n_by_n(arr, n=8) == pattern).all():
+            return len(np.argwhere(arr == ON))
+        return 0
+
+    return aggregate_rounds(arr, next_round, rounds, tiles_if_matching, SUM)
 
 
 if __name__ == "__main__":
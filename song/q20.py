@@ -1,8 +1,7 @@
 from copy import deepcopy
-import networkx as nx
 from input_data import q20_p1, q20_p2, q20_p3
-from typing import List, Tuple
-
+from typing import Dict, List, Tuple
+from utils import UNREACHED, CSRGraph, GraphBuilder, bfs
 
 # Problem statement: https://everybody.codes/event/2025/quests/20
 
@@ -18,41 +17,48 @@ UP = 1
 LEFT = 0
 
 
-def parse_input(data: str) -> nx.Graph:
+def parse_input(data: str) -> Tuple[CSRGraph, Dict[tuple, str]]:
     """Model a triangular tile space using a network Graph, where each trampoline
     is represented as a node, and any place where two triangles' surfaces adjoin
-    is represented as an edge between two of those nodes."""
+    is represented as an edge between two of those nodes.
+
+    Also returns the type of every (row, col) spot holding S or E."""
     data = [[char for char in row] for row in data.split("\n")]
-    G = nx.Graph()
+    G = GraphBuilder()
+    dirs = {}
+    specials = {}
     for i, row in enumerate(data):
         dir = DOWN if i % 2 == 0 else UP
         for j, char in enumerate(row):
             if char in TRAMPOLINES:
-                G.add_node((i, j), row=i, col=j, dir=dir, type=char)
+                G.add_node((i, j))
+                dirs[(i, j)] = dir
+                if char in (START, END):
+                    specials[(i, j)] = char
                 # all triangles adjoin ones to their left and right, if any
-                if (i, j - 1) in G.nodes:
+                if (i, j - 1) in G:
                     G.add_edge((i, j - 1), (i, j))
                 # down-pointing triangle adjoins triangle directly above it, if any
-                if (
-                    (i - 1, j) in G.nodes
-                    and dir == DOWN
-                    and G.nodes[(i - 1, j)]["dir"] == UP
-                ):
+                if (i - 1, j) in G and dir == DOWN and dirs[(i - 1, j)] == UP:
                     G.add_edge((i - 1, j), (i, j))
             dir = (dir + 1) % 2
-    return G
+    return G.build(), specials
 
 
 def part1(data: str):
-    G = parse_input(data)
-    return len(G.edges)
+    G, _ = parse_input(data)
+    return G.num_edges
 
 
 def part2(data: str):
-    G = parse_input(data)
-    start = [n for n, n_data in G.nodes(data=True) if n_data["type"] == START][0]
-    end = [n for n, n_data in G.nodes(data=True) if n_data["type"] == END][0]
-    return len(nx.shortest_path(G, start, end)) - 1
+    G, specials = parse_input(data)
+    start = [n for n, t in specials.items() if t == START][0]
+    end = [n for n, t in specials.items() if t == END][0]
+    dist, _, _ = bfs(G, G.id_of(start))
+    steps = int(dist[G.id_of(end)])
+    if steps == UNREACHED:
+        raise ValueError(f"No path from {start} to {end}")
+    return steps
 
 
 def rotated(floor_str: str) -> str:
@@ -109,10 +115,11 @@ def rotated_helper(
     return new_row
 
 
-def parse_rotating_input(data0: str) -> nx.DiGraph:
+def parse_rotating_input(data0: str) -> Tuple[CSRGraph, Dict[tuple, str]]:
     """Start with a string representation of floor configuration, then create
     a 'three-layered' graph in which every Trampoline has a directed edge to
     every potential landing spot in the layer representing the next time period.
+    Also returns the type of every (row, col, layer) spot holding S or E.
 
     Workhorse method for part 3, which reduces the solution to a simple
     shortest-path algorithm on the graph returned."""
@@ -125,7 +132,9 @@ def parse_rotating_input(data0: str) -> nx.DiGraph:
     layer2 = rotated(rotated(deepcopy(data0)))
     layer2 = [[char for char in row] for row in layer2.split("\n")]
 
-    G = nx.DiGraph()
+    G = GraphBuilder(directed=True)
+    dirs = {}
+    specials = {}
     datas = [layer0, layer1, layer2]
     # create all the valid trampoline spots as nodes first
     for k, data in enumerate(datas):
@@ -138,47 +147,40 @@ def parse_rotating_input(data0: str) -> nx.DiGraph:
                 # Successive triangles within a row strictly alternate orientation.
                 dir = ((i % 2 == 1) + j) % 2
                 if char in TRAMPOLINES:  # treat everything else as void
-                    G.add_node((i, j, k), row=i, col=j, layer=k, dir=dir, type=char)
+                    G.add_node((i, j, k))
+                    dirs[(i, j, k)] = dir
+                    if char in (START, END):
+                        specials[(i, j, k)] = char
     # Iterate through all nodes and create directed edges representing valid jumps.
-    # TODO: make nested if-statements less hideous
-    i_values = sorted(list(set([n_data["row"] for n, n_data in G.nodes(data=True)])))
-    j_values = sorted(list(set([n_data["col"] for n, n_data in G.nodes(data=True)])))
-    k_values = sorted(list(set([n_data["layer"] for n, n_data in G.nodes(data=True)])))
-    for i in i_values:
-        for j in j_values:
-            for k in k_values:
-                # all edges go from layer 0 to 1, or layer 1 to 2, or layer 2 to 0
-                k_next = (k + 1) % len(k_values)
-                index = (i, j, k)
-                if index in G.nodes:
-                    # because graph is now directed, welook left and right
-                    if (i, j - 1, k_next) in G.nodes:
-                        G.add_edge(index, (i, j - 1, k_next))
-                    if (i, j + 1, k_next) in G.nodes:
-                        G.add_edge(index, (i, j + 1, k_next))
-                    # and we look up and down
-                    if G.nodes[index]["dir"] == DOWN and (i - 1, j, k_next) in G.nodes:
-                        G.add_edge(index, (i - 1, j, k_next))
-                    elif G.nodes[index]["dir"] == UP and (i + 1, j, k_next) in G.nodes:
-                        G.add_edge(index, (i + 1, j, k_next))
-                    # and we can hop in place as the floor rotates under us!
-                    if (i, j, k_next) in G.nodes:
-                        G.add_edge(index, (i, j, k_next))
-    return G
+    for index in dirs:
+        i, j, k = index
+        # all edges go from layer 0 to 1, or layer 1 to 2, or layer 2 to 0
+        k_next = (k + 1) % len(datas)
+        # because graph is now directed, we look left and right
+        if (i, j - 1, k_next) in G:
+            G.add_edge(index, (i, j - 1, k_next))
+        if (i, j + 1, k_next) in G:
+            G.add_edge(index, (i, j + 1, k_next))
+        # and we look up and down
+        if dirs[index] == DOWN and (i - 1, j, k_next) in G:
+            G.add_edge(index, (i - 1, j, k_next))
+        elif dirs[index] == UP and (i + 1, j, k_next) in G:
+            G.add_edge(index, (i + 1, j, k_next))
+        # and we can hop in place as the floor rotates under us!
+        if (i, j, k_next) in G:
+            G.add_edge(index, (i, j, k_next))
+    return G.build(), specials
 
 
 def part3(data: str) -> int:
-    G = parse_rotating_input(data)
-    start = [
-        n
-        for n, n_data in G.nodes(data=True)
-        if n_data["type"] == START and n_data["layer"] == 0
-    ][0]
-    ends = [n for n, n_data in G.nodes(data=True) if n_data["type"] == END]
-    short_paths = []
-    for end in ends:
-        if nx.has_path(G, start, end):
-            short_paths.append(nx.shortest_path_length(G, start, end))
+    G, specials = parse_rotating_input(data)
+    start = [n for n, t in specials.items() if t == START and n[2] == 0][0]
+    ends = [n for n, t in specials.items() if t == END]
+    dist, _, _ = bfs(G, G.id_of(start))
+    short_paths = [int(dist[G.id_of(end)]) for end in ends]
+    short_paths = [d for d in short_paths if d != UNREACHED]
+    if not short_paths:
+        raise ValueError(f"No path from {start} to any end")
     return min(short_paths)
 
 
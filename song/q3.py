@@ -11,11 +11,6 @@ def parse_crates(crate_str: str) -> List[int]:
     return [int(i) for i in crate_str.split(",")]
 
 
-p1_data = parse_crates(q3_p1)
-p2_data = parse_crates(q3_p2)
-p3_data = parse_crates(q3_p3)
-
-
 def part1(data: List[int]):
     """If a crate must have a strictly smaller number to fit inside a larger one,
     the largest possible packing is just the sum of all distinct integer sizes."""
@@ -43,6 +38,9 @@ def part3(data: List[int]):
 
 
 if __name__ == "__main__":
+    p1_data = parse_crates(q3_p1)
+    p2_data = parse_crates(q3_p2)
+    p3_data = parse_crates(q3_p3)
     print(f"Part 1 answer: {part1(p1_data)}")
     print(f"Part 2 answer: {part2(p2_data)}")
     print(f"Part 3 test: {part3(p3_data)}")
@@ -3,7 +3,6 @@ from input_data import q4_p1, q4_p2, q4_p3
 from typing import List
 from math import floor, ceil
 
-
 # Problem statement: https://everybody.codes/event/2025/quests/4
 
 
@@ -18,11 +17,6 @@ def parse_gears(gear_str: str) -> List[int]:
     return gear_lst
 
 
-data_p1 = parse_gears(q4_p1)
-data_p2 = parse_gears(q4_p2)
-data_p3 = parse_gears(q4_p3)
-
-
 def part1(gears: List[int], start_rotations: int = 2025) -> int:
     return floor((gears[0] * start_rotations) / gears[-1])
 
@@ -43,6 +37,9 @@ def part3(gears: List[int | List], start_rotations: int = 100) -> int:
 
 
 if __name__ == "__main__":
+    data_p1 = parse_gears(q4_p1)
+    data_p2 = parse_gears(q4_p2)
+    data_p3 = parse_gears(q4_p3)
     print(f"Part 1 answer: {part1(data_p1)}")
     print(f"Part 2 answer: {part2(data_p2)}")
     print(f"Part 3 answer: {part3(data_p3)}")
@@ -1,8 +1,9 @@
 from input_data import q9_p1, q9_p2, q9_p3
 from typing import Tuple, Optional
 from itertools import combinations
-import networkx as nx
+import numpy as np
 from tqdm import tqdm
+from utils import GraphBuilder, connected_components
 
 
 def parse_dnas(dna_data: str) -> dict:
@@ -54,7 +55,7 @@ def solve(data: str) -> Tuple[int, int]:
     """
     dnas = parse_dnas(data)
     children = {}
-    G = nx.Graph()
+    G = GraphBuilder()
     for sn in dnas.keys():
         G.add_node(sn)
 
@@ -74,10 +75,11 @@ def solve(data: str) -> Tuple[int, int]:
 
     max_family_size = 0
     max_family_scale_sum = 0
-    family_forest = nx.connected_components(G)
-    for family_tree in family_forest:
-        family_size = len(family_tree)
-        scale_sum = sum([dragon for dragon in family_tree])
+    G = G.build()
+    family = connected_components(G)
+    family_sizes = np.bincount(family)
+    scale_sums = np.bincount(family, weights=G.keys).astype(np.int64)
+    for family_size, scale_sum in zip(family_sizes.tolist(), scale_sums.tolist()):
         if family_size > max_family_size:
             max_family_size = family_size
             max_family_scale_sum = scale_sum